@@ -2,6 +2,8 @@ from __future__ import annotations
 #import delle librerie python necessarie al codice
 #importazione della libreria random per la generazione dei numeri casuali
 import random
+#importazione di combinations per precalcolare le scelte della generazione in lotto
+from itertools import combinations
 #import delle eccezioni personalizzate
 from bingo_game.exceptions.cartella_exceptions import (
     CartellaNumeroTypeException,
@@ -13,11 +15,28 @@ from bingo_game.exceptions.cartella_exceptions import (
 )
 
 
+# Intervalli di numeri per colonna (stessi di _definisci_range_colonne), come
+# costante di modulo per la generazione in lotto.
+_RANGE_COLONNE: tuple[range, ...] = (
+    range(1, 10), range(10, 20), range(20, 30), range(30, 40), range(40, 50),
+    range(50, 60), range(60, 70), range(70, 80), range(80, 91),
+)
+# Tutte le 126 scelte di 5 colonne su 9 per una riga (tuple già ordinate).
+_COMBINAZIONI_COLONNE_RIGA: tuple[tuple[int, ...], ...] = tuple(combinations(range(9), 5))
+# Per ogni colonna e per k = 1..3: tutte le k-uple crescenti di numeri del range.
+_COMBINAZIONI_NUMERI_COLONNA: tuple[tuple[tuple[tuple[int, ...], ...], ...], ...] = tuple(
+    ((),) + tuple(tuple(combinations(range_colonna, k)) for k in (1, 2, 3))
+    for range_colonna in _RANGE_COLONNE
+)
+
+
 
 #definizione della classe Cartella
 class Cartella:
     #costruttore della classe Cartella
-    def __init__(self, max_numero=90, quantita_numeri=15, nome: str | None = None, indice: int | None = None):
+    def __init__(self, max_numero=90, quantita_numeri=15, nome: str | None = None, indice: int | None = None, rng: random.Random | None = None, griglia: list[list[int | None]] | None = None, valida_griglia: bool = True):
+        #generatore casuale usato per la generazione (None = modulo random globale)
+        self._rng = rng
         #definizione dei parametri della cartella
         #totale numeri estraibili
         self.max_numero = max_numero
@@ -27,20 +46,31 @@ class Cartella:
         self.nome = nome
         #indice della cartella
         self.indice = indice
+        #indice della cartella nel pool da cui è stata distribuita (None = non dal pool)
+        self.indice_pool: int | None = None
         #definisce quante righe ha la cartella
         self.righe = 3
         #definisce quante colonne ha la cartella
         self.colonne = 9
         #definisce quanti numeri possono essere contenuti in una riga
         self.numeri_per_riga = 5
+        # Contatore delle modifiche ai segnati fatte dai metodi pubblici
+        # (segna_numero, reset_cartella) e osservatori avvisati a ogni modifica
+        # (es. il bot proprietario, vedi GiocatoreAutomatico.aggiungi_cartella)
+        self.versione_segnazioni = 0
+        self._osservatori_segnazioni: list = []
         # Set per segnare i numeri estratti presenti nella cartella
         self.numeri_segnati = set()
         #crea una matrice di liste utilizzando il numero di righe e di colonne
         self.cartella = [[None for _ in range(self.colonne)] for _ in range(self.righe)]
         #inizializza il set dei numeri presenti nella cartella
         self.numeri_cartella = set()
-        # Genera la cartella come set di numeri unici casuali
-        self._genera_cartella()
+        # Usa una griglia già pronta (es. da genera_lotto) oppure genera la cartella
+        if griglia is not None:
+            self._carica_griglia(griglia, valida=valida_griglia)
+        else:
+            # Genera la cartella come set di numeri unici casuali
+            self._genera_cartella()
 
 
     """metodi di classe"""
@@ -164,7 +194,7 @@ class Cartella:
             raise RuntimeError(f"Errore: solo {len(colonne_disponibili)} colonne disponibili per riga {numero_riga}, servono 5")
         
         # Scegli ESATTAMENTE 5 colonne diverse a caso tra quelle disponibili
-        colonne_scelte = random.sample(colonne_disponibili, 5)
+        colonne_scelte = (self._rng or random).sample(colonne_disponibili, 5)
         
         # Per ogni colonna scelta, genera un numero e posizionalo
         for indice_colonna in colonne_scelte:
@@ -180,7 +210,7 @@ class Cartella:
                 range_colonna = self._definisci_range_colonne()[indice_colonna]
                 
                 # Genera un numero casuale dal range di questa colonna
-                numero_casuale = random.choice(list(range_colonna))
+                numero_casuale = (self._rng or random).choice(list(range_colonna))
                 
                 # Controlla se il numero è già nella cartella
                 if numero_casuale not in self.numeri_cartella:
@@ -391,6 +421,98 @@ class Cartella:
         self._valida_cartella_generata()
 
 
+    #metodo per caricare una griglia 3x9 già generata al posto della generazione casuale
+    def _carica_griglia(self, griglia, valida=True):
+        """
+        Imposta la cartella a partire da una griglia 3x9 esistente (ad esempio
+        prodotta da genera_lotto()) e la valida con le stesse regole della
+        generazione casuale. Con valida=False la validazione viene saltata:
+        da usare solo per griglie già validate all'origine (es. PoolCartelle).
+        Raises:
+            RuntimeError: se la griglia non ha 3 righe da 9 colonne o viola una regola
+        """
+        if len(griglia) != self.righe or any(len(riga) != self.colonne for riga in griglia):
+            raise RuntimeError("Errore: la griglia deve avere 3 righe e 9 colonne")
+
+        # Copia difensiva: la cartella non deve condividere le liste del chiamante
+        self.cartella = [list(riga) for riga in griglia]
+        self.numeri_cartella = self._estrai_numeri_set()
+        if valida:
+            self._valida_cartella_generata()
+
+
+    """metodi statici e di classe per la generazione di cartelle in lotto"""
+
+    #metodo statico per generare in blocco le griglie di N cartelle valide
+    @staticmethod
+    def genera_lotto(n: int, rng: random.Random | None = None) -> list[list[list[int | None]]]:
+        """
+        Genera le griglie di n cartelle valide, senza tentativi a vuoto.
+
+        Algoritmo (un solo passaggio per cartella, nessun retry):
+        1. Per ogni riga sceglie uniformemente una delle 126 combinazioni di 5
+           colonne su 9. Dopo due righe nessuna colonna può avere più di 2
+           numeri, quindi il limite di 3 numeri per colonna è sempre rispettato
+           e nessuna scelta va scartata.
+        2. Per ogni colonna con k caselle occupate sceglie uniformemente una
+           k-upla crescente di numeri distinti del range della colonna
+           (combinazioni precalcolate): i numeri escono già ordinati e vengono
+           assegnati dall'alto in basso, senza ordinamento a posteriori.
+
+        Le griglie rispettano le regole controllate da _valida_cartella_generata()
+        (15 numeri unici, 5 per riga, massimo 3 per colonna, range di colonna,
+        colonne ordinate in modo crescente).
+
+        Parametri:
+            n: numero di cartelle da generare (>= 0)
+            rng: random.Random opzionale (None = modulo random globale)
+        Returns:
+            list: n griglie 3x9 (liste di liste) con int o None, nello stesso
+                formato di Cartella.cartella. Con Cartella(griglia=...) si
+                ottengono le istanze.
+        Raises:
+            ValueError: se n è negativo
+        """
+        if n < 0:
+            raise ValueError(f"Il numero di cartelle del lotto deve essere >= 0, ricevuto {n}")
+
+        scegli = (rng if rng is not None else random).choice
+        lotto = []
+
+        for _ in range(n):
+            griglia = [[None] * 9, [None] * 9, [None] * 9]
+            righe_per_colonna: list[list[int]] = [[], [], [], [], [], [], [], [], []]
+
+            # 1. Colonne occupate da ciascuna riga (le righe sono visitate in
+            #    ordine, quindi ogni lista di righe è già crescente).
+            for indice_riga in range(3):
+                for indice_colonna in scegli(_COMBINAZIONI_COLONNE_RIGA):
+                    righe_per_colonna[indice_colonna].append(indice_riga)
+
+            # 2. Numeri di colonna distinti e già in ordine crescente.
+            for indice_colonna, righe in enumerate(righe_per_colonna):
+                if not righe:
+                    continue
+                numeri = scegli(_COMBINAZIONI_NUMERI_COLONNA[indice_colonna][len(righe)])
+                for indice_riga, numero in zip(righe, numeri):
+                    griglia[indice_riga][indice_colonna] = numero
+
+            lotto.append(griglia)
+
+        return lotto
+
+
+    #metodo di classe per creare N cartelle a partire da un lotto di griglie
+    @classmethod
+    def crea_lotto(cls, n: int, rng: random.Random | None = None) -> list["Cartella"]:
+        """
+        Crea n istanze di cartella (della classe su cui è chiamato) usando genera_lotto().
+        Returns:
+            list: n cartelle pronte all'uso, ciascuna validata
+        """
+        return [cls(griglia=griglia) for griglia in cls.genera_lotto(n, rng)]
+
+
 
 
 
@@ -858,10 +980,28 @@ class Cartella:
         # SEGNAZIONE VALIDA: Il numero passa tutti i controlli
         # Aggiungi il numero al set dei numeri segnati
         self.numeri_segnati.add(numero)
+        self._segnazioni_modificate()
 
         # Ritorna True per indicare che l'operazione è stata completata con successo
         return True
 
+    #metodo per segnare un numero già noto come presente nella cartella
+    def segna_numero_presente(self, numero: int) -> bool:
+        """
+        Variante di segna_numero() per i chiamanti che sanno già che il numero
+        appartiene alla cartella ed è valido (es. un indice invertito numero ->
+        cartelle): salta i controlli di tipo, range e appartenenza.
+        Non avvisa gli osservatori: il chiamante (Partita) propaga da sé i
+        premi raggiunti.
+
+        Ritorna True se il numero viene segnato, False se era già segnato.
+        """
+        segnati = self.numeri_segnati
+        if numero in segnati:
+            return False
+        segnati.add(numero)
+        return True
+
     #metodo per verificare se un numero è già stato segnato nella cartella
     def is_numero_segnato(self, numero: int) -> bool:
         """
@@ -943,6 +1083,15 @@ class Cartella:
 
         # Svuota il set dei numeri segnati creando un nuovo set vuoto
         self.numeri_segnati = set()
+        self._segnazioni_modificate()
+
+
+    #metodo privato che registra una modifica ai segnati e avvisa gli osservatori
+    def _segnazioni_modificate(self) -> None:
+        """Incrementa versione_segnazioni e avvisa gli osservatori della cartella."""
+        self.versione_segnazioni += 1
+        for osservatore in self._osservatori_segnazioni:
+            osservatore._notifica_segnazioni_cartella(self)
 
 
     """metodi pubblici di interrogazione semplice sulla cartella"""
@@ -0,0 +1,259 @@
+"""
+CLASSE PER LA CARTELLA COMPATTA A MASCHERE DI BIT
+Modulo: bingo_game.cartella_compatta
+
+Tombola / Bingo – Motore cartella compatto per simulazioni su larga scala
+=========================================================================
+
+OVERVIEW DEL MODULO
+-------------------
+
+Questo modulo definisce la classe CartellaCompatta, una variante di Cartella
+che rappresenta i numeri di ogni riga e lo stato dei numeri segnati come
+maschere intere a 90 bit (il bit n-1 corrisponde al numero n).
+
+Con questa rappresentazione:
+- segnare un numero è un singolo OR sulla maschera dei segnati;
+- verificare ambo/terno/quaterna/cinquina è un popcount di
+  (maschera_riga & maschera_segnati);
+- verificare la tombola è un confronto tra popcount e quantita_numeri.
+
+La classe eredita da Cartella, quindi:
+- la generazione e la validazione della griglia 3x9 restano quelle di Cartella;
+- tutti i metodi di interrogazione/visualizzazione restano disponibili;
+- GiocatoreBase.aggiungi_cartella(), Partita.verifica_premi_per_cartella() e
+  GiocatoreAutomatico._valuta_potenziale_reclamo() la accettano senza modifiche.
+
+NOTE DI UTILIZZO
+----------------
+
+- numeri_segnati resta leggibile come set (vista derivata dalla maschera,
+  ricostruita solo quando la maschera cambia: letture ripetute ritornano lo
+  stesso set), ma va modificato solo tramite segna_numero() / reset_cartella().
+- Se la griglia interna viene modificata a mano (es. nei test), riassegnare
+  numeri_cartella (come già avviene per Cartella) ricalcola anche le maschere.
+"""
+
+from __future__ import annotations
+
+import random
+
+from bingo_game.cartella import Cartella
+from bingo_game.exceptions.cartella_exceptions import (
+    CartellaNumeroTypeException,
+    CartellaNumeroValueException,
+    CartellaRigaTypeException,
+    CartellaRigaValueException,
+)
+
+
+#definizione della classe CartellaCompatta
+class CartellaCompatta(Cartella):
+    """
+    Cartella con stato codificato in maschere di bit.
+
+    Mantiene:
+    - _maschere_righe: tupla con una maschera per ciascuna riga;
+    - _maschera_cartella: OR delle maschere di riga (i 15 numeri della cartella);
+    - _maschera_segnati: maschera dei numeri segnati;
+    - _vista_segnati: ultima vista set di numeri_segnati e la maschera da cui deriva.
+
+    È API-compatibile con Cartella: sovrascrive solo i metodi del percorso
+    caldo (segnazione e verifiche dei premi).
+    """
+
+    def __init__(self, max_numero=90, quantita_numeri=15, nome: str | None = None, indice: int | None = None, rng: random.Random | None = None, griglia: list[list[int | None]] | None = None, valida_griglia: bool = True):
+        # Le maschere devono esistere prima che il costruttore base assegni
+        # numeri_segnati / numeri_cartella tramite le property.
+        self._maschere_righe: tuple[int, ...] = (0, 0, 0)
+        self._maschera_cartella: int = 0
+        self._maschera_segnati: int = 0
+        self._numeri_cartella: set[int] = set()
+        self._vista_segnati: tuple[int, set[int]] = (0, set())
+        super().__init__(max_numero=max_numero, quantita_numeri=quantita_numeri, nome=nome, indice=indice, rng=rng, griglia=griglia, valida_griglia=valida_griglia)
+
+
+    """metodi privati di gestione delle maschere"""
+
+    #metodo per ricalcolare le maschere di riga a partire dalla griglia 3x9
+    def _ricalcola_maschere(self) -> None:
+        """
+        Ricalcola le maschere di riga e la maschera della cartella leggendo self.cartella.
+
+        Chiamato al termine della generazione (dopo l'ordinamento nelle colonne,
+        che può spostare i numeri tra le righe) e quando numeri_cartella viene
+        riassegnato dall'esterno.
+        """
+        maschere = []
+        for riga in self.cartella:
+            maschera_riga = 0
+            for valore in riga:
+                if valore is not None:
+                    maschera_riga |= 1 << (valore - 1)
+            maschere.append(maschera_riga)
+
+        self._maschere_righe = tuple(maschere)
+        self._maschera_cartella = 0
+        for maschera_riga in self._maschere_righe:
+            self._maschera_cartella |= maschera_riga
+
+        # I segnati devono restare un sottoinsieme dei numeri della cartella.
+        self._maschera_segnati &= self._maschera_cartella
+
+
+    #metodo per generare la cartella e allineare le maschere
+    def _genera_cartella(self):
+        """
+        Genera la cartella con l'algoritmo di Cartella e poi costruisce le maschere.
+        """
+        super()._genera_cartella()
+        self._ricalcola_maschere()
+
+
+    #metodo per validare l'indice di riga (stesso contratto di Cartella)
+    def _valida_indice_riga(self, numero_riga: int) -> None:
+        if not isinstance(numero_riga, int):
+            raise CartellaRigaTypeException(numero_riga)
+        if numero_riga < 0 or numero_riga >= self.righe:
+            raise CartellaRigaValueException(numero_riga)
+
+
+    """property di compatibilità con Cartella"""
+
+    @property
+    def numeri_cartella(self) -> set[int]:
+        """Set dei numeri della cartella (stesso attributo esposto da Cartella)."""
+        return self._numeri_cartella
+
+    @numeri_cartella.setter
+    def numeri_cartella(self, valore: set[int]) -> None:
+        # Durante la generazione Cartella usa il set in modo incrementale (add);
+        # le maschere vengono riallineate a ogni riassegnazione esplicita.
+        self._numeri_cartella = valore
+        if hasattr(self, "cartella"):
+            self._ricalcola_maschere()
+
+    @property
+    def numeri_segnati(self) -> set[int]:
+        """
+        Vista set dei numeri segnati, derivata da _maschera_segnati.
+
+        Il set viene ricostruito solo se la maschera è cambiata dall'ultima
+        lettura; va trattato in sola lettura.
+        """
+        maschera = self._maschera_segnati
+        maschera_vista, vista = self._vista_segnati
+        if maschera == maschera_vista:
+            return vista
+        segnati = set()
+        while maschera:
+            bit_basso = maschera & -maschera
+            segnati.add(bit_basso.bit_length())
+            maschera ^= bit_basso
+        self._vista_segnati = (self._maschera_segnati, segnati)
+        return segnati
+
+    @numeri_segnati.setter
+    def numeri_segnati(self, valore: set[int]) -> None:
+        maschera = 0
+        for numero in valore:
+            maschera |= 1 << (numero - 1)
+        self._maschera_segnati = maschera & self._maschera_cartella
+        self._segnazioni_modificate()
+
+
+    """metodi pubblici sovrascritti (percorso caldo)"""
+
+    #metodo per segnare un numero nella cartella
+    def segna_numero(self, numero: int):
+        """
+        Segna un numero della cartella se presente e non ancora segnato.
+
+        Stesso contratto di Cartella.segna_numero(): ritorna True se il numero
+        viene segnato, False se non appartiene alla cartella o è già segnato.
+        La segnazione è un singolo OR sulla maschera dei segnati.
+        """
+        if not isinstance(numero, int):
+            raise CartellaNumeroTypeException(numero)
+        if numero < 1 or numero > 90:
+            raise CartellaNumeroValueException(numero)
+
+        bit = 1 << (numero - 1)
+        if not self._maschera_cartella & bit or self._maschera_segnati & bit:
+            return False
+
+        self._maschera_segnati |= bit
+        self._segnazioni_modificate()
+        return True
+
+
+    #metodo per segnare un numero già noto come presente nella cartella
+    def segna_numero_presente(self, numero: int) -> bool:
+        """Come Cartella.segna_numero_presente(): un test e un OR sulla maschera."""
+        bit = 1 << (numero - 1)
+        if self._maschera_segnati & bit:
+            return False
+        self._maschera_segnati |= bit
+        return True
+
+
+    #metodo per verificare se un numero è già stato segnato nella cartella
+    def is_numero_segnato(self, numero: int) -> bool:
+        """Verifica se un numero è segnato (test di un bit sulla maschera)."""
+        if not isinstance(numero, int):
+            raise CartellaNumeroTypeException(numero)
+        if numero < 1 or numero > 90:
+            raise CartellaNumeroValueException(numero)
+
+        return bool(self._maschera_segnati & (1 << (numero - 1)))
+
+
+    #metodo per resettare lo stato della cartella
+    def reset_cartella(self):
+        """Cancella tutti i numeri segnati azzerando la maschera."""
+        self._maschera_segnati = 0
+        self._segnazioni_modificate()
+
+
+    #metodo per contare i numeri segnati nella cartella
+    def conta_numeri_segnati(self):
+        """Ritorna il numero di numeri segnati (popcount della maschera)."""
+        return self._maschera_segnati.bit_count()
+
+
+    #metodo per contare i numeri segnati in una riga
+    def conta_segnati_riga(self, numero_riga: int) -> int:
+        """
+        Ritorna quanti numeri della riga indicata sono segnati.
+
+        Parametri:
+            - numero_riga: int (0, 1 o 2)
+
+        Eccezioni:
+            - CartellaRigaTypeException / CartellaRigaValueException come in Cartella.
+        """
+        self._valida_indice_riga(numero_riga)
+        return (self._maschere_righe[numero_riga] & self._maschera_segnati).bit_count()
+
+
+    def verifica_ambo_riga(self, numero_riga: int):
+        """Ambo: almeno 2 numeri segnati nella riga."""
+        return self.conta_segnati_riga(numero_riga) >= 2
+
+    def verifica_terno_riga(self, numero_riga: int):
+        """Terno: almeno 3 numeri segnati nella riga."""
+        return self.conta_segnati_riga(numero_riga) >= 3
+
+    def verifica_quaterna_riga(self, numero_riga: int):
+        """Quaterna: almeno 4 numeri segnati nella riga."""
+        return self.conta_segnati_riga(numero_riga) >= 4
+
+    def verifica_cinquina_riga(self, numero_riga: int):
+        """Cinquina: 5 numeri segnati nella riga."""
+        return self.conta_segnati_riga(numero_riga) >= 5
+
+
+    #metodo per verificare se la cartella è completamente segnata (tombola)
+    def verifica_cartella_completa(self):
+        """Tombola: tutti i quantita_numeri numeri della cartella sono segnati."""
+        return self._maschera_segnati.bit_count() == self.quantita_numeri
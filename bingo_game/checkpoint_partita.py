@@ -0,0 +1,579 @@
+"""
+CLASSE PER I CHECKPOINT DELLE PARTITE
+Modulo: bingo_game.checkpoint_partita
+
+Tombola / Bingo – Checkpoint binario per turno e ripresa della partita
+=====================================================================
+
+OVERVIEW DEL MODULO
+-------------------
+
+Questo modulo permette di:
+- salvare a ogni turno lo stato di una partita in un file binario compatto
+  (CheckpointPartita), collegato a Partita con Partita.collega_checkpoint();
+- ricostruire una Partita viva dal file (ripristina_partita), ad esempio
+  dopo un crash dell'applicazione, senza rigenerare né rivalidare le cartelle.
+
+Il file contiene uno snapshot completo seguito da delta accodati:
+- esegui_fase_estrazione() accoda il numero estratto;
+- esegui_fase_verifica() accoda le segnazioni delle cartelle umane, i premi
+  assegnati nel turno e lo stato della partita;
+- ogni turni_per_snapshot verifiche il file viene riscritto con un nuovo
+  snapshot: scritto su un file temporaneo e sostituito con os.replace(),
+  quindi sul disco c'è sempre uno snapshot valido seguito da delta completi.
+
+Il pulsante di estrazione paga solo l'accodamento di un record di 6 byte;
+la riscrittura dello snapshot avviene alla chiusura della finestra di reclamo.
+
+FORMATO DEL FILE
+----------------
+
+- Intestazione di 8 byte (little endian): magic b"TSCK", versione (1 byte),
+  3 byte riservati.
+- Record: tipo (1 byte), lunghezza del contenuto (4 byte), contenuto.
+  Il primo record è sempre uno snapshot; i tipi sconosciuti vengono saltati
+  e un record finale incompleto (processo interrotto durante la scrittura)
+  viene ignorato.
+
+Snapshot:
+- testata: stato, fase, flag (bit 0 modalità sala, bit 1 TabelloneMescolato),
+  tipi di premio chiusi (maschera sugli indici di PREMI in bingo_game.premi),
+  seme (-1 = assente),
+  numero di giocatori, lunghezza della configurazione (JSON UTF-8 che segue);
+- estrazioni: conteggio e un byte per numero, in ordine. Con un
+  TabelloneMescolato seguono i 90 byte dell'intera sequenza, così dopo la
+  ripresa vengono estratti gli stessi numeri;
+- giocatori: umano (1 byte), id (-1 = assente), nome UTF-8, cartelle; ogni
+  cartella è indice, 15 byte di griglia (come in pool_cartelle), una
+  maschera a 15 bit dei numeri segnati e l'indice nel pool da cui è stata
+  distribuita (-1 = non dal pool);
+- premi assegnati: il bitset del RegistroPremi (bingo_game.registro_premi)
+  così com'è, CODICI_PER_CARTELLA bit per indice di cartella (3 righe x 4
+  premi di riga, poi la tombola);
+- storico dei premi: posizione del giocatore nel roster, cartella, premio,
+  riga (-1 = tombola), turno.
+
+Delta:
+- estrazione: il numero estratto (1 byte). In ripresa le cartelle dei bot
+  vengono segnate come in Partita.aggiorna_giocatori_con_numero();
+- verifica: stato, maschere delle cartelle umane (segnate a mano) e premi
+  assegnati nel turno (posizione del giocatore, cartella, premio, riga).
+
+NOTE
+----
+
+- Con un Tabellone classico le estrazioni dopo la ripresa usano un nuovo
+  generatore: i numeri già estratti sono esatti, quelli futuri no.
+- Reclami e dichiarazioni di fine turno in corso non vengono salvati: una
+  partita ripresa in "attesa_reclami" riapre la finestra di reclamo.
+- Le cartelle ripristinate sono Cartella con nome assegnato dal giocatore
+  (aggiungi_cartella) e l'indice salvato.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import os
+import struct
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from bingo_game.cartella import Cartella
+from bingo_game.exceptions.checkpoint_partita_exceptions import (
+    CheckpointPartitaException,
+    CheckpointPartitaFormatoException,
+)
+from bingo_game.exceptions.pool_cartelle_exceptions import PoolCartelleFormatoException
+from bingo_game.formato_binario import (
+    CODICE_FASE,
+    DIMENSIONE_INTESTAZIONE,
+    FASI,
+    assente_se_negativo,
+    codifica_intestazione,
+    meno_uno_se_assente,
+    verifica_intestazione,
+)
+from bingo_game.partita import Partita
+from bingo_game.players.giocatore_automatico import GiocatoreAutomatico
+from bingo_game.players.giocatore_base import GiocatoreBase
+from bingo_game.players.giocatore_umano import GiocatoreUmano
+from bingo_game.premi import CODICE_PREMIO, PREMI
+from bingo_game.pool_cartelle import BYTE_PER_CARTELLA, codifica_griglia, decodifica_griglia
+from bingo_game.registro_premi import RegistroPremi, codice_premio as codice_registro
+from bingo_game.tabellone import Tabellone
+from bingo_game.tabellone_mescolato import TabelloneMescolato
+
+
+_MAGIC = b"TSCK"
+_VERSIONE = 3
+
+# Testata di ogni record: tipo e lunghezza del contenuto.
+_FORMATO_RECORD = struct.Struct("<BI")
+
+# Tipi di record
+RECORD_SNAPSHOT = 1
+RECORD_ESTRAZIONE = 2
+RECORD_VERIFICA = 3
+
+# Snapshot: stato, fase, flag, premi chiusi, seme, giocatori, lunghezza configurazione.
+_TESTA_SNAPSHOT = struct.Struct("<BBBBqIH")
+# Giocatore: umano, id, lunghezza del nome, numero di cartelle.
+_GIOCATORE = struct.Struct("<BiBH")
+# Cartella: indice, griglia, maschera dei numeri segnati, indice nel pool.
+_CARTELLA = struct.Struct(f"<H{BYTE_PER_CARTELLA}sHq")
+# Premio dello storico: posizione del giocatore, cartella, premio, riga, turno.
+_PREMIO_STORICO = struct.Struct("<IHBbB")
+# Verifica: stato, numero di cartelle umane, numero di premi del turno.
+_TESTA_VERIFICA = struct.Struct("<BHH")
+_MASCHERA = struct.Struct("<H")
+# Premio del turno: posizione del giocatore, cartella, premio, riga.
+_PREMIO_TURNO = struct.Struct("<IHBb")
+_CONTEGGIO = struct.Struct("<I")
+
+STATI: tuple[str, ...] = ("non_iniziata", "in_corso", "terminata")
+_CODICE_STATO: Dict[str, int] = {stato: codice for codice, stato in enumerate(STATI)}
+
+_FLAG_SALA = 0x01
+_FLAG_MESCOLATO = 0x02
+
+# Verifiche accodate come delta prima di riscrivere lo snapshot.
+_TURNI_PER_SNAPSHOT: int = 30
+
+
+#funzione che ritorna i premi assegnati come RegistroPremi
+def _registro(premi_gia_assegnati: Any) -> RegistroPremi:
+    """
+    Eccezioni:
+    - CheckpointPartitaException: chiave di premio non salvabile nel checkpoint.
+    """
+    if isinstance(premi_gia_assegnati, RegistroPremi):
+        return premi_gia_assegnati
+    try:
+        return RegistroPremi(premi_gia_assegnati)
+    except (TypeError, ValueError) as errore:
+        raise CheckpointPartitaException(f"Premi assegnati non salvabili nel checkpoint: {errore}") from None
+
+
+def _maschera(griglia: bytes, segnati: set) -> int:
+    if not segnati:
+        return 0
+    maschera = 0
+    for bit, numero in enumerate(griglia):
+        if numero in segnati:
+            maschera |= 1 << bit
+    return maschera
+
+
+#definizione della classe CheckpointPartita
+class CheckpointPartita:
+    """
+    Scrittore dei checkpoint per turno di una partita.
+
+    Uso tipico:
+        with CheckpointPartita("partita.tsck") as checkpoint:
+            partita.collega_checkpoint(checkpoint)
+            ... turni ...
+
+    Ripresa dopo un crash:
+        partita = ripristina_partita("partita.tsck")
+        partita.collega_checkpoint(CheckpointPartita("partita.tsck"))
+    """
+
+    def __init__(
+        self,
+        percorso: str | os.PathLike,
+        turni_per_snapshot: int = _TURNI_PER_SNAPSHOT,
+        sincronizza: bool = False,
+    ) -> None:
+        """
+        Parametri:
+        - percorso: file del checkpoint (riscritto al primo snapshot).
+        - turni_per_snapshot: verifiche accodate come delta prima di
+          riscrivere lo snapshot completo (>= 1).
+        - sincronizza: se True ogni scrittura è seguita da os.fsync(), per
+          sopravvivere anche a un'interruzione di corrente (costa qualche
+          millisecondo per turno sui dischi lenti).
+        """
+        self.percorso = os.fspath(percorso)
+        self.turni_per_snapshot = max(1, turni_per_snapshot)
+        self.sincronizza = sincronizza
+        self._file: Optional[BinaryIO] = None
+        self._verifiche_accodate = 0
+        # Roster dell'ultimo snapshot: posizioni dei giocatori e cartelle umane.
+        self._numero_giocatori = 0
+        self._posizioni_per_id: Dict[int, int] = {}
+        self._posizioni_per_nome: Dict[str, int] = {}
+        self._cartelle_umane: List[Tuple[Cartella, bytes]] = []
+        # Griglie codificate per id(cartella): le cartelle non cambiano in partita.
+        self._griglie: Dict[int, Tuple[Cartella, bytes]] = {}
+
+
+    """sezione: scrittura"""
+
+    def _griglia(self, cartella: Cartella) -> bytes:
+        voce = self._griglie.get(id(cartella))
+        if voce is None or voce[0] is not cartella:
+            voce = self._griglie[id(cartella)] = (cartella, codifica_griglia(cartella.cartella))
+        return voce[1]
+
+    def _posizione(self, evento: Dict[str, Any]) -> int:
+        id_giocatore = evento.get("id_giocatore")
+        if id_giocatore is not None and id_giocatore in self._posizioni_per_id:
+            return self._posizioni_per_id[id_giocatore]
+        return self._posizioni_per_nome[evento["giocatore"]]
+
+    def _codifica_snapshot(self, partita: Partita) -> bytearray:
+        tabellone = partita.tabellone
+        giocatori = partita.get_giocatori()
+        estratti = tabellone.storico_estrazioni
+        configurazione = json.dumps(partita.configurazione).encode("utf-8") if partita.configurazione else b""
+
+        flag = _FLAG_SALA if partita.modalita_sala else 0
+        if isinstance(tabellone, TabelloneMescolato):
+            flag |= _FLAG_MESCOLATO
+        premi_chiusi = 0
+        for tipo in partita.premi_tipo_chiusi:
+            premi_chiusi |= 1 << CODICE_PREMIO[tipo]
+
+        dati = bytearray(_TESTA_SNAPSHOT.pack(
+            _CODICE_STATO[partita.stato_partita],
+            CODICE_FASE[partita.fase_turno_corrente],
+            flag,
+            premi_chiusi,
+            meno_uno_se_assente(partita.seme),
+            len(giocatori),
+            len(configurazione),
+        ))
+        dati += configurazione
+        dati.append(len(estratti))
+        dati += bytes(estratti)
+        if flag & _FLAG_MESCOLATO:
+            dati += bytes(tabellone.get_sequenza())
+
+        self._numero_giocatori = len(giocatori)
+        self._posizioni_per_id = {}
+        self._posizioni_per_nome = {}
+        self._cartelle_umane = []
+        for posizione, giocatore in enumerate(giocatori):
+            id_giocatore = giocatore.get_id_giocatore()
+            if id_giocatore is not None:
+                self._posizioni_per_id.setdefault(id_giocatore, posizione)
+            self._posizioni_per_nome.setdefault(giocatore.get_nome(), posizione)
+            umano = isinstance(giocatore, GiocatoreUmano)
+            nome = giocatore.get_nome().encode("utf-8")[:255]
+            cartelle = giocatore.get_cartelle()
+            dati += _GIOCATORE.pack(
+                int(umano), meno_uno_se_assente(id_giocatore), len(nome), len(cartelle)
+            )
+            dati += nome
+            for cartella in cartelle:
+                griglia = self._griglia(cartella)
+                dati += _CARTELLA.pack(
+                    cartella.indice, griglia, _maschera(griglia, cartella.numeri_segnati),
+                    meno_uno_se_assente(cartella.indice_pool),
+                )
+                if umano:
+                    self._cartelle_umane.append((cartella, griglia))
+
+        registro = _registro(partita.premi_gia_assegnati).in_byte()
+        dati += _CONTEGGIO.pack(len(registro))
+        dati += registro
+
+        dati += _CONTEGGIO.pack(len(partita.storico_premi))
+        for evento in partita.storico_premi:
+            dati += _PREMIO_STORICO.pack(
+                self._posizione(evento),
+                evento["cartella"],
+                CODICE_PREMIO[evento["premio"]],
+                meno_uno_se_assente(evento.get("riga")),
+                evento.get("turno", len(estratti)),
+            )
+        return dati
+
+    #metodo per scrivere uno snapshot completo in modo atomico
+    def scrivi_snapshot(self, partita: Partita) -> None:
+        """
+        Riscrive il file con uno snapshot completo della partita: il contenuto
+        va su un file temporaneo che sostituisce il checkpoint con os.replace(),
+        quindi un'interruzione lascia il file precedente intatto.
+        """
+        contenuto = self._codifica_snapshot(partita)
+        dati = bytearray(codifica_intestazione(_MAGIC, _VERSIONE))
+        dati += _FORMATO_RECORD.pack(RECORD_SNAPSHOT, len(contenuto))
+        dati += contenuto
+
+        # Su Windows un file aperto non può essere sostituito: si chiude prima.
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        temporaneo = self.percorso + ".tmp"
+        with open(temporaneo, "wb") as file:
+            file.write(dati)
+            if self.sincronizza:
+                file.flush()
+                os.fsync(file.fileno())
+        os.replace(temporaneo, self.percorso)
+        self._file = open(self.percorso, "ab")
+        self._verifiche_accodate = 0
+
+    def _accoda(self, tipo: int, contenuto: bytes) -> None:
+        if self._file is None:
+            raise CheckpointPartitaException(
+                "Nessuno snapshot scritto: collegare il checkpoint con Partita.collega_checkpoint()."
+            )
+        self._file.write(_FORMATO_RECORD.pack(tipo, len(contenuto)) + contenuto)
+        self._file.flush()
+        if self.sincronizza:
+            os.fsync(self._file.fileno())
+
+    #metodo per registrare l'estrazione di un numero (fase 1 del turno)
+    def registra_estrazione(self, partita: Partita, numero: int) -> None:
+        """Accoda il numero estratto (o riscrive lo snapshot se il roster è cambiato)."""
+        if len(partita.giocatori) != self._numero_giocatori:
+            self.scrivi_snapshot(partita)
+            return
+        self._accoda(RECORD_ESTRAZIONE, bytes((numero,)))
+
+    #metodo per registrare l'esito della verifica (fase 2 del turno)
+    def registra_verifica(self, partita: Partita, premi_nuovi: List[Dict[str, Any]]) -> None:
+        """
+        Accoda segnazioni delle cartelle umane, premi del turno e stato della
+        partita; ogni turni_per_snapshot verifiche riscrive invece lo snapshot.
+        """
+        self._verifiche_accodate += 1
+        if (self._verifiche_accodate >= self.turni_per_snapshot
+                or len(partita.giocatori) != self._numero_giocatori):
+            self.scrivi_snapshot(partita)
+            return
+        dati = bytearray(_TESTA_VERIFICA.pack(
+            _CODICE_STATO[partita.stato_partita], len(self._cartelle_umane), len(premi_nuovi)
+        ))
+        for cartella, griglia in self._cartelle_umane:
+            dati += _MASCHERA.pack(_maschera(griglia, cartella.numeri_segnati))
+        for evento in premi_nuovi:
+            dati += _PREMIO_TURNO.pack(
+                self._posizione(evento),
+                evento["cartella"],
+                CODICE_PREMIO[evento["premio"]],
+                meno_uno_se_assente(evento.get("riga")),
+            )
+        self._accoda(RECORD_VERIFICA, dati)
+
+
+    """sezione: gestione del file"""
+
+    def chiudi(self) -> None:
+        """Chiude il file del checkpoint (i record sono già sul file)."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> CheckpointPartita:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.chiudi()
+
+
+"""sezione: ripresa della partita"""
+
+def _verifica_intestazione(intestazione: bytes) -> None:
+    verifica_intestazione(
+        intestazione, _MAGIC, _VERSIONE, "checkpoint di partita", CheckpointPartitaFormatoException
+    )
+
+
+def _leggi_record(dati: bytes) -> Iterator[Tuple[int, memoryview]]:
+    vista = memoryview(dati)
+    posizione = DIMENSIONE_INTESTAZIONE
+    fine_dati = len(dati)
+    while posizione + _FORMATO_RECORD.size <= fine_dati:
+        tipo, lunghezza = _FORMATO_RECORD.unpack_from(dati, posizione)
+        inizio = posizione + _FORMATO_RECORD.size
+        if inizio + lunghezza > fine_dati:
+            return
+        yield tipo, vista[inizio:inizio + lunghezza]
+        posizione = inizio + lunghezza
+
+
+#definizione della classe di supporto che accumula lo stato letto dal checkpoint
+class _Ripresa:
+    """Stato della partita letto dallo snapshot e aggiornato dai delta."""
+
+    def __init__(self, contenuto: memoryview) -> None:
+        (codice_stato, codice_fase, flag, self.premi_chiusi, seme,
+         numero_giocatori, lunghezza_configurazione) = _TESTA_SNAPSHOT.unpack_from(contenuto, 0)
+        self.stato = STATI[codice_stato]
+        self.fase = FASI[codice_fase]
+        self.modalita_sala = bool(flag & _FLAG_SALA)
+        self.seme: Optional[int] = assente_se_negativo(seme)
+        posizione = _TESTA_SNAPSHOT.size
+        configurazione = bytes(contenuto[posizione:posizione + lunghezza_configurazione])
+        self.configurazione: Optional[Dict[str, Any]] = (
+            json.loads(configurazione.decode("utf-8")) if configurazione else None
+        )
+        posizione += lunghezza_configurazione
+
+        conteggio = contenuto[posizione]
+        posizione += 1
+        self.estratti: List[int] = list(contenuto[posizione:posizione + conteggio])
+        posizione += conteggio
+        self.sequenza: Optional[List[int]] = None
+        if flag & _FLAG_MESCOLATO:
+            self.sequenza = list(contenuto[posizione:posizione + 90])
+            posizione += 90
+
+        self.giocatori: List[GiocatoreBase] = []
+        self.cartelle_umane: List[Tuple[Cartella, bytes]] = []
+        self.cartelle_bot: List[Cartella] = []
+        for _ in range(numero_giocatori):
+            umano, id_giocatore, lunghezza_nome, numero_cartelle = _GIOCATORE.unpack_from(contenuto, posizione)
+            posizione += _GIOCATORE.size
+            nome = bytes(contenuto[posizione:posizione + lunghezza_nome]).decode("utf-8")
+            posizione += lunghezza_nome
+            classe = GiocatoreUmano if umano else GiocatoreAutomatico
+            giocatore = classe(nome=nome, id_giocatore=assente_se_negativo(id_giocatore))
+            for _ in range(numero_cartelle):
+                indice, griglia, maschera, indice_pool = _CARTELLA.unpack_from(contenuto, posizione)
+                posizione += _CARTELLA.size
+                cartella = Cartella(
+                    indice=indice, griglia=decodifica_griglia(griglia, valida=True), valida_griglia=False
+                )
+                cartella.indice_pool = assente_se_negativo(indice_pool)
+                cartella.numeri_segnati = {numero for bit, numero in enumerate(griglia) if maschera >> bit & 1}
+                giocatore.aggiungi_cartella(cartella)
+                if umano:
+                    self.cartelle_umane.append((cartella, griglia))
+                else:
+                    self.cartelle_bot.append(cartella)
+            self.giocatori.append(giocatore)
+
+        (lunghezza_registro,) = _CONTEGGIO.unpack_from(contenuto, posizione)
+        posizione += _CONTEGGIO.size
+        self.registro = RegistroPremi.da_byte(contenuto[posizione:posizione + lunghezza_registro])
+        posizione += lunghezza_registro
+
+        (numero_premi,) = _CONTEGGIO.unpack_from(contenuto, posizione)
+        posizione += _CONTEGGIO.size
+        self.storico_premi: List[Dict[str, Any]] = []
+        for _ in range(numero_premi):
+            valori = _PREMIO_STORICO.unpack_from(contenuto, posizione)
+            posizione += _PREMIO_STORICO.size
+            self.storico_premi.append(self._evento(*valori))
+        self._cartelle_per_numero: Optional[List[List[Cartella]]] = None
+
+    def _evento(self, posizione: int, cartella: int, codice_premio: int, riga: int, turno: int) -> Dict[str, Any]:
+        giocatore = self.giocatori[posizione]
+        return {
+            "giocatore": giocatore.get_nome(),
+            "id_giocatore": giocatore.get_id_giocatore(),
+            "cartella": cartella,
+            "premio": PREMI[codice_premio],
+            "riga": assente_se_negativo(riga),
+            "turno": turno,
+        }
+
+    #metodo che applica un delta di estrazione segnando le cartelle dei bot
+    def applica_estrazione(self, numero: int) -> None:
+        if self._cartelle_per_numero is None:
+            self._cartelle_per_numero = [[] for _ in range(91)]
+            for cartella in self.cartelle_bot:
+                for valore in cartella.numeri_cartella:
+                    self._cartelle_per_numero[valore].append(cartella)
+        self.estratti.append(numero)
+        for cartella in self._cartelle_per_numero[numero]:
+            cartella.segna_numero(numero)
+        self.stato = "in_corso"
+        self.fase = "attesa_reclami"
+
+    #metodo che applica un delta di verifica: segnazioni umane e premi del turno
+    def applica_verifica(self, contenuto: memoryview) -> None:
+        codice_stato, numero_cartelle, numero_premi = _TESTA_VERIFICA.unpack_from(contenuto, 0)
+        if numero_cartelle != len(self.cartelle_umane):
+            raise CheckpointPartitaFormatoException(
+                f"Delta con {numero_cartelle} cartelle umane, lo snapshot ne contiene {len(self.cartelle_umane)}."
+            )
+        posizione = _TESTA_VERIFICA.size
+        for cartella, griglia in self.cartelle_umane:
+            (maschera,) = _MASCHERA.unpack_from(contenuto, posizione)
+            posizione += _MASCHERA.size
+            cartella.numeri_segnati = {numero for bit, numero in enumerate(griglia) if maschera >> bit & 1}
+        for _ in range(numero_premi):
+            posizione_giocatore, indice, codice_premio, riga = _PREMIO_TURNO.unpack_from(contenuto, posizione)
+            posizione += _PREMIO_TURNO.size
+            self.storico_premi.append(
+                self._evento(posizione_giocatore, indice, codice_premio, riga, len(self.estratti))
+            )
+            self.registro.aggiungi_codice(
+                codice_registro(indice, PREMI[codice_premio], assente_se_negativo(riga))
+            )
+            self.premi_chiusi |= 1 << codice_premio
+        self.stato = STATI[codice_stato]
+        self.fase = "attesa_estrazione"
+
+    #metodo che costruisce la Partita viva dallo stato accumulato
+    def crea_partita(self) -> Partita:
+        if self.sequenza is not None:
+            tabellone: Tabellone = TabelloneMescolato(sequenza=self.sequenza)
+        else:
+            tabellone = Tabellone()
+        tabellone.ripristina_estrazioni(self.estratti)
+
+        partita = Partita(tabellone, self.giocatori, modalita_sala=self.modalita_sala)
+        partita.seme = self.seme
+        partita.configurazione = self.configurazione
+        partita.ultimo_numero_estratto = self.estratti[-1] if self.estratti else None
+        partita.premi_gia_assegnati = self.registro
+        partita.premi_tipo_chiusi = {
+            premio for codice, premio in enumerate(PREMI) if self.premi_chiusi >> codice & 1
+        }
+        partita._notifica_tipi_chiusi()
+        partita.storico_premi = self.storico_premi
+        partita.ultimo_premio_evento = self.storico_premi[-1] if self.storico_premi else None
+        partita.fase_turno_corrente = self.fase
+        if self.stato != "non_iniziata":
+            # Come avvia_partita(): indice dei numeri e tracciatore sul roster ripristinato.
+            partita._costruisci_indice_numeri()
+        partita.stato_partita = self.stato
+        return partita
+
+
+#funzione che ricostruisce una partita da un file di checkpoint
+def ripristina_partita(percorso: str | os.PathLike) -> Partita:
+    """
+    Legge il checkpoint e ritorna la Partita nello stato dell'ultimo record
+    completo: roster, cartelle e segnazioni, tabellone, premi assegnati e
+    storico, stato e fase del turno.
+
+    La partita ritornata non è collegata al checkpoint: per continuare a
+    salvarla usare Partita.collega_checkpoint(). Durante la ricostruzione il
+    garbage collector è sospeso: in modalità sala vengono creati centinaia di
+    migliaia di oggetti senza cicli e le raccolte complete ne dominerebbero
+    il costo.
+
+    Eccezioni:
+    - CheckpointPartitaFormatoException: intestazione non valida, snapshot
+      iniziale assente o contenuto incoerente.
+    """
+    with open(percorso, "rb") as file:
+        dati = file.read()
+    _verifica_intestazione(dati[:DIMENSIONE_INTESTAZIONE])
+    record = _leggi_record(dati)
+    primo = next(record, None)
+    if primo is None or primo[0] != RECORD_SNAPSHOT:
+        raise CheckpointPartitaFormatoException("Il checkpoint non inizia con uno snapshot completo.")
+    gc_attivo = gc.isenabled()
+    gc.disable()
+    try:
+        ripresa = _Ripresa(primo[1])
+        for tipo, contenuto in record:
+            if tipo == RECORD_ESTRAZIONE:
+                ripresa.applica_estrazione(contenuto[0])
+            elif tipo == RECORD_VERIFICA:
+                ripresa.applica_verifica(contenuto)
+        return ripresa.crea_partita()
+    except (struct.error, IndexError, KeyError, ValueError, PoolCartelleFormatoException) as exc:
+        raise CheckpointPartitaFormatoException(f"Checkpoint non valido: {exc}") from exc
+    finally:
+        if gc_attivo:
+            gc.enable()
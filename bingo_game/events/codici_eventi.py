@@ -14,6 +14,8 @@ TURNO_TIMEOUT_SALTATO: Final = "TURNO_TIMEOUT_SALTATO"
 TURNO_TUTTI_PRONTI: Final = "TURNO_TUTTI_PRONTI"
 TURNO_PAUSA_INIZIO: Final = "TURNO_PAUSA_INIZIO"
 TURNO_PAUSA_COUNTDOWN: Final = "TURNO_PAUSA_COUNTDOWN"
+TURNO_BOT_PASSA: Final = "TURNO_BOT_PASSA"
+TURNO_BOT_PASSANO: Final = "TURNO_BOT_PASSANO"
 
 # Chiavi pausa gioco (layer UI).
 PAUSA_ATTIVATA: Final = "PAUSA_ATTIVATA"
@@ -29,6 +31,8 @@ Codici_Eventi = Literal[
     "TURNO_TUTTI_PRONTI",
     "TURNO_PAUSA_INIZIO",
     "TURNO_PAUSA_COUNTDOWN",
+    "TURNO_BOT_PASSA",
+    "TURNO_BOT_PASSANO",
     "PAUSA_ATTIVATA",
     "PAUSA_DISATTIVATA",
 ]
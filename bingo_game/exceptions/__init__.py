@@ -54,6 +54,26 @@ from .game_controller_exceptions import (
     ControllerBotExcessException,
 )
 
+# Eccezioni per il pool di cartelle precalcolate
+from .pool_cartelle_exceptions import (
+    PoolCartelleException,
+    PoolCartelleFormatoException,
+    PoolCartelleEsauritoException,
+)
+
+# Eccezioni per il giornale strutturato delle partite
+from .giornale_partita_exceptions import (
+    GiornalePartitaException,
+    GiornalePartitaFormatoException,
+    GiornalePartitaSemeException,
+)
+
+# Eccezioni per i checkpoint delle partite
+from .checkpoint_partita_exceptions import (
+    CheckpointPartitaException,
+    CheckpointPartitaFormatoException,
+)
+
 #definizione dell'export delle eccezioni
 __all__ = [
     #cartella exceptions
@@ -90,4 +110,15 @@ __all__ = [
     "ControllerCartelleNegativeException",
 "ControllerBotNegativeException",
 "ControllerBotExcessException",
+    #pool cartelle
+    "PoolCartelleException",
+    "PoolCartelleFormatoException",
+    "PoolCartelleEsauritoException",
+    #giornale partita
+    "GiornalePartitaException",
+    "GiornalePartitaFormatoException",
+    "GiornalePartitaSemeException",
+    #checkpoint partita
+    "CheckpointPartitaException",
+    "CheckpointPartitaFormatoException",
 ]
\ No newline at end of file
@@ -0,0 +1,18 @@
+"""
+Eccezioni di dominio per i checkpoint delle partite.
+Modulo: bingo_game.exceptions.checkpoint_partita_exceptions
+"""
+
+
+class CheckpointPartitaException(Exception):
+    """
+    Eccezione base per gli errori dei checkpoint di partita (CheckpointPartita).
+    """
+
+
+class CheckpointPartitaFormatoException(CheckpointPartitaException):
+    """
+    Eccezione sollevata quando il file di checkpoint non ha il formato atteso:
+    intestazione assente o con magic/versione sconosciuti, snapshot iniziale
+    mancante o incompleto, oppure record incoerenti con il roster salvato.
+    """
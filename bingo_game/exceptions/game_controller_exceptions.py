@@ -66,7 +66,8 @@ class ControllerBotNegativeException(Exception):
 
 class ControllerBotExcessException(Exception):
     """
-    Eccezione sollevata quando il numero di bot supera il limite massimo (7).
+    Eccezione sollevata quando il numero di bot supera il limite massimo
+    (7, oppure Partita.MAX_GIOCATORI_SALA - 1 in modalità sala).
 
     Sollevata da:
     - crea_giocatori_automatici()
@@ -74,6 +75,9 @@ class ControllerBotExcessException(Exception):
 
     Motivo: Partita standard limitata a 8 giocatori totali (1 umano + 7 bot).
     """
-    def __init__(self) -> None:
-        self.messaggio = "ControllerBotExcessException: Massimo 7 bot consentiti (partita da 8 giocatori totali)"
+    def __init__(self, max_bot: int = 7) -> None:
+        self.messaggio = (
+            f"ControllerBotExcessException: Massimo {max_bot} bot consentiti "
+            f"(partita da {max_bot + 1} giocatori totali)"
+        )
         super().__init__(self.messaggio)
@@ -0,0 +1,26 @@
+"""
+Eccezioni di dominio per il giornale strutturato delle partite.
+Modulo: bingo_game.exceptions.giornale_partita_exceptions
+"""
+
+
+class GiornalePartitaException(Exception):
+    """
+    Eccezione base per gli errori del giornale delle partite (GiornalePartita).
+    """
+
+
+class GiornalePartitaFormatoException(GiornalePartitaException):
+    """
+    Eccezione sollevata quando il file del giornale non ha il formato atteso:
+    intestazione assente o con magic/versione sconosciuti, oppure record di
+    tipo noto con lunghezza incoerente.
+    """
+
+
+class GiornalePartitaSemeException(GiornalePartitaException):
+    """
+    Eccezione sollevata quando il seme di una partita non è rappresentabile nel
+    record inizio_partita (intero con segno a 64 bit, con -1 riservato al seme
+    assente): sono accettati i semi da 0 a 2**63 - 1.
+    """
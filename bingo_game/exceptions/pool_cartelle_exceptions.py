@@ -0,0 +1,26 @@
+"""
+Eccezioni di dominio per il pool di cartelle precalcolate.
+Modulo: bingo_game.exceptions.pool_cartelle_exceptions
+"""
+
+
+class PoolCartelleException(Exception):
+    """
+    Eccezione base per gli errori del pool di cartelle (PoolCartelle).
+    """
+
+
+class PoolCartelleFormatoException(PoolCartelleException):
+    """
+    Eccezione sollevata quando il file del pool non ha il formato atteso:
+    intestazione assente o con magic/versione sconosciuti, dimensione del file
+    incoerente con il numero di cartelle dichiarato, CRC dei record diverso
+    da quello dell'intestazione, oppure record di cartella non valido.
+    """
+
+
+class PoolCartelleEsauritoException(PoolCartelleException):
+    """
+    Eccezione sollevata quando si chiede di distribuire una cartella (o una
+    serie) ma il pool non ne contiene più di disponibili.
+    """
@@ -0,0 +1,84 @@
+"""
+CODIFICHE COMUNI DEI FILE BINARI
+Modulo: bingo_game.formato_binario
+
+Tombola / Bingo – Helper dei formati binari di giornale e checkpoint
+====================================================================
+
+OVERVIEW DEL MODULO
+-------------------
+
+Questo modulo raccoglie le codifiche condivise dal giornale
+(giornale_partita) e dal checkpoint (checkpoint_partita):
+- l'enumerazione delle fasi del turno salvate nei file (FASI);
+- l'intestazione di 8 byte dei file binari (magic di 4 byte, versione,
+  3 byte riservati) e la sua verifica;
+- la codifica dei campi interi opzionali: -1 = valore assente (riga della
+  tombola, id giocatore o seme mancanti).
+
+I premi sono salvati con il loro codice intero (bingo_game.premi).
+Il pool di cartelle (pool_cartelle) ha un'intestazione propria, con il
+numero di cartelle, e non usa questo modulo.
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import Dict, Optional, Tuple, Type
+
+
+"""sezione: fasi del turno"""
+
+FASI: Tuple[str, ...] = ("attesa_estrazione", "attesa_reclami")
+CODICE_FASE: Dict[str, int] = {fase: codice for codice, fase in enumerate(FASI)}
+
+
+"""sezione: intestazione dei file"""
+
+FORMATO_INTESTAZIONE = struct.Struct("<4sBxxx")
+DIMENSIONE_INTESTAZIONE: int = FORMATO_INTESTAZIONE.size
+
+
+#funzione che codifica l'intestazione di un file binario
+def codifica_intestazione(magic: bytes, versione: int) -> bytes:
+    """Ritorna gli 8 byte di intestazione: magic, versione e 3 byte riservati."""
+    return FORMATO_INTESTAZIONE.pack(magic, versione)
+
+
+#funzione che verifica l'intestazione letta da un file binario
+def verifica_intestazione(
+    intestazione: bytes,
+    magic: bytes,
+    versione: int,
+    nome_file: str,
+    eccezione: Type[Exception],
+) -> None:
+    """
+    Controlla lunghezza, magic e versione dell'intestazione.
+
+    Parametri:
+    - nome_file: come il file viene nominato nei messaggi (es. "giornale").
+    - eccezione: classe di eccezione di formato del chiamante.
+
+    Eccezioni:
+    - eccezione: intestazione incompleta, magic diverso o versione non supportata.
+    """
+    if len(intestazione) != DIMENSIONE_INTESTAZIONE:
+        raise eccezione(f"Intestazione del {nome_file} assente o incompleta.")
+    magic_letto, versione_letta = FORMATO_INTESTAZIONE.unpack(intestazione)
+    if magic_letto != magic:
+        raise eccezione(f"Il file non è un {nome_file} (magic errato).")
+    if versione_letta != versione:
+        raise eccezione(f"Versione del {nome_file} non supportata: {versione_letta}.")
+
+
+"""sezione: campi interi opzionali"""
+
+def meno_uno_se_assente(valore: Optional[int]) -> int:
+    """Codifica un intero opzionale: None diventa -1."""
+    return -1 if valore is None else valore
+
+
+def assente_se_negativo(valore: int) -> Optional[int]:
+    """Decodifica un intero opzionale: i valori negativi diventano None."""
+    return None if valore < 0 else valore
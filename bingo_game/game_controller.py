@@ -11,7 +11,22 @@ funzioni di comodo per:
 - avviare la partita in modo sicuro, gestendo eventuali eccezioni;
 - eseguire un turno di gioco e restituire un dizionario pronto per l'interfaccia;
 - ottenere una fotografia sintetica dello stato della partita;
-- ottenere il giocatore umano dalla partita (v0.9.0).
+- ottenere il giocatore umano dalla partita (v0.9.0);
+- ricreare una partita identica a partire da (seme, configurazione).
+
+Riproducibilità:
+crea_partita_standard() crea un unico random.Random a partire dal seme della
+partita (generato se non indicato) e lo passa a Tabellone, Cartella e alla
+creazione dei bot. Seme e configurazione vengono salvati sulla Partita
+(partita.seme, partita.configurazione) e scritti nel log: con
+ricrea_partita(seme, configurazione) si ottengono le stesse cartelle e la
+stessa sequenza di estrazioni.
+
+Stato per partita:
+il contatore dei turni e il flag di terminazione già registrata vivono in un
+ControllerPartita associato alla singola Partita (controller_partita()), non
+in variabili di modulo: più partite possono essere gestite nello stesso
+processo, anche intercalando i turni.
 
 L'obiettivo è separare la logica del "cosa succede" (motore) dalla logica
 del "come viene presentato" (interfaccia da terminale, screen reader, ecc.).
@@ -23,9 +38,12 @@ from typing import List, Optional, Dict, Any
 #import della libreria random per la generazione di numeri casuali.
 import random
 import logging
+import weakref
+from dataclasses import dataclass
 # Import delle classi di gioco
 from bingo_game.tabellone import Tabellone
 from bingo_game.cartella import Cartella
+from bingo_game.pool_cartelle import PoolCartelle
 from bingo_game.partita import Partita
 from bingo_game.players import GiocatoreBase, GiocatoreUmano, GiocatoreAutomatico
 
@@ -61,17 +79,46 @@ _logger_prizes = logging.getLogger("tombola_stark.prizes")
 _logger_system = logging.getLogger("tombola_stark.system")
 _logger_errors = logging.getLogger("tombola_stark.errors")
 
-# Stato di sessione — variabili di modulo (reset in crea_partita_standard)
-_turno_corrente: int = 0
+
+# =========================
+# Contesto del controller per partita
+# =========================
+
+@dataclass
+class ControllerPartita:
+    """Stato del controller legato a una singola Partita.
+
+    Sostituisce le vecchie variabili di modulo: ogni partita ha il proprio
+    contatore di turni (per log e riepilogo) e il proprio flag di
+    terminazione già registrata, così più partite nello stesso processo
+    (tavoli di un server, simulazioni intercalate) non si disturbano.
+    """
+
+    turno_corrente: int = 0
+    terminazione_registrata: bool = False
+
+
+# Registro partita → contesto: le chiavi sono deboli, il contesto sparisce
+# con la partita.
+_contesti_partita: "weakref.WeakKeyDictionary[Partita, ControllerPartita]" = weakref.WeakKeyDictionary()
+
+
+def controller_partita(partita: Partita) -> ControllerPartita:
+    """Ritorna il contesto del controller della partita, creandolo se manca.
+
+    crea_partita_standard() assegna un contesto nuovo a ogni partita; le
+    partite costruite direttamente ricevono il contesto al primo uso.
+    """
+    contesto = _contesti_partita.get(partita)
+    if contesto is None:
+        contesto = _contesti_partita[partita] = ControllerPartita()
+    return contesto
 
 
 # =========================
 # Helper interno per logging sicuro
 # =========================
 
-# Track se abbiamo già loggato la terminazione per evitare duplicati
-_partita_terminata_logged: bool = False
-
 def _log_safe(message: str, level: str = "info", *args,
               logger: logging.Logger | None = None) -> None:
     """Scrive nel log senza mai propagare eccezioni al chiamante.
@@ -146,7 +193,7 @@ def _log_game_summary(partita: Partita) -> None:
         )
         _log_safe(
             "[GAME] Turni giocati: %d | Numeri estratti: %d/90",
-            "info", _turno_corrente, len(stato.get("numeri_estratti", [])),
+            "info", controller_partita(partita).turno_corrente, len(stato.get("numeri_estratti", [])),
             logger=_logger_game
         )
         _log_safe(
@@ -185,7 +232,7 @@ def _conta_premi_assegnati(partita: Partita) -> int:
 # Sezione 1: Creazione oggetti
 # =========================
 
-def crea_tabellone_standard() -> Tabellone:
+def crea_tabellone_standard(rng: Optional[random.Random] = None) -> Tabellone:
     """
     Crea e ritorna un'istanza standard di Tabellone.
 
@@ -193,23 +240,35 @@ def crea_tabellone_standard() -> Tabellone:
     - numeri da 1 a 90
     - tabellone inizialmente pieno (nessun numero estratto)
 
+    Parametri:
+    - rng: Optional[random.Random], generatore per le estrazioni
+      (None = modulo random globale).
+
     Ritorna:
     - Tabellone: tabellone pronto all'uso per una partita standard.
     """
-    return Tabellone()
+    return Tabellone(rng=rng)
 
 
-def assegna_cartelle_a_giocatore(giocatore: GiocatoreBase, num_cartelle: int) -> None:
+def assegna_cartelle_a_giocatore(
+    giocatore: GiocatoreBase,
+    num_cartelle: int,
+    pool: Optional[PoolCartelle] = None,
+    rng: Optional[random.Random] = None,
+) -> None:
     """
     Assegna un certo numero di cartelle a un giocatore.
 
     Per ciascuna cartella:
-    - crea una nuova istanza di Cartella;
+    - crea una nuova istanza di Cartella, oppure la distribuisce dal pool
+      precalcolato se indicato (O(1), senza generazione né validazione);
     - la aggiunge al giocatore tramite GiocatoreBase.aggiungi_cartella().
 
     Parametri:
     - giocatore: GiocatoreBase
     - num_cartelle: int
+    - pool: Optional[PoolCartelle], pool da cui distribuire le cartelle
+    - rng: Optional[random.Random], generatore per le cartelle create
 
     Raises:
     - ControllerCartelleNegativeException: Se num_cartelle è negativo.
@@ -218,13 +277,19 @@ def assegna_cartelle_a_giocatore(giocatore: GiocatoreBase, num_cartelle: int) ->
         raise ControllerCartelleNegativeException(num_cartelle)
 
     for _ in range(num_cartelle):
-        nuova_cartella = Cartella()
+        nuova_cartella = pool.distribuisci() if pool is not None else Cartella(rng=rng)
         giocatore.aggiungi_cartella(nuova_cartella)
 
 
-def crea_giocatore_umano(nome: str, num_cartelle: int = 1, id_giocatore: Optional[int] = None) -> GiocatoreUmano:
+def crea_giocatore_umano(
+    nome: str,
+    num_cartelle: int = 1,
+    id_giocatore: Optional[int] = None,
+    rng: Optional[random.Random] = None,
+) -> GiocatoreUmano:
     """
     Crea un nuovo giocatore umano, assegnandogli un ID (se disponibile) e le cartelle richieste.
+    Le cartelle sono generate con rng, se indicato.
 
     Raises:
     - ControllerNomeGiocatoreException: Se il nome è vuoto.
@@ -234,29 +299,47 @@ def crea_giocatore_umano(nome: str, num_cartelle: int = 1, id_giocatore: Optiona
         raise ControllerNomeGiocatoreException(nome)
 
     giocatore = GiocatoreUmano(nome=nome, id_giocatore=id_giocatore)
-    assegna_cartelle_a_giocatore(giocatore, num_cartelle)
+    assegna_cartelle_a_giocatore(giocatore, num_cartelle, rng=rng)
     return giocatore
 
 
+# Numero massimo di bot accanto al giocatore umano (partita standard / modalità sala)
+_MAX_BOT: int = Partita.MAX_GIOCATORI - 1
+_MAX_BOT_SALA: int = Partita.MAX_GIOCATORI_SALA - 1
+
+
+def _max_bot(modalita_sala: bool) -> int:
+    """Numero massimo di bot ammessi accanto al giocatore umano."""
+    return _MAX_BOT_SALA if modalita_sala else _MAX_BOT
+
+
 def crea_giocatori_automatici(
     num_bot: int = 1,
     id_iniziale: int = 2,
+    rng: Optional[random.Random] = None,
+    modalita_sala: bool = False,
 ) -> List[GiocatoreAutomatico]:
     """
     Crea una lista di giocatori automatici (bot) per la partita di tombola.
 
+    Il numero di cartelle di ogni bot (da 1 a 6) e le cartelle stesse sono
+    generati con rng, se indicato (None = modulo random globale).
+    Con modalita_sala=True il limite è Partita.MAX_GIOCATORI_SALA - 1 bot.
+
     Raises:
     - ControllerBotNegativeException: Se num_bot < 0.
-    - ControllerBotExcessException: Se num_bot > 7 (limite partita).
+    - ControllerBotExcessException: Se num_bot supera il limite della partita.
     """
     if num_bot < 0:
         raise ControllerBotNegativeException(num_bot)
 
-    if num_bot > 7:
-        raise ControllerBotExcessException()
+    max_bot = _max_bot(modalita_sala)
+    if num_bot > max_bot:
+        raise ControllerBotExcessException(max_bot)
 
     num_bot_effettivi = max(1, num_bot)
     lista_bot: List[GiocatoreAutomatico] = []
+    generatore = rng if rng is not None else random
 
     for indice in range(num_bot_effettivi):
         nome_bot = f"Bot {indice + 1}"
@@ -264,8 +347,8 @@ def crea_giocatori_automatici(
             nome=nome_bot,
             id_giocatore=id_iniziale + indice,
         )
-        num_cartelle_bot = random.randint(1, 6)
-        assegna_cartelle_a_giocatore(bot, num_cartelle_bot)
+        num_cartelle_bot = generatore.randint(1, 6)
+        assegna_cartelle_a_giocatore(bot, num_cartelle_bot, rng=rng)
         lista_bot.append(bot)
 
     return lista_bot
@@ -274,23 +357,27 @@ def crea_giocatori_automatici(
 def crea_partita_standard(
     nome_giocatore_umano: str = "Giocatore 1",
     num_cartelle_umano: int = 1,
-    num_bot: int = 1
+    num_bot: int = 1,
+    seme: Optional[int] = None,
+    modalita_sala: bool = False,
 ) -> Partita:
     """
     Crea una partita di tombola standard completamente configurata e pronta per essere avviata.
 
+    Tutta la casualità della partita (cartelle, cartelle per bot, estrazioni)
+    deriva da un unico random.Random inizializzato con seme. Se seme è None ne
+    viene generato uno nuovo; in entrambi i casi viene salvato in
+    partita.seme insieme a partita.configurazione, per ricrea_partita().
+
+    Con modalita_sala=True la Partita viene creata in modalità sala (roster
+    fino a Partita.MAX_GIOCATORI_SALA giocatori, indici e contatori di turno).
+
     Raises:
     - ControllerNomeGiocatoreException: Se nome_giocatore_umano è vuoto.
     - ControllerCartelleNegativeException: Se num_cartelle_umano < 0.
     - ControllerBotNegativeException: Se num_bot < 0.
-    - ControllerBotExcessException: Se num_bot > 7.
+    - ControllerBotExcessException: Se num_bot supera il limite della partita.
     """
-    global _partita_terminata_logged, _turno_corrente
-
-    # Reset flag terminazione e contatori per nuova partita
-    _partita_terminata_logged = False
-    _turno_corrente = 0
-
     if not nome_giocatore_umano or not nome_giocatore_umano.strip():
         raise ControllerNomeGiocatoreException(nome_giocatore_umano)
 
@@ -299,28 +386,44 @@ def crea_partita_standard(
 
     if num_bot < 0:
         raise ControllerBotNegativeException(num_bot)
-    if num_bot > 7:
-        raise ControllerBotExcessException()
+    max_bot = _max_bot(modalita_sala)
+    if num_bot > max_bot:
+        raise ControllerBotExcessException(max_bot)
+
+    if seme is None:
+        seme = random.getrandbits(63)
+    rng = random.Random(seme)
 
     _log_safe("[GAME] crea_partita_standard: tabellone creato.", "debug", logger=_logger_game)
-    tabellone = crea_tabellone_standard()
+    tabellone = crea_tabellone_standard(rng=rng)
 
     _log_safe("[GAME] crea_partita_standard: giocatore umano '%s' creato, cartelle=%d.", "debug", nome_giocatore_umano, num_cartelle_umano, logger=_logger_game)
     giocatore_umano = crea_giocatore_umano(
         nome=nome_giocatore_umano,
         num_cartelle=num_cartelle_umano,
         id_giocatore=1,
+        rng=rng,
     )
 
     num_bot_effettivi = max(1, num_bot)
     _log_safe("[GAME] crea_partita_standard: %d bot automatici creati.", "debug", num_bot_effettivi, logger=_logger_game)
-    lista_bot = crea_giocatori_automatici(num_bot_effettivi, id_iniziale=2)
+    lista_bot = crea_giocatori_automatici(
+        num_bot_effettivi, id_iniziale=2, rng=rng, modalita_sala=modalita_sala
+    )
 
     tutti_i_giocatori = [giocatore_umano] + lista_bot
     _log_safe("[GAME] crea_partita_standard: %d giocatori totali.", "debug", len(tutti_i_giocatori), logger=_logger_game)
 
     _log_safe("[GAME] crea_partita_standard: inizializzazione Partita.", "debug", logger=_logger_game)
-    partita = Partita(tabellone, tutti_i_giocatori)
+    partita = Partita(tabellone, tutti_i_giocatori, modalita_sala=modalita_sala)
+    _contesti_partita[partita] = ControllerPartita()
+    partita.seme = seme
+    partita.configurazione = {
+        "nome_giocatore_umano": nome_giocatore_umano,
+        "num_cartelle_umano": num_cartelle_umano,
+        "num_bot": num_bot,
+        "modalita_sala": modalita_sala,
+    }
 
     if not hasattr(partita, 'tabellone') or partita.tabellone is None:
         raise RuntimeError("Errore critico: tabellone non inizializzato nella partita")
@@ -329,15 +432,37 @@ def crea_partita_standard(
 
     _log_safe("[GAME] crea_partita_standard: partita creata con successo.", "debug", logger=_logger_game)
     _log_safe(
-        "[GAME] Partita creata — giocatore='%s', cartelle=%d, bot=%d, tot_giocatori=%d",
+        "[GAME] Partita creata — giocatore='%s', cartelle=%d, bot=%d, tot_giocatori=%d, seme=%d",
         "info", nome_giocatore_umano, num_cartelle_umano, num_bot_effettivi,
-        len(tutti_i_giocatori),
+        len(tutti_i_giocatori), seme,
         logger=_logger_game
     )
 
     return partita
 
 
+def ricrea_partita(seme: int, configurazione: Dict[str, Any]) -> Partita:
+    """
+    Ricrea una partita identica a quella creata da crea_partita_standard()
+    con lo stesso seme e la stessa configurazione: stesse cartelle per ogni
+    giocatore e stessa sequenza di estrazioni.
+
+    Parametri:
+    - seme: int, valore di partita.seme della partita originale.
+    - configurazione: dict, valore di partita.configurazione
+      (chiavi: nome_giocatore_umano, num_cartelle_umano, num_bot, modalita_sala).
+
+    Raises:
+    - ValueError: Se la configurazione contiene chiavi non riconosciute.
+    - Le stesse eccezioni di crea_partita_standard().
+    """
+    chiavi_ammesse = {"nome_giocatore_umano", "num_cartelle_umano", "num_bot", "modalita_sala"}
+    chiavi_sconosciute = set(configurazione) - chiavi_ammesse
+    if chiavi_sconosciute:
+        raise ValueError(f"Chiavi di configurazione non riconosciute: {sorted(chiavi_sconosciute)}")
+    return crea_partita_standard(seme=seme, **configurazione)
+
+
 # =========================
 # Sezione 2: Operazioni di alto livello sulla partita
 # =========================
@@ -406,10 +531,10 @@ def esegui_turno_sicuro(partita: Partita) -> Optional[Dict[str, Any]]:
         _log_safe(f"[GAME] esegui_turno_sicuro: stato '{stato_attuale}' non in corso.", "warning", logger=_logger_game)
         return None
 
-    global _turno_corrente
+    contesto = controller_partita(partita)
     try:
         risultato_turno = partita.esegui_turno()
-        _turno_corrente += 1
+        contesto.turno_corrente += 1
         premi_totali = _conta_premi_assegnati(partita)
 
         if not isinstance(risultato_turno, dict):
@@ -426,9 +551,9 @@ def esegui_turno_sicuro(partita: Partita) -> Optional[Dict[str, Any]]:
 
         _log_safe(
             "[GAME] Turno #%d — estratto: %d, avanzamento: %.1f%%",
-            "debug", _turno_corrente,
+            "debug", contesto.turno_corrente,
             risultato_turno["numero_estratto"],
-            ((_turno_corrente / 90) * 100),
+            ((contesto.turno_corrente / 90) * 100),
             logger=_logger_game
         )
         _log_safe(
@@ -471,18 +596,18 @@ def esegui_turno_sicuro(partita: Partita) -> Optional[Dict[str, Any]]:
         if risultato_turno.get("tombola_rilevata"):
             _log_safe(
                 "[GAME] Partita terminata per TOMBOLA al turno #%d",
-                "info", _turno_corrente, logger=_logger_game
+                "info", contesto.turno_corrente, logger=_logger_game
             )
             _log_game_summary(partita)
 
         elif risultato_turno.get("partita_terminata"):
             _log_safe(
                 "[GAME] Partita terminata per NUMERI ESAURITI al turno #%d",
-                "info", _turno_corrente, logger=_logger_game
+                "info", contesto.turno_corrente, logger=_logger_game
             )
             _log_safe(
                 "[ERR] Numeri esauriti al turno #%d",
-                "warning", _turno_corrente, logger=_logger_errors
+                "warning", contesto.turno_corrente, logger=_logger_errors
             )
             _log_game_summary(partita)
 
@@ -490,22 +615,22 @@ def esegui_turno_sicuro(partita: Partita) -> Optional[Dict[str, Any]]:
 
     except PartitaNonInCorsoException as exc:
         _log_safe(f"[GAME] esegui_turno_sicuro: turno fallito, partita non in corso. tipo='{type(exc).__name__}'.", "warning", logger=_logger_game)
-        _log_safe("[ERR] Eccezione turno #%d: %s — tipo: %s", "warning", _turno_corrente, str(exc), type(exc).__name__, logger=_logger_errors)
+        _log_safe("[ERR] Eccezione turno #%d: %s — tipo: %s", "warning", contesto.turno_corrente, str(exc), type(exc).__name__, logger=_logger_errors)
         return None
 
     except PartitaNumeriEsauritiException as exc:
         _log_safe(f"[GAME] esegui_turno_sicuro: numeri esauriti. tipo='{type(exc).__name__}'.", "warning", logger=_logger_game)
-        _log_safe("[ERR] Numeri esauriti al turno #%d — %s", "warning", _turno_corrente, str(exc), logger=_logger_errors)
+        _log_safe("[ERR] Numeri esauriti al turno #%d — %s", "warning", contesto.turno_corrente, str(exc), logger=_logger_errors)
         return None
 
     except PartitaException as exc:
         _log_safe(f"[GAME] esegui_turno_sicuro: errore partita durante turno. tipo='{type(exc).__name__}'.", "warning", logger=_logger_game)
-        _log_safe("[ERR] Eccezione turno #%d: %s — tipo: %s", "warning", _turno_corrente, str(exc), type(exc).__name__, logger=_logger_errors)
+        _log_safe("[ERR] Eccezione turno #%d: %s — tipo: %s", "warning", contesto.turno_corrente, str(exc), type(exc).__name__, logger=_logger_errors)
         return None
 
     except Exception as exc:
         _log_safe(f"[ERR] esegui_turno_sicuro: eccezione imprevista. tipo='{type(exc).__name__}'.", "error", logger=_logger_errors)
-        _log_safe("[ERR] Eccezione imprevista turno #%d: %s — tipo: %s", "warning", _turno_corrente, str(exc), type(exc).__name__, logger=_logger_errors)
+        _log_safe("[ERR] Eccezione imprevista turno #%d: %s — tipo: %s", "warning", contesto.turno_corrente, str(exc), type(exc).__name__, logger=_logger_errors)
         raise
 
 
@@ -583,7 +708,7 @@ def esegui_fase_verifica_sicura(partita: Partita) -> Optional[Dict[str, Any]]:
         _log_safe(f"[GAME] esegui_fase_verifica_sicura: stato '{stato_attuale}' non in corso.", "warning", logger=_logger_game)
         return None
 
-    global _turno_corrente
+    contesto = controller_partita(partita)
     try:
         risultato = partita.esegui_fase_verifica()
 
@@ -591,12 +716,12 @@ def esegui_fase_verifica_sicura(partita: Partita) -> Optional[Dict[str, Any]]:
             _log_safe("[SYS] esegui_fase_verifica_sicura: risultato non valido (non dict).", "warning", logger=_logger_system)
             return None
 
-        _turno_corrente += 1
+        contesto.turno_corrente += 1
         premi_totali = _conta_premi_assegnati(partita)
 
         _log_safe(
             "[GAME] Turno #%d completato — premi_sessione=%d",
-            "debug", _turno_corrente, premi_totali,
+            "debug", contesto.turno_corrente, premi_totali,
             logger=_logger_game
         )
 
@@ -632,13 +757,13 @@ def esegui_fase_verifica_sicura(partita: Partita) -> Optional[Dict[str, Any]]:
         if risultato.get("tombola_rilevata"):
             _log_safe(
                 "[GAME] Partita terminata per TOMBOLA al turno #%d",
-                "info", _turno_corrente, logger=_logger_game
+                "info", contesto.turno_corrente, logger=_logger_game
             )
             _log_game_summary(partita)
         elif risultato.get("partita_terminata"):
             _log_safe(
                 "[GAME] Partita terminata per NUMERI ESAURITI al turno #%d",
-                "info", _turno_corrente, logger=_logger_game
+                "info", contesto.turno_corrente, logger=_logger_game
             )
             _log_game_summary(partita)
 
@@ -696,6 +821,26 @@ def ottieni_stato_sintetico(partita: Partita) -> Dict[str, Any]:
     return stato_completo
 
 
+def ottieni_stato_riepilogo(partita: Partita) -> Dict[str, Any]:
+    """
+    Ritorna il riepilogo a costo costante della partita (Partita.get_stato_riepilogo()),
+    da usare per l'interrogazione frequente dello stato.
+
+    Il campo "versione" permette di saltare la rilettura della vista
+    sintetica (ottieni_stato_sintetico()) quando lo stato non è cambiato.
+
+    Raises:
+    - ValueError: parametro non-Partita o errore interno del riepilogo
+    """
+    if not isinstance(partita, Partita):
+        raise ValueError("ottieni_stato_riepilogo: parametro deve essere Partita, ricevuto: " + str(type(partita)))
+
+    try:
+        return partita.get_stato_riepilogo()
+    except Exception as exc:
+        raise ValueError(f"Errore interno Partita.get_stato_riepilogo(): {exc}") from exc
+
+
 def ha_partita_tombola(partita: Partita) -> bool:
     """
     Verifica se almeno un giocatore della partita ha completato una tombola.
@@ -732,8 +877,6 @@ def partita_terminata(partita: Partita) -> bool:
     Raises:
     - ValueError: parametro non-Partita o stato invalido
     """
-    global _partita_terminata_logged
-
     if not isinstance(partita, Partita):
         raise ValueError(
             f"partita_terminata: parametro deve essere Partita, "
@@ -757,9 +900,10 @@ def partita_terminata(partita: Partita) -> bool:
     is_terminata = partita.is_terminata()
 
     if is_terminata:
-        if not _partita_terminata_logged:
+        contesto = controller_partita(partita)
+        if not contesto.terminazione_registrata:
             _log_safe("Partita terminata.", "info")
-            _partita_terminata_logged = True
+            contesto.terminazione_registrata = True
     else:
         _log_safe("[GAME] partita_terminata: partita in corso, continua il loop.", "debug", logger=_logger_game)
 
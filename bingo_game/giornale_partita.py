@@ -0,0 +1,439 @@
+"""
+CLASSE PER IL GIORNALE STRUTTURATO DELLE PARTITE
+Modulo: bingo_game.giornale_partita
+
+Tombola / Bingo – Giornale binario append-only degli eventi di partita
+=====================================================================
+
+OVERVIEW DEL MODULO
+-------------------
+
+Questo modulo permette di:
+- registrare gli eventi di una o più partite (cartelle distribuite da un
+  pool, estrazioni, segnazioni, reclami dei bot, premi assegnati, fasi del
+  turno, fine partita) in un file binario
+  append-only (GiornalePartita), collegato a Partita con
+  Partita.collega_giornale();
+- rileggere il file in streaming (leggi_giornale, partite_dal_giornale) senza
+  caricarlo in memoria, anche con milioni di partite.
+
+Il giornale scrive in un buffer in memoria e lo riversa sul file a blocchi:
+il costo per turno è la codifica di pochi record a lunghezza fissa.
+
+FORMATO DEL FILE
+----------------
+
+- Intestazione di 8 byte (little endian): magic b"TSGP", versione (1 byte),
+  3 byte riservati. Scritta solo quando il file è vuoto: più sessioni
+  accodano le proprie partite allo stesso file, proseguendo la numerazione
+  degli id partita dall'ultimo id presente.
+- Record: tipo (1 byte), lunghezza del contenuto (1 byte), contenuto.
+  Il contenuto di ogni tipo noto ha un formato struct fisso (vedi CAMPI_RECORD);
+  un lettore salta i tipi che non conosce grazie alla lunghezza.
+- Segnalibro: ogni scarico del buffer sul file termina con un record di
+  tipo RECORD_SEGNALIBRO (magic b"TSGS", posizione del segnalibro nel file,
+  prossimo id partita). I lettori lo saltano come un tipo sconosciuto; alla
+  riapertura in scrittura basta cercare all'indietro l'ultimo segnalibro e
+  rileggere i record che lo seguono (al più un buffer), invece di
+  scansionare tutto il file.
+- Un record finale incompleto (es. processo interrotto durante la scrittura)
+  viene ignorato dal lettore e troncato alla successiva apertura in scrittura,
+  così i record accodati restano allineati.
+
+Premi codificati come indice in PREMI (bingo_game.premi, "ambo" = 0 ...
+"tombola" = 4), fasi come indice in FASI (bingo_game.formato_binario);
+riga -1 = nessuna riga (tombola); id giocatore -1 = id assente; seme -1 =
+seme assente (i semi registrabili vanno da 0 a 2**63 - 1, il range di
+simulation.seme_partita()).
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from bingo_game.exceptions.giornale_partita_exceptions import (
+    GiornalePartitaFormatoException,
+    GiornalePartitaSemeException,
+)
+from bingo_game.formato_binario import (
+    CODICE_FASE,
+    DIMENSIONE_INTESTAZIONE,
+    FASI,
+    codifica_intestazione,
+    meno_uno_se_assente,
+    verifica_intestazione,
+)
+from bingo_game.premi import CODICE_PREMIO, PREMI
+
+if TYPE_CHECKING:
+    from bingo_game.partita import Partita
+
+
+_MAGIC = b"TSGP"
+_VERSIONE = 1
+
+# Tipi di record
+RECORD_INIZIO_PARTITA = 1
+RECORD_ESTRAZIONE = 2
+RECORD_SEGNAZIONI = 3
+RECORD_RECLAMO = 4
+RECORD_PREMIO = 5
+RECORD_FASE = 6
+RECORD_FINE_PARTITA = 7
+RECORD_CARTELLA_POOL = 8
+RECORD_SEGNALIBRO = 9
+
+# Contenuto di ogni tipo di record: nome, formato struct e nomi dei campi.
+_FORMATI: Dict[int, struct.Struct] = {
+    RECORD_INIZIO_PARTITA: struct.Struct("<QqIB"),
+    RECORD_ESTRAZIONE: struct.Struct("<BB"),
+    RECORD_SEGNAZIONI: struct.Struct("<BI"),
+    RECORD_RECLAMO: struct.Struct("<iHBbB"),
+    RECORD_PREMIO: struct.Struct("<iHBb"),
+    RECORD_FASE: struct.Struct("<BB"),
+    RECORD_FINE_PARTITA: struct.Struct("<BB"),
+    RECORD_CARTELLA_POOL: struct.Struct("<iHQ"),
+}
+NOMI_RECORD: Dict[int, str] = {
+    RECORD_INIZIO_PARTITA: "inizio_partita",
+    RECORD_ESTRAZIONE: "estrazione",
+    RECORD_SEGNAZIONI: "segnazioni",
+    RECORD_RECLAMO: "reclamo",
+    RECORD_PREMIO: "premio",
+    RECORD_FASE: "fase",
+    RECORD_FINE_PARTITA: "fine_partita",
+    RECORD_CARTELLA_POOL: "cartella_pool",
+}
+CAMPI_RECORD: Dict[str, tuple[str, ...]] = {
+    "inizio_partita": ("id_partita", "seme", "numero_giocatori", "modalita_sala"),
+    "estrazione": ("turno", "numero"),
+    "segnazioni": ("numero", "cartelle_segnate"),
+    "reclamo": ("id_giocatore", "cartella", "premio", "riga", "successo"),
+    "premio": ("id_giocatore", "cartella", "premio", "riga"),
+    "fase": ("turno", "fase"),
+    "fine_partita": ("turni", "tombola"),
+    "cartella_pool": ("id_giocatore", "cartella", "indice_pool"),
+}
+
+# Segnalibro: magic, posizione del record nel file, prossimo id partita. Non è
+# in _FORMATI, così leggi_giornale() lo salta come un tipo sconosciuto.
+_MAGIC_SEGNALIBRO = b"TSGS"
+_SEGNALIBRO = struct.Struct("<4sQQ")
+_PREFISSO_SEGNALIBRO = bytes((RECORD_SEGNALIBRO, _SEGNALIBRO.size)) + _MAGIC_SEGNALIBRO
+_DIMENSIONE_RECORD_SEGNALIBRO = 2 + _SEGNALIBRO.size
+
+# Dimensione del buffer oltre la quale i record vengono riversati sul file.
+_DIMENSIONE_BUFFER: int = 64 * 1024
+# Dimensione dei blocchi letti da leggi_giornale().
+_DIMENSIONE_BLOCCO_LETTURA: int = 1 << 20
+# Prima finestra della ricerca all'indietro del segnalibro (raddoppia a ogni passo).
+_FINESTRA_SEGNALIBRO: int = 2 * _DIMENSIONE_BUFFER
+# Seme massimo registrabile nel campo con segno a 64 bit di inizio_partita.
+SEME_MASSIMO: int = (1 << 63) - 1
+
+
+class RecordGiornale(NamedTuple):
+    """Record letto dal giornale: nome del tipo e valori dei campi (vedi CAMPI_RECORD)."""
+
+    tipo: str
+    valori: tuple
+
+    def come_dizionario(self) -> Dict[str, Any]:
+        """Ritorna i valori come dizionario campo -> valore."""
+        return dict(zip(CAMPI_RECORD[self.tipo], self.valori))
+
+
+#definizione della classe GiornalePartita
+class GiornalePartita:
+    """
+    Scrittore append-only del giornale binario delle partite.
+
+    Un'istanza può registrare più partite in sequenza sullo stesso file;
+    ogni partita inizia con un record inizio_partita.
+
+    Uso tipico:
+        with GiornalePartita("partite.tsgp") as giornale:
+            partita.collega_giornale(giornale)
+            ... turni ...
+    """
+
+    def __init__(self, percorso: str, dimensione_buffer: int = _DIMENSIONE_BUFFER) -> None:
+        """
+        Parametri:
+        - percorso: file del giornale; se esiste, le nuove partite vengono accodate.
+        - dimensione_buffer: byte accumulati in memoria prima di scrivere sul file.
+
+        Se il file esiste ne viene letta solo la coda, dall'ultimo segnalibro
+        in poi: un record finale incompleto viene troncato e gli id partita
+        proseguono dall'ultimo registrato. Un file senza segnalibri (scritto
+        da una versione precedente) viene scansionato per intero una volta.
+
+        Eccezioni:
+        - GiornalePartitaFormatoException: se il file esiste ma non è un giornale.
+        """
+        self._file: BinaryIO = open(percorso, "a+b")
+        self._prossimo_id_partita = 0
+        self._fine_file = self._file.seek(0, 2)
+        if self._fine_file == 0:
+            self._file.write(codifica_intestazione(_MAGIC, _VERSIONE))
+            self._fine_file = DIMENSIONE_INTESTAZIONE
+        else:
+            try:
+                self._riprendi_file()
+            except GiornalePartitaFormatoException:
+                self._file.close()
+                raise
+        self._buffer = bytearray()
+        self._dimensione_buffer = dimensione_buffer
+
+    #metodo per allinearsi a un giornale esistente prima di accodare nuove partite
+    def _riprendi_file(self) -> None:
+        """
+        Verifica l'intestazione, riparte dall'ultimo segnalibro (o
+        dall'intestazione se non ce ne sono), tronca un eventuale record finale
+        incompleto e imposta il prossimo id partita dopo l'ultimo presente nel
+        file.
+        """
+        self._file.seek(0)
+        _verifica_intestazione(self._file.read(DIMENSIONE_INTESTAZIONE))
+        fine_valida = DIMENSIONE_INTESTAZIONE
+        segnalibro = _cerca_segnalibro(self._file, self._fine_file)
+        if segnalibro is not None:
+            posizione, self._prossimo_id_partita = segnalibro
+            fine_valida = posizione + _DIMENSIONE_RECORD_SEGNALIBRO
+        self._file.seek(fine_valida)
+        for tipo, valori, fine_valida in _scorri_record(self._file, _DIMENSIONE_BLOCCO_LETTURA):
+            if tipo == RECORD_INIZIO_PARTITA:
+                self._prossimo_id_partita = valori[0] + 1
+        if self._fine_file != fine_valida:
+            self._file.truncate(fine_valida)
+            self._fine_file = self._file.seek(0, 2)
+
+
+    """sezione: registrazione degli eventi"""
+
+    def _scrivi(self, tipo: int, *valori: Any) -> None:
+        formato = _FORMATI[tipo]
+        self._buffer += bytes((tipo, formato.size))
+        self._buffer += formato.pack(*valori)
+        if len(self._buffer) >= self._dimensione_buffer:
+            self.scarica()
+
+    #metodo per registrare l'inizio di una partita
+    def inizia_partita(self, partita: Partita, id_partita: Optional[int] = None) -> int:
+        """
+        Registra l'inizio di una partita e ritorna il suo id nel giornale.
+        Per ogni cartella distribuita da un pool (cartella.indice_pool) segue
+        un record cartella_pool, così si sa esattamente quale cartella è
+        stata venduta.
+
+        Se id_partita è None viene usato un contatore progressivo, che su un
+        file esistente riparte dopo l'ultimo id registrato.
+
+        Eccezioni:
+        - GiornalePartitaSemeException: seme della partita fuori da 0 - SEME_MASSIMO.
+        """
+        seme = partita.seme if partita.seme is not None else -1
+        if partita.seme is not None and not 0 <= seme <= SEME_MASSIMO:
+            raise GiornalePartitaSemeException(
+                f"Seme non registrabile nel giornale: {seme} (ammessi 0 - {SEME_MASSIMO})."
+            )
+        if id_partita is None:
+            id_partita = self._prossimo_id_partita
+        self._prossimo_id_partita = id_partita + 1
+        self._scrivi(
+            RECORD_INIZIO_PARTITA,
+            id_partita, seme, partita.get_numero_giocatori(), int(partita.modalita_sala),
+        )
+        for giocatore in partita.get_giocatori():
+            id_giocatore = meno_uno_se_assente(giocatore.get_id_giocatore())
+            for cartella in giocatore.get_cartelle():
+                if cartella.indice_pool is not None:
+                    self._scrivi(RECORD_CARTELLA_POOL, id_giocatore, cartella.indice, cartella.indice_pool)
+        return id_partita
+
+    #metodo per registrare l'estrazione di un numero (fase 1 del turno)
+    def registra_estrazione(self, partita: Partita, numero: int) -> None:
+        """Registra numero estratto, cartelle segnate e passaggio alla fase di reclamo."""
+        turno = partita.tabellone.get_conteggio_estratti()
+        self._scrivi(RECORD_ESTRAZIONE, turno, numero)
+        self._scrivi(RECORD_SEGNAZIONI, numero, len(partita.cartelle_modificate_turno))
+        self._scrivi(RECORD_FASE, turno, CODICE_FASE["attesa_reclami"])
+
+    #metodo per registrare l'esito della verifica (fase 2 del turno)
+    def registra_verifica(
+        self,
+        partita: Partita,
+        premi_nuovi: List[Dict[str, Any]],
+        reclami_bot: List[Dict[str, Any]],
+    ) -> None:
+        """Registra reclami dei bot, premi assegnati, nuova fase ed eventuale fine partita."""
+        turno = partita.tabellone.get_conteggio_estratti()
+        for esito in reclami_bot:
+            reclamo = esito["reclamo"]
+            self._scrivi(
+                RECORD_RECLAMO,
+                meno_uno_se_assente(esito.get("id_giocatore")),
+                reclamo.indice_cartella,
+                CODICE_PREMIO[reclamo.tipo],
+                meno_uno_se_assente(reclamo.indice_riga),
+                int(esito["successo"]),
+            )
+        for evento in premi_nuovi:
+            self._scrivi(
+                RECORD_PREMIO,
+                meno_uno_se_assente(evento.get("id_giocatore")),
+                evento["cartella"],
+                CODICE_PREMIO[evento["premio"]],
+                meno_uno_se_assente(evento.get("riga")),
+            )
+        if partita.is_terminata():
+            self._scrivi(RECORD_FINE_PARTITA, turno, int(partita.has_tombola()))
+        else:
+            self._scrivi(RECORD_FASE, turno, CODICE_FASE["attesa_estrazione"])
+
+
+    """sezione: gestione del file"""
+
+    def scarica(self) -> None:
+        """Riversa sul file i record ancora nel buffer, chiusi da un segnalibro."""
+        if self._buffer:
+            posizione = self._fine_file + len(self._buffer)
+            self._buffer += bytes((RECORD_SEGNALIBRO, _SEGNALIBRO.size))
+            self._buffer += _SEGNALIBRO.pack(_MAGIC_SEGNALIBRO, posizione, self._prossimo_id_partita)
+            self._file.write(self._buffer)
+            self._fine_file += len(self._buffer)
+            self._buffer.clear()
+        self._file.flush()
+
+    def chiudi(self) -> None:
+        """Scarica il buffer e chiude il file."""
+        if self._file.closed:
+            return
+        self.scarica()
+        self._file.close()
+
+    def __enter__(self) -> GiornalePartita:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.chiudi()
+
+
+"""sezione: lettura in streaming"""
+
+def _verifica_intestazione(intestazione: bytes) -> None:
+    verifica_intestazione(
+        intestazione, _MAGIC, _VERSIONE, "giornale delle partite", GiornalePartitaFormatoException
+    )
+
+
+#funzione che cerca all'indietro l'ultimo segnalibro completo del file
+def _cerca_segnalibro(file: BinaryIO, fine_file: int) -> Optional[Tuple[int, int]]:
+    """
+    Ritorna (posizione, prossimo id partita) dell'ultimo segnalibro, oppure
+    None se il file non ne contiene. La ricerca legge finestre sempre più
+    ampie a partire dalla fine, quindi costa quanto la distanza del
+    segnalibro dalla fine del file.
+
+    Un segnalibro è valido solo se la posizione che contiene coincide con
+    quella in cui si trova: byte uguali al prefisso dentro un altro record
+    non vengono scambiati per un segnalibro.
+    """
+    fine = fine_file
+    finestra = _FINESTRA_SEGNALIBRO
+    while fine > DIMENSIONE_INTESTAZIONE:
+        inizio = max(DIMENSIONE_INTESTAZIONE, fine - finestra)
+        file.seek(inizio)
+        # La finestra sconfina di un segnalibro oltre fine, per non perdere
+        # quello a cavallo con la finestra precedente.
+        dati = file.read(min(fine + _DIMENSIONE_RECORD_SEGNALIBRO, fine_file) - inizio)
+        candidato = len(dati)
+        while True:
+            candidato = dati.rfind(_PREFISSO_SEGNALIBRO, 0, candidato)
+            if candidato < 0:
+                break
+            if candidato + _DIMENSIONE_RECORD_SEGNALIBRO <= len(dati):
+                _magic, posizione, prossimo_id = _SEGNALIBRO.unpack_from(dati, candidato + 2)
+                if posizione == inizio + candidato:
+                    return posizione, prossimo_id
+        fine = inizio
+        finestra *= 2
+    return None
+
+
+#funzione che scorre i record completi a partire dalla posizione corrente del file
+def _scorri_record(
+    file: BinaryIO, dimensione_blocco: int
+) -> Iterator[Tuple[int, Optional[tuple], int]]:
+    """
+    Ritorna (tipo, valori, fine) per ogni record completo: valori è None per i
+    tipi sconosciuti, fine è la posizione nel file subito dopo il record.
+    """
+    inizio_dati = file.tell()
+    resto = b""
+    while True:
+        blocco = file.read(dimensione_blocco)
+        if not blocco:
+            return
+        dati = resto + blocco if resto else blocco
+        posizione = 0
+        fine_dati = len(dati)
+        while posizione + 2 <= fine_dati:
+            tipo = dati[posizione]
+            lunghezza = dati[posizione + 1]
+            fine_record = posizione + 2 + lunghezza
+            if fine_record > fine_dati:
+                break
+            formato = _FORMATI.get(tipo)
+            valori = None
+            if formato is not None:
+                if formato.size != lunghezza:
+                    raise GiornalePartitaFormatoException(
+                        f"Record '{NOMI_RECORD[tipo]}' di {lunghezza} byte, attesi {formato.size}."
+                    )
+                valori = formato.unpack_from(dati, posizione + 2)
+            yield tipo, valori, inizio_dati + fine_record
+            posizione = fine_record
+        resto = dati[posizione:]
+        inizio_dati += posizione
+
+
+#funzione che legge i record del giornale in streaming
+def leggi_giornale(
+    percorso: str,
+    dimensione_blocco: int = _DIMENSIONE_BLOCCO_LETTURA,
+) -> Iterator[RecordGiornale]:
+    """
+    Ritorna un iteratore sui record del giornale, letti a blocchi.
+
+    In memoria resta solo il blocco corrente: il file può contenere un numero
+    arbitrario di partite. I tipi di record sconosciuti vengono saltati e un
+    record finale incompleto viene ignorato.
+
+    Eccezioni:
+    - GiornalePartitaFormatoException: intestazione non valida o record di tipo
+      noto con lunghezza diversa da quella attesa.
+    """
+    with open(percorso, "rb") as file:
+        _verifica_intestazione(file.read(DIMENSIONE_INTESTAZIONE))
+        for tipo, valori, _fine in _scorri_record(file, dimensione_blocco):
+            if valori is not None:
+                yield RecordGiornale(NOMI_RECORD[tipo], valori)
+
+
+#funzione che raggruppa i record del giornale per partita
+def partite_dal_giornale(percorso: str) -> Iterator[List[RecordGiornale]]:
+    """
+    Ritorna un iteratore sulle partite del giornale: per ciascuna, la lista dei
+    suoi record a partire da inizio_partita. In memoria resta una partita alla volta.
+    """
+    correnti: List[RecordGiornale] = []
+    for record in leggi_giornale(percorso):
+        if record.tipo == "inizio_partita" and correnti:
+            yield correnti
+            correnti = []
+        correnti.append(record)
+    if correnti:
+        yield correnti
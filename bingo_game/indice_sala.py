@@ -0,0 +1,296 @@
+"""
+CLASSE PER L'INDICE DEI NUMERI IN MODALITÀ SALA
+Modulo: bingo_game.indice_sala
+
+Tombola / Bingo – Segnazione e premi a blocchi per decine di migliaia di cartelle
+=================================================================================
+
+OVERVIEW DEL MODULO
+-------------------
+
+Questo modulo definisce IndiceSala, l'indice invertito usato da Partita in
+modalità sala. Ogni cartella indicizzata occupa uno slot; i suoi contatori di
+riga stanno in un unico bytearray (slot * 3 + riga), e per ogni numero 1-90
+l'indice tiene liste parallele precalcolate:
+- gli slot di riga che contengono il numero;
+- i set numeri_segnati delle cartelle, segnati in blocco con
+  map(set.add, ...) senza una chiamata Python per cartella;
+- le cartelle stesse, che diventano cartelle_modificate_turno.
+
+Per ogni estrazione segna() fa quindi un solo ciclo stretto su interi
+(incremento del contatore di riga) e conserva solo le righe che hanno
+raggiunto una soglia ancora utile: la più bassa soglia di premio di riga
+aperto, o la lunghezza della riga (possibile tombola). Solo queste diventano
+notifiche ai giocatori: per chi espone una coda (_coda_premi_raggiunti(), es.
+GiocatoreAutomatico) la notifica è il solo slot di riga aggiunto alla coda, e
+premio e cartella vengono letti dai contatori quando il giocatore la consegna
+(consegna_premi(), alla sua prossima valutazione); agli altri viene chiamato
+subito _notifica_premio_raggiunto().
+
+L'elenco completo dei premi raggiunti con l'ultimo numero e le posizioni
+(giocatore, cartella, riga, colonna) di un numero vengono costruiti solo su
+richiesta (premi_raggiunti(), posizioni()) leggendo i contatori.
+
+NOTE DI UTILIZZO
+----------------
+
+- Le cartelle indicizzate vanno segnate solo tramite segna(): l'indice si
+  registra come osservatore delle cartelle e, se una cartella viene segnata o
+  azzerata da fuori (segna_numero(), reset_cartella()), diventa obsoleto e
+  Partita lo ricostruisce alla prima estrazione successiva.
+- Le cartelle con una propria segna_numero_presente() (es. CartellaCompatta)
+  vengono segnate chiamando quel metodo invece che in blocco sul set.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from itertools import repeat
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+from bingo_game.cartella import Cartella
+from bingo_game.premi import SOGLIE_PREMI_RIGA
+from bingo_game.tracciatore_premi import PREMIO_PER_SOGLIA
+
+if TYPE_CHECKING:
+    from bingo_game.players.giocatore_base import GiocatoreBase
+
+
+# Soglia oltre ogni premio di riga: nessun premio di riga ancora aperto.
+_NESSUNA_SOGLIA: int = 6
+
+
+#definizione della classe IndiceSala
+class IndiceSala:
+    """
+    Indice invertito numero -> slot di riga, con contatori in un bytearray.
+
+    Uso tipico (Partita in modalità sala):
+        indice = IndiceSala()
+        for giocatore, cartella in ...:
+            indice.aggiungi_cartella(giocatore, cartella)
+        tombola = indice.segna(numero, premi_tipo_chiusi)
+    """
+
+    def __init__(self) -> None:
+        self._proprietari: List[Any] = []
+        self._cartelle: List[Cartella] = []
+        self._slot_per_cartella: Dict[int, int] = {}
+        # Per slot di riga: coda del proprietario in cui accodare lo slot (o None).
+        self._code_riga: List[Optional[List[int]]] = []
+        # Per slot di riga (slot * 3 + riga): numeri segnati e numeri presenti.
+        self._segnati_riga = bytearray()
+        self._lunghezze_riga = bytearray()
+        # Per slot di cartella: numeri presenti (per la tombola).
+        self._quantita = bytearray()
+        self._lunghezza_minima: int = _NESSUNA_SOGLIA
+        self._righe_per_numero: List[List[int]] = [[] for _ in range(91)]
+        self._insiemi_per_numero: List[List[Set[int]]] = [[] for _ in range(91)]
+        self._segna_per_numero: List[List[Any]] = [[] for _ in range(91)]
+        self._cartelle_per_numero: List[List[Cartella]] = [[] for _ in range(91)]
+        self._propagati = bytearray(91)
+        self.obsoleto: bool = False
+
+
+    """sezione: costruzione"""
+
+    #metodo per aggiungere una cartella all'indice
+    def aggiungi_cartella(self, proprietario: Any, cartella: Cartella) -> None:
+        """
+        Assegna uno slot alla cartella, ne registra i numeri nelle liste per
+        numero e allinea i contatori ai numeri già segnati (es. partita
+        ripristinata da un checkpoint).
+        """
+        slot = len(self._cartelle)
+        self._cartelle.append(cartella)
+        self._proprietari.append(proprietario)
+        self._slot_per_cartella[id(cartella)] = slot
+        coda = proprietario._coda_premi_raggiunti(self)
+        self._code_riga.extend((coda, coda, coda))
+        cartella._osservatori_segnazioni.append(self)
+
+        segnati = cartella.numeri_segnati
+        if type(cartella).segna_numero_presente is Cartella.segna_numero_presente and type(segnati) is set:
+            liste_segnazione, segnazione = self._insiemi_per_numero, segnati
+        else:
+            liste_segnazione, segnazione = self._segna_per_numero, cartella.segna_numero_presente
+        righe_per_numero = self._righe_per_numero
+        cartelle_per_numero = self._cartelle_per_numero
+
+        quantita = 0
+        for indice_riga, riga in enumerate(cartella.cartella):
+            slot_riga = slot * 3 + indice_riga
+            lunghezza = 0
+            conteggio = 0
+            for valore in riga:
+                if valore is None:
+                    continue
+                lunghezza += 1
+                righe_per_numero[valore].append(slot_riga)
+                cartelle_per_numero[valore].append(cartella)
+                liste_segnazione[valore].append(segnazione)
+                if valore in segnati:
+                    conteggio += 1
+            self._segnati_riga.append(conteggio)
+            self._lunghezze_riga.append(lunghezza)
+            if 0 < lunghezza < self._lunghezza_minima:
+                self._lunghezza_minima = lunghezza
+            quantita += lunghezza
+        self._quantita.append(quantita)
+
+    #metodo per staccare l'indice dalle cartelle prima di sostituirlo
+    def scollega(self) -> None:
+        """Toglie l'indice dagli osservatori delle cartelle."""
+        for cartella in self._cartelle:
+            try:
+                cartella._osservatori_segnazioni.remove(self)
+            except ValueError:
+                pass
+
+    #metodo chiamato dalla cartella quando viene segnata o azzerata fuori dall'indice
+    def _notifica_segnazioni_cartella(self, cartella: Cartella) -> None:
+        self.obsoleto = True
+
+
+    """sezione: segnazione"""
+
+    #metodo per segnare un numero estratto su tutte le cartelle che lo contengono
+    def segna(self, numero: int, tipi_chiusi: Set[str]) -> Optional[bool]:
+        """
+        Segna il numero sulle cartelle indicizzate, aggiorna i contatori di
+        riga e notifica ai proprietari i premi raggiunti ancora utili.
+
+        Un premio di riga viene notificato (o accodato, vedi
+        _coda_premi_raggiunti() dei giocatori) se almeno un premio di riga con
+        soglia minore o uguale è ancora aperto (un premio più alto toglie dai
+        candidati del bot quello più basso della stessa riga); la tombola
+        viene sempre notificata.
+
+        Il numero deve essere già validato (1-90) dal chiamante.
+
+        Ritorna:
+        - True / False: se almeno una cartella ha fatto tombola;
+        - None: se il numero era già stato segnato da questo indice.
+        """
+        if self._propagati[numero]:
+            return None
+        self._propagati[numero] = 1
+        for segna_presente in self._segna_per_numero[numero]:
+            segna_presente(numero)
+        deque(map(set.add, self._insiemi_per_numero[numero], repeat(numero)), maxlen=0)
+
+        soglia_riga = min(
+            (soglia for tipo, soglia in SOGLIE_PREMI_RIGA if tipo not in tipi_chiusi),
+            default=_NESSUNA_SOGLIA,
+        )
+        soglia = min(soglia_riga, self._lunghezza_minima)
+
+        segnati_riga = self._segnati_riga
+        raggiunte = []
+        aggiungi = raggiunte.append
+        for slot_riga in self._righe_per_numero[numero]:
+            segnati = segnati_riga[slot_riga] + 1
+            segnati_riga[slot_riga] = segnati
+            if segnati >= soglia:
+                aggiungi(slot_riga)
+
+        tombola = False
+        lunghezze_riga, code_riga = self._lunghezze_riga, self._code_riga
+        for slot_riga in raggiunte:
+            segnati = segnati_riga[slot_riga]
+            coda = code_riga[slot_riga]
+            if coda is not None:
+                coda.append(slot_riga)
+            elif segnati >= soglia_riga:
+                self._notifica_riga(self._proprietari[slot_riga // 3], slot_riga, segnati)
+            if segnati == lunghezze_riga[slot_riga] and self._cartella_completa(slot_riga // 3):
+                tombola = True
+                if coda is None:
+                    slot = slot_riga // 3
+                    self._proprietari[slot]._notifica_premio_raggiunto(self._cartelle[slot], "tombola", None)
+        return tombola
+
+    #metodo che consegna al proprietario i premi delle righe accodate da segna()
+    def consegna_premi(self, coda: List[int], proprietario: Any) -> None:
+        """
+        Notifica al proprietario (_notifica_premio_raggiunto()) il premio
+        attuale di ogni riga nella coda, e la tombola se la cartella è
+        completa, poi svuota la coda. I contatori vengono letti adesso: una
+        riga accodata in più turni riceve solo il premio più recente.
+        """
+        segnati_riga, lunghezze_riga = self._segnati_riga, self._lunghezze_riga
+        for slot_riga in coda:
+            segnati = segnati_riga[slot_riga]
+            self._notifica_riga(proprietario, slot_riga, segnati)
+            slot = slot_riga // 3
+            if segnati == lunghezze_riga[slot_riga] and self._cartella_completa(slot):
+                proprietario._notifica_premio_raggiunto(self._cartelle[slot], "tombola", None)
+        coda.clear()
+
+    def _notifica_riga(self, proprietario: Any, slot_riga: int, segnati: int) -> None:
+        tipo = PREMIO_PER_SOGLIA.get(segnati)
+        if tipo is not None:
+            slot, indice_riga = divmod(slot_riga, 3)
+            proprietario._notifica_premio_raggiunto(self._cartelle[slot], tipo, indice_riga)
+
+    def _cartella_completa(self, slot: int) -> bool:
+        base = slot * 3
+        segnati_riga = self._segnati_riga
+        return segnati_riga[base] + segnati_riga[base + 1] + segnati_riga[base + 2] == self._quantita[slot]
+
+
+    """sezione: viste costruite su richiesta"""
+
+    #metodo che dice se una cartella è indicizzata
+    def contiene(self, cartella: Cartella) -> bool:
+        return id(cartella) in self._slot_per_cartella
+
+    #metodo per ottenere il premio di riga più alto raggiunto da una cartella indicizzata
+    def premio_massimo_riga(self, cartella: Cartella, indice_riga: int) -> Optional[str]:
+        """Come TracciatorePremi.premio_massimo_riga(), letto dal contatore di riga."""
+        return PREMIO_PER_SOGLIA.get(self._segnati_riga[self._slot_per_cartella[id(cartella)] * 3 + indice_riga])
+
+    #metodo per verificare se una cartella indicizzata ha fatto tombola
+    def ha_tombola(self, cartella: Cartella) -> bool:
+        """Come TracciatorePremi.ha_tombola(), letto dai contatori di riga."""
+        return self._cartella_completa(self._slot_per_cartella[id(cartella)])
+
+    #metodo che ritorna le cartelle che contengono il numero
+    def cartelle_con_numero(self, numero: int) -> List[Cartella]:
+        """Copia della lista delle cartelle indicizzate che contengono il numero."""
+        return list(self._cartelle_per_numero[numero])
+
+    #metodo che ritorna i premi raggiunti con un numero appena segnato
+    def premi_raggiunti(self, numero: int) -> List[Tuple[Any, Cartella, str, Optional[int]]]:
+        """
+        Ritorna i premi raggiunti segnando il numero, come tuple (proprietario,
+        cartella, premio, riga) con riga None per la tombola, nell'ordine delle
+        cartelle e delle righe. Legge i contatori correnti: vale per l'ultimo
+        numero segnato, prima della segnazione successiva.
+        """
+        segnati_riga = self._segnati_riga
+        premi = []
+        for slot_riga in self._righe_per_numero[numero]:
+            segnati = segnati_riga[slot_riga]
+            if segnati < 2:
+                continue
+            slot, indice_riga = divmod(slot_riga, 3)
+            proprietario, cartella = self._proprietari[slot], self._cartelle[slot]
+            tipo = PREMIO_PER_SOGLIA.get(segnati)
+            if tipo is not None:
+                premi.append((proprietario, cartella, tipo, indice_riga))
+            if segnati == self._lunghezze_riga[slot_riga] and self._cartella_completa(slot):
+                premi.append((proprietario, cartella, "tombola", None))
+        return premi
+
+    #metodo che ritorna le posizioni di un numero nelle cartelle indicizzate
+    def posizioni(self, numero: int) -> List[Tuple[GiocatoreBase, Cartella, int, int]]:
+        """Ritorna le posizioni (proprietario, cartella, riga, colonna) del numero."""
+        posizioni = []
+        for slot_riga in self._righe_per_numero[numero]:
+            slot, indice_riga = divmod(slot_riga, 3)
+            cartella = self._cartelle[slot]
+            posizioni.append((
+                self._proprietari[slot], cartella, indice_riga, cartella.cartella[indice_riga].index(numero),
+            ))
+        return posizioni
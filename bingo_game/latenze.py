@@ -0,0 +1,169 @@
+"""Strumentazione opzionale delle latenze del ciclo di turno.
+
+Misura la durata di sezioni nominate (span) del ciclo di gioco: estrazione,
+propagazione del numero, valutazione dei bot, verifica premi, costruzione
+degli eventi di turno e render/voce. Ogni span accumula le durate in un
+istogramma logaritmico a memoria fissa, da cui si ricavano p50/p95/p99.
+
+La strumentazione è spenta per impostazione predefinita: inizio() ritorna
+None senza leggere l'orologio e fine() ritorna subito, quindi i punti di
+misura possono restare nel codice di produzione.
+
+Esempio:
+    >>> latenze.attiva()
+    >>> t0 = latenze.inizio()
+    >>> ...
+    >>> latenze.fine(latenze.SPAN_ESTRAZIONE, t0)
+    >>> latenze.rapporto()["estrazione"]["p95_ms"]
+
+Il rapporto viene scritto nel log da GameLogger.shutdown() se la
+strumentazione è attiva, oppure esportato in JSON con esporta_rapporto().
+
+Version:
+    v0.6.0: Prima implementazione
+"""
+from __future__ import annotations
+
+import json
+import math
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+# Span del ciclo di turno
+SPAN_ESTRAZIONE = "estrazione"
+SPAN_PROPAGAZIONE = "propagazione"
+SPAN_VALUTAZIONE_BOT = "valutazione_bot"
+SPAN_VERIFICA_PREMI = "verifica_premi"
+SPAN_EVENTI = "costruzione_eventi"
+SPAN_RENDER = "render_voce"
+
+# Istogramma: 8 sotto-intervalli per ogni potenza di 2 (errore relativo ≤ 12,5%)
+_SOTTO_INTERVALLI = 8
+_BUCKET_LINEARI = 2 * _SOTTO_INTERVALLI
+_NUMERO_BUCKET = _BUCKET_LINEARI + 48 * _SOTTO_INTERVALLI   # fino a ~2^52 ns
+
+_PERCENTILI = (50, 95, 99)
+
+
+def _indice_bucket(valore: int) -> int:
+    """Bucket di una durata in nanosecondi (lineare sotto 16 ns, poi logaritmico)."""
+    if valore < _BUCKET_LINEARI:
+        return max(valore, 0)
+    spostamento = valore.bit_length() - 4
+    indice = _BUCKET_LINEARI + (spostamento - 1) * _SOTTO_INTERVALLI + (valore >> spostamento) - _SOTTO_INTERVALLI
+    return min(indice, _NUMERO_BUCKET - 1)
+
+
+def _limite_superiore_bucket(indice: int) -> int:
+    """Durata massima (esclusa) rappresentata dal bucket."""
+    if indice < _BUCKET_LINEARI:
+        return indice + 1
+    spostamento, sotto = divmod(indice - _BUCKET_LINEARI, _SOTTO_INTERVALLI)
+    return (_SOTTO_INTERVALLI + sotto + 1) << (spostamento + 1)
+
+
+class Istogramma:
+    """Istogramma delle durate di uno span, a memoria fissa.
+
+    registra() è un calcolo di bucket e un incremento; i percentili sono
+    approssimati per eccesso al limite superiore del bucket (e mai oltre
+    il massimo osservato).
+    """
+
+    def __init__(self) -> None:
+        self.conteggi = [0] * _NUMERO_BUCKET
+        self.numero = 0
+        self.totale_ns = 0
+        self.massimo_ns = 0
+
+    def registra(self, durata_ns: int) -> None:
+        self.conteggi[_indice_bucket(durata_ns)] += 1
+        self.numero += 1
+        self.totale_ns += durata_ns
+        if durata_ns > self.massimo_ns:
+            self.massimo_ns = durata_ns
+
+    def percentile(self, percentuale: float) -> int:
+        """Durata in ns sotto la quale cade `percentuale`% delle misure (0 se vuoto)."""
+        if self.numero == 0:
+            return 0
+        soglia = max(1, math.ceil(self.numero * percentuale / 100))
+        cumulato = 0
+        for indice, conteggio in enumerate(self.conteggi):
+            cumulato += conteggio
+            if cumulato >= soglia:
+                return min(_limite_superiore_bucket(indice), self.massimo_ns)
+        return self.massimo_ns
+
+
+_attiva = False
+_istogrammi: Dict[str, Istogramma] = {}
+
+
+def attiva(abilitata: bool = True) -> None:
+    """Accende (o spegne) la misura delle latenze."""
+    global _attiva
+    _attiva = abilitata
+
+
+def is_attiva() -> bool:
+    return _attiva
+
+
+def azzera() -> None:
+    """Elimina tutte le misure raccolte."""
+    _istogrammi.clear()
+
+
+def inizio() -> Optional[int]:
+    """Istante di inizio di uno span in ns, None se la strumentazione è spenta."""
+    if _attiva:
+        return time.perf_counter_ns()
+    return None
+
+
+def fine(nome: str, inizio_ns: Optional[int]) -> None:
+    """Chiude lo span `nome` iniziato a `inizio_ns` (nessun effetto se None)."""
+    if inizio_ns is None:
+        return
+    registra(nome, time.perf_counter_ns() - inizio_ns)
+
+
+def registra(nome: str, durata_ns: int) -> None:
+    """Aggiunge una durata all'istogramma dello span."""
+    istogramma = _istogrammi.get(nome)
+    if istogramma is None:
+        istogramma = _istogrammi[nome] = Istogramma()
+    istogramma.registra(durata_ns)
+
+
+def rapporto() -> Dict[str, Dict[str, float]]:
+    """Per ogni span: numero di misure, media, p50/p95/p99 e massimo in millisecondi."""
+    risultato: Dict[str, Dict[str, float]] = {}
+    for nome, istogramma in sorted(_istogrammi.items()):
+        voce: Dict[str, float] = {
+            "numero": istogramma.numero,
+            "media_ms": istogramma.totale_ns / istogramma.numero / 1e6,
+        }
+        for percentuale in _PERCENTILI:
+            voce[f"p{percentuale}_ms"] = istogramma.percentile(percentuale) / 1e6
+        voce["max_ms"] = istogramma.massimo_ns / 1e6
+        risultato[nome] = voce
+    return risultato
+
+
+def righe_rapporto() -> List[str]:
+    """Rapporto in righe di testo, una per span (lista vuota senza misure)."""
+    return [
+        f"[LAT] {nome:<20} n={voce['numero']:<7d} p50={voce['p50_ms']:.3f}ms "
+        f"p95={voce['p95_ms']:.3f}ms p99={voce['p99_ms']:.3f}ms max={voce['max_ms']:.3f}ms"
+        for nome, voce in rapporto().items()
+    ]
+
+
+def esporta_rapporto(percorso: str | Path) -> None:
+    """Scrive il rapporto in JSON."""
+    with open(percorso, "w", encoding="utf-8") as file:
+        json.dump(rapporto(), file, indent=2)
@@ -1,4 +1,9 @@
 """Modulo di logging centralizzato per Tombola Stark."""
-from bingo_game.logging.game_logger import GameLogger
+from bingo_game.logging.game_logger import (
+    GameLogger,
+    indice_sessioni,
+    leggi_sessione,
+    ricostruisci_indice_sessioni,
+)
 
-__all__ = ["GameLogger"]
+__all__ = ["GameLogger", "indice_sessioni", "leggi_sessione", "ricostruisci_indice_sessioni"]
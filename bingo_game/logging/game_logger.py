@@ -3,16 +3,36 @@
 Fornisce un Singleton GameLogger che scrive su un file di testo cumulativo
 con flush immediato (leggibile in tempo reale) e marcatori di sessione.
 
+In modalità bufferizzata (initialize(bufferizzato=True)) i record passano da
+una coda limitata (QueueHandler) a un thread di scrittura (QueueListener):
+il thread di gioco non attende mai il disco, il file viene scaricato a blocchi
+(per numero di record o per intervallo) e subito dopo ogni ERROR.
+
+Il file ruota per dimensione (predefinito 10 MiB) e, se richiesto, per età;
+i segmenti ruotati possono essere compressi con gzip e oltre un numero
+massimo vengono eliminati. Ogni segmento ha un indice .idx con l'offset in
+byte di ogni marcatore "SESSIONE AVVIATA": indice_sessioni() e
+leggi_sessione() raggiungono una sessione senza scorrere tutto il file.
+
 Version:
     v0.4.0: Introduzione del sistema di logging centralizzato
+    v0.5.0: Pipeline bufferizzata opzionale con QueueHandler/QueueListener
+    v0.6.0: Rotazione con compressione e conservazione, indice delle sessioni
 """
 from __future__ import annotations
 
+import gzip
 import logging
+import logging.handlers
 import os
+import queue
+import shutil
+import time
 from datetime import datetime
 from pathlib import Path
 
+from bingo_game import latenze
+
 
 # Formato riga: QUANDO | QUANTO importante | CHI | COSA
 _LOG_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)-25s | %(message)s"
@@ -22,6 +42,226 @@ _LOG_FILE = _LOG_DIR / "tombola_stark.log"
 _LOGGER_NAME = "tombola_stark"
 _SESSION_SEPARATOR = "-" * 60
 
+# Pipeline bufferizzata: valori predefiniti
+_CAPACITA_CODA = 10_000        # record in attesa prima che il chiamante attenda il writer
+_RECORD_PER_FLUSH = 200        # flush dopo questo numero di record scritti
+_INTERVALLO_FLUSH_S = 1.0      # flush almeno ogni intervallo, anche senza nuovi record
+
+# Rotazione del file cumulativo: valori predefiniti
+_MAX_BYTE = 10 * 1024 * 1024   # rotazione oltre 10 MiB (0 = mai per dimensione)
+_CONSERVA = 5                  # segmenti ruotati conservati
+
+# Attributo dei record marcatore di inizio sessione (indicizzati nel file .idx)
+_ATTRIBUTO_SESSIONE = "sessione_avviata"
+
+
+def _nome_segmento(base: str, numero: int, suffisso: str) -> str:
+    """Nome del segmento ruotato numero `numero` (1 = il più recente)."""
+    return f"{base}.{numero}{suffisso}"
+
+
+def _nome_indice(percorso: str | Path) -> str:
+    """Nome del file indice delle sessioni di un segmento di log."""
+    return f"{percorso}.idx"
+
+
+def _rimuovi_se_esiste(percorso: str) -> None:
+    try:
+        os.remove(percorso)
+    except FileNotFoundError:
+        pass
+
+
+def _sposta_indice(sorgente: str, destinazione: str) -> None:
+    """Sposta l'indice del segmento sorgente su quello di destinazione
+    (o elimina l'indice di destinazione, ormai non più valido)."""
+    if os.path.exists(_nome_indice(sorgente)):
+        os.replace(_nome_indice(sorgente), _nome_indice(destinazione))
+    else:
+        _rimuovi_se_esiste(_nome_indice(destinazione))
+
+
+def _sposta_segmento(sorgente: str, destinazione: str) -> None:
+    """Sposta un segmento ruotato (e il suo indice), se esiste."""
+    if os.path.exists(sorgente):
+        os.replace(sorgente, destinazione)
+        _sposta_indice(sorgente, destinazione)
+
+
+def _inizio_segmento(percorso: str) -> float:
+    """Istante della prima riga del file di log (ora corrente se vuoto o illeggibile)."""
+    try:
+        with open(percorso, "r", encoding="utf-8") as file:
+            prima_riga = file.readline()
+        return datetime.strptime(prima_riga[:19], _DATE_FORMAT).timestamp()
+    except (OSError, ValueError):
+        return time.time()
+
+
+class _RotatingLogHandler(logging.handlers.BaseRotatingHandler):
+    """FileHandler del file cumulativo con rotazione e indice delle sessioni.
+
+    Il file attivo ruota quando supera `max_byte` (dimensione stimata in
+    caratteri scritti) oppure quando il segmento è più vecchio di
+    `intervallo_rotazione_s`; 0 disattiva il rispettivo criterio. I segmenti
+    ruotati si chiamano tombola_stark.log.1, .2, ... (.gz se compressi) e
+    oltre `conserva` vengono eliminati.
+
+    Accanto a ogni segmento un file .idx elenca offset in byte e timestamp
+    di ogni marcatore "SESSIONE AVVIATA" (vedi indice_sessioni()).
+    """
+
+    def __init__(
+        self,
+        filename: Path,
+        max_byte: int = 0,
+        intervallo_rotazione_s: float = 0,
+        comprimi: bool = False,
+        conserva: int = _CONSERVA,
+    ) -> None:
+        super().__init__(filename, mode="a", encoding="utf-8", delay=False)
+        self._max_byte = max_byte
+        self._intervallo_rotazione_s = intervallo_rotazione_s
+        self._comprimi = comprimi
+        self._conserva = conserva
+        self._dimensione = os.path.getsize(self.baseFilename)
+        self._scadenza = _inizio_segmento(self.baseFilename) + intervallo_rotazione_s
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self._max_byte > 0 and self._dimensione >= self._max_byte:
+            return True
+        return self._intervallo_rotazione_s > 0 and time.time() >= self._scadenza
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            if getattr(record, _ATTRIBUTO_SESSIONE, False):
+                self._indicizza_sessione(record)
+            msg = self.format(record) + self.terminator
+            self.stream.write(msg)
+            self._dimensione += len(msg)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def doRollover(self) -> None:
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        suffisso = ".gz" if self._comprimi else ""
+        if self._conserva > 0:
+            for numero in range(self._conserva - 1, 0, -1):
+                _sposta_segmento(
+                    _nome_segmento(self.baseFilename, numero, suffisso),
+                    _nome_segmento(self.baseFilename, numero + 1, suffisso),
+                )
+            destinazione = _nome_segmento(self.baseFilename, 1, suffisso)
+            if self._comprimi:
+                with open(self.baseFilename, "rb") as sorgente, gzip.open(destinazione, "wb") as gz:
+                    shutil.copyfileobj(sorgente, gz)
+                os.remove(self.baseFilename)
+            else:
+                os.replace(self.baseFilename, destinazione)
+            _sposta_indice(self.baseFilename, destinazione)
+        else:
+            os.remove(self.baseFilename)
+            _rimuovi_se_esiste(_nome_indice(self.baseFilename))
+        self.stream = self._open()
+        self._dimensione = 0
+        self._scadenza = time.time() + self._intervallo_rotazione_s
+
+    def _indicizza_sessione(self, record: logging.LogRecord) -> None:
+        """Aggiunge all'indice l'offset in byte della riga che sta per essere scritta."""
+        offset = self.stream.tell()
+        timestamp = datetime.fromtimestamp(record.created).strftime(_DATE_FORMAT)
+        with open(_nome_indice(self.baseFilename), "a", encoding="utf-8") as indice:
+            indice.write(f"{offset}\t{timestamp}\n")
+
+
+class _FlushingFileHandler(_RotatingLogHandler):
+    """Handler del file con flush dopo ogni record (modalità predefinita)."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        super().emit(record)
+        self.flush()
+
+
+class _BufferedFileHandler(_RotatingLogHandler):
+    """Handler del file che scarica il file a blocchi.
+
+    Flush dopo `record_per_flush` record, dopo `intervallo_flush_s` secondi
+    dall'ultimo flush, oppure subito per record di livello ERROR o superiore.
+    """
+
+    def __init__(
+        self,
+        filename: Path,
+        record_per_flush: int,
+        intervallo_flush_s: float,
+        **rotazione: object,
+    ) -> None:
+        super().__init__(filename, **rotazione)
+        self._record_per_flush = record_per_flush
+        self._intervallo_flush_s = intervallo_flush_s
+        self._non_scaricati = 0
+        self._ultimo_flush = time.monotonic()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        super().emit(record)
+        self._non_scaricati += 1
+        if (
+            record.levelno >= logging.ERROR
+            or self._non_scaricati >= self._record_per_flush
+            or time.monotonic() - self._ultimo_flush >= self._intervallo_flush_s
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        super().flush()
+        self._non_scaricati = 0
+        self._ultimo_flush = time.monotonic()
+
+
+class _CodaLogHandler(logging.handlers.QueueHandler):
+    """QueueHandler su coda limitata.
+
+    A coda piena il chiamante attende il writer invece di perdere record.
+    Dopo un record ERROR attende che la coda sia scritta e scaricata su
+    disco, così un crash subito dopo non perde le ultime righe.
+    """
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self.queue.put(record)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        super().emit(record)
+        if record.levelno >= logging.ERROR:
+            self.queue.join()
+
+
+class _AscoltatoreLog(logging.handlers.QueueListener):
+    """QueueListener che scarica gli handler anche quando la coda resta vuota."""
+
+    def __init__(self, coda: queue.Queue, handler: logging.Handler, intervallo_flush_s: float) -> None:
+        super().__init__(coda, handler, respect_handler_level=True)
+        self._intervallo_flush_s = intervallo_flush_s
+
+    def enqueue_sentinel(self) -> None:
+        # A coda piena put_nowait() solleverebbe queue.Full: si attende il writer.
+        self.queue.put(self._sentinel)
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        while True:
+            try:
+                return self.queue.get(block, self._intervallo_flush_s)
+            except queue.Empty:
+                for handler in self.handlers:
+                    handler.flush()
+
 
 class GameLogger:
     """Singleton per il sistema di logging di Tombola Stark.
@@ -40,6 +280,7 @@ class GameLogger:
 
     _instance: GameLogger | None = None
     _initialized: bool = False
+    _listener: logging.handlers.QueueListener | None = None
 
     def __init__(self) -> None:
         """Non chiamare direttamente — usare initialize() e get_instance()."""
@@ -47,15 +288,38 @@ class GameLogger:
             raise RuntimeError("Usare GameLogger.get_instance()")
 
     @classmethod
-    def initialize(cls, debug_mode: bool = False) -> None:
+    def initialize(
+        cls,
+        debug_mode: bool = False,
+        bufferizzato: bool = False,
+        capacita_coda: int = _CAPACITA_CODA,
+        record_per_flush: int = _RECORD_PER_FLUSH,
+        intervallo_flush_s: float = _INTERVALLO_FLUSH_S,
+        max_byte: int = _MAX_BYTE,
+        intervallo_rotazione_s: float = 0,
+        comprimi: bool = False,
+        conserva: int = _CONSERVA,
+    ) -> None:
         """Inizializza il logger. Chiamare una sola volta all'avvio dell'applicazione.
 
         Args:
             debug_mode: Se True, imposta il livello a DEBUG (modalità dettagliata).
                         Se False (default), imposta il livello a INFO.
+            bufferizzato: Se True, i record passano da una coda limitata a un
+                        thread di scrittura che scarica il file a blocchi.
+                        Se False (default), flush dopo ogni record.
+            capacita_coda: Record in attesa oltre i quali il chiamante attende.
+            record_per_flush: Record scritti tra due flush (solo bufferizzato).
+            intervallo_flush_s: Intervallo massimo tra due flush (solo bufferizzato).
+            max_byte: Dimensione oltre la quale il file ruota (0 = mai).
+            intervallo_rotazione_s: Età massima del file prima della rotazione (0 = mai).
+            comprimi: Se True, i segmenti ruotati vengono compressi con gzip.
+            conserva: Numero di segmenti ruotati conservati (0 = nessuno).
 
         Version:
             v0.4.0: Prima implementazione
+            v0.5.0: Pipeline bufferizzata opzionale
+            v0.6.0: Rotazione, compressione e indice delle sessioni
         """
         if cls._initialized:
             return
@@ -66,19 +330,31 @@ class GameLogger:
         level = logging.DEBUG if debug_mode else logging.INFO
         logger.setLevel(level)
 
-        class FlushingFileHandler(logging.FileHandler):
-            def emit(self, record: logging.LogRecord) -> None:
-                super().emit(record)
-                self.flush()
-
         logger.handlers.clear()
-        flushing_handler = FlushingFileHandler(
-            _LOG_FILE, mode="a", encoding="utf-8", delay=False
-        )
-        flushing_handler.setLevel(level)
         formatter = logging.Formatter(_LOG_FORMAT, datefmt=_DATE_FORMAT)
-        flushing_handler.setFormatter(formatter)
-        logger.addHandler(flushing_handler)
+        rotazione = dict(
+            max_byte=max_byte,
+            intervallo_rotazione_s=intervallo_rotazione_s,
+            comprimi=comprimi,
+            conserva=conserva,
+        )
+        if bufferizzato:
+            file_handler: _RotatingLogHandler = _BufferedFileHandler(
+                _LOG_FILE, record_per_flush, intervallo_flush_s, **rotazione
+            )
+            file_handler.setLevel(level)
+            file_handler.setFormatter(formatter)
+            coda: queue.Queue = queue.Queue(maxsize=capacita_coda)
+            coda_handler = _CodaLogHandler(coda)
+            coda_handler.setLevel(level)
+            logger.addHandler(coda_handler)
+            cls._listener = _AscoltatoreLog(coda, file_handler, intervallo_flush_s)
+            cls._listener.start()
+        else:
+            file_handler = _FlushingFileHandler(_LOG_FILE, **rotazione)
+            file_handler.setLevel(level)
+            file_handler.setFormatter(formatter)
+            logger.addHandler(file_handler)
         logger.propagate = False
 
         cls._initialized = True
@@ -107,14 +383,37 @@ class GameLogger:
     def shutdown(cls) -> None:
         """Scrive il marcatore di chiusura sessione e chiude tutti gli handler.
 
+        In modalità bufferizzata ferma il thread di scrittura dopo aver
+        scritto tutti i record in coda, poi scarica e chiude il file.
+        Se la strumentazione delle latenze è attiva, scrive prima il
+        rapporto p50/p95/p99 di ogni span.
+
         Version:
             v0.4.0: Prima implementazione
+            v0.5.0: Flush finale garantito della pipeline bufferizzata
+            v0.6.0: Rapporto delle latenze in chiusura
         """
         if not cls._initialized:
             return
         logger = logging.getLogger(_LOGGER_NAME)
+        if latenze.is_attiva():
+            for riga in latenze.righe_rapporto():
+                logger.info(riga)
         logger.info("Sistema di logging in chiusura.")
         cls._write_session_marker(logger, "CHIUSA")
+        if cls._listener is not None:
+            # Prima si stacca il QueueHandler: un record emesso dopo lo stop
+            # del writer resterebbe in coda e un ERROR attenderebbe per sempre
+            # in queue.join().
+            for handler in list(logger.handlers):
+                if isinstance(handler, _CodaLogHandler):
+                    logger.removeHandler(handler)
+                    handler.close()
+            cls._listener.stop()
+            for handler in cls._listener.handlers:
+                handler.flush()
+                handler.close()
+            cls._listener = None
         logging.shutdown()
         cls._initialized = False
 
@@ -138,7 +437,72 @@ class GameLogger:
             name=logger.name, level=logging.INFO, pathname="",
             lineno=0, msg=f"SESSIONE {tipo}: {timestamp}", args=(), exc_info=None,
         )
+        setattr(record_marker, _ATTRIBUTO_SESSIONE, tipo == "AVVIATA")
         for handler in logger.handlers:
             handler.emit(record_sep)
             handler.emit(record_marker)
             handler.emit(record_sep)
+
+
+# ---------------------------------------------------------------------------
+# Indice delle sessioni
+# ---------------------------------------------------------------------------
+
+def _apri_segmento(percorso: str | Path):
+    """Apre un segmento di log in binario (decompresso se .gz)."""
+    if str(percorso).endswith(".gz"):
+        return gzip.open(percorso, "rb")
+    return open(percorso, "rb")
+
+
+def ricostruisci_indice_sessioni(percorso: str | Path | None = None) -> list[tuple[int, str]]:
+    """Ricostruisce l'indice delle sessioni di un segmento scorrendolo una volta.
+
+    Serve per i file scritti prima dell'indice o con l'indice perso;
+    l'indice ricostruito viene salvato accanto al segmento.
+    """
+    percorso = _LOG_FILE if percorso is None else percorso
+    marcatore = b"| SESSIONE AVVIATA: "
+    voci: list[tuple[int, str]] = []
+    offset = 0
+    with _apri_segmento(percorso) as file:
+        for riga in file:
+            if marcatore in riga:
+                voci.append((offset, riga[:19].decode("utf-8", errors="replace")))
+            offset += len(riga)
+    with open(_nome_indice(percorso), "w", encoding="utf-8") as indice:
+        indice.writelines(f"{offset}\t{timestamp}\n" for offset, timestamp in voci)
+    return voci
+
+
+def indice_sessioni(percorso: str | Path | None = None) -> list[tuple[int, str]]:
+    """Ritorna (offset in byte, timestamp) di ogni sessione avviata nel segmento.
+
+    Legge il file .idx accanto al segmento (predefinito il file attivo);
+    se manca lo ricostruisce con ricostruisci_indice_sessioni(). Gli offset
+    sono nel contenuto decompresso anche per i segmenti .gz.
+    """
+    percorso = _LOG_FILE if percorso is None else percorso
+    try:
+        with open(_nome_indice(percorso), "r", encoding="utf-8") as indice:
+            voci = []
+            for riga in indice:
+                offset, _sep, timestamp = riga.rstrip("\n").partition("\t")
+                voci.append((int(offset), timestamp))
+            return voci
+    except FileNotFoundError:
+        return ricostruisci_indice_sessioni(percorso)
+
+
+def leggi_sessione(numero: int = -1, percorso: str | Path | None = None) -> list[str]:
+    """Righe della sessione `numero` del segmento (-1 = l'ultima), dal
+    marcatore di avvio fino al marcatore della sessione successiva."""
+    percorso = _LOG_FILE if percorso is None else percorso
+    voci = indice_sessioni(percorso)
+    inizio = voci[numero][0]
+    indice = numero % len(voci)
+    fine = voci[indice + 1][0] if indice + 1 < len(voci) else None
+    with _apri_segmento(percorso) as file:
+        file.seek(inizio)
+        dati = file.read() if fine is None else file.read(fine - inizio)
+    return dati.decode("utf-8").splitlines()
@@ -0,0 +1,292 @@
+"""
+CLASSE PER L'ORCHESTRAZIONE ASINCRONA DI PIÙ TAVOLI
+Modulo: bingo_game.orchestratore_tavoli
+
+Tombola / Bingo – Ciclo di turno V2 su un event loop asyncio
+============================================================
+
+OVERVIEW DEL MODULO
+-------------------
+
+Il ciclo di turno V2 (estrazione → finestra "attesa_reclami" → verifica →
+pausa tra turni) esiste nella finestra wx come catena di timer e CallLater
+(FinestraGioco._avvia_timer_azione, _on_tick_azione, _pianifica_risposta_bot).
+Questo modulo esegue la stessa macchina a fasi senza interfaccia, per molti
+tavoli contemporaneamente sullo stesso event loop asyncio:
+
+- ogni tavolo è una coroutine che chiama Partita.esegui_fase_estrazione() e
+  Partita.esegui_fase_verifica();
+- le dichiarazioni dei bot sono coroutine che attendono un ritardo casuale
+  (come _pianifica_risposta_bot: fino al 70% della finestra) e poi chiamano
+  dichiara_fine_fase_azione();
+- la scadenza della finestra d'azione è un timer del loop (call_later);
+  se tutti i giocatori dichiarano prima, la verifica parte subito;
+- la pausa tra turni è un asyncio.sleep().
+
+I giocatori umani dichiarano tramite il proprio canale (es. ComandiGiocatoreUmano)
+e poi chiamano Tavolo.notifica_dichiarazione(): se mancano, la finestra si chiude
+alla scadenza, come in FinestraGioco.
+
+Il ritardo con cui il loop risveglia scadenze e pause rispetto all'istante
+previsto (jitter) viene raccolto in un istogramma (latenze.Istogramma) per
+verificare che centinaia di tavoli restino puntuali. Con centinaia di tavoli
+conviene usare sfasamento_s (avvii distribuiti invece che simultanei) e
+chiamare gc.freeze() dopo aver creato le partite: le raccolte complete del
+garbage collector su migliaia di cartelle sono la causa principale dei
+ritardi oltre il p95.
+
+CLASSI PRINCIPALI
+-----------------
+
+- Tavolo: stato di un tavolo (partita, fase, turni, errore).
+- OrchestratoreTavoli: registra i tavoli e li esegue sull'event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import random
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from bingo_game.latenze import Istogramma
+from bingo_game.partita import Partita
+from bingo_game.registro_premi import RegistroPremi
+
+
+# Callback dopo ogni turno: (tavolo, risultato estrazione, risultato verifica).
+# Può essere una funzione normale o una coroutine.
+CallbackTurno = Callable[["Tavolo", Dict[str, Any], Dict[str, Any]], Optional[Awaitable[None]]]
+
+
+#definizione della classe che rappresenta un tavolo gestito dall'orchestratore
+class Tavolo:
+    """
+    Un tavolo: una Partita e lo stato del suo ciclo di turno.
+
+    Attributi:
+    - id_tavolo: int
+    - partita: Partita
+    - fase: str — "attesa_estrazione", "attesa_reclami", "pausa_turno" o "terminato"
+    - turni: int — turni completati (estrazione + verifica)
+    - errore: Optional[BaseException] — eccezione che ha fermato il tavolo
+    """
+
+    def __init__(self, id_tavolo: int, partita: Partita, rng: random.Random) -> None:
+        self.id_tavolo = id_tavolo
+        self.partita = partita
+        self.fase: str = "attesa_estrazione"
+        self.turni: int = 0
+        self.errore: Optional[BaseException] = None
+        self._rng = rng
+        self._tutti_pronti: Optional[asyncio.Event] = None
+
+    #metodo da chiamare quando un giocatore (umano) ha dichiarato fine turno
+    def notifica_dichiarazione(self) -> None:
+        """
+        Controlla se tutti i giocatori hanno dichiarato fine turno e, in caso,
+        chiude in anticipo la finestra d'azione corrente.
+
+        Va chiamato dopo GiocatoreBase.dichiara_fine_turno() di un giocatore
+        umano, dallo stesso thread dell'event loop. Fuori dalla fase
+        "attesa_reclami" non ha effetto.
+        """
+        if self._tutti_pronti is not None and self.partita.tutti_hanno_dichiarato_fine():
+            self._tutti_pronti.set()
+
+    def is_terminato(self) -> bool:
+        return self.fase == "terminato"
+
+
+#definizione della classe che esegue il ciclo di turno di molti tavoli su un event loop
+class OrchestratoreTavoli:
+    """
+    Esegue il ciclo di turno V2 di più tavoli sullo stesso event loop asyncio.
+
+    Parametri:
+    - durata_finestra_s: float — durata della finestra "attesa_reclami"
+      (FinestraGioco: durata_finestra_ms / 1000).
+    - durata_pausa_s: float — pausa tra un turno e il successivo.
+    - ritardo_bot_min_s: float — ritardo minimo di risposta dei bot.
+    - quota_ritardo_bot: float — ritardo massimo dei bot come frazione della
+      finestra (0.70 come in _pianifica_risposta_bot).
+    - seme: Optional[int] — se indicato, i ritardi dei bot di ogni tavolo
+      derivano da (seme, id_tavolo) e sono riproducibili.
+    - sfasamento_s: float — ogni tavolo parte dopo un ritardo casuale in
+      [0, sfasamento_s): con centinaia di tavoli evita che avvio, estrazioni
+      e verifiche di tutti cadano nella stessa iterazione del loop.
+    - al_turno: Optional[CallbackTurno] — chiamato dopo ogni verifica.
+    """
+
+    def __init__(
+        self,
+        durata_finestra_s: float = 60.0,
+        durata_pausa_s: float = 5.0,
+        ritardo_bot_min_s: float = 0.5,
+        quota_ritardo_bot: float = 0.70,
+        seme: Optional[int] = None,
+        sfasamento_s: float = 0.0,
+        al_turno: Optional[CallbackTurno] = None,
+    ) -> None:
+        self.durata_finestra_s = durata_finestra_s
+        self.durata_pausa_s = durata_pausa_s
+        self.ritardo_bot_min_s = ritardo_bot_min_s
+        self.quota_ritardo_bot = quota_ritardo_bot
+        self.seme = seme
+        self.sfasamento_s = sfasamento_s
+        self.al_turno = al_turno
+        self.tavoli: List[Tavolo] = []
+        self.jitter = Istogramma()
+        self._task: List[asyncio.Task] = []
+
+
+    """sezione: registrazione dei tavoli"""
+
+    #metodo per aggiungere un tavolo all'orchestratore
+    def aggiungi_tavolo(self, partita: Partita) -> Tavolo:
+        """
+        Registra una partita come nuovo tavolo e lo ritorna.
+
+        La partita può essere non ancora avviata (viene avviata all'inizio
+        del ciclo) oppure già in corso in fase "attesa_estrazione".
+        """
+        id_tavolo = len(self.tavoli)
+        if self.seme is None:
+            rng = random.Random()
+        else:
+            rng = random.Random((self.seme << 32) + id_tavolo)
+        tavolo = Tavolo(id_tavolo, partita, rng)
+        self.tavoli.append(tavolo)
+        return tavolo
+
+
+    """sezione: esecuzione"""
+
+    #metodo che esegue tutti i tavoli registrati fino alla fine delle partite
+    async def esegui(self) -> List[Tavolo]:
+        """
+        Esegue il ciclo di turno di tutti i tavoli finché ogni partita termina
+        (o si ferma per errore). Ritorna la lista dei tavoli.
+
+        L'errore di un tavolo (eccezione della partita, di un bot o del
+        callback al_turno) viene salvato in Tavolo.errore e non ferma gli
+        altri; solo la cancellazione (ferma()) interrompe esegui().
+        """
+        self._task = [asyncio.create_task(self._ciclo_tavolo(tavolo)) for tavolo in self.tavoli]
+        try:
+            await asyncio.gather(*self._task)
+        finally:
+            self._task = []
+        return self.tavoli
+
+    #metodo che interrompe l'esecuzione di tutti i tavoli
+    def ferma(self) -> None:
+        """Cancella i cicli dei tavoli in esecuzione (esegui() solleva CancelledError)."""
+        for task in self._task:
+            task.cancel()
+
+    #metodo che esegue il ciclo di turno di un singolo tavolo
+    async def _ciclo_tavolo(self, tavolo: Tavolo) -> None:
+        partita = tavolo.partita
+        if self.sfasamento_s > 0:
+            await asyncio.sleep(tavolo._rng.uniform(0.0, self.sfasamento_s))
+        try:
+            if partita.get_stato_partita() == "non_iniziata":
+                partita.avvia_partita()
+            while not partita.is_terminata():
+                risultato_estrazione = partita.esegui_fase_estrazione()
+                tavolo.fase = "attesa_reclami"
+                await self._finestra_azione(tavolo)
+
+                risultato_verifica = partita.esegui_fase_verifica()
+                tavolo.turni += 1
+                if self.al_turno is not None:
+                    esito = self.al_turno(tavolo, risultato_estrazione, risultato_verifica)
+                    if inspect.isawaitable(esito):
+                        await esito
+                if partita.is_terminata():
+                    break
+
+                tavolo.fase = "pausa_turno"
+                await self._attendi(self.durata_pausa_s)
+                tavolo.fase = "attesa_estrazione"
+        except Exception as exc:
+            # CancelledError non deriva da Exception: ferma() interrompe comunque il ciclo.
+            tavolo.errore = exc
+        tavolo.fase = "terminato"
+
+    #metodo che gestisce la finestra d'azione: dichiarazioni dei bot e scadenza
+    async def _finestra_azione(self, tavolo: Tavolo) -> None:
+        """
+        Attende che tutti i giocatori dichiarino fine turno o che scada la
+        finestra. Le dichiarazioni dei bot ancora in attesa alla scadenza
+        vengono annullate.
+        """
+        loop = asyncio.get_running_loop()
+        partita = tavolo.partita
+        tutti_pronti = asyncio.Event()
+        tavolo._tutti_pronti = tutti_pronti
+
+        premi_gia_assegnati = partita.premi_gia_assegnati.copia()
+        premi_tipo_chiusi = set(partita.premi_tipo_chiusi)
+        ritardo_max = max(self.ritardo_bot_min_s, self.durata_finestra_s * self.quota_ritardo_bot)
+        dichiarazioni = [
+            asyncio.create_task(self._dichiara_bot(
+                tavolo, giocatore, tavolo._rng.uniform(self.ritardo_bot_min_s, ritardo_max),
+                premi_gia_assegnati, premi_tipo_chiusi,
+            ))
+            for giocatore in partita.get_giocatori()
+            if giocatore.is_automatico()
+        ]
+
+        previsto = loop.time() + self.durata_finestra_s
+
+        def scadenza() -> None:
+            self.jitter.registra(int(max(0.0, loop.time() - previsto) * 1e9))
+            tutti_pronti.set()
+
+        timer = loop.call_at(previsto, scadenza)
+        try:
+            if not dichiarazioni:
+                tavolo.notifica_dichiarazione()
+            await tutti_pronti.wait()
+            for task in dichiarazioni:
+                if task.done() and not task.cancelled() and task.exception() is not None:
+                    raise task.exception()
+        finally:
+            timer.cancel()
+            tavolo._tutti_pronti = None
+            for task in dichiarazioni:
+                task.cancel()
+
+    #coroutine che dichiara la fine della fase d'azione di un bot dopo il suo ritardo
+    async def _dichiara_bot(
+        self,
+        tavolo: Tavolo,
+        bot: Any,
+        ritardo_s: float,
+        premi_gia_assegnati: RegistroPremi,
+        premi_tipo_chiusi: set,
+    ) -> None:
+        await asyncio.sleep(ritardo_s)
+        bot.dichiara_fine_fase_azione(premi_gia_assegnati, premi_tipo_chiusi)
+        tavolo.notifica_dichiarazione()
+
+    #metodo che attende una durata registrando il ritardo di risveglio
+    async def _attendi(self, durata_s: float) -> None:
+        loop = asyncio.get_running_loop()
+        previsto = loop.time() + durata_s
+        await asyncio.sleep(durata_s)
+        self.jitter.registra(int(max(0.0, loop.time() - previsto) * 1e9))
+
+
+#funzione di comodo che esegue un insieme di partite fino alla fine
+def esegui_tavoli(partite: List[Partita], **opzioni: Any) -> List[Tavolo]:
+    """
+    Crea un OrchestratoreTavoli con le opzioni indicate, registra le partite
+    come tavoli e li esegue con asyncio.run(). Ritorna i tavoli.
+    """
+    orchestratore = OrchestratoreTavoli(**opzioni)
+    for partita in partite:
+        orchestratore.aggiungi_tavolo(partita)
+    return asyncio.run(orchestratore.esegui())
@@ -118,10 +118,24 @@ giocatori o controlli più specifici sul tipo di giocatore.)
   ritorna una rappresentazione sintetica dello stato dei giocatori
   (es. nome, id, numero di cartelle, presenza di tombola).
 
+- get_stato_riepilogo():
+  ritorna in tempo costante i contatori essenziali della partita (stato,
+  fase, ultimo estratto, conteggi) e la versione dello stato.
+
+- get_stato_sintetico():
+  ritorna la vista di bordo per controller/UI (stato, estratti, giocatori,
+  premi assegnati), costruita senza passare dallo snapshot completo.
+
 - get_stato_completo():
   ritorna un riepilogo complessivo della partita (stato, ultimo numero
   estratto, premi assegnati, elenco sintetico dei giocatori).
 
+- get_versione_stato():
+  ritorna un contatore incrementato a ogni modifica dello stato di partita
+  (roster, avvio/fine, estrazione, fase del turno, premi assegnati): chi
+  interroga lo stato periodicamente può saltare la rilettura se la versione
+  non è cambiata.
+
 NOTE DI UTILIZZO
 ----------------
 
@@ -134,19 +148,61 @@ NOTE DI UTILIZZO
   avviene al di fuori della Partita: il "controller" si occupa di
   configurare il numero di giocatori, di bot e di cartelle, e poi
   registra questi oggetti nella Partita prima dell'avvio.
+
+- Modalità sala (Partita(..., modalita_sala=True)): per sessioni con migliaia
+  di giocatori il limite diventa MAX_GIOCATORI_SALA e i percorsi per turno
+  non scorrono più l'intero roster:
+  - giocatori indicizzati per id_giocatore (get_giocatore_per_id());
+  - reclami e dichiarazioni di fine turno tenuti in contatori aggiornati
+    dai giocatori stessi (tutti_hanno_dichiarato_fine() in O(1), verifica e
+    reset toccano solo chi ha reclamato o dichiarato);
+  - numeri propagati da un IndiceSala (bingo_game.indice_sala): set dei
+    segnati aggiornati in blocco e contatori di riga in un bytearray; i
+    premi ancora utili vengono accodati ai bot e applicati alla loro
+    valutazione, insieme ai tipi chiusi (premi_tipo_chiusi passato a
+    dichiara_fine_fase_azione());
+  - reclami sulle cartelle indicizzate verificati leggendo i contatori
+    dell'indice invece del tracciatore premi;
+  - tombola rilevata durante la propagazione del numero, più una scansione
+    dei soli giocatori umani.
+  In questa modalità le cartelle dei bot vanno segnate solo tramite la
+  propagazione dei numeri estratti: una segnazione esterna rende l'indice
+  obsoleto e lo fa ricostruire (per intero) alla prima estrazione successiva.
+
+- Giornale degli eventi: collega_giornale() associa un GiornalePartita
+  (bingo_game.giornale_partita); esegui_fase_estrazione() ed
+  esegui_fase_verifica() vi registrano estrazioni, segnazioni, reclami dei
+  bot, premi, fasi e fine partita.
+
+- Checkpoint: collega_checkpoint() associa un CheckpointPartita
+  (bingo_game.checkpoint_partita) e vi scrive uno snapshot completo;
+  esegui_fase_estrazione() ed esegui_fase_verifica() vi accodano i delta del
+  turno. ripristina_partita() ricostruisce la partita dal file.
 """
 
 from __future__ import annotations
+
+import gc
 #import dei tipi di dati avanzato 
-from typing import Dict, Any, List, Literal, Optional, TYPE_CHECKING
+from typing import Dict, Any, List, Literal, Optional, Tuple, TYPE_CHECKING
 if TYPE_CHECKING:
     from bingo_game.cartella import Cartella
+    from bingo_game.giornale_partita import GiornalePartita
+    from bingo_game.checkpoint_partita import CheckpointPartita
 
 #import dei file di gioco
+from bingo_game import latenze
+from bingo_game.registro_premi import RegistroPremi, codice_premio
 from bingo_game.tabellone import Tabellone
+from bingo_game.indice_sala import IndiceSala
+from bingo_game.tracciatore_premi import TracciatorePremi
 from bingo_game.exceptions.tabellone_exceptions import TabelloneNumeriEsauritiException
-from bingo_game.players.giocatore_base import GiocatoreBase
+from bingo_game.players.giocatore_base import GenerazioneTurno, GiocatoreBase
 from bingo_game.players.giocatore_umano import GiocatoreUmano
+from bingo_game.exceptions.giocatore_exceptions import (
+    GiocatoreNumeroTypeException,
+    GiocatoreNumeroValueException,
+)
 # Import pulito grazie all'init aggiornato
 from bingo_game.exceptions import (
     PartitaException,
@@ -181,8 +237,15 @@ class Partita:
     # Limiti consigliati sul numero di giocatori
     MIN_GIOCATORI: int = 2
     MAX_GIOCATORI: int = 8  # es. 1 umano + fino a 7 bot
-
-    def __init__(self, tabellone: Tabellone, giocatori: Optional[List[GiocatoreBase]] = None) -> None:
+    # Limite in modalità sala (sessioni da migliaia di giocatori)
+    MAX_GIOCATORI_SALA: int = 10000
+
+    def __init__(
+        self,
+        tabellone: Tabellone,
+        giocatori: Optional[List[GiocatoreBase]] = None,
+        modalita_sala: bool = False,
+    ) -> None:
         """
         Inizializza una nuova partita.
 
@@ -193,21 +256,98 @@ class Partita:
           Lista opzionale di giocatori già creati e configurati
           (umani e automatici). Se None, la partita parte senza
           giocatori e questi potranno essere aggiunti in seguito.
+        - modalita_sala: bool
+          Se True il limite di giocatori è MAX_GIOCATORI_SALA e i percorsi
+          per turno usano indici e contatori invece di scorrere il roster.
 
         La partita inizia nello stato "non iniziata".
         """
+        # Versione dello stato di partita (vedi get_versione_stato()).
+        self._versione_stato: int = 0
         self.tabellone = tabellone
         self.giocatori: List[GiocatoreBase] = giocatori[:] if giocatori else []
         self.stato_partita: str = "non_iniziata"  # possibili valori: non_iniziata, in_corso, terminata
         self.ultimo_numero_estratto: Optional[int] = None
-        self.premi_gia_assegnati = set()
+        # Registro a codici interi con vista a chiavi stringa (bingo_game.registro_premi).
+        self.premi_gia_assegnati: RegistroPremi = RegistroPremi()
         self.premi_tipo_chiusi: set = set()
         self.ultimo_premio_evento: Optional[Dict[str, Any]] = None
         self.storico_premi: List[Dict[str, Any]] = []
         self.fase_turno_corrente: str = "attesa_estrazione"
+        # Indice invertito numero -> [(giocatore, cartella, riga, colonna)],
+        # costruito all'avvio (o alla prima estrazione) e usato per segnare
+        # solo le cartelle che contengono il numero estratto.
+        self._indice_numeri: Optional[List[List[Tuple[GiocatoreBase, 'Cartella', int, int]]]] = None
+        # In modalità sala l'indice è un IndiceSala (slot di riga e contatori
+        # per numero) e _indice_numeri resta None.
+        self._indice_sala: Optional[IndiceSala] = None
+        # True quando roster o cartelle sono cambiati dall'ultima costruzione
+        # dell'indice (aggiungi_giocatore() / aggiungi_cartella() dei giocatori).
+        self._indice_da_ricostruire: bool = True
+        self._giocatori_indicizzati: int = 0
+        # Cartelle segnate dall'ultima propagazione di un numero estratto.
+        self.cartelle_modificate_turno: List['Cartella'] = []
+        # Contatori incrementali per (cartella, riga) usati da verifica_premi()
+        # e premi raggiunti con l'ultima estrazione.
+        self.tracciatore_premi = TracciatorePremi()
+        self.premi_raggiunti_turno: List[Dict[str, Any]] = []
+        # Modalità sala: ultimo numero propagato, i cui premi raggiunti vengono
+        # letti dall'indice solo su richiesta (get_premi_raggiunti_turno()).
+        self._numero_premi_sala: Optional[int] = None
+        # Seme e configurazione con cui la partita è stata creata
+        # (impostati da game_controller.crea_partita_standard()).
+        self.seme: Optional[int] = None
+        self.configurazione: Optional[Dict[str, Any]] = None
+        # Modalità sala: indici per id e contatori di turno aggiornati dai giocatori.
+        self.modalita_sala: bool = modalita_sala
+        self._giocatori_per_id: Dict[int, GiocatoreBase] = {}
+        self._posizione_giocatore: Dict[int, int] = {}
+        self._giocatori_con_reclamo: Dict[int, GiocatoreBase] = {}
+        self._giocatori_dichiarati: Dict[int, GiocatoreBase] = {}
+        # Generazione di turno condivisa con i giocatori in modalità sala.
+        self._generazione_turno: GenerazioneTurno = GenerazioneTurno()
+        self._giocatori_non_indicizzati: List[GiocatoreBase] = []
+        self._tombola_da_propagazione: bool = False
+        # Giornale strutturato degli eventi (vedi collega_giornale()).
+        self.giornale: Optional['GiornalePartita'] = None
+        # Checkpoint per turno (vedi collega_checkpoint()).
+        self.checkpoint: Optional['CheckpointPartita'] = None
+        for giocatore in self.giocatori:
+            giocatore._osservatori_cartelle.append(self)
+            giocatore._notifica_tipi_chiusi(self.premi_tipo_chiusi)
+        if modalita_sala:
+            self.MAX_GIOCATORI = self.MAX_GIOCATORI_SALA
+            for giocatore in self.giocatori:
+                self._registra_giocatore_sala(giocatore)
 
 
 
+    """property con versionamento dello stato"""
+
+    @property
+    def stato_partita(self) -> str:
+        """Stato della partita: non_iniziata, in_corso, terminata."""
+        return self._stato_partita
+
+    @stato_partita.setter
+    def stato_partita(self, stato: str) -> None:
+        self._stato_partita = stato
+        self._versione_stato += 1
+
+
+    #metodo che ritorna la versione corrente dello stato di partita
+    def get_versione_stato(self) -> int:
+        """
+        Ritorna il contatore di versione dello stato di partita.
+
+        Il contatore cresce a ogni modifica di roster, stato (avvio/fine),
+        estrazione, fase del turno e premi assegnati. La segnazione manuale
+        delle cartelle del giocatore umano non fa parte dello stato di partita
+        e non cambia la versione.
+        """
+        return self._versione_stato
+
+
     #metodo che ritorna una lista con i giocatori partecipanti
     def get_giocatori(self) -> List[GiocatoreBase]:
         """
@@ -228,6 +368,22 @@ class Partita:
         return len(self.giocatori)
 
 
+    #metodo che ritorna il giocatore con l'id indicato
+    def get_giocatore_per_id(self, id_giocatore: int) -> Optional[GiocatoreBase]:
+        """
+        Ritorna il giocatore con l'id_giocatore indicato, oppure None.
+
+        In modalità sala la ricerca è una consultazione dell'indice per id;
+        altrimenti scorre il roster.
+        """
+        if self.modalita_sala:
+            return self._giocatori_per_id.get(id_giocatore)
+        for giocatore in self.giocatori:
+            if giocatore.get_id_giocatore() == id_giocatore:
+                return giocatore
+        return None
+
+
     #metodo che ritorna lo stato corrente della partita 
     def get_stato_partita(self):
         """
@@ -303,8 +459,15 @@ class Partita:
                 f"Il giocatore deve essere un'istanza di GiocatoreBase, ricevuto: {type(giocatore)}"
             )
 
-        # CONTROLLO DUPLICATI
-        if giocatore in self.giocatori:
+        # CONTROLLO DUPLICATI (in modalità sala: per identità e per id, in O(1))
+        if self.modalita_sala:
+            gia_presente = (
+                id(giocatore) in self._posizione_giocatore
+                or (giocatore.id_giocatore is not None and giocatore.id_giocatore in self._giocatori_per_id)
+            )
+        else:
+            gia_presente = giocatore in self.giocatori
+        if gia_presente:
             raise PartitaGiocatoreGiaPresenteException(
                 f"Il giocatore '{giocatore.nome}' (ID: {giocatore.id_giocatore}) è già presente nella partita."
             )
@@ -317,6 +480,108 @@ class Partita:
             )
 
         self.giocatori.append(giocatore)
+        giocatore._osservatori_cartelle.append(self)
+        giocatore._notifica_tipi_chiusi(self.premi_tipo_chiusi)
+        self._indice_da_ricostruire = True
+        if self.modalita_sala:
+            self._registra_giocatore_sala(giocatore)
+        self._versione_stato += 1
+
+
+    #metodo chiamato dal giocatore quando gli viene aggiunta una cartella
+    def _notifica_cartella_aggiunta(self, giocatore: GiocatoreBase, cartella: 'Cartella') -> None:
+        """Segna l'indice invertito come da ricostruire alla prossima estrazione."""
+        self._indice_da_ricostruire = True
+
+
+    #metodo privato che avvisa i giocatori dei tipi premio chiusi
+    def _notifica_tipi_chiusi(self) -> None:
+        """
+        I bot scartano subito i candidati al reclamo dei tipi ormai chiusi.
+
+        In modalità sala, con l'indice aggiornato, vengono avvisati solo i
+        giocatori fuori da IndiceSala: quelli indicizzati ricevono
+        premi_tipo_chiusi a ogni valutazione (dichiara_fine_fase_azione()) e
+        lo applicano lì, senza un ciclo su tutto il roster a ogni chiusura.
+        """
+        giocatori = self.giocatori
+        if self._indice_sala is not None and not self._indice_obsoleto():
+            giocatori = self._giocatori_non_indicizzati
+        for giocatore in giocatori:
+            giocatore._notifica_tipi_chiusi(self.premi_tipo_chiusi)
+
+
+    #metodo privato che registra un giocatore negli indici e nei contatori della modalità sala
+    def _registra_giocatore_sala(self, giocatore: GiocatoreBase) -> None:
+        """
+        Indicizza il giocatore per id e posizione nel roster, si registra come
+        osservatore del suo stato di turno e allinea i contatori al suo stato attuale.
+        """
+        chiave = id(giocatore)
+        giocatore._collega_generazione_turno(self._generazione_turno)
+        self._posizione_giocatore[chiave] = len(self._posizione_giocatore)
+        if giocatore.id_giocatore is not None:
+            self._giocatori_per_id[giocatore.id_giocatore] = giocatore
+        giocatore._osservatori_turno.append(self)
+        if giocatore.reclamo_turno is not None:
+            self._giocatori_con_reclamo[chiave] = giocatore
+        if giocatore.turno_dichiarato_concluso:
+            self._giocatori_dichiarati[chiave] = giocatore
+
+
+    #metodo chiamato dal giocatore quando il suo reclamo di turno viene impostato o azzerato
+    def _notifica_reclamo_turno(self, giocatore: GiocatoreBase, presente: bool) -> None:
+        """Aggiorna l'insieme dei giocatori con un reclamo pendente (modalità sala)."""
+        if presente:
+            self._giocatori_con_reclamo[id(giocatore)] = giocatore
+        else:
+            self._giocatori_con_reclamo.pop(id(giocatore), None)
+
+
+    #metodo chiamato dal giocatore quando dichiara (o annulla) la fine del turno
+    def _notifica_dichiarazione_turno(self, giocatore: GiocatoreBase, dichiarato: bool) -> None:
+        """Aggiorna l'insieme dei giocatori che hanno dichiarato fine turno (modalità sala)."""
+        if dichiarato:
+            self._giocatori_dichiarati[id(giocatore)] = giocatore
+        else:
+            self._giocatori_dichiarati.pop(id(giocatore), None)
+
+
+    #metodo privato che ritorna i giocatori da esaminare per i reclami del turno
+    def _giocatori_con_reclamo_turno(self) -> List[GiocatoreBase]:
+        """
+        Ritorna i giocatori con un reclamo pendente, nell'ordine del roster.
+        Fuori dalla modalità sala ritorna l'intero roster (il chiamante salta
+        chi non ha reclamato).
+        """
+        if not self.modalita_sala:
+            return self.giocatori
+        posizione = self._posizione_giocatore
+        return sorted(self._giocatori_con_reclamo.values(), key=lambda g: posizione[id(g)])
+
+
+    #metodo per collegare un giornale strutturato degli eventi alla partita
+    def collega_giornale(self, giornale: 'GiornalePartita', id_partita: Optional[int] = None) -> int:
+        """
+        Collega un GiornalePartita e vi registra l'inizio della partita.
+
+        Da chiamare dopo aver registrato i giocatori (il record di inizio
+        riporta seme e numero di giocatori). Ritorna l'id della partita nel giornale.
+        """
+        self.giornale = giornale
+        return giornale.inizia_partita(self, id_partita)
+
+
+    #metodo per collegare un checkpoint per turno alla partita
+    def collega_checkpoint(self, checkpoint: 'CheckpointPartita') -> None:
+        """
+        Collega un CheckpointPartita e vi scrive subito uno snapshot completo.
+
+        Da chiamare dopo aver registrato i giocatori, oppure su una partita
+        appena ricostruita con ripristina_partita() per continuare a salvarla.
+        """
+        self.checkpoint = checkpoint
+        checkpoint.scrivi_snapshot(self)
 
 
     """Sezione 3: Avvio e terminazione della partita"""
@@ -359,6 +624,14 @@ class Partita:
         # Se tutti i controlli sono passati, avvia la partita
         self.stato_partita = "in_corso"
 
+        # Costruisce l'indice invertito numero -> cartelle sul roster definitivo.
+        self._costruisci_indice_numeri()
+        if self.modalita_sala:
+            # Roster e indice di una sala sono milioni di oggetti appena creati:
+            # una raccolta completa adesso evita che il garbage collector la
+            # faccia durante una delle prime estrazioni (pausa di decine di ms).
+            gc.collect()
+
 
 
     #porta la partita nello stato "terminata". Può in futuro registrare vincitori, statistiche o log di fine partita.
@@ -429,6 +702,7 @@ class Partita:
             )
 
         # Estrae dal tabellone (può sollevare TabelloneNumeriEsauritiException se i numeri sono terminati).
+        t0 = latenze.inizio()
         try:
             numero_estratto = self.tabellone.estrai_numero()
         except TabelloneNumeriEsauritiException as exc:
@@ -437,11 +711,16 @@ class Partita:
                 "Impossibile estrarre un altro numero: il tabellone non ha più numeri disponibili."
             ) from exc
 
+        latenze.fine(latenze.SPAN_ESTRAZIONE, t0)
+
         # Aggiorna lo stato interno della partita.
         self.ultimo_numero_estratto = numero_estratto
 
         # Aggiorna tutti i giocatori con il numero estratto.
+        t0 = latenze.inizio()
         self.aggiorna_giocatori_con_numero(numero_estratto)
+        latenze.fine(latenze.SPAN_PROPAGAZIONE, t0)
+        self._versione_stato += 1
 
         return numero_estratto
 
@@ -454,12 +733,19 @@ class Partita:
         Questo metodo riceve un numero (tipicamente estratto dal tabellone) e lo
         propaga a tutti i giocatori registrati nella partita.
 
-        La logica concreta di aggiornamento è delegata ai giocatori stessi:
-        per ogni giocatore automatico o base viene chiamato
-        GiocatoreBase.aggiorna_con_numero(numero), che si occupa di validare il
-        parametro e di segnare il numero su tutte le cartelle possedute dal
-        giocatore. Il giocatore umano viene escluso da questo aggiornamento
-        automatico: la segnazione resta manuale tramite i comandi UI.
+        Invece di scorrere tutti i giocatori e tutte le cartelle, il metodo usa
+        l'indice invertito numero -> (giocatore, cartella, riga, colonna)
+        costruito da _costruisci_indice_numeri() e chiama segna_numero_presente()
+        solo sulle cartelle che contengono il numero: il costo per estrazione
+        cresce con le cartelle colpite, non con il totale delle cartelle.
+        Il giocatore umano viene escluso da questo aggiornamento automatico:
+        la segnazione resta manuale tramite i comandi UI.
+
+        Le cartelle effettivamente segnate vengono registrate in
+        self.cartelle_modificate_turno; i premi raggiunti per effetto del numero
+        (soglie superate nel tracciatore premi) in self.premi_raggiunti_turno e
+        al proprietario della cartella (_notifica_premio_raggiunto()), così i bot
+        aggiornano i candidati al reclamo senza riscansionare le cartelle.
 
         Vincoli:
         - In una partita ben strutturata questo metodo viene usato durante lo stato
@@ -475,8 +761,8 @@ class Partita:
 
         Eccezioni:
                 - PartitaNonInCorsoException: se la partita non è nello stato "in_corso".
-        - Le eccezioni di validazione del giocatore (es. tipo/range del numero)
-          possono propagarsi da GiocatoreBase.aggiorna_con_numero(numero).
+        - GiocatoreNumeroTypeException / GiocatoreNumeroValueException: numero non
+          intero o fuori dal range 1-90 (stesso contratto di GiocatoreBase.aggiorna_con_numero).
         """
         # Consentire l'aggiornamento dei giocatori solo durante una partita in corso.
         if self.stato_partita != "in_corso":
@@ -485,12 +771,199 @@ class Partita:
                 "È possibile aggiornare i giocatori solo quando la partita è in_corso."
             )
 
-        # Propaga il numero a tutti i giocatori registrati, ma lascia al
-        # giocatore umano la segnazione manuale tramite Space.
-        for giocatore in self.giocatori:
-            if isinstance(giocatore, GiocatoreUmano):
-                continue
-            giocatore.aggiorna_con_numero(numero)
+        # Stessa validazione di GiocatoreBase.aggiorna_con_numero(): l'indice
+        # invertito non passa più dal giocatore, quindi il controllo avviene qui.
+        if not isinstance(numero, int):
+            raise GiocatoreNumeroTypeException(numero)
+        if numero < 1 or numero > 90:
+            raise GiocatoreNumeroValueException(numero)
+
+        # Ricostruisce l'indice solo se roster o cartelle sono cambiati
+        # (flag impostato da aggiungi_giocatore() e aggiungi_cartella()).
+        if self._indice_obsoleto():
+            self._costruisci_indice_numeri()
+
+        # Segna il numero solo sulle cartelle che lo contengono. Il giocatore
+        # umano è già escluso dall'indice: la sua segnazione resta manuale (Space).
+        # Ogni segnazione aggiorna anche i contatori del tracciatore premi, che
+        # ritorna i premi appena raggiunti senza riscansionare la cartella.
+        if self.modalita_sala:
+            self._propaga_numero_sala(numero)
+            return
+
+        cartelle_modificate = []
+        premi_raggiunti = []
+        for giocatore, cartella, indice_riga, _colonna in self._indice_numeri[numero]:
+            if cartella.segna_numero_presente(numero):
+                cartelle_modificate.append(cartella)
+                for tipo, riga in self.tracciatore_premi.segna(cartella, indice_riga):
+                    if tipo == "tombola":
+                        self._tombola_da_propagazione = True
+                    giocatore._notifica_premio_raggiunto(cartella, tipo, riga)
+                    premi_raggiunti.append({
+                        "giocatore": giocatore.get_nome(),
+                        "id_giocatore": giocatore.get_id_giocatore(),
+                        "cartella": cartella.indice,
+                        "premio": tipo,
+                        "riga": riga,
+                    })
+        self.cartelle_modificate_turno = cartelle_modificate
+        self.premi_raggiunti_turno = premi_raggiunti
+
+
+    #metodo privato che propaga il numero estratto in modalità sala
+    def _propaga_numero_sala(self, numero: int) -> None:
+        """
+        Variante di aggiorna_giocatori_con_numero() per la modalità sala.
+
+        Stesso effetto (cartelle segnate, cartelle_modificate_turno,
+        premi_raggiunti_turno), ma segnazione e contatori di riga sono
+        aggiornati a blocchi da IndiceSala.segna(), che notifica ai giocatori
+        solo i premi ancora utili. I premi raggiunti vengono letti dall'indice
+        e convertiti in dizionari solo da get_premi_raggiunti_turno().
+        """
+        tombola = self._indice_sala.segna(numero, self.premi_tipo_chiusi)
+        self.premi_raggiunti_turno = []
+        if tombola is None:
+            # Numero già propagato: nessuna cartella cambia.
+            self.cartelle_modificate_turno = []
+            self._numero_premi_sala = None
+            return
+        if tombola:
+            self._tombola_da_propagazione = True
+        self.cartelle_modificate_turno = self._indice_sala.cartelle_con_numero(numero)
+        self._numero_premi_sala = numero
+
+
+    #metodo privato che dice se l'indice invertito va ricostruito
+    def _indice_obsoleto(self) -> bool:
+        """
+        True se l'indice non è mai stato costruito o se dall'ultima costruzione
+        è stato aggiunto un giocatore o una cartella. Il confronto sulla
+        lunghezza del roster copre anche i giocatori aggiunti direttamente alla
+        lista self.giocatori. Costo O(1) a ogni estrazione.
+        """
+        return (
+            self._indice_da_ricostruire
+            or self._giocatori_indicizzati != len(self.giocatori)
+            or (self._indice_sala is not None and self._indice_sala.obsoleto)
+        )
+
+
+    #metodo privato che costruisce l'indice invertito numero -> (giocatore, cartella, riga, colonna)
+    def _costruisci_indice_numeri(self) -> None:
+        """
+        Costruisce l'indice invertito dei numeri delle cartelle dei giocatori.
+
+        Per ogni numero 1-90 memorizza la lista delle posizioni
+        (giocatore, cartella, riga, colonna) in cui compare, leggendo la griglia
+        3x9 di ogni cartella. I giocatori umani sono esclusi, perché le loro
+        cartelle non vengono segnate automaticamente.
+
+        In questo modo aggiorna_giocatori_con_numero() tocca solo le cartelle
+        che contengono il numero estratto (in media circa 1/6 del totale),
+        invece di chiamare segna_numero() su tutte.
+
+        In modalità sala viene costruito invece un IndiceSala (slot di riga e
+        contatori per numero): le tuple di posizione non vengono create e le
+        cartelle non vengono registrate nel tracciatore premi, che le
+        ricalcola solo se reclamate.
+
+        Note:
+        - L'indice fotografa le griglie al momento della costruzione: le cartelle
+          non devono essere rigenerate durante la partita.
+        - La slot 0 resta vuota per poter indicizzare direttamente con il numero.
+        """
+        non_indicizzati: List[GiocatoreBase] = []
+        if self.modalita_sala:
+            if self._indice_sala is not None:
+                self._indice_sala.scollega()
+            indice_sala = IndiceSala()
+            for giocatore in self.giocatori:
+                if isinstance(giocatore, GiocatoreUmano):
+                    non_indicizzati.append(giocatore)
+                    continue
+                for cartella in giocatore.get_cartelle():
+                    indice_sala.aggiungi_cartella(giocatore, cartella)
+            self._indice_sala = indice_sala
+        else:
+            indice: List[List[Tuple[GiocatoreBase, 'Cartella', int, int]]] = [[] for _ in range(91)]
+            for giocatore in self.giocatori:
+                if isinstance(giocatore, GiocatoreUmano):
+                    non_indicizzati.append(giocatore)
+                    continue
+                for cartella in giocatore.get_cartelle():
+                    self.tracciatore_premi.registra_cartella(cartella)
+                    for indice_riga, riga in enumerate(cartella.cartella):
+                        for indice_colonna, valore in enumerate(riga):
+                            if valore is not None:
+                                indice[valore].append((giocatore, cartella, indice_riga, indice_colonna))
+            self._indice_numeri = indice
+
+        self._giocatori_non_indicizzati = non_indicizzati
+        self._indice_da_ricostruire = False
+        self._giocatori_indicizzati = len(self.giocatori)
+
+
+    #metodo che ritorna le posizioni indicizzate di un numero nelle cartelle dei giocatori non umani
+    def get_posizioni_numero(self, numero: int) -> List[Tuple[GiocatoreBase, 'Cartella', int, int]]:
+        """
+        Ritorna le posizioni (giocatore, cartella, riga, colonna) in cui compare
+        il numero nelle cartelle segnate automaticamente.
+
+        Se l'indice non è ancora stato costruito (partita non avviata), viene
+        costruito al volo sul roster corrente.
+
+        Ritorna:
+        - List[Tuple]: copia della lista di posizioni (vuota se il numero non compare).
+        """
+        if self._indice_obsoleto():
+            self._costruisci_indice_numeri()
+        if self._indice_sala is not None:
+            return self._indice_sala.posizioni(numero)
+        return list(self._indice_numeri[numero])
+
+
+    #metodo che ritorna le cartelle segnate dall'ultimo numero propagato
+    def get_cartelle_modificate_turno(self) -> List['Cartella']:
+        """
+        Ritorna le cartelle il cui stato è cambiato con l'ultimo numero estratto.
+
+        Sono le sole cartelle (non umane) su cui un nuovo premio può essere
+        comparso per effetto dell'estrazione del turno corrente.
+
+        Ritorna:
+        - List[Cartella]: copia della lista delle cartelle modificate.
+        """
+        return list(self.cartelle_modificate_turno)
+
+
+    #metodo che ritorna i premi raggiunti sulle cartelle con l'ultimo numero propagato
+    def get_premi_raggiunti_turno(self) -> List[Dict[str, Any]]:
+        """
+        Ritorna i premi "appena raggiunti" con l'ultimo numero estratto, così come
+        emessi dal tracciatore premi durante la propagazione.
+
+        Sono eventi di stato delle cartelle, non assegnazioni: un premio viene
+        assegnato solo da verifica_premi() a fronte di un reclamo.
+
+        Ritorna:
+        - List[Dict]: copie degli eventi {"giocatore", "id_giocatore", "cartella",
+          "premio", "riga"}; riga è None per la tombola.
+        """
+        if self._numero_premi_sala is not None:
+            self.premi_raggiunti_turno = [
+                {
+                    "giocatore": giocatore.get_nome(),
+                    "id_giocatore": giocatore.get_id_giocatore(),
+                    "cartella": cartella.indice,
+                    "premio": tipo,
+                    "riga": riga,
+                }
+                for giocatore, cartella, tipo, riga in self._indice_sala.premi_raggiunti(self._numero_premi_sala)
+            ]
+            self._numero_premi_sala = None
+        return [dict(evento) for evento in self.premi_raggiunti_turno]
 
 
 
@@ -578,7 +1051,8 @@ class Partita:
         Scansiona tutti i giocatori e le loro cartelle per trovare NUOVI premi.
         
         Questo metodo è il 'regista' delle vittorie:
-        1. Chiama 'verifica_premi_per_cartella' per sapere cosa c'è su ogni cartella.
+        1. Interroga il tracciatore premi (contatori per riga e per cartella,
+           controlli a soglia in O(1)) per sapere cosa c'è sulla cartella reclamata.
         2. Confronta i risultati con 'self.premi_gia_assegnati' per capire se sono novità.
         3. Se un premio è nuovo, lo registra e lo aggiunge alla lista degli eventi da ritornare.
         
@@ -593,10 +1067,16 @@ class Partita:
         """
         
         # Raccoglie tutti i candidati validi per tipo senza assegnare (prima passata).
-        # Struttura: tipo_premio -> lista di candidati {giocatore, cartella, indice_riga, chiave}
+        # Struttura: tipo_premio -> lista di candidati {giocatore, cartella, indice_riga, codice}
         candidati_per_tipo: Dict[str, List[Dict]] = {}
 
-        for giocatore in self.giocatori:
+        # In modalità sala le cartelle indicizzate si leggono dai contatori di
+        # IndiceSala, senza ricalcolarle nel tracciatore.
+        indice_sala = self._indice_sala
+        if indice_sala is not None and self._indice_obsoleto():
+            indice_sala = None
+
+        for giocatore in self._giocatori_con_reclamo_turno():
             if giocatore.reclamo_turno is None:
                 continue
 
@@ -610,14 +1090,14 @@ class Partita:
             if cartella is None:
                 continue
 
-            stato_cartella = self.verifica_premi_per_cartella(cartella)
             id_cartella = cartella.indice
+            contatori = indice_sala if indice_sala is not None and indice_sala.contiene(cartella) else self.tracciatore_premi
 
             if reclamo.tipo == "tombola":
-                chiave = f"cartella_{id_cartella}_tombola"
-                if (stato_cartella["tombola"]
+                codice = codice_premio(id_cartella, "tombola")
+                if (contatori.ha_tombola(cartella)
                         and "tombola" not in self.premi_tipo_chiusi
-                        and chiave not in self.premi_gia_assegnati):
+                        and not self.premi_gia_assegnati.contiene_codice(codice)):
                     tipo = "tombola"
                     if tipo not in candidati_per_tipo:
                         candidati_per_tipo[tipo] = []
@@ -625,33 +1105,34 @@ class Partita:
                         "giocatore": giocatore,
                         "cartella": id_cartella,
                         "indice_riga": None,
-                        "chiave": chiave,
+                        "codice": codice,
                     })
             else:
                 # Premio di riga: trova il premio più alto realmente presente sulla riga.
                 indice_riga = reclamo.indice_riga
                 if indice_riga is None:
                     continue
-                premi_riga = stato_cartella["righe"].get(indice_riga, {})
-                for tipo in ["cinquina", "quaterna", "terno", "ambo"]:
-                    if premi_riga.get(tipo, False):
-                        chiave = f"cartella_{id_cartella}_riga_{indice_riga}_{tipo}"
-                        if tipo not in self.premi_tipo_chiusi and chiave not in self.premi_gia_assegnati:
-                            if tipo not in candidati_per_tipo:
-                                candidati_per_tipo[tipo] = []
-                            candidati_per_tipo[tipo].append({
-                                "giocatore": giocatore,
-                                "cartella": id_cartella,
-                                "indice_riga": indice_riga,
-                                "chiave": chiave,
-                            })
-                        break  # Solo il premio più alto presente sulla riga
+                if indice_riga not in (0, 1, 2):
+                    continue
+                # Solo il premio più alto presente sulla riga (soglia sul contatore).
+                tipo = contatori.premio_massimo_riga(cartella, indice_riga)
+                if tipo is not None:
+                    codice = codice_premio(id_cartella, tipo, indice_riga)
+                    if tipo not in self.premi_tipo_chiusi and not self.premi_gia_assegnati.contiene_codice(codice):
+                        if tipo not in candidati_per_tipo:
+                            candidati_per_tipo[tipo] = []
+                        candidati_per_tipo[tipo].append({
+                            "giocatore": giocatore,
+                            "cartella": id_cartella,
+                            "indice_riga": indice_riga,
+                            "codice": codice,
+                        })
 
         # Seconda passata: assegna il premio a TUTTI i candidati validi per tipo (co-vincita).
         nuovi_eventi = []
         for tipo, candidati in candidati_per_tipo.items():
             for candidato in candidati:
-                self.premi_gia_assegnati.add(candidato["chiave"])
+                self.premi_gia_assegnati.aggiungi_codice(candidato["codice"])
                 evento: Dict[str, Any] = {
                     "giocatore": candidato["giocatore"].get_nome(),
                     "id_giocatore": candidato["giocatore"].get_id_giocatore(),
@@ -666,6 +1147,8 @@ class Partita:
 
         if nuovi_eventi:
             self.ultimo_premio_evento = nuovi_eventi[-1]
+            self._notifica_tipi_chiusi()
+            self._versione_stato += 1
 
         return nuovi_eventi
 
@@ -688,7 +1171,15 @@ class Partita:
         - Se la partita è "non_iniziata", tipicamente il risultato sarà False,
           perché non sono ancora state fatte estrazioni.
         - Il metodo non modifica lo stato della partita.
+        - In modalità sala la tombola dei giocatori indicizzati è quella
+          segnalata dal tracciatore premi durante la propagazione dei numeri;
+          vengono scansionati solo i giocatori esclusi dall'indice (umani).
         """
+        if self.modalita_sala and self._indice_sala is not None:
+            if self._tombola_da_propagazione:
+                return True
+            return any(giocatore.has_tombola() for giocatore in self._giocatori_non_indicizzati)
+
         # Scorre i giocatori: basta che uno abbia tombola per terminare il controllo.
         for giocatore in self.giocatori:
             if giocatore.has_tombola():
@@ -734,6 +1225,11 @@ class Partita:
         numero_estratto = self.estrai_prossimo_numero()
 
         self.fase_turno_corrente = "attesa_reclami"
+        self._versione_stato += 1
+        if self.giornale is not None:
+            self.giornale.registra_estrazione(self, numero_estratto)
+        if self.checkpoint is not None:
+            self.checkpoint.registra_estrazione(self, numero_estratto)
 
         return {
             "numero_estratto": numero_estratto,
@@ -768,43 +1264,61 @@ class Partita:
                 "attesa 'attesa_reclami'."
             )
 
+        t0 = latenze.inizio()
         premi_nuovi = self.verifica_premi()
+        latenze.fine(latenze.SPAN_VERIFICA_PREMI, t0)
+
+        t0 = latenze.inizio()
+        # Confronto reclami bot vs premi reali: i premi nuovi vengono indicizzati
+        # per (giocatore, cartella, premio, riga), così ogni reclamo è una
+        # consultazione invece di una scansione degli eventi. Il giocatore è
+        # identificato per id, oppure per nome se il bot non ha id.
+        premi_indicizzati = set()
+        for evento in premi_nuovi:
+            dettaglio = (evento["cartella"], evento["premio"], evento["riga"])
+            premi_indicizzati.add((("id", evento.get("id_giocatore")),) + dettaglio)
+            premi_indicizzati.add((("nome", evento["giocatore"]),) + dettaglio)
 
-        # Confronto reclami bot vs premi reali.
         reclami_bot = []
-        for giocatore in self.giocatori:
+        for giocatore in self._giocatori_con_reclamo_turno():
             if giocatore.is_automatico() and giocatore.reclamo_turno is not None:
                 reclamo = giocatore.reclamo_turno
-                successo = False
                 id_bot = giocatore.get_id_giocatore()
-                for evento in premi_nuovi:
-                    giocatore_match = (
-                        (id_bot is not None and evento.get("id_giocatore") == id_bot) or
-                        (id_bot is None and evento["giocatore"] == giocatore.get_nome())
-                    )
-                    if (giocatore_match and
-                            evento["cartella"] == reclamo.indice_cartella and
-                            evento["premio"] == reclamo.tipo and
-                            evento["riga"] == reclamo.indice_riga):
-                        successo = True
-                        break
+                identita = ("id", id_bot) if id_bot is not None else ("nome", giocatore.get_nome())
+                successo = (
+                    identita, reclamo.indice_cartella, reclamo.tipo, reclamo.indice_riga
+                ) in premi_indicizzati
                 reclami_bot.append({
                     "nome_giocatore": giocatore.get_nome(),
                     "id_giocatore": giocatore.get_id_giocatore(),
                     "reclamo": reclamo,
                     "successo": successo,
                 })
+        latenze.fine(latenze.SPAN_EVENTI, t0)
 
         # Reset: reclami e turno_dichiarato_concluso per tutti i giocatori.
-        for giocatore in self.giocatori:
-            giocatore.reset_reclamo_turno()
-            giocatore.turno_dichiarato_concluso = False
+        # In modalità sala basta far avanzare la generazione di turno condivisa:
+        # lo stato scritto nel turno appena chiuso diventa obsoleto e viene
+        # azzerato dal giocatore alla prima lettura o scrittura.
+        if self.modalita_sala:
+            self._generazione_turno.valore += 1
+            self._giocatori_con_reclamo.clear()
+            self._giocatori_dichiarati.clear()
+        else:
+            for giocatore in self.giocatori:
+                giocatore.reset_reclamo_turno()
+                giocatore.turno_dichiarato_concluso = False
 
         tombola_rilevata = self.has_tombola()
         if tombola_rilevata:
             self.termina_partita()
 
         self.fase_turno_corrente = "attesa_estrazione"
+        self._versione_stato += 1
+        if self.giornale is not None:
+            self.giornale.registra_verifica(self, premi_nuovi, reclami_bot)
+        if self.checkpoint is not None:
+            self.checkpoint.registra_verifica(self, premi_nuovi)
 
         return {
             "premi_nuovi": premi_nuovi,
@@ -826,7 +1340,12 @@ class Partita:
         Ritorna:
         - True: tutti i giocatori hanno turno_dichiarato_concluso == True.
         - False: almeno uno (umano o bot) non ha ancora dichiarato fine.
+
+        In modalità sala il controllo è un confronto tra il contatore dei
+        giocatori che hanno dichiarato e la dimensione del roster.
         """
+        if self.modalita_sala:
+            return len(self._giocatori_dichiarati) == len(self.giocatori)
         for giocatore in self.giocatori:
             if not giocatore.turno_dichiarato_concluso:
                 return False
@@ -965,8 +1484,11 @@ class Partita:
       """
       Ritorna la fotografia sintetica pubblica dello stato attuale della partita.
 
-      È una vista ridotta di get_stato_completo(): include solo i campi minimi
-      richiesti dal layer controller/UI secondo il contratto di bordo.
+      Contiene gli stessi valori dei corrispondenti campi di get_stato_completo(),
+      ma li costruisce direttamente: non calcola numeri_mancanti e non passa
+      dallo snapshot completo. Include solo i campi minimi richiesti dal layer
+      controller/UI secondo il contratto di bordo. Per un'interrogazione
+      periodica a costo costante usare get_stato_riepilogo().
 
       Ritorna:
       - Dict[str, Any]: Dizionario con chiavi pubbliche e stabili per il bordo
@@ -977,15 +1499,46 @@ class Partita:
         - "giocatori"
         - "premi_gia_assegnati"
       """
-      completo = self.get_stato_completo()
+      stato_partita = self.stato_partita
+      if not isinstance(stato_partita, str):
+        stato_partita = str(stato_partita)
+
+      # Liste nuove a ogni chiamata: nessun alias sullo stato interno.
+      return {
+        "stato_partita": stato_partita,
+        "ultimo_numero_estratto": self.ultimo_numero_estratto,
+        "numeri_estratti": list(self.tabellone.get_numeri_estratti()),
+        "giocatori": list(self.get_stato_giocatori()),
+        "premi_gia_assegnati": sorted(self.premi_gia_assegnati),
+      }
+
+
+    #metodo che ritorna i contatori essenziali della partita in tempo costante
+    def get_stato_riepilogo(self) -> Dict[str, Any]:
+      """
+      Ritorna un riepilogo a costo costante dello stato della partita, pensato
+      per l'interrogazione frequente da parte della UI.
 
-      # Copie difensive per evitare alias sullo stato interno.
+      Non scorre giocatori, cartelle né premi: legge solo attributi e contatori.
+
+      Ritorna:
+      - Dict[str, Any] con chiavi:
+          - "versione": int (vedi get_versione_stato())
+          - "stato_partita": str
+          - "fase_turno": str
+          - "ultimo_numero_estratto": int | None
+          - "conteggio_estratti": int
+          - "conteggio_giocatori": int
+          - "conteggio_premi_assegnati": int
+      """
       return {
-        "stato_partita": completo["stato_partita"],
-        "ultimo_numero_estratto": completo["ultimo_numero_estratto"],
-        "numeri_estratti": list(completo["numeri_estratti"]),
-        "giocatori": list(completo["giocatori"]),
-        "premi_gia_assegnati": list(completo["premi_gia_assegnati"]),
+        "versione": self._versione_stato,
+        "stato_partita": self.stato_partita,
+        "fase_turno": self.fase_turno_corrente,
+        "ultimo_numero_estratto": self.ultimo_numero_estratto,
+        "conteggio_estratti": self.tabellone.get_conteggio_estratti(),
+        "conteggio_giocatori": len(self.giocatori),
+        "conteggio_premi_assegnati": len(self.premi_gia_assegnati),
       }
 
 
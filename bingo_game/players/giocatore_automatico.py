@@ -8,14 +8,61 @@ Al momento questa classe si appoggia completamente alla logica di
 GiocatoreBase per la gestione di nome, id, cartelle e aggiornamento
 rispetto ai numeri estratti, ma espone un punto di ingresso comodo
 per la futura integrazione con la logica della Partita.
+
+La valutazione del reclamo (_valuta_potenziale_reclamo) legge una struttura
+di candidati per rango, tenuti in ordine di cartella e di riga, mantenuta dal
+bot stesso: la Partita notifica i premi raggiunti dal percorso di segnazione
+e i tipi chiusi, le cartelle notificano le segnazioni fatte fuori dalla
+Partita (ricalcolate alla valutazione successiva). I candidati portano il
+codice intero del premio (bingo_game.registro_premi): con un RegistroPremi
+il controllo "già assegnato" è un accesso al bitset, senza costruire chiavi.
 """
 
 from __future__ import annotations
 
-from typing import Optional
+from bisect import bisect_left, insort
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
 
+from bingo_game.cartella import Cartella
+from bingo_game import latenze
 from bingo_game.players.giocatore_base import GiocatoreBase
 from bingo_game.events.eventi_partita import ReclamoVittoria
+from bingo_game.registro_premi import RegistroPremi, chiave_premio, codice_premio
+from bingo_game.tracciatore_premi import PREMIO_PER_SOGLIA
+
+if TYPE_CHECKING:
+    from bingo_game.indice_sala import IndiceSala
+
+
+# Gerarchia dei premi per la scelta del reclamo: tombola=4, cinquina=3,
+# quaterna=2, terno=1, ambo=0 (vince il rango più alto).
+_PREMI_PER_RANGO: Tuple[str, ...] = ("ambo", "terno", "quaterna", "cinquina", "tombola")
+_RANGO_PREMIO: Dict[str, int] = {tipo: rango for rango, tipo in enumerate(_PREMI_PER_RANGO)}
+_RANGO_TOMBOLA: int = _RANGO_PREMIO["tombola"]
+
+# Candidato al reclamo: codice del premio, tipo, indice cartella, indice riga.
+_Candidato = Tuple[int, str, Optional[int], Optional[int]]
+
+
+#definizione della classe di supporto con lo stato di una cartella del bot
+class _StatoCartellaBot:
+    """
+    Premi raggiunti da una cartella del bot, come riflessi nei candidati.
+
+    posizione è l'indice della cartella nel roster del bot (ordine di
+    scansione); versione è la versione_segnazioni della cartella all'ultimo
+    ricalcolo (-1 = mai ricalcolata); tipi_riga è il premio più alto di ogni
+    riga (None sotto l'ambo).
+    """
+
+    __slots__ = ("cartella", "posizione", "versione", "tipi_riga", "tombola")
+
+    def __init__(self, cartella: Cartella, posizione: int) -> None:
+        self.cartella = cartella
+        self.posizione = posizione
+        self.versione: int = -1
+        self.tipi_riga: List[Optional[str]] = [None, None, None]
+        self.tombola: bool = False
 
 
 class GiocatoreAutomatico(GiocatoreBase):
@@ -48,6 +95,20 @@ class GiocatoreAutomatico(GiocatoreBase):
         La validazione di nome e id_giocatore è delegata a GiocatoreBase.
         """
         super().__init__(nome=nome, id_giocatore=id_giocatore)
+        # Candidati al reclamo mantenuti in modo incrementale: per ogni rango,
+        # i candidati indicizzati per ordine di scansione (posizione cartella * 4,
+        # poi 0 = tombola, 1-3 = righe) e gli stessi ordini tenuti ordinati, così
+        # il miglior reclamo è il primo ordine non assegnato del rango più alto.
+        self._stati_cartelle: Dict[int, _StatoCartellaBot] = {}
+        self._cartelle_da_sincronizzare: Dict[int, _StatoCartellaBot] = {}
+        self._candidati_per_rango: List[Dict[int, _Candidato]] = [{} for _ in _PREMI_PER_RANGO]
+        self._ordini_per_rango: List[List[int]] = [[] for _ in _PREMI_PER_RANGO]
+        # Ranghi dei tipi chiusi nella partita: i loro candidati non vengono tenuti.
+        self._ranghi_chiusi: Set[int] = set()
+        # Slot di riga accodati dall'IndiceSala della modalità sala, consegnati
+        # come premi raggiunti alla prossima valutazione.
+        self._indice_sala: Optional[IndiceSala] = None
+        self._premi_in_coda: List[int] = []
 
 
     """metodi relativi alla classe giocatoreAutomatico"""
@@ -83,27 +144,183 @@ class GiocatoreAutomatico(GiocatoreBase):
         self.aggiorna_con_numero(numero)
 
 
-    def _valuta_potenziale_reclamo(self, premi_gia_assegnati: set[str], premi_tipo_chiusi: Optional[set] = None) -> Optional[ReclamoVittoria]:
+    #metodo per aggiungere una cartella al bot registrandosi come suo osservatore
+    def aggiungi_cartella(self, cartella: Cartella) -> None:
+        """
+        Override di GiocatoreBase: oltre ad aggiungere la cartella, il bot si
+        registra come osservatore delle sue segnazioni e la mette tra le
+        cartelle da sincronizzare alla prossima valutazione.
+        """
+        super().aggiungi_cartella(cartella)
+        stato = _StatoCartellaBot(cartella, len(self.cartelle) - 1)
+        self._stati_cartelle[id(cartella)] = stato
+        self._cartelle_da_sincronizzare[id(cartella)] = stato
+        cartella._osservatori_segnazioni.append(self)
+
+
+    """metodi privati di mantenimento dei candidati al reclamo"""
+
+    #metodo chiamato dalla cartella quando segna_numero() o reset_cartella() la modificano
+    def _notifica_segnazioni_cartella(self, cartella: Cartella) -> None:
+        stato = self._stati_cartelle.get(id(cartella))
+        if stato is not None:
+            self._cartelle_da_sincronizzare[id(cartella)] = stato
+
+    #metodo chiamato dalla Partita quando una cartella del bot raggiunge un premio
+    def _notifica_premio_raggiunto(self, cartella: Cartella, tipo: str, indice_riga: Optional[int]) -> None:
+        """
+        Aggiorna il candidato della riga (o la tombola) dal percorso di
+        segnazione della Partita, senza riscansionare la cartella. Le cartelle
+        in attesa di sincronizzazione vengono comunque ricalcolate per intero.
+        """
+        chiave = id(cartella)
+        stato = self._stati_cartelle.get(chiave)
+        if stato is None or chiave in self._cartelle_da_sincronizzare:
+            return
+        if tipo == "tombola":
+            self._imposta_tombola(stato, True)
+        else:
+            self._imposta_premio_riga(stato, indice_riga, tipo)
+
+    #metodo che ritorna la coda in cui IndiceSala accoda i premi raggiunti
+    def _coda_premi_raggiunti(self, indice: IndiceSala) -> List[int]:
+        """
+        Override di GiocatoreBase: in modalità sala i premi raggiunti vengono
+        accodati e consegnati da _sincronizza_candidati(), fuori dal percorso
+        di estrazione. La coda di un indice sostituito viene consegnata subito.
+        """
+        if indice is not self._indice_sala:
+            if self._premi_in_coda:
+                self._indice_sala.consegna_premi(self._premi_in_coda, self)
+            self._indice_sala = indice
+        return self._premi_in_coda
+
+    #metodo chiamato dalla Partita quando l'insieme dei tipi premio chiusi cambia
+    def _notifica_tipi_chiusi(self, tipi_chiusi: Set[str]) -> None:
+        """
+        Scarta i candidati dei tipi appena chiusi. Se un tipo torna aperto
+        (nuova partita) tutte le cartelle vengono ricalcolate.
+        """
+        ranghi = {_RANGO_PREMIO[tipo] for tipo in tipi_chiusi}
+        riaperti = self._ranghi_chiusi - ranghi
+        self._ranghi_chiusi = ranghi
+        for rango in ranghi:
+            self._candidati_per_rango[rango].clear()
+            self._ordini_per_rango[rango].clear()
+        if riaperti:
+            self._candidati_per_rango = [{} for _ in _PREMI_PER_RANGO]
+            self._ordini_per_rango = [[] for _ in _PREMI_PER_RANGO]
+            for chiave, stato in self._stati_cartelle.items():
+                stato.versione = -1
+                stato.tipi_riga = [None, None, None]
+                stato.tombola = False
+                self._cartelle_da_sincronizzare[chiave] = stato
+
+    #metodo che applica le notifiche in attesa e ricalcola le cartelle modificate fuori dalla Partita
+    def _sincronizza_candidati(self, tipi_chiusi: Optional[Set[str]] = None) -> None:
+        """
+        Applica i tipi chiusi ricevuti con la valutazione, se diversi da quelli
+        già noti (in modalità sala Partita non li notifica ai bot indicizzati),
+        poi i premi accodati da IndiceSala, infine ricalcola le cartelle
+        segnalate dalle loro notifiche (segna_numero(), reset_cartella(),
+        cartelle aggiunte) la cui versione_segnazioni è cambiata dall'ultimo
+        ricalcolo. Senza notifiche non costa nulla.
+        """
+        if tipi_chiusi and {_RANGO_PREMIO[tipo] for tipo in tipi_chiusi} != self._ranghi_chiusi:
+            self._notifica_tipi_chiusi(tipi_chiusi)
+        if self._premi_in_coda:
+            self._indice_sala.consegna_premi(self._premi_in_coda, self)
+        da_sincronizzare = self._cartelle_da_sincronizzare
+        if not da_sincronizzare:
+            return
+        for stato in da_sincronizzare.values():
+            if stato.versione != stato.cartella.versione_segnazioni:
+                self._ricalcola_cartella(stato)
+        da_sincronizzare.clear()
+
+    #metodo che ricalcola i premi raggiunti da una cartella e ne aggiorna i candidati
+    def _ricalcola_cartella(self, stato: _StatoCartellaBot) -> None:
+        cartella = stato.cartella
+        segnati = cartella.numeri_segnati
+        totale = 0
+        for indice_riga, riga in enumerate(cartella.cartella):
+            conteggio = 0
+            for valore in riga:
+                if valore is not None and valore in segnati:
+                    conteggio += 1
+            totale += conteggio
+            self._imposta_premio_riga(stato, indice_riga, PREMIO_PER_SOGLIA.get(conteggio))
+        self._imposta_tombola(stato, bool(cartella.numeri_cartella) and totale == len(cartella.numeri_cartella))
+        stato.versione = cartella.versione_segnazioni
+
+    #metodo che sostituisce il candidato di una riga quando il suo premio più alto cambia
+    def _imposta_premio_riga(self, stato: _StatoCartellaBot, indice_riga: int, tipo: Optional[str]) -> None:
+        precedente = stato.tipi_riga[indice_riga]
+        if tipo == precedente:
+            return
+        ordine = stato.posizione * 4 + 1 + indice_riga
+        if precedente is not None:
+            self._rimuovi_candidato(_RANGO_PREMIO[precedente], ordine)
+        if tipo is not None:
+            indice_cartella = stato.cartella.indice
+            self._inserisci_candidato(
+                _RANGO_PREMIO[tipo], ordine,
+                (codice_premio(indice_cartella, tipo, indice_riga), tipo, indice_cartella, indice_riga),
+            )
+        stato.tipi_riga[indice_riga] = tipo
+
+    #metodo che aggiunge o toglie il candidato tombola di una cartella
+    def _imposta_tombola(self, stato: _StatoCartellaBot, tombola: bool) -> None:
+        if tombola == stato.tombola:
+            return
+        ordine = stato.posizione * 4
+        if tombola:
+            indice_cartella = stato.cartella.indice
+            self._inserisci_candidato(
+                _RANGO_TOMBOLA, ordine,
+                (codice_premio(indice_cartella, "tombola"), "tombola", indice_cartella, None),
+            )
+        else:
+            self._rimuovi_candidato(_RANGO_TOMBOLA, ordine)
+        stato.tombola = tombola
+
+    def _inserisci_candidato(self, rango: int, ordine: int, candidato: _Candidato) -> None:
+        if rango in self._ranghi_chiusi:
+            return
+        self._candidati_per_rango[rango][ordine] = candidato
+        insort(self._ordini_per_rango[rango], ordine)
+
+    def _rimuovi_candidato(self, rango: int, ordine: int) -> None:
+        if self._candidati_per_rango[rango].pop(ordine, None) is not None:
+            ordini = self._ordini_per_rango[rango]
+            del ordini[bisect_left(ordini, ordine)]
+
+    def _valuta_potenziale_reclamo(self, premi_gia_assegnati: RegistroPremi | set[str], premi_tipo_chiusi: Optional[set] = None) -> Optional[ReclamoVittoria]:
         """
         Valuta se il bot può reclamare un premio in base allo stato attuale delle sue cartelle.
 
-        Questo metodo è il cuore della feature "Bot Attivo": analizza tutte le cartelle
-        del bot e determina il premio di rango più alto che può essere reclamato,
-        rispettando i premi già assegnati in turni precedenti.
+        Questo metodo è il cuore della feature "Bot Attivo": determina il premio
+        di rango più alto che il bot può reclamare, rispettando i premi già
+        assegnati in turni precedenti.
 
         Algoritmo:
-        1. Definisce la gerarchia dei premi (dal più alto al più basso):
+        1. Gerarchia dei premi (dal più alto al più basso):
            tombola > cinquina > quaterna > terno > ambo
-        2. Per ogni cartella:
-           - Controlla la tombola (cartella completa)
-           - Controlla ogni riga per premi intermedi (cinquina, quaterna, terno, ambo)
-        3. Seleziona il reclamo con il rango più alto tra tutte le cartelle
+        2. I candidati (tombola di ogni cartella completa, premio più alto di
+           ogni riga) sono mantenuti per rango, in ordine di cartella e di
+           riga, dalle notifiche della Partita (premi raggiunti, tipi chiusi);
+           le cartelle segnate fuori dalla Partita vengono ricalcolate qui
+           (_sincronizza_candidati()).
+        3. Dal rango più alto si saltano i tipi chiusi; del primo rango aperto
+           si sceglie il primo candidato non ancora assegnato. Una riga il cui
+           premio più alto è già assegnato non propone premi inferiori.
         4. Ritorna il reclamo, oppure None se nessun premio è reclamabile
 
         Parametri:
-        - premi_gia_assegnati: set[str]
-          Snapshot dei premi già assegnati nei turni precedenti.
-          Ogni chiave ha il formato:
+        - premi_gia_assegnati: RegistroPremi | set[str]
+          Snapshot dei premi già assegnati nei turni precedenti: un
+          RegistroPremi (interrogato per codice) oppure un set di chiavi nel
+          formato:
           - "cartella_{idx}_tombola" per la tombola
           - "cartella_{idx}_riga_{r}_{tipo}" per i premi di riga
 
@@ -113,82 +330,32 @@ class GiocatoreAutomatico(GiocatoreBase):
 
         Note:
         - Questo è un metodo INTERNO (prefisso _), non fa parte dell'API pubblica
-        - Il metodo non modifica lo stato del bot: è un'operazione di sola lettura
+        - Lo stato delle cartelle non viene modificato: si aggiorna solo la
+          struttura dei candidati del bot
         - La validazione del reclamo è demandata a Partita.verifica_premi()
         """
-        # Definizione della gerarchia dei premi (dal più alto al più basso)
-        # Ogni premio ha un rank: tombola=4, cinquina=3, quaterna=2, terno=1, ambo=0
-        RANK_PREMI = {
-            "tombola": 4,
-            "cinquina": 3,
-            "quaterna": 2,
-            "terno": 1,
-            "ambo": 0
-        }
-
-        # Inizializzazione del miglior reclamo trovato finora
-        best_claim: Optional[ReclamoVittoria] = None
-        best_rank: int = -1
-
-        # Scansione di tutte le cartelle del bot
-        for cartella in self.get_cartelle():
-            # A. CONTROLLO TOMBOLA (premio globale sulla cartella)
-            if cartella.verifica_cartella_completa():
-                # Costruzione della chiave univoca per questo premio
-                chiave_tombola = f"cartella_{cartella.indice}_tombola"
-
-                # Verifica se il premio è già stato assegnato
-                if "tombola" not in (premi_tipo_chiusi or set()) and chiave_tombola not in premi_gia_assegnati:
-                    # Tombola disponibile! Ha il rango più alto (4)
-                    # Creo il reclamo direttamente (factory methods non disponibili nel file corrente)
-                    reclamo = ReclamoVittoria(
-                        tipo="tombola",
-                        indice_cartella=cartella.indice,
-                        indice_riga=None
-                    )
-
-                    # Aggiorno il miglior reclamo se questo ha rango superiore
-                    if RANK_PREMI["tombola"] > best_rank:
-                        best_claim = reclamo
-                        best_rank = RANK_PREMI["tombola"]
-
-            # B. CONTROLLO PREMI INTERMEDI (per ogni riga della cartella)
-            # Ordine di controllo: cinquina > quaterna > terno > ambo (dal più alto al più basso)
-            tipi_premio = ["cinquina", "quaterna", "terno", "ambo"]
-
-            for indice_riga in range(3):  # 3 righe per cartella (0, 1, 2)
-                for tipo in tipi_premio:
-                    # Chiamata dinamica al metodo di verifica appropriato
-                    metodo_verifica = getattr(cartella, f"verifica_{tipo}_riga")
-                    
-                    if metodo_verifica(indice_riga):
-                        # Costruzione della chiave univoca per questo premio
-                        chiave_premio = f"cartella_{cartella.indice}_riga_{indice_riga}_{tipo}"
-
-                        # Verifica se il premio è già stato assegnato
-                        if tipo not in (premi_tipo_chiusi or set()) and chiave_premio not in premi_gia_assegnati:
-                            # Premio disponibile! Creo il reclamo direttamente
-                            reclamo = ReclamoVittoria(
-                                tipo=tipo,
-                                indice_cartella=cartella.indice,
-                                indice_riga=indice_riga
-                            )
-
-                            # Aggiorno il miglior reclamo se questo ha rango superiore
-                            if RANK_PREMI[tipo] > best_rank:
-                                best_claim = reclamo
-                                best_rank = RANK_PREMI[tipo]
-                        
-                        # Ottimizzazione: il tipo più alto per questa riga è stato trovato
-                        # (tipi_premio è già ordinato dal più alto al più basso)
-                        break
-
-        # Ritorno il miglior reclamo trovato (o None se nessuno disponibile)
-        return best_claim
+        self._sincronizza_candidati(premi_tipo_chiusi)
+        if isinstance(premi_gia_assegnati, RegistroPremi):
+            assegnato = premi_gia_assegnati.contiene_codice
+        else:
+            def assegnato(codice: int) -> bool:
+                return chiave_premio(codice) in premi_gia_assegnati
+        for rango in range(_RANGO_TOMBOLA, -1, -1):
+            ordini = self._ordini_per_rango[rango]
+            if not ordini:
+                continue
+            if premi_tipo_chiusi and _PREMI_PER_RANGO[rango] in premi_tipo_chiusi:
+                continue
+            candidati = self._candidati_per_rango[rango]
+            for ordine in ordini:
+                codice, tipo, indice_cartella, indice_riga = candidati[ordine]
+                if not assegnato(codice):
+                    return ReclamoVittoria(tipo=tipo, indice_cartella=indice_cartella, indice_riga=indice_riga)
+        return None
 
     def dichiara_fine_fase_azione(
         self,
-        premi_gia_assegnati: set[str],
+        premi_gia_assegnati: RegistroPremi | set[str],
         premi_tipo_chiusi: Optional[set] = None,
     ) -> None:
         """
@@ -210,6 +377,8 @@ class GiocatoreAutomatico(GiocatoreBase):
           della pianificazione (da Partita.premi_gia_assegnati).
         - premi_tipo_chiusi: snapshot dei tipi premio chiusi (opzionale).
         """
+        t0 = latenze.inizio()
         reclamo = self._valuta_potenziale_reclamo(premi_gia_assegnati, premi_tipo_chiusi)
+        latenze.fine(latenze.SPAN_VALUTAZIONE_BOT, t0)
         self.reclamo_turno = reclamo
         self.dichiara_fine_turno()
@@ -63,11 +63,16 @@ NOTE DI UTILIZZO
 - Le classi derivate possono sovrascrivere o estendere alcuni metodi
   per aggiungere comportamenti specifici (ad esempio interazione con
   l'interfaccia utente o logiche automatiche).
+- Una Partita in modalità sala collega i propri giocatori a una
+  GenerazioneTurno condivisa: reclamo_turno e turno_dichiarato_concluso
+  valgono solo per la generazione in cui sono stati scritti, quindi far
+  avanzare la generazione azzera lo stato di turno di tutti i giocatori
+  senza toccarli uno per uno.
 """
 
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional, Set
 # Importa la classe Cartella per la gestione delle cartelle del giocatore
 from bingo_game.cartella import Cartella
 # Importa le eccezioni personalizzate per la validazione dei parametri
@@ -81,9 +86,25 @@ from bingo_game.exceptions import (
 )
 #import degli eventi necessari in questo file
 from bingo_game.events.eventi_partita import ReclamoVittoria, EventoFineTurno
+if TYPE_CHECKING:
+    from bingo_game.indice_sala import IndiceSala
 
 
 
+#definizione della classe con il numero di turno condiviso tra partita e giocatori
+class GenerazioneTurno:
+    """
+    Numero del turno corrente, condiviso da una Partita in modalità sala con
+    i propri giocatori. Incrementare valore rende obsoleto (None / False) lo
+    stato di turno scritto in tutte le generazioni precedenti.
+    """
+
+    __slots__ = ("valore",)
+
+    def __init__(self) -> None:
+        self.valore: int = 0
+
+
 #classe per la gestione dei metodi comuni a tutti i giocatori della partita
 class GiocatoreBase:
     """
@@ -119,6 +140,18 @@ class GiocatoreBase:
         self.id_giocatore = id_giocatore
         self.cartelle: List[Cartella] = []
         self._prossimo_indice_cartella: int = 1
+        # Partite che tengono contatori sullo stato di turno del giocatore
+        # (modalità sala): vengono avvisate quando reclamo o dichiarazione cambiano.
+        self._osservatori_turno: List[Any] = []
+        # Partite che indicizzano le cartelle del giocatore: vengono avvisate
+        # quando viene aggiunta una cartella (indice invertito da ricostruire).
+        self._osservatori_cartelle: List[Any] = []
+        # Generazione di turno condivisa (modalità sala) e generazione in cui
+        # è stato scritto lo stato di turno del giocatore.
+        self._generazione_turno: Optional[GenerazioneTurno] = None
+        self._turno_stato: int = 0
+        self._reclamo_turno: Optional[ReclamoVittoria] = None
+        self._turno_dichiarato_concluso: bool = False
         # Reclamo del turno corrente (None = nessun reclamo inviato).
         # Il reclamo viene consumato e resettato dalla Partita quando processa il turno.
         self.reclamo_turno: Optional[ReclamoVittoria] = None
@@ -128,6 +161,77 @@ class GiocatoreBase:
 
     """metodi di classe per la gestione del giocatore base"""
 
+    """Sezione: Stato di turno osservabile"""
+
+    @property
+    def reclamo_turno(self) -> Optional[ReclamoVittoria]:
+        """Reclamo del turno corrente (None = nessun reclamo inviato)."""
+        generazione = self._generazione_turno
+        if generazione is not None and self._turno_stato != generazione.valore:
+            return None
+        return self._reclamo_turno
+
+    @reclamo_turno.setter
+    def reclamo_turno(self, reclamo: Optional[ReclamoVittoria]) -> None:
+        self._allinea_generazione_turno()
+        presente_prima = self._reclamo_turno is not None
+        self._reclamo_turno = reclamo
+        if self._osservatori_turno and presente_prima != (reclamo is not None):
+            for osservatore in self._osservatori_turno:
+                osservatore._notifica_reclamo_turno(self, reclamo is not None)
+
+    @property
+    def turno_dichiarato_concluso(self) -> bool:
+        """True quando il giocatore ha dichiarato fine del proprio turno."""
+        generazione = self._generazione_turno
+        if generazione is not None and self._turno_stato != generazione.valore:
+            return False
+        return self._turno_dichiarato_concluso
+
+    @turno_dichiarato_concluso.setter
+    def turno_dichiarato_concluso(self, dichiarato: bool) -> None:
+        self._allinea_generazione_turno()
+        dichiarato_prima = self._turno_dichiarato_concluso
+        self._turno_dichiarato_concluso = bool(dichiarato)
+        if self._osservatori_turno and dichiarato_prima != self._turno_dichiarato_concluso:
+            for osservatore in self._osservatori_turno:
+                osservatore._notifica_dichiarazione_turno(self, self._turno_dichiarato_concluso)
+
+    #metodo privato che azzera lo stato di turno scritto in una generazione precedente
+    def _allinea_generazione_turno(self) -> None:
+        generazione = self._generazione_turno
+        if generazione is not None and self._turno_stato != generazione.valore:
+            self._reclamo_turno = None
+            self._turno_dichiarato_concluso = False
+            self._turno_stato = generazione.valore
+
+    #metodo chiamato dalla Partita in modalità sala per condividere la generazione di turno
+    def _collega_generazione_turno(self, generazione: GenerazioneTurno) -> None:
+        """Lo stato di turno attuale resta valido nella generazione corrente."""
+        self._allinea_generazione_turno()
+        self._generazione_turno = generazione
+        self._turno_stato = generazione.valore
+
+    """Sezione: Notifiche della partita"""
+
+    #metodo chiamato dalla Partita quando una cartella del giocatore raggiunge un premio
+    def _notifica_premio_raggiunto(self, cartella: Cartella, tipo: str, indice_riga: Optional[int]) -> None:
+        """Nessuna azione: GiocatoreAutomatico aggiorna i propri candidati al reclamo."""
+
+    #metodo chiamato dalla Partita quando l'insieme dei tipi premio chiusi cambia
+    def _notifica_tipi_chiusi(self, tipi_chiusi: Set[str]) -> None:
+        """Nessuna azione: GiocatoreAutomatico scarta i candidati dei tipi chiusi."""
+
+    #metodo chiamato dall'indice della modalità sala per sapere dove accodare i premi raggiunti
+    def _coda_premi_raggiunti(self, indice: IndiceSala) -> Optional[List[int]]:
+        """
+        Lista in cui l'indice accoda gli slot di riga che hanno raggiunto un
+        premio invece di chiamare _notifica_premio_raggiunto(); None (default)
+        se le notifiche vanno consegnate subito. GiocatoreAutomatico la
+        consegna (IndiceSala.consegna_premi()) alla prossima valutazione.
+        """
+        return None
+
     """Sezione: Metodi di identità"""
 
     #metodo di identità che ritorna il nome del giocatore
@@ -170,6 +274,9 @@ class GiocatoreBase:
         self._prossimo_indice_cartella += 1
         #aggiunge la cartella alla lista
         self.cartelle.append(cartella)
+        #avvisa le partite che indicizzano le cartelle del giocatore
+        for osservatore in self._osservatori_cartelle:
+            osservatore._notifica_cartella_aggiunta(self, cartella)
 
 
     #metodo per ottenere la lista delle cartelle del giocatore
@@ -0,0 +1,374 @@
+"""
+CLASSE PER IL POOL DI CARTELLE PRECALCOLATE
+Modulo: bingo_game.pool_cartelle
+
+Tombola / Bingo – Pool binario di cartelle pre-validate con accesso mmap
+=======================================================================
+
+OVERVIEW DEL MODULO
+-------------------
+
+Questo modulo permette di:
+- costruire offline un file binario con milioni di cartelle già validate
+  (scrivi_pool), eventualmente raggruppate in serie da 6;
+- aprire il file a runtime con mmap (PoolCartelle) e distribuire cartelle
+  in O(1), senza rigenerarle né rivalidarle.
+
+FORMATO DEL FILE
+----------------
+
+- Intestazione di 20 byte (little endian): magic b"TSPC", versione (1 byte),
+  flag (1 byte, bit 0 = cartelle raggruppate in serie da 6), 2 byte riservati,
+  numero di cartelle (8 byte), CRC-32 dei record (4 byte). Il CRC viene
+  verificato una sola volta all'apertura: le distribuzioni successive
+  decodificano i record senza controlli.
+- Un record di 15 byte per cartella: i numeri della riga 0, poi della riga 1,
+  poi della riga 2, ciascuna riga in ordine di colonna. La colonna di un
+  numero si ricava dal suo valore, quindi i 15 byte bastano a ricostruire
+  esattamente la griglia 3x9 (una maschera a 90 bit perderebbe invece la
+  disposizione nelle righe).
+
+La cartella di indice i si trova all'offset 20 + 15 * i: l'indice è anche il
+riferimento stabile per sapere quale cartella è stata venduta. Le cartelle
+distribuite lo portano in Cartella.indice_pool, salvato nel giornale
+(record cartella_pool) e nel checkpoint.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import random
+import struct
+import zlib
+from typing import BinaryIO, List, Optional, Type
+
+from bingo_game.cartella import Cartella
+from bingo_game.exceptions.pool_cartelle_exceptions import (
+    PoolCartelleEsauritoException,
+    PoolCartelleFormatoException,
+)
+from bingo_game.serie import CARTELLE_PER_SERIE, genera_serie
+
+
+# Intestazione: magic, versione, flag, 2 byte riservati, numero di cartelle, CRC-32 dei record.
+_FORMATO_INTESTAZIONE = struct.Struct("<4sBBxxQI")
+_MAGIC = b"TSPC"
+_VERSIONE = 2
+_FLAG_SERIE = 0x01
+
+DIMENSIONE_INTESTAZIONE: int = _FORMATO_INTESTAZIONE.size
+BYTE_PER_CARTELLA: int = 15
+
+# Colonna di ciascun numero 1-90 (slot 0 inutilizzato), per ricostruire la griglia.
+_COLONNA_DEL_NUMERO: tuple[int, ...] = (0,) + tuple(min(numero // 10, 8) for numero in range(1, 91))
+
+# Dimensione dei blocchi di cartelle generati e scritti insieme.
+_CARTELLE_PER_BLOCCO: int = 4096
+
+
+#funzione che codifica una griglia 3x9 nel record binario di 15 byte
+def codifica_griglia(griglia: List[List[Optional[int]]]) -> bytes:
+    """
+    Ritorna i 15 byte della griglia: i numeri non vuoti letti riga per riga.
+
+    Eccezioni:
+    - PoolCartelleFormatoException: se la griglia non contiene 15 numeri.
+    """
+    numeri = bytes(valore for riga in griglia for valore in riga if valore is not None)
+    if len(numeri) != BYTE_PER_CARTELLA:
+        raise PoolCartelleFormatoException(
+            f"Una cartella del pool deve contenere {BYTE_PER_CARTELLA} numeri, trovati {len(numeri)}."
+        )
+    return numeri
+
+
+#funzione che ricostruisce la griglia 3x9 da un record di 15 byte
+def decodifica_griglia(record: bytes | memoryview, valida: bool = False) -> List[List[Optional[int]]]:
+    """
+    Ricostruisce la griglia 3x9 (formato di Cartella.cartella) dai 15 byte
+    di un record: 5 numeri per riga, colonna ricavata dal valore.
+
+    Con valida=False (distribuzione dal pool, il cui CRC è già stato
+    verificato all'apertura) è una semplice decodifica. Con valida=True il
+    record viene controllato: lunghezza, numeri in 1-90, colonne crescenti in
+    ogni riga e numeri crescenti dall'alto in basso in ogni colonna.
+
+    Eccezioni:
+    - PoolCartelleFormatoException: con valida=True, record corrotto o di un
+      altro formato.
+    """
+    if not valida:
+        griglia = [[None] * 9, [None] * 9, [None] * 9]
+        for posizione, numero in enumerate(record):
+            griglia[posizione // 5][_COLONNA_DEL_NUMERO[numero]] = numero
+        return griglia
+    if len(record) != BYTE_PER_CARTELLA:
+        raise PoolCartelleFormatoException(
+            f"Record di cartella di {len(record)} byte, attesi {BYTE_PER_CARTELLA}."
+        )
+    griglia: List[List[Optional[int]]] = [[None] * 9, [None] * 9, [None] * 9]
+    ultimo_per_colonna = [0] * 9
+    colonna_precedente = -1
+    for posizione, numero in enumerate(record):
+        if posizione % 5 == 0:
+            colonna_precedente = -1
+        if numero < 1 or numero > 90:
+            raise PoolCartelleFormatoException(f"Numero {numero} fuori dal range 1-90 nel record di cartella.")
+        colonna = _COLONNA_DEL_NUMERO[numero]
+        if colonna <= colonna_precedente or numero <= ultimo_per_colonna[colonna]:
+            raise PoolCartelleFormatoException(
+                f"Numero {numero} fuori posizione nel record di cartella (riga {posizione // 5}, colonna {colonna})."
+            )
+        griglia[posizione // 5][colonna] = numero
+        ultimo_per_colonna[colonna] = numero
+        colonna_precedente = colonna
+    return griglia
+
+
+#funzione che costruisce offline il file del pool
+def scrivi_pool(
+    percorso: str | os.PathLike,
+    num_cartelle: int = 0,
+    num_serie: int = 0,
+    rng: Optional[random.Random] = None,
+) -> int:
+    """
+    Scrive un file di pool con cartelle pre-validate.
+
+    Si indica num_cartelle (cartelle indipendenti, generate con
+    Cartella.genera_lotto) oppure num_serie (serie da 6 che coprono 1-90,
+    generate con genera_serie): non entrambi.
+
+    Parametri:
+    - percorso: percorso del file da creare (sovrascritto se esiste).
+    - num_cartelle: int >= 0
+    - num_serie: int >= 0
+    - rng: random.Random opzionale per un pool riproducibile.
+
+    Ritorna:
+    - int: numero di cartelle scritte.
+
+    Eccezioni:
+    - ValueError: se i parametri sono negativi o vengono indicati entrambi.
+    """
+    if num_cartelle < 0 or num_serie < 0:
+        raise ValueError("num_cartelle e num_serie devono essere >= 0.")
+    if num_cartelle and num_serie:
+        raise ValueError("Indicare num_cartelle oppure num_serie, non entrambi.")
+
+    con_serie = num_serie > 0
+    totale = num_serie * CARTELLE_PER_SERIE if con_serie else num_cartelle
+    flag = _FLAG_SERIE if con_serie else 0
+
+    with open(percorso, "wb") as file_pool:
+        file_pool.write(_FORMATO_INTESTAZIONE.pack(_MAGIC, _VERSIONE, flag, totale, 0))
+        if con_serie:
+            crc = _scrivi_serie(file_pool, num_serie, rng)
+        else:
+            crc = _scrivi_cartelle(file_pool, num_cartelle, rng)
+        file_pool.seek(0)
+        file_pool.write(_FORMATO_INTESTAZIONE.pack(_MAGIC, _VERSIONE, flag, totale, crc))
+    return totale
+
+
+#funzione privata che scrive cartelle indipendenti a blocchi e ritorna il CRC dei record
+def _scrivi_cartelle(file_pool: BinaryIO, num_cartelle: int, rng: Optional[random.Random]) -> int:
+    crc = 0
+    rimanenti = num_cartelle
+    while rimanenti > 0:
+        blocco = min(rimanenti, _CARTELLE_PER_BLOCCO)
+        dati = b"".join(codifica_griglia(g) for g in Cartella.genera_lotto(blocco, rng))
+        file_pool.write(dati)
+        crc = zlib.crc32(dati, crc)
+        rimanenti -= blocco
+    return crc
+
+
+#funzione privata che scrive serie da 6 cartelle in streaming e ritorna il CRC dei record
+def _scrivi_serie(file_pool: BinaryIO, num_serie: int, rng: Optional[random.Random]) -> int:
+    crc = 0
+    buffer = []
+    for griglie in genera_serie(num_serie, rng):
+        buffer.extend(codifica_griglia(g) for g in griglie)
+        if len(buffer) >= _CARTELLE_PER_BLOCCO:
+            dati = b"".join(buffer)
+            file_pool.write(dati)
+            crc = zlib.crc32(dati, crc)
+            buffer = []
+    if buffer:
+        dati = b"".join(buffer)
+        file_pool.write(dati)
+        crc = zlib.crc32(dati, crc)
+    return crc
+
+
+#definizione della classe PoolCartelle
+class PoolCartelle:
+    """
+    Pool di cartelle precalcolate letto tramite mmap.
+
+    Le cartelle vengono distribuite in ordine a partire da una posizione
+    iniziale: ogni distribuzione legge 15 byte dal file mappato e costruisce
+    la cartella senza rivalidarla (le griglie sono state validate quando il
+    pool è stato scritto, il CRC dei record all'apertura).
+
+    Si usa come context manager oppure chiamando chiudi() alla fine.
+    """
+
+    def __init__(self, percorso: str | os.PathLike, posizione_iniziale: int = 0) -> None:
+        """
+        Apre il file del pool e ne verifica intestazione e CRC dei record.
+
+        Parametri:
+        - percorso: file creato da scrivi_pool().
+        - posizione_iniziale: indice della prima cartella da distribuire.
+
+        Eccezioni:
+        - PoolCartelleFormatoException: file non riconosciuto, troncato o con
+          record corrotti (CRC diverso da quello dell'intestazione).
+        - ValueError: posizione_iniziale fuori dal pool.
+        """
+        self._file = open(percorso, "rb")
+        try:
+            dimensione = os.fstat(self._file.fileno()).st_size
+            if dimensione < DIMENSIONE_INTESTAZIONE:
+                raise PoolCartelleFormatoException(f"File di pool troppo corto: {dimensione} byte.")
+            self._mappa = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+
+        magic, versione, flag, totale, crc = _FORMATO_INTESTAZIONE.unpack_from(self._mappa, 0)
+        if magic != _MAGIC or versione != _VERSIONE:
+            self.chiudi()
+            raise PoolCartelleFormatoException(
+                f"Intestazione del pool non valida (magic={magic!r}, versione={versione})."
+            )
+        if dimensione != DIMENSIONE_INTESTAZIONE + totale * BYTE_PER_CARTELLA:
+            self.chiudi()
+            raise PoolCartelleFormatoException(
+                f"Dimensione del pool ({dimensione} byte) incoerente con {totale} cartelle."
+            )
+
+        self._vista = memoryview(self._mappa)
+        with self._vista[DIMENSIONE_INTESTAZIONE:] as record:
+            crc_record = zlib.crc32(record)
+        if crc_record != crc:
+            self.chiudi()
+            raise PoolCartelleFormatoException("Record del pool corrotti: CRC diverso da quello dell'intestazione.")
+        self.numero_cartelle: int = totale
+        self.con_serie: bool = bool(flag & _FLAG_SERIE)
+        if not 0 <= posizione_iniziale <= totale:
+            self.chiudi()
+            raise ValueError(f"posizione_iniziale fuori dal pool: {posizione_iniziale}.")
+        self._posizione: int = posizione_iniziale
+
+
+    """sezione: accesso diretto"""
+
+    def __len__(self) -> int:
+        return self.numero_cartelle
+
+
+    #metodo che ritorna la griglia della cartella di indice dato
+    def get_griglia(self, indice: int) -> List[List[Optional[int]]]:
+        """
+        Ritorna la griglia 3x9 della cartella di indice dato (accesso O(1)).
+
+        Eccezioni:
+        - IndexError: indice fuori dal pool.
+        """
+        if not 0 <= indice < self.numero_cartelle:
+            raise IndexError(f"Indice di cartella fuori dal pool: {indice}.")
+        inizio = DIMENSIONE_INTESTAZIONE + indice * BYTE_PER_CARTELLA
+        return decodifica_griglia(self._vista[inizio:inizio + BYTE_PER_CARTELLA])
+
+
+    #metodo che crea la cartella di indice dato
+    def get_cartella(self, indice: int, classe_cartella: Type[Cartella] = Cartella) -> Cartella:
+        """
+        Ritorna una nuova istanza di cartella con la griglia di indice dato;
+        l'indice resta in cartella.indice_pool.
+        """
+        cartella = classe_cartella(griglia=self.get_griglia(indice), valida_griglia=False)
+        cartella.indice_pool = indice
+        return cartella
+
+
+    """sezione: distribuzione sequenziale"""
+
+    #metodo che ritorna l'indice della prossima cartella da distribuire
+    def get_posizione(self) -> int:
+        """Ritorna l'indice della prossima cartella che verrà distribuita."""
+        return self._posizione
+
+
+    #metodo che ritorna quante cartelle restano da distribuire
+    def get_rimanenti(self) -> int:
+        """Ritorna il numero di cartelle non ancora distribuite."""
+        return self.numero_cartelle - self._posizione
+
+
+    #metodo per distribuire la prossima cartella del pool
+    def distribuisci(self, classe_cartella: Type[Cartella] = Cartella) -> Cartella:
+        """
+        Distribuisce la prossima cartella del pool e avanza la posizione.
+
+        L'indice della cartella distribuita è get_posizione() prima della
+        chiamata, e resta in cartella.indice_pool.
+
+        Eccezioni:
+        - PoolCartelleEsauritoException: nessuna cartella rimanente.
+        """
+        if self._posizione >= self.numero_cartelle:
+            raise PoolCartelleEsauritoException(
+                f"Pool esaurito: tutte le {self.numero_cartelle} cartelle sono state distribuite."
+            )
+        cartella = self.get_cartella(self._posizione, classe_cartella)
+        self._posizione += 1
+        return cartella
+
+
+    #metodo per distribuire le 6 cartelle della prossima serie
+    def distribuisci_serie(self, classe_cartella: Type[Cartella] = Cartella) -> List[Cartella]:
+        """
+        Distribuisce le 6 cartelle della prossima serie (pool scritto con num_serie).
+
+        Se la posizione corrente non è all'inizio di una serie, salta alla
+        serie successiva. Se non resta una serie completa la posizione non
+        cambia.
+
+        Eccezioni:
+        - PoolCartelleFormatoException: il pool non contiene serie.
+        - PoolCartelleEsauritoException: nessuna serie completa rimanente.
+        """
+        if not self.con_serie:
+            raise PoolCartelleFormatoException("Il pool non è stato scritto a serie da 6.")
+        inizio = self._posizione + (-self._posizione % CARTELLE_PER_SERIE)
+        if inizio + CARTELLE_PER_SERIE > self.numero_cartelle:
+            raise PoolCartelleEsauritoException("Pool esaurito: nessuna serie completa rimanente.")
+        self._posizione = inizio
+        return [self.distribuisci(classe_cartella) for _ in range(CARTELLE_PER_SERIE)]
+
+
+    """sezione: chiusura"""
+
+    #metodo per rilasciare mmap e file
+    def chiudi(self) -> None:
+        """Rilascia la vista, la mappa di memoria e il file. Idempotente."""
+        vista = getattr(self, "_vista", None)
+        if vista is not None:
+            vista.release()
+            self._vista = None
+        mappa = getattr(self, "_mappa", None)
+        if mappa is not None and not mappa.closed:
+            mappa.close()
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self) -> "PoolCartelle":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.chiudi()
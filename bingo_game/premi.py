@@ -0,0 +1,37 @@
+"""
+ENUMERAZIONE DEI PREMI
+Modulo: bingo_game.premi
+
+Tombola / Bingo – Premi di riga, tombola e soglie
+=================================================
+
+OVERVIEW DEL MODULO
+-------------------
+
+Questo modulo definisce l'unica enumerazione dei premi del gioco, usata dal
+tracciatore dei premi (tracciatore_premi), dal registro dei premi assegnati
+(registro_premi) e dai file binari (giornale_partita, checkpoint_partita):
+- PREMI_RIGA: i premi di riga in ordine crescente;
+- PREMI: i premi di riga seguiti dalla tombola; l'indice in PREMI è il
+  codice intero del premio ("ambo" = 0 ... "tombola" = 4, CODICE_PREMIO);
+- SOGLIE_PREMI_RIGA: ogni premio di riga con la soglia di numeri segnati
+  richiesta.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Tuple
+
+
+PREMI_RIGA: Tuple[str, ...] = ("ambo", "terno", "quaterna", "cinquina")
+PREMI: Tuple[str, ...] = PREMI_RIGA + ("tombola",)
+
+CODICE_PREMIO: Dict[str, int] = {premio: codice for codice, premio in enumerate(PREMI)}
+
+# Premi di riga in ordine crescente, con la soglia di numeri segnati richiesta.
+SOGLIE_PREMI_RIGA: Tuple[Tuple[str, int], ...] = (
+    ("ambo", 2),
+    ("terno", 3),
+    ("quaterna", 4),
+    ("cinquina", 5),
+)
@@ -0,0 +1,231 @@
+"""
+CLASSE PER IL REGISTRO DEI PREMI ASSEGNATI
+Modulo: bingo_game.registro_premi
+
+Tombola / Bingo – Premi assegnati come codici interi in un bitset
+=================================================================
+
+OVERVIEW DEL MODULO
+-------------------
+
+Questo modulo definisce RegistroPremi, la struttura di
+Partita.premi_gia_assegnati. Ogni premio (cartella, riga, tipo) è un codice
+intero:
+
+    codice = indice_cartella * CODICI_PER_CARTELLA + riga * 4 + tipo   (premi di riga)
+    codice = indice_cartella * CODICI_PER_CARTELLA + 12                (tombola)
+
+con tipo = indice in PREMI_RIGA ("ambo" = 0 ... "cinquina" = 3, vedi
+bingo_game.premi). Il registro è un bytearray usato come bitset indicizzato
+per codice: appartenenza e inserimento sono un accesso per indice, senza
+stringhe.
+
+Vista compatibile con le stringhe
+---------------------------------
+
+RegistroPremi è un MutableSet di chiavi stringa nel formato storico
+("cartella_{indice}_riga_{r}_{tipo}", "cartella_{indice}_tombola"):
+in, add(), update(), len(), iterazione, sorted() e confronto con un set
+funzionano come prima, quindi report, log e stato della partita non cambiano.
+Le chiavi vengono costruite solo quando si itera il registro.
+
+Il percorso caldo (verifica_premi, valutazione dei reclami dei bot) usa
+invece i codici: codice_premio(), contiene_codice(), aggiungi_codice().
+in_byte() / da_byte() danno il bitset grezzo, che è già la forma salvata
+nei checkpoint.
+"""
+
+from __future__ import annotations
+
+from collections.abc import MutableSet
+from typing import Iterable, Iterator, Optional, Union
+
+from bingo_game.premi import PREMI, PREMI_RIGA
+
+# Codici riservati a ogni indice di cartella: 3 righe x 4 premi di riga, poi la tombola.
+CODICI_PER_CARTELLA: int = 13
+_OFFSET_TOMBOLA: int = 12
+
+_TIPO_RIGA = {tipo: codice for codice, tipo in enumerate(PREMI_RIGA)}
+
+
+#funzione che calcola il codice intero di un premio
+def codice_premio(indice_cartella: int, tipo: str, indice_riga: Optional[int] = None) -> int:
+    """
+    Ritorna il codice del premio tipo sulla cartella (e riga) indicata.
+    Per la tombola indice_riga va omesso.
+
+    Eccezioni:
+    - ValueError: tipo sconosciuto, riga mancante o fuori da 0-2, indice di
+      cartella assente (None), non intero o negativo.
+    """
+    if not isinstance(indice_cartella, int) or indice_cartella < 0:
+        raise ValueError(f"Indice di cartella non valido per il registro dei premi: {indice_cartella}.")
+    base = indice_cartella * CODICI_PER_CARTELLA
+    if tipo == "tombola":
+        return base + _OFFSET_TOMBOLA
+    if tipo not in _TIPO_RIGA or indice_riga not in (0, 1, 2):
+        raise ValueError(f"Premio non valido: tipo={tipo!r}, riga={indice_riga!r}.")
+    return base + indice_riga * 4 + _TIPO_RIGA[tipo]
+
+
+#funzione che ritorna la chiave stringa di un codice
+def chiave_premio(codice: int) -> str:
+    """Ritorna la chiave nel formato storico di premi_gia_assegnati."""
+    indice_cartella, resto = divmod(codice, CODICI_PER_CARTELLA)
+    if resto == _OFFSET_TOMBOLA:
+        return f"cartella_{indice_cartella}_tombola"
+    return f"cartella_{indice_cartella}_riga_{resto // 4}_{PREMI_RIGA[resto % 4]}"
+
+
+#funzione che converte una chiave stringa nel suo codice
+def codice_da_chiave(chiave: str) -> Optional[int]:
+    """Ritorna il codice della chiave, oppure None se la chiave non è nel formato storico."""
+    parti = chiave.split("_")
+    try:
+        if parti[0] != "cartella":
+            return None
+        indice_cartella = int(parti[1])
+        if len(parti) == 3 and parti[2] == "tombola":
+            return codice_premio(indice_cartella, "tombola")
+        if len(parti) == 5 and parti[2] == "riga":
+            return codice_premio(indice_cartella, parti[4], int(parti[3]))
+    except (IndexError, ValueError):
+        return None
+    return None
+
+
+#definizione della classe RegistroPremi
+class RegistroPremi(MutableSet):
+    """
+    Insieme dei premi assegnati: bitset per codice con vista a chiavi stringa.
+
+    Accetta come elementi sia le chiavi stringa sia i codici interi
+    (codice_premio()); l'iterazione ritorna le chiavi stringa in ordine di
+    codice. Gli elementi fuori dal formato dei premi (es.
+    "cartella_None_tombola") restano in un piccolo set a parte, come nel set
+    che il registro sostituisce: appartenenza, iterazione (dopo le chiavi dei
+    codici) e len() li includono, ma non fanno parte del bitset (codici(),
+    in_byte(), checkpoint).
+    """
+
+    __slots__ = ("_bit", "_conteggio", "_altre")
+
+    def __init__(self, chiavi: Iterable[Union[str, int]] = ()) -> None:
+        self._bit = bytearray()
+        self._conteggio = 0
+        self._altre: set = set()
+        for chiave in chiavi:
+            self.add(chiave)
+
+
+    """sezione: accesso per codice"""
+
+    def contiene_codice(self, codice: int) -> bool:
+        """True se il premio con questo codice è assegnato (O(1))."""
+        posizione = codice >> 3
+        return posizione < len(self._bit) and bool(self._bit[posizione] >> (codice & 7) & 1)
+
+    def aggiungi_codice(self, codice: int) -> bool:
+        """Registra il premio; ritorna False se era già assegnato."""
+        posizione = codice >> 3
+        maschera = 1 << (codice & 7)
+        bit = self._bit
+        if posizione >= len(bit):
+            bit.extend(bytes(posizione + 1 - len(bit)))
+        elif bit[posizione] & maschera:
+            return False
+        bit[posizione] |= maschera
+        self._conteggio += 1
+        return True
+
+    def rimuovi_codice(self, codice: int) -> bool:
+        """Toglie il premio; ritorna False se non era assegnato."""
+        if not self.contiene_codice(codice):
+            return False
+        self._bit[codice >> 3] &= ~(1 << (codice & 7)) & 0xFF
+        self._conteggio -= 1
+        return True
+
+    def codici(self) -> Iterator[int]:
+        """Codici dei premi assegnati, in ordine crescente."""
+        for posizione, byte in enumerate(self._bit):
+            if not byte:
+                continue
+            for spostamento in range(8):
+                if byte >> spostamento & 1:
+                    yield posizione * 8 + spostamento
+
+    def in_byte(self) -> bytes:
+        """Bitset grezzo (bit i del byte j = codice 8 * j + i)."""
+        return bytes(self._bit).rstrip(b"\x00")
+
+    @classmethod
+    def da_byte(cls, dati: bytes) -> RegistroPremi:
+        """Ricostruisce un registro dal bitset di in_byte()."""
+        registro = cls()
+        registro._bit = bytearray(dati)
+        registro._conteggio = sum(bin(byte).count("1") for byte in registro._bit)
+        return registro
+
+    def copia(self) -> RegistroPremi:
+        """Copia indipendente del registro (snapshot da passare ai bot)."""
+        registro = self.da_byte(self._bit)
+        registro._altre = set(self._altre)
+        return registro
+
+
+    """sezione: vista MutableSet a chiavi stringa"""
+
+    @staticmethod
+    def _codice(chiave: Union[str, int]) -> Optional[int]:
+        if isinstance(chiave, int):
+            return chiave if chiave >= 0 else None
+        if isinstance(chiave, str):
+            return codice_da_chiave(chiave)
+        return None
+
+    def __contains__(self, chiave: object) -> bool:
+        codice = self._codice(chiave)  # type: ignore[arg-type]
+        if codice is None:
+            return bool(self._altre) and chiave in self._altre
+        return self.contiene_codice(codice)
+
+    def __iter__(self) -> Iterator[str]:
+        for codice in self.codici():
+            yield chiave_premio(codice)
+        yield from self._altre
+
+    def __len__(self) -> int:
+        return self._conteggio + len(self._altre)
+
+    def add(self, chiave: Union[str, int]) -> None:
+        """
+        Aggiunge un premio per chiave stringa o codice; un elemento fuori dal
+        formato dei premi viene tenuto nel set a parte.
+        """
+        codice = self._codice(chiave)
+        if codice is None:
+            self._altre.add(chiave)
+        else:
+            self.aggiungi_codice(codice)
+
+    def discard(self, chiave: Union[str, int]) -> None:
+        codice = self._codice(chiave)
+        if codice is None:
+            self._altre.discard(chiave)
+        else:
+            self.rimuovi_codice(codice)
+
+    def update(self, *chiavi: Iterable[Union[str, int]]) -> None:
+        for iterabile in chiavi:
+            for chiave in iterabile:
+                self.add(chiave)
+
+    def clear(self) -> None:
+        self._bit = bytearray()
+        self._conteggio = 0
+        self._altre = set()
+
+    def __repr__(self) -> str:
+        return f"RegistroPremi({sorted(self)!r})"
@@ -0,0 +1,194 @@
+"""
+CLASSE PER LA SERIE DA SEI CARTELLE
+Modulo: bingo_game.serie
+
+Tombola / Bingo – Generazione di serie da 6 cartelle che coprono 1-90
+=====================================================================
+
+OVERVIEW DEL MODULO
+-------------------
+
+Nella tombola tradizionale le cartelle sono vendute in serie da sei: le sei
+cartelle insieme contengono ogni numero da 1 a 90 esattamente una volta.
+
+Questo modulo definisce:
+- genera_griglie_serie(): costruisce le 6 griglie 3x9 di una serie;
+- genera_serie(): generatore che produce n serie in streaming;
+- Serie: le 6 cartelle di una serie più la tabella numero -> cartella, con
+  cui la segnazione di un numero estratto tocca una sola cartella.
+
+ALGORITMO (senza tentativi a vuoto)
+-----------------------------------
+
+1) Conteggi per colonna: ogni cartella riceve 1 numero in ogni colonna
+   (9 numeri); i 36 numeri restanti (3 nella colonna 0, 4 nelle colonne 1-7,
+   5 nella colonna 8) vengono distribuiti in modo che ogni cartella ne
+   riceva altri 6, al massimo uno per colonna. È un grafo bipartito con gradi
+   assegnati, costruito con la regola di Havel–Hakimi (colonne in ordine di
+   grado decrescente, ciascuna collegata alle cartelle con più posti liberi,
+   pareggi risolti a caso): la costruzione riesce sempre.
+2) Numeri: i numeri di ogni colonna vengono mescolati, divisi tra le cartelle
+   secondo i conteggi e ordinati dall'alto in basso.
+3) Disposizione nelle righe: in ogni cartella le colonne con 2 numeri e quelle
+   con 1 vengono distribuite sulle 3 righe da 5 caselle con la stessa regola
+   (colonne a grado 2 per prime, righe con più posti liberi).
+
+Le griglie risultanti rispettano le regole di Cartella._valida_cartella_generata()
+(15 numeri, 5 per riga, massimo 3 per colonna, range di colonna).
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Iterator, List, Optional, Type
+
+from bingo_game.cartella import Cartella, _RANGE_COLONNE
+
+
+# Numero di cartelle in una serie.
+CARTELLE_PER_SERIE: int = 6
+
+
+#funzione che costruisce le 6 griglie di una serie completa
+def genera_griglie_serie(rng: Optional[random.Random] = None) -> List[List[List[Optional[int]]]]:
+    """
+    Genera le griglie 3x9 delle 6 cartelle di una serie.
+
+    Parametri:
+    - rng: random.Random opzionale (None = modulo random globale).
+
+    Ritorna:
+    - List: 6 griglie nel formato di Cartella.cartella; l'unione dei loro
+      numeri è esattamente {1, ..., 90}.
+    """
+    generatore = rng if rng is not None else random
+    casuale = generatore.random
+
+    # 1) Conteggi per (cartella, colonna): 1 di base + al massimo 1 extra.
+    conteggi = [[1] * 9 for _ in range(CARTELLE_PER_SERIE)]
+    posti_liberi = [6] * CARTELLE_PER_SERIE
+    extra_colonne = [len(range_colonna) - CARTELLE_PER_SERIE for range_colonna in _RANGE_COLONNE]
+    ordine_colonne = sorted(range(9), key=lambda c: (-extra_colonne[c], casuale()))
+    for indice_colonna in ordine_colonne:
+        cartelle_scelte = sorted(
+            range(CARTELLE_PER_SERIE), key=lambda t: (-posti_liberi[t], casuale())
+        )[:extra_colonne[indice_colonna]]
+        for indice_cartella in cartelle_scelte:
+            conteggi[indice_cartella][indice_colonna] += 1
+            posti_liberi[indice_cartella] -= 1
+
+    # 2) Numeri di ogni colonna mescolati e divisi tra le cartelle.
+    numeri_per_cartella_colonna: List[List[List[int]]] = [[[] for _ in range(9)] for _ in range(CARTELLE_PER_SERIE)]
+    for indice_colonna, range_colonna in enumerate(_RANGE_COLONNE):
+        numeri = list(range_colonna)
+        generatore.shuffle(numeri)
+        inizio = 0
+        for indice_cartella in range(CARTELLE_PER_SERIE):
+            quanti = conteggi[indice_cartella][indice_colonna]
+            numeri_per_cartella_colonna[indice_cartella][indice_colonna] = sorted(numeri[inizio:inizio + quanti])
+            inizio += quanti
+
+    griglie = []
+    for indice_cartella in range(CARTELLE_PER_SERIE):
+        # 3) Righe occupate da ciascuna colonna della cartella.
+        griglia: List[List[Optional[int]]] = [[None] * 9, [None] * 9, [None] * 9]
+        posti_riga = [5, 5, 5]
+        ordine = sorted(range(9), key=lambda c: (-conteggi[indice_cartella][c], casuale()))
+        for indice_colonna in ordine:
+            quanti = conteggi[indice_cartella][indice_colonna]
+            righe = sorted(sorted(range(3), key=lambda r: (-posti_riga[r], casuale()))[:quanti])
+            numeri = numeri_per_cartella_colonna[indice_cartella][indice_colonna]
+            for indice_riga, numero in zip(righe, numeri):
+                griglia[indice_riga][indice_colonna] = numero
+                posti_riga[indice_riga] -= 1
+        griglie.append(griglia)
+
+    generatore.shuffle(griglie)
+    return griglie
+
+
+#funzione generatrice che produce n serie in streaming
+def genera_serie(n: int, rng: Optional[random.Random] = None) -> Iterator[List[List[List[Optional[int]]]]]:
+    """
+    Produce n serie (ciascuna come lista di 6 griglie) una alla volta,
+    senza tenerle tutte in memoria.
+
+    Eccezioni:
+    - ValueError: se n è negativo.
+    """
+    if n < 0:
+        raise ValueError(f"Il numero di serie deve essere >= 0, ricevuto {n}.")
+    for _ in range(n):
+        yield genera_griglie_serie(rng)
+
+
+#definizione della classe Serie
+class Serie:
+    """
+    Serie di 6 cartelle che coprono ogni numero da 1 a 90 esattamente una volta.
+
+    Mantiene:
+    - cartelle: le 6 istanze di cartella (indice da 1 a 6);
+    - _cartella_per_numero: tabella di 91 slot numero -> cartella che lo contiene.
+
+    Poiché ogni numero appartiene a una sola cartella della serie, segnare un
+    numero estratto è una singola consultazione della tabella.
+    """
+
+    def __init__(
+        self,
+        rng: Optional[random.Random] = None,
+        classe_cartella: Type[Cartella] = Cartella,
+        griglie: Optional[List[List[List[Optional[int]]]]] = None,
+    ) -> None:
+        """
+        Crea una serie nuova (griglie generate con rng) oppure a partire da
+        6 griglie esistenti, validate come serie completa.
+
+        Eccezioni:
+        - ValueError: se le griglie fornite non sono 6 o non coprono 1-90
+          esattamente una volta.
+        - RuntimeError: se una griglia viola le regole di Cartella.
+        """
+        if griglie is None:
+            griglie = genera_griglie_serie(rng)
+        if len(griglie) != CARTELLE_PER_SERIE:
+            raise ValueError(f"Una serie deve avere {CARTELLE_PER_SERIE} cartelle, ricevute {len(griglie)}.")
+
+        self.cartelle: List[Cartella] = [
+            classe_cartella(griglia=griglia, indice=indice)
+            for indice, griglia in enumerate(griglie, start=1)
+        ]
+
+        self._cartella_per_numero: List[Optional[Cartella]] = [None] * 91
+        for cartella in self.cartelle:
+            for numero in cartella.numeri_cartella:
+                if self._cartella_per_numero[numero] is not None:
+                    raise ValueError(f"Il numero {numero} compare in più cartelle della serie.")
+                self._cartella_per_numero[numero] = cartella
+        if any(cartella is None for cartella in self._cartella_per_numero[1:]):
+            raise ValueError("La serie non copre tutti i numeri da 1 a 90.")
+
+
+    #metodo che ritorna la cartella della serie che contiene il numero
+    def get_cartella_con_numero(self, numero: int) -> Cartella:
+        """Ritorna l'unica cartella della serie che contiene il numero (1-90)."""
+        if not isinstance(numero, int) or numero < 1 or numero > 90:
+            raise ValueError(f"Numero non valido: {numero!r} (atteso un intero tra 1 e 90).")
+        return self._cartella_per_numero[numero]
+
+
+    #metodo per segnare un numero estratto sulla serie
+    def segna_numero(self, numero: int) -> Cartella:
+        """
+        Segna il numero sull'unica cartella che lo contiene e ritorna la cartella.
+        """
+        cartella = self.get_cartella_con_numero(numero)
+        cartella.segna_numero(numero)
+        return cartella
+
+
+    #metodo che ritorna le cartelle della serie
+    def get_cartelle(self) -> List[Cartella]:
+        """Ritorna una copia della lista delle 6 cartelle."""
+        return list(self.cartelle)
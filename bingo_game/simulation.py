@@ -0,0 +1,425 @@
+"""
+MODULO PER LA SIMULAZIONE HEADLESS DI PARTITE
+Modulo: bingo_game.simulation
+
+Tombola / Bingo – Simulazione in batch di partite complete senza interfaccia
+===========================================================================
+
+OVERVIEW DEL MODULO
+-------------------
+
+Questo modulo permette di giocare N partite complete di sola logica di
+dominio (Partita, Tabellone, Cartella, GiocatoreAutomatico), senza:
+- la finestra wx e il suo timer;
+- i wrapper di logging del game_controller;
+- la costruzione degli eventi di turno per l'interfaccia.
+
+Ogni partita usa un proprio random.Random, derivato in modo deterministico
+dal seme principale e dall'indice della partita (seme_partita()), quindi:
+- la stessa campagna con lo stesso seme produce sempre lo stesso risultato;
+- un sottoinsieme di partite (es. un intervallo di indici) può essere
+  rigiocato in modo isolato e dà gli stessi esiti.
+
+Le statistiche vengono aggregate in RisultatoSimulazione:
+- istogramma delle estrazioni necessarie per ciascun premio;
+- distribuzione delle vittorie per giocatore (per premio);
+- frequenza delle co-vincite (più vincitori dello stesso premio nel turno).
+
+FUNZIONI PRINCIPALI
+-------------------
+
+- simula_partita(): gioca una singola partita e ritorna gli eventi di premio.
+- esegui_simulazione(): gioca un intervallo di partite e aggrega le statistiche.
+- esegui_simulazione_parallela(): divide la campagna in shard (intervalli
+  disgiunti di indici di partita) eseguiti su un ProcessPoolExecutor; ogni
+  worker ritorna solo gli istogrammi del proprio shard e il processo padre
+  li unisce. Il risultato è identico a esegui_simulazione() con lo stesso seme.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from bingo_game.cartella import Cartella
+from bingo_game.cartella_compatta import CartellaCompatta
+from bingo_game.partita import Partita
+from bingo_game.players.giocatore_automatico import GiocatoreAutomatico
+from bingo_game.tabellone_mescolato import TabelloneMescolato
+
+
+# Premi in ordine di gerarchia (dal più basso al più alto).
+PREMI_SIMULATI: tuple[str, ...] = ("ambo", "terno", "quaterna", "cinquina", "tombola")
+
+
+#funzione che calcola il seme deterministico di una singola partita della campagna
+def seme_partita(seme: int, indice_partita: int) -> int:
+    """
+    Ritorna il seme della partita di indice indice_partita nella campagna
+    con seme principale seme.
+
+    Il seme è un hash (BLAKE2b a 63 bit) della coppia (seme, indice_partita):
+    vale per semi negativi e indici di qualsiasi grandezza, coppie diverse
+    danno semi diversi salvo collisioni dell'hash (trascurabili), quindi la
+    campagna può essere spezzata in intervalli di indici senza sovrapposizioni.
+    Il risultato sta in un intero con segno a 64 bit.
+    """
+    impronta = hashlib.blake2b(f"{seme}:{indice_partita}".encode("ascii"), digest_size=8).digest()
+    return int.from_bytes(impronta, "little") >> 1
+
+
+#definizione della classe che aggrega le statistiche di una campagna di simulazione
+class RisultatoSimulazione:
+    """
+    Statistiche aggregate di un insieme di partite simulate.
+
+    Attributi:
+    - partite_giocate: int
+    - estrazioni_per_premio: Dict[str, Dict[int, int]]
+      premio -> {numero di estrazioni al momento dell'assegnazione: partite}
+    - vittorie_per_giocatore: Dict[str, Dict[int, int]]
+      premio -> {id_giocatore: vittorie} (in caso di co-vincita vince ciascuno)
+    - pareggi_per_premio: Dict[str, int]
+      premio -> partite in cui il premio è stato assegnato a più vincitori
+
+    Contiene solo contatori interi, quindi due risultati si possono unire con
+    unisci() ottenendo lo stesso valore che si avrebbe giocando tutte le
+    partite in un'unica esecuzione.
+    """
+
+    def __init__(self) -> None:
+        self.partite_giocate: int = 0
+        self.estrazioni_per_premio: Dict[str, Dict[int, int]] = {premio: {} for premio in PREMI_SIMULATI}
+        self.vittorie_per_giocatore: Dict[str, Dict[int, int]] = {premio: {} for premio in PREMI_SIMULATI}
+        self.pareggi_per_premio: Dict[str, int] = {premio: 0 for premio in PREMI_SIMULATI}
+
+
+    """sezione: aggiornamento dei contatori"""
+
+    #metodo per registrare gli eventi di premio di una partita conclusa
+    def registra_partita(self, eventi_premi: List[Dict[str, Any]]) -> None:
+        """
+        Aggiunge ai contatori gli eventi di premio di una partita.
+
+        Parametri:
+        - eventi_premi: List[Dict]
+          Eventi nel formato di Partita.verifica_premi() (chiavi usate:
+          "premio", "turno", "id_giocatore").
+        """
+        self.partite_giocate += 1
+
+        vincitori_per_premio: Dict[str, List[Dict[str, Any]]] = {}
+        for evento in eventi_premi:
+            vincitori_per_premio.setdefault(evento["premio"], []).append(evento)
+
+        for premio, eventi in vincitori_per_premio.items():
+            # Un tipo di premio viene assegnato in un solo turno (poi si chiude).
+            turno = eventi[0]["turno"]
+            istogramma = self.estrazioni_per_premio.setdefault(premio, {})
+            istogramma[turno] = istogramma.get(turno, 0) + 1
+
+            vittorie = self.vittorie_per_giocatore.setdefault(premio, {})
+            for evento in eventi:
+                id_giocatore = evento["id_giocatore"]
+                vittorie[id_giocatore] = vittorie.get(id_giocatore, 0) + 1
+
+            if len(eventi) > 1:
+                self.pareggi_per_premio[premio] = self.pareggi_per_premio.get(premio, 0) + 1
+
+
+    #metodo per unire i contatori di un altro risultato
+    def unisci(self, altro: "RisultatoSimulazione") -> "RisultatoSimulazione":
+        """
+        Somma ai contatori di questo risultato quelli di altro.
+
+        Ritorna:
+        - RisultatoSimulazione: self, per permettere l'uso in catena.
+        """
+        self.partite_giocate += altro.partite_giocate
+        for premio, istogramma in altro.estrazioni_per_premio.items():
+            destinazione = self.estrazioni_per_premio.setdefault(premio, {})
+            for turno, conteggio in istogramma.items():
+                destinazione[turno] = destinazione.get(turno, 0) + conteggio
+        for premio, vittorie in altro.vittorie_per_giocatore.items():
+            destinazione = self.vittorie_per_giocatore.setdefault(premio, {})
+            for id_giocatore, conteggio in vittorie.items():
+                destinazione[id_giocatore] = destinazione.get(id_giocatore, 0) + conteggio
+        for premio, conteggio in altro.pareggi_per_premio.items():
+            self.pareggi_per_premio[premio] = self.pareggi_per_premio.get(premio, 0) + conteggio
+        return self
+
+
+    """sezione: statistiche derivate"""
+
+    #metodo che ritorna in quante partite il premio è stato assegnato
+    def partite_con_premio(self, premio: str) -> int:
+        """Ritorna il numero di partite in cui il premio è stato assegnato."""
+        return sum(self.estrazioni_per_premio.get(premio, {}).values())
+
+
+    #metodo che ritorna la media delle estrazioni necessarie per un premio
+    def media_estrazioni(self, premio: str) -> Optional[float]:
+        """
+        Ritorna il numero medio di estrazioni al momento dell'assegnazione del
+        premio, calcolato sulle sole partite in cui è stato assegnato
+        (None se non è mai stato assegnato).
+        """
+        istogramma = self.estrazioni_per_premio.get(premio, {})
+        totale = sum(istogramma.values())
+        if totale == 0:
+            return None
+        return sum(turno * conteggio for turno, conteggio in istogramma.items()) / totale
+
+
+    #metodo che ritorna la frequenza di co-vincita di un premio
+    def frequenza_pareggio(self, premio: str) -> float:
+        """
+        Ritorna la frazione di partite (tra quelle in cui il premio è stato
+        assegnato) con più vincitori dello stesso premio.
+        """
+        totale = self.partite_con_premio(premio)
+        if totale == 0:
+            return 0.0
+        return self.pareggi_per_premio.get(premio, 0) / totale
+
+
+    #metodo che ritorna la distribuzione delle vittorie per giocatore su un premio
+    def distribuzione_vittorie(self, premio: str) -> Dict[int, float]:
+        """
+        Ritorna, per ogni id_giocatore, la quota delle vittorie del premio.
+        """
+        vittorie = self.vittorie_per_giocatore.get(premio, {})
+        totale = sum(vittorie.values())
+        if totale == 0:
+            return {}
+        return {id_giocatore: conteggio / totale for id_giocatore, conteggio in sorted(vittorie.items())}
+
+
+    #metodo che ritorna una rappresentazione serializzabile del risultato
+    def to_dict(self) -> Dict[str, Any]:
+        """Ritorna i contatori come dizionario di tipi semplici (copie)."""
+        return {
+            "partite_giocate": self.partite_giocate,
+            "estrazioni_per_premio": {p: dict(sorted(h.items())) for p, h in self.estrazioni_per_premio.items()},
+            "vittorie_per_giocatore": {p: dict(sorted(v.items())) for p, v in self.vittorie_per_giocatore.items()},
+            "pareggi_per_premio": dict(self.pareggi_per_premio),
+        }
+
+
+    #metodo di classe che ricostruisce un risultato da to_dict()
+    @classmethod
+    def da_dict(cls, dati: Dict[str, Any]) -> "RisultatoSimulazione":
+        """Ricostruisce un risultato a partire dal dizionario prodotto da to_dict()."""
+        risultato = cls()
+        risultato.partite_giocate = int(dati["partite_giocate"])
+        for premio, istogramma in dati["estrazioni_per_premio"].items():
+            risultato.estrazioni_per_premio[premio] = {int(t): int(c) for t, c in istogramma.items()}
+        for premio, vittorie in dati["vittorie_per_giocatore"].items():
+            risultato.vittorie_per_giocatore[premio] = {int(g): int(c) for g, c in vittorie.items()}
+        for premio, conteggio in dati["pareggi_per_premio"].items():
+            risultato.pareggi_per_premio[premio] = int(conteggio)
+        return risultato
+
+
+    def __eq__(self, altro: object) -> bool:
+        if not isinstance(altro, RisultatoSimulazione):
+            return NotImplemented
+        return self.to_dict() == altro.to_dict()
+
+
+#funzione che gioca una singola partita headless e ritorna gli eventi di premio
+def simula_partita(
+    num_giocatori: int,
+    cartelle_per_giocatore: int,
+    rng: random.Random,
+    classe_cartella: Type[Cartella] = CartellaCompatta,
+) -> List[Dict[str, Any]]:
+    """
+    Gioca una partita completa tra giocatori automatici e ritorna gli eventi
+    di premio assegnati (formato di Partita.verifica_premi()).
+
+    Il ciclo riproduce le fasi del turno V2 senza timer, logging né eventi UI:
+    estrazione, dichiarazione dei bot, verifica dei reclami, reset del turno.
+    Poiché tutti i giocatori sono bot e la tombola ha il rango più alto, la
+    partita termina nel turno in cui la prima tombola viene assegnata.
+
+    Parametri:
+    - num_giocatori: int, numero di bot (id_giocatore da 1 a num_giocatori).
+    - cartelle_per_giocatore: int, cartelle assegnate a ogni bot.
+    - rng: random.Random usato per cartelle ed estrazioni.
+    - classe_cartella: classe della cartella (es. Cartella o CartellaCompatta).
+    """
+    giocatori = []
+    for id_giocatore in range(1, num_giocatori + 1):
+        bot = GiocatoreAutomatico(f"Bot {id_giocatore}", id_giocatore=id_giocatore)
+        for _ in range(cartelle_per_giocatore):
+            bot.aggiungi_cartella(classe_cartella(rng=rng))
+        giocatori.append(bot)
+
+    partita = Partita(TabelloneMescolato(rng=rng), giocatori)
+    partita.avvia_partita()
+
+    eventi_partita: List[Dict[str, Any]] = []
+    while True:
+        partita.estrai_prossimo_numero()
+        for bot in giocatori:
+            bot.dichiara_fine_fase_azione(partita.premi_gia_assegnati, partita.premi_tipo_chiusi)
+        eventi = partita.verifica_premi()
+        for bot in giocatori:
+            bot.reset_reclamo_turno()
+            bot.turno_dichiarato_concluso = False
+        if eventi:
+            eventi_partita.extend(eventi)
+            if "tombola" in partita.premi_tipo_chiusi:
+                partita.termina_partita()
+                return eventi_partita
+
+
+#funzione che gioca un intervallo di partite e ne aggrega le statistiche
+def esegui_simulazione(
+    num_partite: int,
+    num_giocatori: int = 4,
+    cartelle_per_giocatore: int = 1,
+    seme: int = 0,
+    classe_cartella: Type[Cartella] = CartellaCompatta,
+    indice_iniziale: int = 0,
+) -> RisultatoSimulazione:
+    """
+    Gioca num_partite partite headless e ritorna le statistiche aggregate.
+
+    La partita di indice i (da indice_iniziale a indice_iniziale + num_partite - 1)
+    usa random.Random(seme_partita(seme, i)): il risultato dipende solo da
+    seme e dall'intervallo di indici, non dall'ordine o dal processo di esecuzione.
+
+    Parametri:
+    - num_partite: int >= 0
+    - num_giocatori: int >= 2 (vincolo di Partita.MIN_GIOCATORI)
+    - cartelle_per_giocatore: int >= 1
+    - seme: int, seme principale della campagna
+    - classe_cartella: classe delle cartelle generate
+    - indice_iniziale: int, indice della prima partita dell'intervallo
+
+    Eccezioni:
+    - ValueError: parametri fuori dai limiti.
+    """
+    if num_partite < 0:
+        raise ValueError(f"num_partite deve essere >= 0, ricevuto {num_partite}.")
+    if num_giocatori < Partita.MIN_GIOCATORI:
+        raise ValueError(
+            f"num_giocatori deve essere >= {Partita.MIN_GIOCATORI}, ricevuto {num_giocatori}."
+        )
+    if cartelle_per_giocatore < 1:
+        raise ValueError(f"cartelle_per_giocatore deve essere >= 1, ricevuto {cartelle_per_giocatore}.")
+
+    risultato = RisultatoSimulazione()
+    for indice_partita in range(indice_iniziale, indice_iniziale + num_partite):
+        rng = random.Random(seme_partita(seme, indice_partita))
+        eventi = simula_partita(num_giocatori, cartelle_per_giocatore, rng, classe_cartella)
+        risultato.registra_partita(eventi)
+    return risultato
+
+
+"""sezione: esecuzione parallela per shard"""
+
+#funzione che divide un intervallo di partite in shard contigui e disgiunti
+def partiziona_partite(num_partite: int, num_shard: int, indice_iniziale: int = 0) -> List[Tuple[int, int]]:
+    """
+    Divide le partite [indice_iniziale, indice_iniziale + num_partite) in al
+    massimo num_shard intervalli contigui e disgiunti di dimensione quasi uguale.
+
+    Ritorna:
+    - List[Tuple[int, int]]: coppie (indice_iniziale_shard, num_partite_shard),
+      in ordine di indice; gli shard vuoti vengono omessi.
+    """
+    if num_shard < 1:
+        raise ValueError(f"num_shard deve essere >= 1, ricevuto {num_shard}.")
+    base, resto = divmod(num_partite, num_shard)
+    shard = []
+    inizio = indice_iniziale
+    for indice_shard in range(num_shard):
+        dimensione = base + (1 if indice_shard < resto else 0)
+        if dimensione == 0:
+            continue
+        shard.append((inizio, dimensione))
+        inizio += dimensione
+    return shard
+
+
+#funzione eseguita dal worker: gioca uno shard e ritorna gli istogrammi compatti
+def _esegui_shard(
+    parametri: Tuple[int, int, int, int, Type[Cartella], int],
+) -> Dict[str, Any]:
+    """
+    Esegue uno shard nel processo worker.
+
+    Ritorna solo i contatori dello shard (RisultatoSimulazione.to_dict()),
+    non gli eventi delle singole partite.
+    """
+    indice_iniziale, num_partite, num_giocatori, cartelle_per_giocatore, classe_cartella, seme = parametri
+    risultato = esegui_simulazione(
+        num_partite,
+        num_giocatori=num_giocatori,
+        cartelle_per_giocatore=cartelle_per_giocatore,
+        seme=seme,
+        classe_cartella=classe_cartella,
+        indice_iniziale=indice_iniziale,
+    )
+    return risultato.to_dict()
+
+
+#funzione che distribuisce una campagna di simulazione su più processi
+def esegui_simulazione_parallela(
+    num_partite: int,
+    num_giocatori: int = 4,
+    cartelle_per_giocatore: int = 1,
+    seme: int = 0,
+    classe_cartella: Type[Cartella] = CartellaCompatta,
+    num_processi: Optional[int] = None,
+    num_shard: Optional[int] = None,
+) -> RisultatoSimulazione:
+    """
+    Gioca num_partite partite distribuendole su un ProcessPoolExecutor.
+
+    La campagna viene divisa da partiziona_partite() in shard di indici
+    contigui e disgiunti; la partita di indice i usa sempre
+    seme_partita(seme, i), quindi ogni worker lavora su un intervallo di semi
+    riproducibile e indipendente dagli altri. Gli istogrammi degli shard
+    vengono uniti nel processo padre: il risultato è identico a quello di
+    esegui_simulazione() con gli stessi parametri, qualunque sia il numero di
+    processi o di shard.
+
+    Parametri:
+    - num_partite, num_giocatori, cartelle_per_giocatore, seme, classe_cartella:
+      come in esegui_simulazione().
+    - num_processi: Optional[int], worker del pool (None = os.cpu_count()).
+    - num_shard: Optional[int], numero di shard (None = 4 per processo, per
+      bilanciare il carico tra partite di durata diversa).
+
+    Eccezioni:
+    - ValueError: parametri fuori dai limiti.
+    """
+    if num_processi is None:
+        num_processi = os.cpu_count() or 1
+    if num_processi < 1:
+        raise ValueError(f"num_processi deve essere >= 1, ricevuto {num_processi}.")
+    if num_shard is None:
+        num_shard = num_processi * 4
+
+    # Validazione anticipata nel processo padre (stessi controlli dei worker).
+    esegui_simulazione(0, num_giocatori, cartelle_per_giocatore, seme, classe_cartella)
+
+    risultato = RisultatoSimulazione()
+    lavori = [
+        (inizio, dimensione, num_giocatori, cartelle_per_giocatore, classe_cartella, seme)
+        for inizio, dimensione in partiziona_partite(num_partite, num_shard)
+    ]
+    if not lavori:
+        return risultato
+
+    with ProcessPoolExecutor(max_workers=min(num_processi, len(lavori))) as pool:
+        for dati_shard in pool.map(_esegui_shard, lavori):
+            risultato.unisci(RisultatoSimulazione.da_dict(dati_shard))
+    return risultato
@@ -76,7 +76,7 @@ La classe Tabellone è organizzata in due gruppi principali di metodi:
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Iterable
 import random
 
 from bingo_game.exceptions.tabellone_exceptions import TabelloneNumeriEsauritiException
@@ -95,7 +95,9 @@ class Tabellone:
     """
 
     #costruttore della classe Tabellone
-    def __init__(self) -> None:
+    def __init__(self, rng: random.Random | None = None) -> None:
+        # Generatore casuale per le estrazioni (None = modulo random globale)
+        self._rng = rng
         # Inizializza il tabellone
         self._inizializza_tabellone()
 
@@ -147,7 +149,7 @@ class Tabellone:
         # Crea una lista dei numeri disponibili per l'estrazione
         lista_disponibili = list(self.numeri_disponibili)
         # Estrae un numero casuale dalla lista dei numeri disponibili
-        numero_estratto = random.choice(lista_disponibili)
+        numero_estratto = (self._rng or random).choice(lista_disponibili)
         # Rimuove il numero estratto dai numeri disponibili e lo aggiunge ai numeri estratti
         self.numeri_disponibili.remove(numero_estratto)
         #aggiunge il numero estratto al set dei numeri estratti
@@ -197,6 +199,27 @@ class Tabellone:
         self._inizializza_tabellone()
 
 
+    #metodo per riportare il tabellone a una sequenza di estrazioni già avvenute
+    def ripristina_estrazioni(self, numeri: Iterable[int]) -> None:
+        """
+        Riporta il tabellone allo stato in cui si trovava dopo aver estratto
+        i numeri indicati, nell'ordine dato (es. ripresa da un checkpoint).
+
+        Le estrazioni successive proseguono con il generatore del tabellone.
+
+        Eccezioni:
+        - ValueError: se un numero è fuori dal range 1-90 o ripetuto.
+        """
+        self._inizializza_tabellone()
+        for numero in numeri:
+            if numero not in self.numeri_disponibili:
+                raise ValueError(f"Numero non ripristinabile: {numero} (fuori range o ripetuto).")
+            self.numeri_disponibili.remove(numero)
+            self.numeri_estratti.add(numero)
+            self.storico_estrazioni.append(numero)
+            self.ultimo_numero_estratto = numero
+
+
 
     """sezione: metodi di stato/controllo"""
     #metodo per verificare se i numeri del tabellone sono terminati
@@ -0,0 +1,206 @@
+"""
+CLASSE PER IL TABELLONE A SEQUENZA PRE-MESCOLATA
+Modulo: bingo_game.tabellone_mescolato
+
+Tombola / Bingo – Tabellone con estrazione O(1) e stato su bytearray
+====================================================================
+
+OVERVIEW DEL MODULO
+-------------------
+
+Questo modulo definisce la classe TabelloneMescolato, una variante di
+Tabellone in cui l'ordine di estrazione viene fissato una sola volta in
+_inizializza_tabellone():
+- con un mescolamento Fisher–Yates (random.shuffle) dei numeri 1-90, usando
+  il random.Random iniettato (o il modulo random globale);
+- oppure usando una sequenza pre-impegnata passata dal chiamante (es. per
+  rigiocare una partita o per test deterministici).
+
+Con questa rappresentazione:
+- estrai_numero() legge il prossimo elemento della sequenza e avanza un
+  cursore (O(1), nessuna lista ricostruita a ogni estrazione);
+- lo stato "estratto / non estratto" è un bytearray da 91 slot (lo slot 0
+  non è usato), quindi is_numero_estratto() è un accesso per indice;
+- lo storico delle estrazioni è il prefisso della sequenza già estratto.
+
+La classe eredita da Tabellone: tutti i metodi di stato (conteggi,
+percentuale, ultimi estratti, get_stato_tabellone) restano disponibili con lo
+stesso contratto.
+
+NOTE DI UTILIZZO
+----------------
+
+- numeri_estratti e numeri_disponibili restano leggibili come set (viste
+  derivate, costruite a ogni accesso) per compatibilità con l'interfaccia;
+  per le interrogazioni frequenti usare i metodi get_*/is_numero_estratto().
+- reset_tabellone() rimescola la sequenza (o riparte dalla sequenza
+  pre-impegnata).
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Iterable, Optional
+
+from bingo_game.tabellone import Tabellone
+
+
+#definizione della classe TabelloneMescolato
+class TabelloneMescolato(Tabellone):
+    """
+    Tabellone con ordine di estrazione fissato all'inizializzazione.
+
+    Mantiene:
+    - _sequenza: lista dei 90 numeri nell'ordine in cui verranno estratti;
+    - _prossimo: indice del prossimo numero da estrarre nella sequenza;
+    - _estratti: bytearray da 91 slot, 1 se il numero è stato estratto.
+    """
+
+    def __init__(self, rng: Optional[random.Random] = None, sequenza: Optional[Iterable[int]] = None) -> None:
+        """
+        Parametri:
+        - rng: random.Random opzionale usato per il mescolamento.
+        - sequenza: ordine di estrazione pre-impegnato; deve essere una
+          permutazione dei numeri da 1 a 90. Se indicata, rng non viene usato.
+
+        Eccezioni:
+        - ValueError: se sequenza non è una permutazione di 1-90.
+        """
+        self._sequenza_impegnata: Optional[tuple[int, ...]] = None
+        if sequenza is not None:
+            sequenza_impegnata = tuple(sequenza)
+            if sorted(sequenza_impegnata) != list(range(1, 91)):
+                raise ValueError("La sequenza di estrazione deve essere una permutazione dei numeri da 1 a 90.")
+            self._sequenza_impegnata = sequenza_impegnata
+        super().__init__(rng=rng)
+
+
+    """sezione: metodi di creazione del tabellone"""
+
+    #metodo per inizializzare il tabellone fissando l'ordine di estrazione
+    def _inizializza_tabellone(self) -> None:
+        """
+        Fissa l'ordine di estrazione (sequenza pre-impegnata oppure un unico
+        mescolamento Fisher–Yates) e azzera lo stato delle estrazioni.
+        """
+        if self._sequenza_impegnata is not None:
+            self._sequenza: list[int] = list(self._sequenza_impegnata)
+        else:
+            self._sequenza = list(range(1, 91))
+            (self._rng or random).shuffle(self._sequenza)
+        self._prossimo: int = 0
+        self._estratti: bytearray = bytearray(91)
+        self.ultimo_numero_estratto: int | None = None
+
+
+    #metodo per estrarre il prossimo numero della sequenza
+    def estrai_numero(self) -> int:
+        """
+        Estrae il prossimo numero della sequenza (O(1)).
+
+        Stesso contratto di Tabellone.estrai_numero().
+
+        Eccezioni:
+        - TabelloneNumeriEsauritiException: se tutti i numeri sono già stati estratti.
+        """
+        if self._prossimo >= 90:
+            self.gestione_errore_numeri_terminati()
+        numero_estratto = self._sequenza[self._prossimo]
+        self._prossimo += 1
+        self._estratti[numero_estratto] = 1
+        self.ultimo_numero_estratto = numero_estratto
+        return numero_estratto
+
+
+    #metodo per riportare la sequenza a estrazioni già avvenute
+    def ripristina_estrazioni(self, numeri: Iterable[int]) -> None:
+        """
+        Porta i numeri indicati in testa alla sequenza, nell'ordine dato, e
+        sposta il cursore dopo di essi; i numeri non ancora estratti restano
+        nell'ordine della sequenza corrente.
+
+        Eccezioni:
+        - ValueError: se un numero è fuori dal range 1-90 o ripetuto.
+        """
+        estratti = list(numeri)
+        presenti = bytearray(91)
+        for numero in estratti:
+            if not isinstance(numero, int) or numero < 1 or numero > 90 or presenti[numero]:
+                raise ValueError(f"Numero non ripristinabile: {numero} (fuori range o ripetuto).")
+            presenti[numero] = 1
+        self._sequenza = estratti + [numero for numero in self._sequenza if not presenti[numero]]
+        self._prossimo = len(estratti)
+        self._estratti = presenti
+        self.ultimo_numero_estratto = estratti[-1] if estratti else None
+
+
+    #metodo per verificare se un numero è già stato estratto
+    def is_numero_estratto(self, numero: int) -> bool:
+        """
+        Verifica se il numero è stato estratto (accesso al bytearray).
+        Come in Tabellone, un numero fuori dal range 1-90 ritorna False.
+        """
+        if not isinstance(numero, int) or numero < 1 or numero > 90:
+            return False
+        return bool(self._estratti[numero])
+
+
+    """property di compatibilità con Tabellone"""
+
+    @property
+    def numeri_estratti(self) -> set[int]:
+        """Vista set dei numeri estratti (derivata dalla sequenza)."""
+        return set(self._sequenza[:self._prossimo])
+
+    @property
+    def numeri_disponibili(self) -> set[int]:
+        """Vista set dei numeri ancora disponibili (derivata dalla sequenza)."""
+        return set(self._sequenza[self._prossimo:])
+
+    @property
+    def storico_estrazioni(self) -> list[int]:
+        """Numeri estratti in ordine temporale (prefisso della sequenza)."""
+        return self._sequenza[:self._prossimo]
+
+
+    """sezione: metodi di stato/controllo"""
+
+    def get_sequenza(self) -> tuple[int, ...]:
+        """Ordine completo di estrazione: numeri già estratti, poi quelli futuri."""
+        return tuple(self._sequenza)
+
+    def numeri_terminati(self) -> bool:
+        """True se tutti e 90 i numeri sono stati estratti."""
+        return self._prossimo >= 90
+
+    def get_conteggio_estratti(self) -> int:
+        """Numero di estrazioni effettuate (posizione del cursore)."""
+        return self._prossimo
+
+    def get_conteggio_disponibili(self) -> int:
+        """Numero di estrazioni rimanenti."""
+        return 90 - self._prossimo
+
+    def get_numeri_estratti(self) -> list[int]:
+        """Lista ordinata dei numeri estratti, letta dal bytearray."""
+        estratti = self._estratti
+        return [numero for numero in range(1, 91) if estratti[numero]]
+
+    def get_numeri_disponibili(self) -> list[int]:
+        """Lista ordinata dei numeri disponibili, letta dal bytearray."""
+        estratti = self._estratti
+        return [numero for numero in range(1, 91) if not estratti[numero]]
+
+    def get_ultimi_numeri_estratti(self, n: int = 5) -> tuple[int, ...]:
+        """
+        Ultimi N numeri estratti in ordine temporale, letti direttamente dalla
+        sequenza senza copiare l'intero storico.
+
+        Eccezioni:
+        - ValueError: se n non è un intero oppure se n <= 0.
+        """
+        if not isinstance(n, int):
+            raise ValueError("Il parametro 'n' deve essere un intero.")
+        if n <= 0:
+            raise ValueError("Il parametro 'n' deve essere maggiore di 0.")
+        return tuple(self._sequenza[max(0, self._prossimo - n):self._prossimo])
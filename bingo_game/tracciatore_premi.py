@@ -0,0 +1,200 @@
+"""
+CLASSE PER IL TRACCIAMENTO INCREMENTALE DEI PREMI
+Modulo: bingo_game.tracciatore_premi
+
+Tombola / Bingo – Stato dei premi aggiornato a ogni segnazione
+==============================================================
+
+OVERVIEW DEL MODULO
+-------------------
+
+Questo modulo definisce la classe TracciatorePremi, che mantiene per ogni
+cartella tracciata:
+- il numero di caselle segnate in ciascuna riga;
+- il numero totale di caselle segnate nella cartella.
+
+I contatori vengono incrementati a ogni segnazione (segna()), quindi:
+- ambo / terno / quaterna / cinquina di riga sono un confronto con le soglie
+  2 / 3 / 4 / 5 sul contatore della riga;
+- la tombola è un confronto tra il contatore della cartella e quantita_numeri;
+- segna() ritorna direttamente i premi "appena raggiunti" da quella
+  segnazione, senza riscansionare la cartella.
+
+Partita usa il tracciatore al posto di verifica_premi_per_cartella() nel
+percorso caldo di verifica_premi().
+
+NOTE DI UTILIZZO
+----------------
+
+- Le cartelle possono essere segnate anche fuori dal tracciatore (segnazione
+  manuale del giocatore umano, chiamate dirette a segna_numero() nei test).
+  Prima di ogni interrogazione il tracciatore confronta il proprio contatore
+  con conta_numeri_segnati() della cartella e, se differiscono, ricalcola i
+  contatori di quella sola cartella.
+- Le cartelle sono identificate per identità dell'oggetto, non per indice.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from bingo_game.premi import SOGLIE_PREMI_RIGA
+
+if TYPE_CHECKING:
+    from bingo_game.cartella import Cartella
+
+
+# Mappa inversa soglia -> premio, per rilevare in O(1) il premio appena raggiunto.
+PREMIO_PER_SOGLIA: Dict[int, str] = {soglia: tipo for tipo, soglia in SOGLIE_PREMI_RIGA}
+
+#definizione della classe di supporto con i contatori di una cartella
+class _ContatoriCartella:
+    """Contatori di una singola cartella tracciata."""
+
+    __slots__ = ("cartella", "segnati_riga", "segnati_totali")
+
+    def __init__(self, cartella: 'Cartella') -> None:
+        self.cartella = cartella
+        self.segnati_riga: List[int] = [0, 0, 0]
+        self.segnati_totali: int = 0
+
+
+#definizione della classe TracciatorePremi
+class TracciatorePremi:
+    """
+    Tracciatore incrementale dello stato dei premi delle cartelle.
+
+    Mantiene un contatore di numeri segnati per (cartella, riga) e per cartella;
+    le verifiche dei premi sono confronti con soglie fisse.
+    """
+
+    def __init__(self) -> None:
+        self._contatori: Dict[int, _ContatoriCartella] = {}
+
+
+    """metodi privati di allineamento"""
+
+    #metodo per ricalcolare i contatori di una cartella leggendone lo stato corrente
+    def _ricalcola(self, cartella: 'Cartella') -> _ContatoriCartella:
+        """
+        Ricostruisce da zero i contatori della cartella leggendo la griglia e
+        numeri_segnati. È l'unico punto in cui la cartella viene scansionata.
+        """
+        contatori = _ContatoriCartella(cartella)
+        segnati = cartella.numeri_segnati
+        for indice_riga, riga in enumerate(cartella.cartella):
+            contatori.segnati_riga[indice_riga] = sum(
+                1 for valore in riga if valore is not None and valore in segnati
+            )
+        contatori.segnati_totali = cartella.conta_numeri_segnati()
+        self._contatori[id(cartella)] = contatori
+        return contatori
+
+
+    #metodo per ottenere i contatori allineati allo stato reale della cartella
+    def _allinea(self, cartella: 'Cartella') -> _ContatoriCartella:
+        """
+        Ritorna i contatori della cartella, ricalcolandoli se la cartella non è
+        ancora tracciata o se è stata segnata fuori dal tracciatore.
+        """
+        contatori = self._contatori.get(id(cartella))
+        if (contatori is None
+                or contatori.cartella is not cartella
+                or contatori.segnati_totali != cartella.conta_numeri_segnati()):
+            contatori = self._ricalcola(cartella)
+        return contatori
+
+
+    """metodi pubblici"""
+
+    #metodo per iniziare a tracciare una cartella
+    def registra_cartella(self, cartella: 'Cartella') -> None:
+        """
+        Registra la cartella nel tracciatore, allineando i contatori allo stato
+        attuale (anche se contiene già numeri segnati).
+        """
+        self._ricalcola(cartella)
+
+
+    #metodo per aggiornare i contatori dopo una segnazione e ritornare i premi appena raggiunti
+    def segna(self, cartella: 'Cartella', indice_riga: int) -> List[Tuple[str, Optional[int]]]:
+        """
+        Registra una segnazione appena avvenuta sulla riga indicata.
+
+        Va chiamato dopo che cartella.segna_numero() ha ritornato True.
+
+        Parametri:
+        - cartella: Cartella su cui è stato segnato il numero.
+        - indice_riga: int (0, 1 o 2), riga del numero segnato.
+
+        Ritorna:
+        - List[Tuple[str, Optional[int]]]: premi raggiunti per effetto di questa
+          segnazione, come coppie (tipo, riga); la riga è None per la tombola.
+        """
+        contatori = self._contatori.get(id(cartella))
+        if (contatori is None
+                or contatori.cartella is not cartella
+                or contatori.segnati_totali != cartella.conta_numeri_segnati() - 1):
+            # Stato non allineato: si riparte dallo stato reale, che include già
+            # la segnazione appena avvenuta, e si valuta la soglia raggiunta.
+            contatori = self._ricalcola(cartella)
+        else:
+            contatori.segnati_riga[indice_riga] += 1
+            contatori.segnati_totali += 1
+
+        premi_raggiunti: List[Tuple[str, Optional[int]]] = []
+        tipo = PREMIO_PER_SOGLIA.get(contatori.segnati_riga[indice_riga])
+        if tipo is not None:
+            premi_raggiunti.append((tipo, indice_riga))
+        if contatori.segnati_totali == cartella.quantita_numeri:
+            premi_raggiunti.append(("tombola", None))
+        return premi_raggiunti
+
+
+    #metodo per ottenere il numero di caselle segnate in una riga
+    def conta_segnati_riga(self, cartella: 'Cartella', indice_riga: int) -> int:
+        """Ritorna quanti numeri della riga indicata risultano segnati."""
+        return self._allinea(cartella).segnati_riga[indice_riga]
+
+
+    #metodo per ottenere il premio di riga più alto raggiunto
+    def premio_massimo_riga(self, cartella: 'Cartella', indice_riga: int) -> Optional[str]:
+        """
+        Ritorna il premio di riga più alto raggiunto ("cinquina", "quaterna",
+        "terno", "ambo"), oppure None se la riga ha meno di 2 numeri segnati.
+        """
+        segnati = self._allinea(cartella).segnati_riga[indice_riga]
+        premio = None
+        for tipo, soglia in SOGLIE_PREMI_RIGA:
+            if segnati >= soglia:
+                premio = tipo
+        return premio
+
+
+    #metodo per verificare se la cartella ha fatto tombola
+    def ha_tombola(self, cartella: 'Cartella') -> bool:
+        """Ritorna True se tutti i numeri della cartella sono segnati."""
+        return self._allinea(cartella).segnati_totali == cartella.quantita_numeri
+
+
+    #metodo per ottenere lo stato dei premi nello stesso formato di Partita.verifica_premi_per_cartella()
+    def stato_premi(self, cartella: 'Cartella') -> Dict[str, object]:
+        """
+        Ritorna lo stato dei premi della cartella con la stessa struttura di
+        Partita.verifica_premi_per_cartella():
+        {"tombola": bool, "righe": {0: {"ambo": bool, ...}, 1: {...}, 2: {...}}}
+        """
+        contatori = self._allinea(cartella)
+        righe = {}
+        for indice_riga, segnati in enumerate(contatori.segnati_riga):
+            righe[indice_riga] = {tipo: segnati >= soglia for tipo, soglia in SOGLIE_PREMI_RIGA}
+        return {
+            "tombola": contatori.segnati_totali == cartella.quantita_numeri,
+            "righe": righe,
+        }
+
+
+    #metodo per dimenticare tutte le cartelle tracciate
+    def reset(self) -> None:
+        """Svuota il tracciatore."""
+        self._contatori.clear()
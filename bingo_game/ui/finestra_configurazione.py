@@ -39,7 +39,8 @@ class FinestraConfigurazione(wx.Frame):
 
     Controlli minimi: nome giocatore, numero bot (1-7), cartelle per giocatore (1-6).
     Il focus iniziale è posizionato sul primo campo utile (nome).
-    La conferma delega a ComandiSistema e apre FinestraGioco in caso di successo.
+    La conferma delega a ComandiSistema e apre FinestraGioco in caso di successo,
+    con le griglie disegnate o classiche secondo griglie_disegnate.
     """
 
     def __init__(
@@ -47,6 +48,7 @@ class FinestraConfigurazione(wx.Frame):
         renderer: "WxRenderer",
         parent: Optional[wx.Window] = None,
         parent_frame: Optional[wx.Frame] = None,
+        griglie_disegnate: bool = True,
     ) -> None:
         super().__init__(
             parent,
@@ -56,6 +58,7 @@ class FinestraConfigurazione(wx.Frame):
         )
         self._renderer = renderer
         self._parent_frame = parent_frame
+        self._griglie_disegnate: bool = griglie_disegnate
         self._comandi_sistema = ComandiSistema()
         self._build_ui()
         self._bind_events()
@@ -223,6 +226,7 @@ class FinestraConfigurazione(wx.Frame):
             durata_finestra_ms=durata_finestra_ms,
             durata_pausa_ms=durata_pausa_ms,
             finestra_principale=self._parent_frame,
+            griglie_disegnate=self._griglie_disegnate,
         )
         finestra_gioco.Show()
         self.Hide()
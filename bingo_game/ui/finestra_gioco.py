@@ -72,9 +72,17 @@ from bingo_game.ui.tema import (
 )
 
 from bingo_game.ui.finestra_aiuto_tasti_rapidi import FinestraAiutoTastiRapidi
+from bingo_game.ui.griglie_disegnate import PannelloCartellaDisegnata, PannelloTabelloneDisegnato
+from bingo_game.ui.stato_griglie import (
+    CELLE_CARTELLA, CELLE_TABELLONE,
+    STATO_CARTELLA_ESTRATTO, STATO_CARTELLA_NUMERO, STATO_CARTELLA_SEGNATO, STATO_CARTELLA_VUOTA,
+    STATO_TABELLONE_DISPONIBILE, STATO_TABELLONE_ESTRATTO,
+    StatoGriglia, numero_cella_tabellone, stati_cartella, stati_tabellone,
+)
 from bingo_game.ui.locales.it import CIFRE_VERBALI, MESSAGGI_OUTPUT_UI_UMANI
 from bingo_game.ui.overlay_numero import OverlayNumeroEstratto
 from bingo_game.comandi_partita import ComandiSistema, ComandiGiocatoreUmano
+from bingo_game import latenze
 from bingo_game.partita import Partita
 
 if TYPE_CHECKING:
@@ -108,7 +116,8 @@ class PannelloTabellone(wx.Panel):
     Griglia visiva 9 colonne × 10 righe del tabellone (numeri 1-90).
 
     Puramente visiva e non focalizzabile. Ogni colonna raggruppa una decina.
-    Dati statici placeholder: aggiornamento dinamico in fase successiva.
+    Ricorda l'ultimo stato disegnato (StatoGriglia) e ridipinge solo le celle
+    cambiate: di norma il solo numero appena estratto.
     """
 
     def __init__(self, parent: wx.Window) -> None:
@@ -140,17 +149,40 @@ class PannelloTabellone(wx.Panel):
                 sizer.Add(cell, 1, wx.EXPAND)
                 self._celle[numero] = cell
         self.SetSizer(sizer)
+        # Le celle sono create già nello stato "disponibile".
+        self._stato = StatoGriglia(CELLE_TABELLONE)
+        self._stato.registra(stati_tabellone(()))
+        self._colori = {
+            STATO_TABELLONE_DISPONIBILE: (wx.Colour(COLORE_CELLA_VUOTA), wx.Colour(COLORE_CELLA_TESTO_INATTIVO)),
+            STATO_TABELLONE_ESTRATTO: (wx.Colour(COLORE_CELLA_ESTRATTO), wx.Colour(COLORE_TESTO_CHIARO)),
+        }
+
+    def calcola_modifiche(self, numeri_estratti: set) -> tuple:
+        """Ritorna (stati, indici delle celle cambiate) rispetto all'ultimo disegno."""
+        stati = stati_tabellone(numeri_estratti)
+        return stati, self._stato.celle_modificate(stati)
+
+    def applica_modifiche(self, modifiche: tuple) -> None:
+        """Ridipinge solo le celle indicate da calcola_modifiche()."""
+        stati, indici = modifiche
+        for indice in indici:
+            cell = self._celle[numero_cella_tabellone(indice)]
+            sfondo, testo = self._colori[stati[indice]]
+            cell.SetBackgroundColour(sfondo)
+            cell.SetForegroundColour(testo)
+            cell.Refresh()
+        self._stato.registra(stati)
 
     def aggiorna(self, numeri_estratti: set) -> None:
-        """Ridipinge le celle secondo i numeri già estratti."""
-        for numero, cell in self._celle.items():
-            if numero in numeri_estratti:
-                cell.SetBackgroundColour(wx.Colour(COLORE_CELLA_ESTRATTO))
-                cell.SetForegroundColour(wx.Colour(COLORE_TESTO_CHIARO))
-            else:
-                cell.SetBackgroundColour(wx.Colour(COLORE_CELLA_VUOTA))
-                cell.SetForegroundColour(wx.Colour(COLORE_CELLA_TESTO_INATTIVO))
-        self.Refresh()
+        """Ridipinge le celle il cui stato è cambiato, in un unico Freeze/Thaw."""
+        modifiche = self.calcola_modifiche(numeri_estratti)
+        if not modifiche[1]:
+            return
+        self.Freeze()
+        try:
+            self.applica_modifiche(modifiche)
+        finally:
+            self.Thaw()
 
 
 class PannelloCartella(wx.Panel):
@@ -158,7 +190,9 @@ class PannelloCartella(wx.Panel):
     Griglia visiva 9 colonne × 3 righe per una cartella (15 numeri).
 
     Puramente visiva e non focalizzabile. Celle vuote e celle con numero
-    usano colori distinti da tema.py. Dati statici placeholder.
+    usano colori distinti da tema.py. Ricorda l'ultimo stato disegnato
+    (StatoGriglia) e ridipinge solo le celle cambiate; l'intera cartella
+    viene ridipinta solo quando cambiano le etichette (cambio di cartella).
     """
 
     def __init__(self, parent: wx.Window, on_click_numero: Optional[callable] = None) -> None:
@@ -173,6 +207,7 @@ class PannelloCartella(wx.Panel):
         self._lampeggio_attivo: bool = False
         self._tick_lampeggio: int = 0
         self._mappa_celle_numero: dict[int, wx.StaticText] = {}
+        self._indice_cella_numero: dict[int, int] = {}
         self._callback_click: Optional[callable] = on_click_numero
 
     def _build_ui(self) -> None:
@@ -199,14 +234,21 @@ class PannelloCartella(wx.Panel):
                 riga.append(cell)
             self._celle.append(riga)
         self.SetSizer(sizer)
+        self._stato = StatoGriglia(CELLE_CARTELLA)
+        self._colori = {
+            STATO_CARTELLA_VUOTA: (wx.Colour(COLORE_CELLA_CARTELLA_VUOTA), wx.Colour(COLORE_TESTO_SCURO)),
+            STATO_CARTELLA_NUMERO: (wx.Colour(COLORE_CELLA_CARTELLA_NUMERO), wx.Colour(COLORE_TESTO_SCURO)),
+            STATO_CARTELLA_ESTRATTO: (wx.Colour(COLORE_CELLA_ESTRATTA_NON_SEGNATA), wx.Colour(COLORE_TESTO_SCURO)),
+            STATO_CARTELLA_SEGNATO: (wx.Colour(COLORE_CELLA_SEGNATA), wx.Colour(COLORE_TESTO_CHIARO)),
+        }
 
-    def aggiorna(
+    def calcola_modifiche(
         self,
         griglia: tuple,
         numeri_segnati: set,
         numeri_estratti: set,
-    ) -> None:
-        """Ridipinge la cartella con i colori semantici correnti.
+    ) -> tuple:
+        """Ritorna (griglia, stati, etichette, indici delle celle cambiate).
 
         griglia: restituita da Cartella.get_griglia_semplice() —
                  "-" per cella vuota, int per numero.
@@ -215,33 +257,52 @@ class PannelloCartella(wx.Panel):
         """
         if self._lampeggio_attivo:
             self.ferma_lampeggio()
-        for row in range(3):
-            for col in range(9):
-                val = griglia[row][col]
-                cell = self._celle[row][col]
-                if isinstance(val, str):            # cella vuota ("-")
-                    cell.SetBackgroundColour(wx.Colour(COLORE_CELLA_CARTELLA_VUOTA))
-                    cell.SetForegroundColour(wx.Colour(COLORE_TESTO_SCURO))
-                    cell.SetLabel("")
-                elif val in numeri_segnati:          # numero segnato
-                    cell.SetBackgroundColour(wx.Colour(COLORE_CELLA_SEGNATA))
-                    cell.SetForegroundColour(wx.Colour(COLORE_TESTO_CHIARO))
-                    cell.SetLabel(str(val))
-                elif val in numeri_estratti:         # estratto non segnato
-                    cell.SetBackgroundColour(wx.Colour(COLORE_CELLA_ESTRATTA_NON_SEGNATA))
-                    cell.SetForegroundColour(wx.Colour(COLORE_TESTO_SCURO))
-                    cell.SetLabel(str(val))
-                else:                               # numero non ancora estratto
-                    cell.SetBackgroundColour(wx.Colour(COLORE_CELLA_CARTELLA_NUMERO))
-                    cell.SetForegroundColour(wx.Colour(COLORE_TESTO_SCURO))
-                    cell.SetLabel(str(val))
-        self.Refresh()
-        self._mappa_celle_numero = {
-            int(griglia[row][col]): self._celle[row][col]
-            for row in range(3)
-            for col in range(9)
-            if isinstance(griglia[row][col], int)
-        }
+        stati, etichette = stati_cartella(griglia, numeri_segnati, numeri_estratti)
+        return griglia, stati, etichette, self._stato.celle_modificate(stati, etichette)
+
+    def applica_modifiche(self, modifiche: tuple) -> None:
+        """Ridipinge solo le celle indicate da calcola_modifiche()."""
+        griglia, stati, etichette, indici = modifiche
+        etichette_cambiate = etichette != self._stato.etichette
+        for indice in indici:
+            cell = self._celle[indice // 9][indice % 9]
+            sfondo, testo = self._colori[stati[indice]]
+            cell.SetBackgroundColour(sfondo)
+            cell.SetForegroundColour(testo)
+            if etichette_cambiate:
+                cell.SetLabel(etichette[indice])
+            cell.Refresh()
+        self._stato.registra(stati, etichette)
+        if etichette_cambiate:
+            self._indice_cella_numero = {
+                int(griglia[row][col]): row * 9 + col
+                for row in range(3)
+                for col in range(9)
+                if isinstance(griglia[row][col], int)
+            }
+            self._mappa_celle_numero = {
+                numero: self._celle[indice // 9][indice % 9]
+                for numero, indice in self._indice_cella_numero.items()
+            }
+
+    def aggiorna(
+        self,
+        griglia: tuple,
+        numeri_segnati: set,
+        numeri_estratti: set,
+    ) -> None:
+        """Ridipinge le celle il cui stato è cambiato, in un unico Freeze/Thaw.
+
+        Stessi parametri di calcola_modifiche().
+        """
+        modifiche = self.calcola_modifiche(griglia, numeri_segnati, numeri_estratti)
+        if not modifiche[3]:
+            return
+        self.Freeze()
+        try:
+            self.applica_modifiche(modifiche)
+        finally:
+            self.Thaw()
 
     def avvia_lampeggio(self, numero: int) -> None:
         """Avvia l'animazione lampeggio sulla cella del numero indicato.
@@ -298,11 +359,18 @@ class PannelloCartella(wx.Panel):
         cella.Refresh()
 
     def ferma_lampeggio(self) -> None:
-        """Ferma il timer lampeggio e azzera lo stato. Non ripristina il colore della cella."""
+        """Ferma il timer lampeggio e azzera lo stato. Non ripristina il colore della cella.
+
+        La cella che lampeggiava viene invalidata: il prossimo aggiorna() la
+        ridipinge anche se il suo stato non è cambiato.
+        """
         if self._timer_lampeggio is not None:
             self._timer_lampeggio.Stop()
             self._timer_lampeggio = None
         self._lampeggio_attivo = False
+        indice = self._indice_cella_numero.get(self._numero_lampeggio)
+        if indice is not None:
+            self._stato.invalida(indice)
 
     def _on_cella_click(self, event: wx.MouseEvent) -> None:
         """Handler click sinistro su una cella della cartella.
@@ -600,6 +668,10 @@ class FinestraGioco(wx.Frame):
 
     Contiene pannello griglia, pulsante principale a due stati e log annunci.
     Coordina il ciclo di gioco tramite ComandiSistema e ComandiGiocatoreUmano.
+
+    Tabellone e cartella usano i pannelli disegnati di griglie_disegnate.py
+    (un solo widget per griglia); con griglie_disegnate=False tornano i
+    pannelli classici con una wx.StaticText per cella.
     """
 
     def __init__(
@@ -610,6 +682,7 @@ class FinestraGioco(wx.Frame):
         durata_finestra_ms: int = 60000,
         durata_pausa_ms: int = 5000,
         finestra_principale: Optional[wx.Frame] = None,
+        griglie_disegnate: bool = True,
     ) -> None:
         super().__init__(
             parent,
@@ -620,6 +693,7 @@ class FinestraGioco(wx.Frame):
         self._partita = partita
         self._renderer = renderer
         self._finestra_principale: Optional[wx.Frame] = finestra_principale
+        self._griglie_disegnate: bool = griglie_disegnate
         self._comandi_sistema = ComandiSistema()
         self._comandi = ComandiGiocatoreUmano(partita)
         self._turno_corrente: int = 0
@@ -718,7 +792,11 @@ class FinestraGioco(wx.Frame):
 
         # Pannelli visivi affiancati: tabellone (sinistra) e cartella con frecce (destra)
         sizer_griglie = wx.BoxSizer(wx.HORIZONTAL)
-        self._pannello_tabellone = PannelloTabellone(panel)
+        if getattr(self, "_griglie_disegnate", True):
+            classe_tabellone, classe_cartella = PannelloTabelloneDisegnato, PannelloCartellaDisegnata
+        else:
+            classe_tabellone, classe_cartella = PannelloTabellone, PannelloCartella
+        self._pannello_tabellone = classe_tabellone(panel)
         sizer_griglie.Add(self._pannello_tabellone, 0, wx.ALL, 5)
 
         # Gruppo 1 — freccia sinistra [◀]
@@ -741,7 +819,7 @@ class FinestraGioco(wx.Frame):
         self._lbl_cartella_titolo.SetForegroundColour(wx.Colour(COLORE_TESTO_SCURO))
         sizer_cartella_con_titolo.Add(self._lbl_cartella_titolo, 0, wx.BOTTOM | wx.ALIGN_CENTER, 2)
 
-        self._pannello_cartella = PannelloCartella(
+        self._pannello_cartella = classe_cartella(
             panel, on_click_numero=self._on_click_numero_cartella
         )
         sizer_cartella_con_titolo.Add(self._pannello_cartella, 1, wx.EXPAND)
@@ -971,10 +1049,12 @@ class FinestraGioco(wx.Frame):
                 return
             self._turno_corrente += 1
             numero = risultato_est.get("numero_estratto", "?")
+            t0 = latenze.inizio()
             self._renderer.annuncia_numero_estratto(numero, self._turno_corrente)
             if isinstance(numero, int) and numero >= 10:
                 self._renderer.mostra_messaggio_sistema(_spelling_numero(numero))
             self._aggiorna_griglie_visive()
+            latenze.fine(latenze.SPAN_RENDER, t0)
             self._fase_turno_ui = "attesa_reclami"
             self._aggiorna_stato_pulsante()
             # Avvia il timer della finestra d'azione e pianifica le risposte dei bot.
@@ -1081,8 +1161,10 @@ class FinestraGioco(wx.Frame):
             self._aggiorna_stato_pulsante()
             return
         premi_nuovi = risultato_ver.get("premi_nuovi", [])
+        t0 = latenze.inizio()
         self._renderer.annuncia_premi_turno(premi_nuovi)
         self._aggiorna_griglie_visive()
+        latenze.fine(latenze.SPAN_RENDER, t0)
 
         if risultato_ver.get("partita_terminata") or risultato_ver.get("tombola_rilevata"):
             storico_premi = list(getattr(self._partita, "storico_premi", []))
@@ -1171,7 +1253,7 @@ class FinestraGioco(wx.Frame):
             return
         bot.dichiara_fine_fase_azione(premi_gia_assegnati, premi_tipo_chiusi)  # type: ignore[union-attr]
         nome_bot: str = getattr(bot, "nome", "Bot")
-        self._renderer.mostra_messaggio_sistema(f"{nome_bot} ha passato il turno.")
+        self._renderer.annuncia_bot_passa_turno(nome_bot)
         self._controlla_tutti_pronti()
 
     def _on_torna_menu(self, event: wx.Event) -> None:
@@ -1468,28 +1550,56 @@ class FinestraGioco(wx.Frame):
     # ------------------------------------------------------------------
 
     def _aggiorna_griglie_visive(self) -> None:
-        """Sincronizza le griglie visive con lo stato corrente della partita."""
+        """Sincronizza le griglie visive con lo stato corrente della partita.
+
+        I pannelli calcolano solo le celle cambiate dall'ultimo disegno; se ce
+        ne sono, tabellone e cartella vengono ridipinti in un unico
+        Freeze/Thaw del pannello principale.
+        """
         if not hasattr(self, "_pannello_tabellone") or not hasattr(self, "_pannello_cartella"):
             return
-        self._pannello_tabellone.aggiorna(self._partita.tabellone.numeri_estratti)
+        numeri_estratti = self._partita.tabellone.numeri_estratti
+        modifiche_tabellone = self._pannello_tabellone.calcola_modifiche(numeri_estratti)
+        modifiche_cartella = None
         giocatore_umano = next(
             (g for g in self._partita.giocatori if not g.is_automatico()), None
         )
-        if giocatore_umano is None or not giocatore_umano.cartelle:
-            return
-        indice = getattr(giocatore_umano, "_indice_cartella_focus", None)
-        if indice is None:
-            indice = 0
-        indice = max(0, min(indice, len(giocatore_umano.cartelle) - 1))
-        cartella = giocatore_umano.cartelle[indice]
-        if hasattr(self._pannello_cartella, "ferma_lampeggio"):
-            self._pannello_cartella.ferma_lampeggio()
-        self._pannello_cartella.aggiorna(
-            griglia=cartella.get_griglia_semplice(),
-            numeri_segnati=cartella.numeri_segnati,
-            numeri_estratti=self._partita.tabellone.numeri_estratti,
+        if giocatore_umano is not None and giocatore_umano.cartelle:
+            indice = getattr(giocatore_umano, "_indice_cartella_focus", None)
+            if indice is None:
+                indice = 0
+            indice = max(0, min(indice, len(giocatore_umano.cartelle) - 1))
+            cartella = giocatore_umano.cartelle[indice]
+            if hasattr(self._pannello_cartella, "ferma_lampeggio"):
+                self._pannello_cartella.ferma_lampeggio()
+            modifiche_cartella = self._pannello_cartella.calcola_modifiche(
+                griglia=self._griglia_semplice(cartella),
+                numeri_segnati=cartella.numeri_segnati,
+                numeri_estratti=numeri_estratti,
+            )
+
+        da_ridipingere = bool(modifiche_tabellone[1]) or (
+            modifiche_cartella is not None and bool(modifiche_cartella[3])
         )
-        self._aggiorna_titolo_cartella()
+        if da_ridipingere:
+            self._panel.Freeze()
+            try:
+                if modifiche_tabellone[1]:
+                    self._pannello_tabellone.applica_modifiche(modifiche_tabellone)
+                if modifiche_cartella is not None and modifiche_cartella[3]:
+                    self._pannello_cartella.applica_modifiche(modifiche_cartella)
+            finally:
+                self._panel.Thaw()
+        if modifiche_cartella is not None:
+            self._aggiorna_titolo_cartella()
+
+    def _griglia_semplice(self, cartella: Any) -> tuple:
+        """Griglia semplice della cartella, ricalcolata solo al cambio di cartella."""
+        cache = getattr(self, "_cache_griglia_semplice", None)
+        if cache is None or cache[0] is not cartella:
+            cache = (cartella, cartella.get_griglia_semplice())
+            self._cache_griglia_semplice = cache
+        return cache[1]
 
     def _aggiorna_titolo_cartella(self) -> None:
         """Aggiorna l'etichetta visiva 'Cartella N di M' sopra il pannello cartella."""
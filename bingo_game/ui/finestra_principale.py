@@ -41,12 +41,15 @@ class FinestraPrincipale(wx.Frame):
     Apre FinestraConfigurazione su "Nuova partita".
     Mostra messaggi placeholder per "Impostazioni" e "Guida".
     Termina il processo su "Esci" via ExitMainLoop.
+    griglie_disegnate viene passato a FinestraConfigurazione e da lì a
+    FinestraGioco.
     """
 
     def __init__(
         self,
         renderer: "WxRenderer",
         parent: Optional[wx.Window] = None,
+        griglie_disegnate: bool = True,
     ) -> None:
         super().__init__(
             parent,
@@ -55,6 +58,7 @@ class FinestraPrincipale(wx.Frame):
             style=wx.DEFAULT_FRAME_STYLE,
         )
         self._renderer = renderer
+        self._griglie_disegnate: bool = griglie_disegnate
         self._build_ui()
         self.Centre()
         renderer.aggiorna_finestra(self)
@@ -205,6 +209,7 @@ class FinestraPrincipale(wx.Frame):
         finestra_conf = FinestraConfigurazione(
             renderer=self._renderer,
             parent_frame=self,
+            griglie_disegnate=self._griglie_disegnate,
         )
         finestra_conf.Show()
         self.Hide()
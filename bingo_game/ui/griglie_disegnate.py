@@ -0,0 +1,410 @@
+"""
+griglie_disegnate.py — Griglie visive di tabellone e cartella disegnate su un unico pannello.
+
+Alternativa a PannelloTabellone / PannelloCartella di finestra_gioco.py: invece
+di una wx.StaticText per cella (90 per il tabellone, 27 per la cartella) ogni
+griglia è un solo wx.Panel che disegna le celle in EVT_PAINT a partire dallo
+stato compatto di stato_griglie.py (un byte per cella), con font, pennelli e
+colori creati una sola volta.
+
+Stessa interfaccia pubblica dei pannelli a StaticText (calcola_modifiche,
+applica_modifiche, aggiorna, lampeggio e click sulla cartella), quindi
+FinestraGioco li usa in modo intercambiabile.
+
+Accessibilità: dove wxPython espone wx.Accessible (Windows), ogni griglia
+pubblica le celle come figli semplici con gli stessi nomi delle StaticText
+(il numero mostrato), ruolo cella, posizione e hit test.
+
+path: bingo_game/ui/griglie_disegnate.py
+"""
+from __future__ import annotations
+
+from typing import Callable, Optional
+
+import wx
+
+from bingo_game.ui.tema import (
+    COLORE_CELLA_VUOTA, COLORE_CELLA_TESTO_INATTIVO,
+    COLORE_CELLA_ESTRATTO, COLORE_TESTO_CHIARO,
+    COLORE_CELLA_CARTELLA_VUOTA, COLORE_CELLA_CARTELLA_NUMERO,
+    COLORE_CELLA_SEGNATA, COLORE_CELLA_ESTRATTA_NON_SEGNATA,
+    COLORE_CELLA_EVIDENZIATA, COLORE_TESTO_SCURO,
+    FONT_CARTELLA_NUMERO_PT,
+    DIMENSIONE_CELLA_TABELLONE, DIMENSIONE_CELLA_CARTELLA,
+)
+from bingo_game.ui.stato_griglie import (
+    CELLE_TABELLONE,
+    STATO_CARTELLA_ESTRATTO, STATO_CARTELLA_NUMERO, STATO_CARTELLA_SEGNATO, STATO_CARTELLA_VUOTA,
+    STATO_TABELLONE_DISPONIBILE, STATO_TABELLONE_ESTRATTO,
+    StatoGriglia, cella_in_punto, nome_cella_cartella, nome_cella_tabellone,
+    rettangolo_cella, stati_cartella, stati_tabellone,
+)
+
+# wx.Accessible esiste solo nelle build con wxUSE_ACCESSIBILITY (Windows).
+_ACCESSIBILITA_DISPONIBILE: bool = hasattr(wx, "Accessible")
+
+_N_TICK_LAMPEGGIO: int = 7  # 7 tick × 300ms ≈ 2.1 secondi totali, come PannelloCartella
+
+
+if _ACCESSIBILITA_DISPONIBILE:
+
+    class _AccessibileGriglia(wx.Accessible):
+        """
+        Espone le celle di una griglia disegnata come figli semplici (id 1..N).
+
+        L'id 0 è il pannello stesso; l'id k corrisponde alla cella di indice k-1.
+        """
+
+        def __init__(self, griglia: "_GrigliaDisegnata") -> None:
+            super().__init__(griglia)
+            self._griglia = griglia
+
+        def GetChildCount(self):
+            return wx.ACC_OK, self._griglia.numero_celle
+
+        def GetChild(self, childId):
+            # None con ACC_OK: il figlio è un elemento semplice, non un oggetto accessibile
+            return wx.ACC_OK, None
+
+        def GetName(self, childId):
+            if childId == 0:
+                return wx.ACC_OK, self._griglia.GetName()
+            return wx.ACC_OK, self._griglia.nome_cella(childId - 1)
+
+        def GetRole(self, childId):
+            if childId == 0:
+                return wx.ACC_OK, wx.ROLE_SYSTEM_TABLE
+            return wx.ACC_OK, wx.ROLE_SYSTEM_CELL
+
+        def GetState(self, childId):
+            return wx.ACC_OK, wx.ACC_STATE_SYSTEM_READONLY
+
+        def GetLocation(self, elementId):
+            if elementId == 0:
+                return wx.ACC_OK, self._griglia.GetScreenRect()
+            rect = self._griglia.rettangolo_cella(elementId - 1)
+            rect.SetPosition(self._griglia.ClientToScreen(rect.GetPosition()))
+            return wx.ACC_OK, rect
+
+        def HitTest(self, pt):
+            x, y = self._griglia.ScreenToClient(pt)
+            indice = self._griglia.cella_in_punto(x, y)
+            if indice is None:
+                return wx.ACC_OK, 0, None
+            return wx.ACC_OK, indice + 1, None
+
+
+class _GrigliaDisegnata(wx.Panel):
+    """
+    Base comune: pannello che disegna una griglia righe × colonne di celle.
+
+    Ogni cella è descritta da uno stato (byte) e da un'etichetta; il disegno
+    usa pennelli e colori precalcolati per stato. Le sottoclassi calcolano
+    gli stati e decidono le etichette.
+    """
+
+    def __init__(
+        self,
+        parent: wx.Window,
+        nome: str,
+        righe: int,
+        colonne: int,
+        dimensione_cella: tuple[int, int],
+        spaziatura: int,
+        colori: dict[int, tuple[str, str]],
+    ) -> None:
+        super().__init__(parent, style=wx.NO_BORDER | wx.FULL_REPAINT_ON_RESIZE)
+        # Rimuove TAB_TRAVERSAL: il pannello non partecipa al ciclo focus
+        self.SetWindowStyleFlag(self.GetWindowStyleFlag() & ~wx.TAB_TRAVERSAL)
+        self.SetName(nome)
+        self.SetBackgroundStyle(wx.BG_STYLE_PAINT)
+        self._righe = righe
+        self._colonne = colonne
+        self._spaziatura = spaziatura
+        self.numero_celle = righe * colonne
+        self.SetMinSize(wx.Size(
+            colonne * dimensione_cella[0] + spaziatura * (colonne - 1),
+            righe * dimensione_cella[1] + spaziatura * (righe - 1),
+        ))
+
+        self._font = wx.Font(
+            FONT_CARTELLA_NUMERO_PT,
+            wx.FONTFAMILY_DEFAULT,
+            wx.FONTSTYLE_NORMAL,
+            wx.FONTWEIGHT_NORMAL,
+        )
+        self._pennelli: dict[int, wx.Brush] = {
+            stato: wx.Brush(wx.Colour(sfondo)) for stato, (sfondo, _testo) in colori.items()
+        }
+        self._colori_testo: dict[int, wx.Colour] = {
+            stato: wx.Colour(testo) for stato, (_sfondo, testo) in colori.items()
+        }
+        # Sfondo forzato per singole celle (lampeggio), valido fino al prossimo ridisegno della cella
+        self._sfondi_forzati: dict[int, wx.Brush] = {}
+
+        self._stato = StatoGriglia(self.numero_celle)
+        self._stati: bytearray = bytearray(self.numero_celle)
+        self._etichette: tuple[str, ...] = ("",) * self.numero_celle
+
+        self.Bind(wx.EVT_PAINT, self._on_paint)
+        if _ACCESSIBILITA_DISPONIBILE:
+            self.SetAccessible(_AccessibileGriglia(self))
+
+    # ------------------------------------------------------------------
+    # Geometria e nomi
+    # ------------------------------------------------------------------
+
+    def rettangolo_cella(self, indice: int) -> wx.Rect:
+        """Rettangolo della cella in coordinate client."""
+        larghezza, altezza = self.GetClientSize()
+        return wx.Rect(*rettangolo_cella(
+            indice, self._colonne, self._righe, larghezza, altezza, self._spaziatura
+        ))
+
+    def cella_in_punto(self, x: int, y: int) -> Optional[int]:
+        """Indice della cella nel punto client (x, y), None se fuori dalle celle."""
+        larghezza, altezza = self.GetClientSize()
+        return cella_in_punto(
+            x, y, self._colonne, self._righe, larghezza, altezza, self._spaziatura
+        )
+
+    def nome_cella(self, indice: int) -> str:
+        """Nome accessibile della cella (ridefinito dalle sottoclassi)."""
+        return self._etichette[indice]
+
+    # ------------------------------------------------------------------
+    # Disegno
+    # ------------------------------------------------------------------
+
+    def _ridisegna_celle(self, indici: list[int]) -> None:
+        """Invalida solo i rettangoli delle celle indicate."""
+        for indice in indici:
+            self.RefreshRect(self.rettangolo_cella(indice), eraseBackground=False)
+
+    def _on_paint(self, event: wx.PaintEvent) -> None:
+        dc = wx.AutoBufferedPaintDC(self)
+        dc.SetBackground(wx.Brush(self.GetParent().GetBackgroundColour()))
+        dc.Clear()
+        dc.SetPen(wx.TRANSPARENT_PEN)
+        dc.SetFont(self._font)
+        area = self.GetUpdateRegion().GetBox()
+        for indice in range(self.numero_celle):
+            rect = self.rettangolo_cella(indice)
+            if not area.Intersects(rect):
+                continue
+            stato = self._stati[indice]
+            dc.SetBrush(self._sfondi_forzati.get(indice, self._pennelli[stato]))
+            dc.DrawRectangle(rect)
+            etichetta = self._etichette[indice]
+            if etichetta:
+                dc.SetTextForeground(self._colori_testo[stato])
+                dc.DrawLabel(etichetta, rect, wx.ALIGN_CENTER)
+
+    def _registra(self, stati: bytearray, etichette: Optional[tuple[str, ...]], indici: list[int]) -> None:
+        """Memorizza il nuovo stato e invalida le celle cambiate."""
+        self._stati = bytearray(stati)
+        if etichette is not None:
+            self._etichette = etichette
+        for indice in indici:
+            self._sfondi_forzati.pop(indice, None)
+        self._stato.registra(stati, etichette)
+        self._ridisegna_celle(indici)
+
+
+class PannelloTabelloneDisegnato(_GrigliaDisegnata):
+    """
+    Griglia visiva 9 colonne × 10 righe del tabellone disegnata su un solo pannello.
+
+    Puramente visiva e non focalizzabile; stessa interfaccia di PannelloTabellone.
+    """
+
+    def __init__(self, parent: wx.Window) -> None:
+        super().__init__(
+            parent,
+            nome="Tabellone estrazioni",
+            righe=10,
+            colonne=9,
+            dimensione_cella=DIMENSIONE_CELLA_TABELLONE,
+            spaziatura=1,
+            colori={
+                STATO_TABELLONE_DISPONIBILE: (COLORE_CELLA_VUOTA, COLORE_CELLA_TESTO_INATTIVO),
+                STATO_TABELLONE_ESTRATTO: (COLORE_CELLA_ESTRATTO, COLORE_TESTO_CHIARO),
+            },
+        )
+        self._etichette = tuple(nome_cella_tabellone(indice) for indice in range(CELLE_TABELLONE))
+        self._stato.registra(self._stati)
+
+    def nome_cella(self, indice: int) -> str:
+        return nome_cella_tabellone(indice)
+
+    def calcola_modifiche(self, numeri_estratti: set) -> tuple:
+        """Ritorna (stati, indici delle celle cambiate) rispetto all'ultimo disegno."""
+        stati = stati_tabellone(numeri_estratti)
+        return stati, self._stato.celle_modificate(stati)
+
+    def applica_modifiche(self, modifiche: tuple) -> None:
+        """Invalida solo le celle indicate da calcola_modifiche()."""
+        stati, indici = modifiche
+        self._registra(stati, None, indici)
+
+    def aggiorna(self, numeri_estratti: set) -> None:
+        """Ridisegna le celle il cui stato è cambiato."""
+        modifiche = self.calcola_modifiche(numeri_estratti)
+        if modifiche[1]:
+            self.applica_modifiche(modifiche)
+
+
+class PannelloCartellaDisegnata(_GrigliaDisegnata):
+    """
+    Griglia visiva 9 colonne × 3 righe di una cartella disegnata su un solo pannello.
+
+    Puramente visiva e non focalizzabile; stessa interfaccia di PannelloCartella
+    (aggiornamento incrementale, lampeggio del numero estratto, click su un numero).
+    """
+
+    def __init__(self, parent: wx.Window, on_click_numero: Optional[Callable[[int], None]] = None) -> None:
+        super().__init__(
+            parent,
+            nome="Cartella giocatore",
+            righe=3,
+            colonne=9,
+            dimensione_cella=DIMENSIONE_CELLA_CARTELLA,
+            spaziatura=2,
+            colori={
+                STATO_CARTELLA_VUOTA: (COLORE_CELLA_CARTELLA_VUOTA, COLORE_TESTO_SCURO),
+                STATO_CARTELLA_NUMERO: (COLORE_CELLA_CARTELLA_NUMERO, COLORE_TESTO_SCURO),
+                STATO_CARTELLA_ESTRATTO: (COLORE_CELLA_ESTRATTA_NON_SEGNATA, COLORE_TESTO_SCURO),
+                STATO_CARTELLA_SEGNATO: (COLORE_CELLA_SEGNATA, COLORE_TESTO_CHIARO),
+            },
+        )
+        self._pennello_evidenziato = wx.Brush(wx.Colour(COLORE_CELLA_EVIDENZIATA))
+        # Stato animazione lampeggio
+        self._timer_lampeggio: Optional[wx.Timer] = None
+        self._numero_lampeggio: Optional[int] = None
+        self._lampeggio_attivo: bool = False
+        self._tick_lampeggio: int = 0
+        self._indice_cella_numero: dict[int, int] = {}
+        self._callback_click: Optional[Callable[[int], None]] = on_click_numero
+        self.Bind(wx.EVT_LEFT_DOWN, self._on_click)
+
+    def nome_cella(self, indice: int) -> str:
+        return nome_cella_cartella(indice, self._stato.etichette)
+
+    def calcola_modifiche(
+        self,
+        griglia: tuple,
+        numeri_segnati: set,
+        numeri_estratti: set,
+    ) -> tuple:
+        """Ritorna (griglia, stati, etichette, indici delle celle cambiate).
+
+        Stessi parametri di PannelloCartella.calcola_modifiche().
+        """
+        if self._lampeggio_attivo:
+            self.ferma_lampeggio()
+        stati, etichette = stati_cartella(griglia, numeri_segnati, numeri_estratti)
+        return griglia, stati, etichette, self._stato.celle_modificate(stati, etichette)
+
+    def applica_modifiche(self, modifiche: tuple) -> None:
+        """Invalida solo le celle indicate da calcola_modifiche()."""
+        griglia, stati, etichette, indici = modifiche
+        if etichette != self._stato.etichette:
+            self._indice_cella_numero = {
+                int(griglia[row][col]): row * 9 + col
+                for row in range(3)
+                for col in range(9)
+                if isinstance(griglia[row][col], int)
+            }
+        self._registra(stati, etichette, indici)
+
+    def aggiorna(
+        self,
+        griglia: tuple,
+        numeri_segnati: set,
+        numeri_estratti: set,
+    ) -> None:
+        """Ridisegna le celle il cui stato è cambiato."""
+        modifiche = self.calcola_modifiche(griglia, numeri_segnati, numeri_estratti)
+        if modifiche[3]:
+            self.applica_modifiche(modifiche)
+
+    # ------------------------------------------------------------------
+    # Lampeggio
+    # ------------------------------------------------------------------
+
+    def _imposta_sfondo_lampeggio(self, indice: int, evidenziato: bool) -> None:
+        pennello = (
+            self._pennello_evidenziato if evidenziato
+            else self._pennelli[STATO_CARTELLA_ESTRATTO]
+        )
+        self._sfondi_forzati[indice] = pennello
+        self._ridisegna_celle([indice])
+
+    def avvia_lampeggio(self, numero: int) -> None:
+        """Avvia l'animazione lampeggio sulla cella del numero indicato.
+
+        Stesso comportamento di PannelloCartella.avvia_lampeggio(): ignorato se
+        il numero non è nella cartella visualizzata.
+        """
+        if numero not in self._indice_cella_numero:
+            return
+
+        if self._timer_lampeggio is not None:
+            self._timer_lampeggio.Stop()
+            self._timer_lampeggio = None
+        indice_prec = self._indice_cella_numero.get(self._numero_lampeggio)
+        if indice_prec is not None:
+            self._imposta_sfondo_lampeggio(indice_prec, evidenziato=False)
+
+        self._numero_lampeggio = numero
+        self._lampeggio_attivo = True
+        self._tick_lampeggio = 0
+        self._timer_lampeggio = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self._on_tick_lampeggio, self._timer_lampeggio)
+        self._timer_lampeggio.Start(300)
+
+    def _on_tick_lampeggio(self, event: wx.TimerEvent) -> None:
+        """Tick del timer lampeggio: alterna i colori per N cicli, poi stabilizza."""
+        if not self._lampeggio_attivo or self._numero_lampeggio is None:
+            return
+        indice = self._indice_cella_numero.get(self._numero_lampeggio)
+        if indice is None:
+            self.ferma_lampeggio()
+            return
+
+        self._tick_lampeggio += 1
+
+        if self._tick_lampeggio >= _N_TICK_LAMPEGGIO:
+            self.ferma_lampeggio()
+            self._imposta_sfondo_lampeggio(indice, evidenziato=False)
+            return
+
+        self._imposta_sfondo_lampeggio(indice, evidenziato=self._tick_lampeggio % 2 == 1)
+
+    def ferma_lampeggio(self) -> None:
+        """Ferma il timer lampeggio e azzera lo stato. Non ripristina il colore della cella.
+
+        La cella che lampeggiava viene invalidata: il prossimo aggiorna() la
+        ridisegna con il colore del suo stato.
+        """
+        if self._timer_lampeggio is not None:
+            self._timer_lampeggio.Stop()
+            self._timer_lampeggio = None
+        self._lampeggio_attivo = False
+        indice = self._indice_cella_numero.get(self._numero_lampeggio)
+        if indice is not None:
+            self._stato.invalida(indice)
+
+    # ------------------------------------------------------------------
+    # Click
+    # ------------------------------------------------------------------
+
+    def _on_click(self, event: wx.MouseEvent) -> None:
+        """Click sinistro: individua la cella con un hit test e notifica il numero."""
+        x, y = event.GetPosition()
+        indice = self.cella_in_punto(x, y)
+        if indice is not None and self._callback_click is not None:
+            etichetta = self._etichette[indice]
+            if etichetta:
+                self._callback_click(int(etichetta))
+        event.Skip()
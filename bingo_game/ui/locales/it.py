@@ -184,6 +184,18 @@ MESSAGGI_EVENTI: Mapping[Codici_Eventi, tuple[str, ...]] = MappingProxyType({
         "{s} secondi al prossimo turno.",
     ),
 
+    # TURNO_BOT_PASSA: un bot ha dichiarato fine turno.
+    # Placeholder: {nome} nome del bot.
+    "TURNO_BOT_PASSA": (
+        "{nome} ha passato il turno.",
+    ),
+
+    # TURNO_BOT_PASSANO: più bot in coda uniti in un solo annuncio.
+    # Placeholder: {nomi} nomi separati da virgola, {ultimo} nome dell'ultimo bot.
+    "TURNO_BOT_PASSANO": (
+        "{nomi} e {ultimo} hanno passato il turno.",
+    ),
+
     # --- Pausa gioco (layer UI) ---
 
     # PAUSA_ATTIVATA: gioco messo in pausa dal giocatore.
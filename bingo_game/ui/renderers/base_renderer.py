@@ -179,6 +179,18 @@ class BaseRenderer(ABC):
         """
         ...
 
+    def annuncia_bot_passa_turno(self, nome: str) -> None:
+        """
+        Annuncia che un bot ha dichiarato fine turno (chiave TURNO_BOT_PASSA).
+
+        Implementazione di default: messaggio di sistema. I renderer con una
+        coda vocale possono unire più passaggi consecutivi in un solo annuncio.
+
+        Parametri:
+        - nome: nome del bot.
+        """
+        self.mostra_messaggio_sistema(self._formatta_testo_da_catalogo("TURNO_BOT_PASSA", nome=nome))
+
     @abstractmethod
     def annuncia_pausa(self, testo: str) -> None:
         """Vocalizza lo stato di pausa o ripresa del gioco."""
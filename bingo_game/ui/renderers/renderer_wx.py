@@ -21,7 +21,7 @@ import wx
 if TYPE_CHECKING:
     pass
 
-from my_lib.vocalizzatore import IVocalizzatore
+from my_lib.vocalizzatore import PRIORITA_ALTA, IVocalizzatore
 from bingo_game.events.codici_messaggi_sistema import SISTEMA_ERRORE_CODICE_MANCANTE
 from bingo_game.events.eventi import EsitoAzione
 from bingo_game.events.eventi_output_ui_umani import (
@@ -60,6 +60,12 @@ from bingo_game.ui.renderers.base_renderer import BaseRenderer, StatoConfigurazi
 _ui_logger = logging.getLogger("ui")
 _error_logger = logging.getLogger("error")
 
+# Chiavi di coalescenza per i vocalizzatori con coda (VocalizzatoreAsincrono).
+_CHIAVE_AVVISO_TIMEOUT = "avviso_timeout"
+_CHIAVE_BOT_PASSA_TURNO = "bot_passa_turno"
+# Un avviso di timeout non pronunciato entro questo tempo riporta secondi ormai errati.
+_VALIDITA_AVVISO_TIMEOUT_S = 2.0
+
 
 class WxRenderer(BaseRenderer):
     """
@@ -200,7 +206,12 @@ class WxRenderer(BaseRenderer):
         self._wx_aggiorna_output(testo)
         self._wx_avvia_lampeggio(numero)
         self._wx_aggiorna_header(turno=numero_turno, ultimo_numero=numero)
-        self._ao2_vocalizza(testo)
+        # Il nuovo numero supera avvisi e passaggi dei bot del turno precedente.
+        self._ao2_vocalizza(
+            testo,
+            priorita=PRIORITA_ALTA,
+            annulla=(_CHIAVE_AVVISO_TIMEOUT, _CHIAVE_BOT_PASSA_TURNO),
+        )
         wx.CallLater(350, self._wx_mostra_overlay_numero, numero)
 
     def annuncia_premi_turno(self, premi: list) -> None:
@@ -234,7 +245,11 @@ class WxRenderer(BaseRenderer):
         chiave = _chiavi.get(livello, "TURNO_AVVISO_80")
         testo = self._formatta_testo_da_catalogo(chiave, s=secondi_rimanenti)
         self._wx_aggiorna_output(testo)
-        self._ao2_vocalizza(testo)
+        self._ao2_vocalizza(
+            testo,
+            chiave=_CHIAVE_AVVISO_TIMEOUT,
+            validita_s=_VALIDITA_AVVISO_TIMEOUT_S,
+        )
 
     def annuncia_avvio_pausa_turno(self, secondi: int) -> None:
         """Vocalizza l'annuncio di avvio della pausa tra turni (V2)."""
@@ -248,6 +263,17 @@ class WxRenderer(BaseRenderer):
         self._wx_aggiorna_output(testo)
         self._ao2_vocalizza(testo)
 
+    def annuncia_bot_passa_turno(self, nome: str) -> None:
+        """Vocalizza il passaggio di turno di un bot; in coda più bot diventano un solo annuncio."""
+        testo = self._formatta_testo_da_catalogo("TURNO_BOT_PASSA", nome=nome)
+        self._wx_aggiorna_output(testo)
+        self._ao2_vocalizza(
+            testo,
+            testo_parte=nome,
+            chiave=_CHIAVE_BOT_PASSA_TURNO,
+            unisci=self._unisci_bot_passano,
+        )
+
     def annuncia_pausa(self, testo: str) -> None:
         """Vocalizza lo stato di pausa o ripresa del gioco."""
         self._wx_aggiorna_output(testo)
@@ -861,9 +887,23 @@ class WxRenderer(BaseRenderer):
     # Layer voce (_ao2_*)
     # ---------------------------------------------------------------
 
-    def _ao2_vocalizza(self, testo: str) -> None:
+    def _ao2_vocalizza(self, testo: str, testo_parte: Optional[str] = None, **opzioni_coda: Any) -> None:
+        """Vocalizza il testo.
+
+        Se il vocalizzatore ha una coda (accoda(), es. VocalizzatoreAsincrono)
+        le opzioni di coda (priorita, chiave, unisci, validita_s, annulla)
+        vengono inoltrate; con unisci viene accodata solo testo_parte.
+        Altrimenti le opzioni sono ignorate e il testo va a vocalizza_testo().
+        """
         self._ultimo_annuncio = testo
-        self._vocalizzatore.vocalizza_testo(testo)
+        accoda = getattr(self._vocalizzatore, "accoda", None) if opzioni_coda else None
+        if accoda is None:
+            self._vocalizzatore.vocalizza_testo(testo)
+            return
+        if opzioni_coda.get("unisci") is not None and testo_parte is not None:
+            accoda(testo_parte, **opzioni_coda)
+        else:
+            accoda(testo, **opzioni_coda)
 
     # ---------------------------------------------------------------
     # Helper puri
@@ -877,6 +917,14 @@ class WxRenderer(BaseRenderer):
             return f"{testo} segnato"
         return testo
 
+    def _unisci_bot_passano(self, nomi: list[str]) -> str:
+        """Compone un solo annuncio per più bot che passano il turno."""
+        if len(nomi) == 1:
+            return self._formatta_testo_da_catalogo("TURNO_BOT_PASSA", nome=nomi[0])
+        return self._formatta_testo_da_catalogo(
+            "TURNO_BOT_PASSANO", nomi=", ".join(nomi[:-1]), ultimo=nomi[-1]
+        )
+
     @staticmethod
     def _indice_umano(indice_zero_based: int) -> int:
         """Converte indice interno 0-based in numero 1-based per la UI."""
@@ -0,0 +1,215 @@
+"""
+stato_griglie.py — Stato compatto delle griglie visive (tabellone e cartella).
+
+Questo modulo non importa wx: descrive lo stato di ogni cella delle griglie
+visive come un byte e confronta lo stato appena calcolato con l'ultimo
+disegnato, così i pannelli di finestra_gioco.py ridipingono solo le celle
+cambiate (il numero appena estratto, le caselle appena segnate).
+
+Contenuto:
+- costanti STATO_*: stato visivo di una cella;
+- stati_tabellone(): stati delle 90 celle del tabellone;
+- stati_cartella(): stati ed etichette delle 27 celle di una cartella;
+- StatoGriglia: ultimo stato disegnato e calcolo delle celle da ridipingere;
+- rettangolo_cella() / cella_in_punto(): geometria delle griglie disegnate
+  (griglie_disegnate.py) e hit test per mouse e screen reader;
+- nome_cella_tabellone() / nome_cella_cartella(): nomi accessibili delle celle.
+
+path: bingo_game/ui/stato_griglie.py
+"""
+from __future__ import annotations
+
+from typing import Iterable, Optional, Sequence
+
+# ---------------------------------------------------------------------------
+# Stati visivi delle celle
+# ---------------------------------------------------------------------------
+
+# Tabellone
+STATO_TABELLONE_DISPONIBILE = 0   # numero non ancora estratto
+STATO_TABELLONE_ESTRATTO = 1      # numero estratto
+
+# Cartella
+STATO_CARTELLA_VUOTA = 0          # casella senza numero ("-")
+STATO_CARTELLA_NUMERO = 1         # numero non ancora estratto
+STATO_CARTELLA_ESTRATTO = 2       # numero estratto ma non segnato
+STATO_CARTELLA_SEGNATO = 3        # numero segnato
+
+# Stato "sconosciuto": forza il ridisegno della cella al prossimo confronto.
+STATO_INVALIDO = 255
+
+# Dimensioni delle griglie (celle in ordine riga per riga)
+CELLE_TABELLONE = 90
+CELLE_CARTELLA = 27
+
+
+def indice_cella_tabellone(numero: int) -> int:
+    """Indice della cella del numero (1-90) nella griglia 10 righe × 9 colonne.
+
+    Ogni colonna raggruppa una decina: il numero n sta in riga (n-1) % 10,
+    colonna (n-1) // 10.
+    """
+    riga, colonna = (numero - 1) % 10, (numero - 1) // 10
+    return riga * 9 + colonna
+
+
+def numero_cella_tabellone(indice: int) -> int:
+    """Numero (1-90) mostrato nella cella di indice dato (inversa di indice_cella_tabellone)."""
+    riga, colonna = divmod(indice, 9)
+    return colonna * 10 + riga + 1
+
+
+def stati_tabellone(numeri_estratti: Iterable[int]) -> bytearray:
+    """Ritorna gli stati delle 90 celle del tabellone, in ordine riga per riga."""
+    stati = bytearray(CELLE_TABELLONE)
+    for numero in numeri_estratti:
+        stati[indice_cella_tabellone(numero)] = STATO_TABELLONE_ESTRATTO
+    return stati
+
+
+def stati_cartella(
+    griglia: Sequence[Sequence[object]],
+    numeri_segnati: Iterable[int],
+    numeri_estratti: Iterable[int],
+) -> tuple[bytearray, tuple[str, ...]]:
+    """Ritorna stati ed etichette delle 27 celle di una cartella.
+
+    griglia: come restituita da Cartella.get_griglia_semplice() —
+             "-" (o altra stringa) per cella vuota, int per numero.
+    """
+    stati = bytearray(CELLE_CARTELLA)
+    etichette: list[str] = []
+    for riga in range(3):
+        for colonna in range(9):
+            valore = griglia[riga][colonna]
+            indice = riga * 9 + colonna
+            if isinstance(valore, str):
+                stati[indice] = STATO_CARTELLA_VUOTA
+                etichette.append("")
+                continue
+            if valore in numeri_segnati:
+                stati[indice] = STATO_CARTELLA_SEGNATO
+            elif valore in numeri_estratti:
+                stati[indice] = STATO_CARTELLA_ESTRATTO
+            else:
+                stati[indice] = STATO_CARTELLA_NUMERO
+            etichette.append(str(valore))
+    return stati, tuple(etichette)
+
+
+class StatoGriglia:
+    """
+    Ultimo stato disegnato di una griglia di celle.
+
+    Mantiene stati (un byte per cella) ed etichette dell'ultimo disegno e
+    ritorna, per un nuovo stato, gli indici delle celle da ridipingere.
+    All'inizio tutte le celle sono STATO_INVALIDO: il primo confronto le
+    ritorna tutte.
+    """
+
+    def __init__(self, numero_celle: int) -> None:
+        self.numero_celle = numero_celle
+        self.stati = bytearray([STATO_INVALIDO]) * numero_celle
+        self.etichette: Optional[tuple[str, ...]] = None
+
+    def celle_modificate(
+        self,
+        stati: bytearray,
+        etichette: Optional[tuple[str, ...]] = None,
+    ) -> list[int]:
+        """Indici delle celle il cui stato (o etichetta) differisce dall'ultimo disegno.
+
+        Non modifica lo stato memorizzato: chiamare registra() dopo aver
+        ridipinto le celle.
+        """
+        if stati == self.stati and (etichette is None or etichette == self.etichette):
+            return []
+        if etichette is not None and etichette != self.etichette:
+            precedenti = self.etichette
+            if precedenti is None:
+                return list(range(self.numero_celle))
+            return [
+                indice for indice in range(self.numero_celle)
+                if stati[indice] != self.stati[indice] or etichette[indice] != precedenti[indice]
+            ]
+        vecchi = self.stati
+        return [indice for indice in range(self.numero_celle) if stati[indice] != vecchi[indice]]
+
+    def registra(self, stati: bytearray, etichette: Optional[tuple[str, ...]] = None) -> None:
+        """Memorizza lo stato appena disegnato."""
+        self.stati = bytearray(stati)
+        if etichette is not None:
+            self.etichette = etichette
+
+    def invalida(self, indice: Optional[int] = None) -> None:
+        """Forza il ridisegno di una cella (o di tutte se indice è None) al prossimo confronto."""
+        if indice is None:
+            self.stati = bytearray([STATO_INVALIDO]) * self.numero_celle
+            self.etichette = None
+        else:
+            self.stati[indice] = STATO_INVALIDO
+
+
+# ---------------------------------------------------------------------------
+# Geometria delle griglie disegnate
+# ---------------------------------------------------------------------------
+
+def rettangolo_cella(
+    indice: int,
+    colonne: int,
+    righe: int,
+    larghezza: int,
+    altezza: int,
+    spaziatura: int,
+) -> tuple[int, int, int, int]:
+    """Rettangolo (x, y, w, h) della cella in un'area larghezza × altezza.
+
+    Le celle dividono l'area in parti uguali, separate da `spaziatura` pixel,
+    come un wx.GridSizer con vgap = hgap = spaziatura.
+    """
+    riga, colonna = divmod(indice, colonne)
+    w = max(0, (larghezza - spaziatura * (colonne - 1)) // colonne)
+    h = max(0, (altezza - spaziatura * (righe - 1)) // righe)
+    return colonna * (w + spaziatura), riga * (h + spaziatura), w, h
+
+
+def cella_in_punto(
+    x: int,
+    y: int,
+    colonne: int,
+    righe: int,
+    larghezza: int,
+    altezza: int,
+    spaziatura: int,
+) -> Optional[int]:
+    """Indice della cella che contiene il punto (x, y), None se il punto cade
+    fuori dalla griglia o nella spaziatura tra due celle."""
+    w = max(0, (larghezza - spaziatura * (colonne - 1)) // colonne)
+    h = max(0, (altezza - spaziatura * (righe - 1)) // righe)
+    if w == 0 or h == 0 or x < 0 or y < 0:
+        return None
+    colonna, dx = divmod(x, w + spaziatura)
+    riga, dy = divmod(y, h + spaziatura)
+    if colonna >= colonne or riga >= righe or dx >= w or dy >= h:
+        return None
+    return riga * colonne + colonna
+
+
+# ---------------------------------------------------------------------------
+# Nomi accessibili
+# ---------------------------------------------------------------------------
+
+def nome_cella_tabellone(indice: int) -> str:
+    """Nome accessibile di una cella del tabellone: il numero mostrato.
+
+    Coincide con l'etichetta della wx.StaticText usata da PannelloTabellone.
+    """
+    return str(numero_cella_tabellone(indice))
+
+
+def nome_cella_cartella(indice: int, etichette: Optional[Sequence[str]]) -> str:
+    """Nome accessibile di una cella della cartella: l'etichetta mostrata
+    ("" per cella vuota o cartella non ancora disegnata), come in PannelloCartella."""
+    if etichette is None:
+        return ""
+    return etichette[indice]
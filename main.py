@@ -4,10 +4,11 @@ import argparse
 
 import wx
 
+from bingo_game import latenze
 from bingo_game.logging import GameLogger
 from bingo_game.ui.finestra_principale import FinestraPrincipale
 from bingo_game.ui.renderers.renderer_wx import WxRenderer
-from my_lib.vocalizzatore import Vocalizzatore
+from my_lib.vocalizzatore import VocalizzatoreAsincrono
 
 
 def _parse_args() -> argparse.Namespace:
@@ -20,17 +21,55 @@ def _parse_args() -> argparse.Namespace:
         default=False,
         help="Attiva modalità DEBUG per tracciatura dettagliata (livello logging DEBUG)",
     )
+    parser.add_argument(
+        "--log-bufferizzato",
+        action="store_true",
+        default=False,
+        help="Scrive il log da un thread dedicato con flush a blocchi (flush immediato solo su ERROR)",
+    )
+    parser.add_argument(
+        "--log-rotazione-ore",
+        type=float,
+        default=0,
+        help="Ruota il file di log quando è più vecchio di questo numero di ore (0 = solo per dimensione)",
+    )
+    parser.add_argument(
+        "--log-comprimi",
+        action="store_true",
+        default=False,
+        help="Comprime con gzip i segmenti di log ruotati",
+    )
+    parser.add_argument(
+        "--latenze",
+        action="store_true",
+        default=False,
+        help="Misura le latenze del ciclo di turno e scrive p50/p95/p99 nel log alla chiusura",
+    )
+    parser.add_argument(
+        "--griglie-classiche",
+        action="store_true",
+        default=False,
+        help="Usa tabellone e cartella con un controllo per cella invece delle griglie disegnate",
+    )
     return parser.parse_args()
 
 
 def main() -> None:
     """Avvia l'applicazione wxPython aprendo la finestra di configurazione."""
     args = _parse_args()
-    GameLogger.initialize(debug_mode=args.debug)
+    GameLogger.initialize(
+        debug_mode=args.debug,
+        bufferizzato=args.log_bufferizzato,
+        intervallo_rotazione_s=args.log_rotazione_ore * 3600,
+        comprimi=args.log_comprimi,
+    )
+    latenze.attiva(args.latenze)
+    vocalizzatore = None
 
     try:
         app = wx.App(redirect=False)
-        vocalizzatore = Vocalizzatore()
+        # Vocalizzazione in background: un backend TTS lento non blocca il thread UI.
+        vocalizzatore = VocalizzatoreAsincrono()
 
         # Il renderer viene creato con un frame temporaneo nullo;
         # FinestraConfigurazione chiama aggiorna_finestra nel proprio __init__.
@@ -41,7 +80,10 @@ def main() -> None:
         renderer._log_text_ctrl = None
         renderer.numero_in_focus = None
 
-        finestra = FinestraPrincipale(renderer=renderer)
+        finestra = FinestraPrincipale(
+            renderer=renderer,
+            griglie_disegnate=not args.griglie_classiche,
+        )
         finestra.Show()
         app.MainLoop()
     except Exception:
@@ -52,6 +94,8 @@ def main() -> None:
             f.write(traceback.format_exc())
         raise
     finally:
+        if vocalizzatore is not None:
+            vocalizzatore.chiudi()
         GameLogger.shutdown()
 
 
@@ -5,13 +5,22 @@ Espone:
 - IVocalizzatore: contratto Protocol minimale per la vocalizzazione.
 - NullVocalizzatore: implementazione muta headless-safe.
 - Vocalizzatore: adattatore AO2 con backend iniettabile e best-effort.
+- VocalizzatoreAsincrono: adattatore AO2 con worker in background e coda
+  limitata a priorità; unisce o sostituisce gli annunci superati e scarta
+  quelli scaduti, senza mai bloccare il thread chiamante (thread UI wx).
+- BackendFittizio: backend TTS headless che registra i testi, per i test.
 
 path: my_lib/vocalizzatore.py
 """
 from __future__ import annotations
 
+import heapq
+import itertools
 import logging
-from typing import Protocol, runtime_checkable
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Optional, Protocol, runtime_checkable
 
 try:
     from accessible_output2.outputs.auto import Auto as _Auto
@@ -20,6 +29,13 @@ except Exception:
     _Auto = None  # type: ignore[assignment]
     _AO2_DISPONIBILE = False
 
+# Su Windows i backend AO2 (SAPI, screen reader) sono oggetti COM: ogni thread
+# che li crea e li usa deve inizializzare COM (pywin32).
+try:
+    import pythoncom as _pythoncom
+except Exception:
+    _pythoncom = None  # type: ignore[assignment]
+
 _error_logger = logging.getLogger("error")
 
 
@@ -89,3 +105,307 @@ class Vocalizzatore:
         except Exception:
             _error_logger.exception("Errore backend TTS in vocalizza_testo")
 
+
+
+# ---------------------------------------------------------------------------
+# Vocalizzazione asincrona
+# ---------------------------------------------------------------------------
+
+PRIORITA_ALTA = 0      # annunci che non devono attendere (es. numero estratto)
+PRIORITA_NORMALE = 1   # default
+PRIORITA_BASSA = 2     # annunci di contorno, scartati per primi a coda piena
+
+
+@dataclass
+class _Annuncio:
+    """Annuncio in attesa nella coda di VocalizzatoreAsincrono."""
+
+    priorita: int
+    sequenza: int
+    testo: str
+    interrompi: bool = False
+    chiave: Optional[str] = None
+    parti: list[str] = field(default_factory=list)
+    unisci: Optional[Callable[[list[str]], str]] = None
+    scadenza: Optional[float] = None
+    annullato: bool = False
+
+
+class VocalizzatoreAsincrono:
+    """
+    Adattatore AO2 con vocalizzazione in un thread di background.
+
+    vocalizza_testo() e accoda() inseriscono l'annuncio in una coda limitata a
+    priorità e ritornano subito: il backend TTS (anche se lento, es. SAPI) non
+    blocca mai il thread chiamante. Il worker pronuncia gli annunci in ordine
+    di priorità e, a parità, di arrivo.
+
+    Regole della coda:
+    - interrompi=True scarta tutti gli annunci in attesa e passa il nuovo con
+      interrupt=True al backend;
+    - annunci con la stessa chiave non si accumulano: se è indicata una
+      funzione unisci, le parti vengono unite in un solo annuncio
+      (es. più bot che passano il turno), altrimenti l'ultimo sostituisce
+      il precedente (es. avvisi di timeout);
+    - un annuncio con validita_s non ancora pronunciato entro quel tempo viene
+      scartato;
+    - a coda piena viene scartato l'annuncio meno prioritario e più vecchio.
+
+    Il worker inizializza COM (pythoncom.CoInitialize) prima di creare Auto()
+    e lo rilascia all'uscita, quando pywin32 è disponibile.
+    Come Vocalizzatore, gli errori del backend non si propagano.
+    """
+
+    def __init__(
+        self,
+        backend: _SpeakBackend | None = None,
+        capacita: int = 16,
+        orologio: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Inizializza la coda e avvia il worker.
+
+        Args:
+            backend: backend TTS iniettabile. Se None, Auto() di AO2 viene
+                creato nel thread del worker (che lo usa in esclusiva).
+            capacita: numero massimo di annunci in attesa.
+            orologio: sorgente del tempo per le scadenze (iniettabile nei test).
+
+        Raises:
+            ImportError: se backend è None e accessible_output2 non è installato.
+            ValueError: se capacita < 1.
+        """
+        if backend is None and not (_AO2_DISPONIBILE and _Auto is not None):
+            raise ImportError(
+                "accessible_output2 non è disponibile."
+            )
+        if capacita < 1:
+            raise ValueError("La capacità della coda deve essere almeno 1.")
+        self._backend: _SpeakBackend | None = backend
+        self._capacita = capacita
+        self._orologio = orologio
+        self._coda: list[tuple[int, int, _Annuncio]] = []
+        self._per_chiave: dict[str, _Annuncio] = {}
+        self._in_attesa: int = 0
+        self._sequenza = itertools.count()
+        self._condizione = threading.Condition()
+        self._in_corso: bool = False
+        self._chiuso: bool = False
+        self.scartati: int = 0
+        self._worker = threading.Thread(
+            target=self._esegui_worker, name="vocalizzatore", daemon=True
+        )
+        self._worker.start()
+
+    def vocalizza_testo(self, testo: str, interrompi: bool = False) -> None:
+        """Accoda il testo con priorità normale (contratto IVocalizzatore)."""
+        self.accoda(testo, interrompi=interrompi)
+
+    def accoda(
+        self,
+        testo: str,
+        interrompi: bool = False,
+        priorita: int = PRIORITA_NORMALE,
+        chiave: Optional[str] = None,
+        unisci: Optional[Callable[[list[str]], str]] = None,
+        validita_s: Optional[float] = None,
+        annulla: tuple[str, ...] = (),
+    ) -> None:
+        """
+        Accoda un annuncio senza attendere il backend.
+
+        Args:
+            testo: testo da vocalizzare (o singola parte se è indicata unisci).
+            interrompi: se True scarta gli annunci in attesa e interrompe la lettura.
+            priorita: PRIORITA_ALTA, PRIORITA_NORMALE o PRIORITA_BASSA.
+            chiave: annunci con la stessa chiave vengono uniti o sostituiti.
+            unisci: funzione che compone il testo dalle parti accumulate
+                per la stessa chiave; se None l'ultimo annuncio sostituisce il precedente.
+            validita_s: secondi oltre i quali l'annuncio non pronunciato è scartato.
+            annulla: chiavi degli annunci in attesa da scartare (superati da questo).
+        """
+        with self._condizione:
+            if self._chiuso:
+                return
+            if interrompi:
+                self._scarta_tutti()
+            for chiave_superata in annulla:
+                self._scarta_chiave(chiave_superata)
+            scadenza = None if validita_s is None else self._orologio() + validita_s
+
+            esistente = self._per_chiave.get(chiave) if chiave is not None else None
+            if esistente is not None:
+                if unisci is not None:
+                    esistente.parti.append(testo)
+                    esistente.testo = unisci(esistente.parti)
+                else:
+                    esistente.parti = [testo]
+                    esistente.testo = testo
+                esistente.unisci = unisci
+                esistente.scadenza = scadenza
+                esistente.interrompi = esistente.interrompi or interrompi
+                return
+
+            if self._in_attesa >= self._capacita:
+                self._scarta_meno_prioritario()
+            annuncio = _Annuncio(
+                priorita=priorita,
+                sequenza=next(self._sequenza),
+                testo=unisci([testo]) if unisci is not None else testo,
+                interrompi=interrompi,
+                chiave=chiave,
+                parti=[testo],
+                unisci=unisci,
+                scadenza=scadenza,
+            )
+            heapq.heappush(self._coda, (annuncio.priorita, annuncio.sequenza, annuncio))
+            self._in_attesa += 1
+            if chiave is not None:
+                self._per_chiave[chiave] = annuncio
+            self._condizione.notify_all()
+
+    def attendi(self, timeout: Optional[float] = None) -> bool:
+        """Attende che la coda sia vuota e nessun annuncio sia in corso.
+
+        Ritorna False se il timeout scade prima.
+        """
+        with self._condizione:
+            return self._condizione.wait_for(
+                lambda: self._in_attesa == 0 and not self._in_corso, timeout
+            )
+
+    def chiudi(self, timeout: Optional[float] = 1.0) -> None:
+        """Scarta gli annunci in attesa e ferma il worker."""
+        with self._condizione:
+            self._chiuso = True
+            self._scarta_tutti()
+            self._condizione.notify_all()
+        self._worker.join(timeout)
+
+    # ------------------------------------------------------------------
+    # Gestione coda (da chiamare con il lock acquisito)
+    # ------------------------------------------------------------------
+
+    def _annulla(self, annuncio: _Annuncio) -> None:
+        annuncio.annullato = True
+        self._in_attesa -= 1
+        self.scartati += 1
+        if annuncio.chiave is not None and self._per_chiave.get(annuncio.chiave) is annuncio:
+            del self._per_chiave[annuncio.chiave]
+
+    def _scarta_tutti(self) -> None:
+        for _priorita, _sequenza, annuncio in self._coda:
+            if not annuncio.annullato:
+                self._annulla(annuncio)
+        self._coda.clear()
+
+    def _scarta_chiave(self, chiave: str) -> None:
+        annuncio = self._per_chiave.get(chiave)
+        if annuncio is not None:
+            self._annulla(annuncio)
+
+    def _scarta_meno_prioritario(self) -> None:
+        candidati = [voce for voce in self._coda if not voce[2].annullato]
+        if candidati:
+            peggiore = max(candidati, key=lambda voce: (voce[0], -voce[1]))
+            self._annulla(peggiore[2])
+
+    def _prossimo_annuncio(self) -> Optional[_Annuncio]:
+        while self._coda:
+            _priorita, _sequenza, annuncio = heapq.heappop(self._coda)
+            if annuncio.annullato:
+                continue
+            if annuncio.scadenza is not None and self._orologio() > annuncio.scadenza:
+                self._annulla(annuncio)
+                continue
+            self._in_attesa -= 1
+            if annuncio.chiave is not None and self._per_chiave.get(annuncio.chiave) is annuncio:
+                del self._per_chiave[annuncio.chiave]
+            return annuncio
+        return None
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+
+    def _esegui_worker(self) -> None:
+        com_inizializzato = _inizializza_com()
+        try:
+            if self._backend is None:
+                try:
+                    self._backend = _Auto()  # type: ignore[misc]
+                except Exception:
+                    _error_logger.exception("Impossibile inizializzare il backend TTS")
+            self._pronuncia_annunci()
+        finally:
+            if com_inizializzato:
+                _pythoncom.CoUninitialize()
+
+    def _pronuncia_annunci(self) -> None:
+        while True:
+            with self._condizione:
+                annuncio = self._prossimo_annuncio()
+                while annuncio is None and not self._chiuso:
+                    self._condizione.notify_all()
+                    self._condizione.wait()
+                    annuncio = self._prossimo_annuncio()
+                if annuncio is None:
+                    self._condizione.notify_all()
+                    return
+                self._in_corso = True
+            try:
+                if self._backend is not None:
+                    self._backend.speak(annuncio.testo, interrupt=annuncio.interrompi)
+            except Exception:
+                _error_logger.exception("Errore backend TTS in VocalizzatoreAsincrono")
+            finally:
+                with self._condizione:
+                    self._in_corso = False
+                    self._condizione.notify_all()
+
+
+def _inizializza_com() -> bool:
+    """Inizializza COM nel thread corrente; ritorna True se va poi rilasciato."""
+    if _pythoncom is None:
+        return False
+    try:
+        _pythoncom.CoInitialize()
+    except Exception:
+        _error_logger.exception("Impossibile inizializzare COM nel thread del vocalizzatore")
+        return False
+    return True
+
+
+class BackendFittizio:
+    """
+    Backend TTS headless per test: registra i testi invece di pronunciarli.
+
+    Con ritardo_s simula un backend lento; con blocca() / sblocca() i test
+    possono trattenere il worker su un annuncio per riempire la coda.
+    """
+
+    def __init__(self, ritardo_s: float = 0.0) -> None:
+        self.ritardo_s = ritardo_s
+        self.pronunciati: list[tuple[str, bool]] = []
+        self._via_libera = threading.Event()
+        self._via_libera.set()
+        self.in_parlato = threading.Event()
+
+    def speak(self, testo: str, interrupt: bool = False) -> None:
+        self.in_parlato.set()
+        self._via_libera.wait()
+        if self.ritardo_s:
+            time.sleep(self.ritardo_s)
+        self.pronunciati.append((testo, interrupt))
+
+    def blocca(self) -> None:
+        """Trattiene il prossimo speak() finché non viene chiamato sblocca()."""
+        self.in_parlato.clear()
+        self._via_libera.clear()
+
+    def sblocca(self) -> None:
+        self._via_libera.set()
+
+    @property
+    def testi(self) -> list[str]:
+        return [testo for testo, _interrupt in self.pronunciati]
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+benchmark.py -- Esegue la suite di benchmark del motore (tests/benchmark).
+
+Le baseline vengono salvate da pytest-benchmark in .benchmarks/ (una per
+macchina e versione di Python). Senza --salva la suite viene confrontata
+con l'ultima baseline salvata e fallisce se la mediana di un benchmark
+peggiora oltre la soglia.
+
+Uso:
+    python scripts/benchmark.py --salva               # misura e salva una nuova baseline
+    python scripts/benchmark.py                       # confronta con l'ultima baseline (soglia 10%)
+    python scripts/benchmark.py --soglia 20 -k turno  # soglia e filtro personalizzati
+    python scripts/benchmark.py --help
+
+Richiede pytest-benchmark (pip install pytest-benchmark).
+
+Exit code: quello di pytest (0 se nessuna regressione oltre la soglia).
+"""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+RADICE = Path(__file__).resolve().parent.parent
+SUITE = RADICE / "tests" / "benchmark"
+SOGLIA_PREDEFINITA = 10.0
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Suite di benchmark del motore di Tombola Stark")
+    parser.add_argument(
+        "--salva",
+        action="store_true",
+        help="Salva le misure come nuova baseline invece di confrontarle",
+    )
+    parser.add_argument(
+        "--soglia",
+        type=float,
+        default=SOGLIA_PREDEFINITA,
+        help="Peggioramento massimo ammesso della mediana, in percentuale (default: 10)",
+    )
+    parser.add_argument("-k", dest="filtro", default=None, help="Filtro pytest -k sui benchmark")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    comando = [sys.executable, "-m", "pytest", str(SUITE), "--benchmark-only", "-q"]
+    if args.salva:
+        comando.append("--benchmark-autosave")
+    else:
+        comando += ["--benchmark-compare", f"--benchmark-compare-fail=median:{args.soglia:g}%"]
+    if args.filtro:
+        comando += ["-k", args.filtro]
+    return subprocess.call(comando, cwd=RADICE)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
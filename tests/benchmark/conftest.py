@@ -0,0 +1,18 @@
+"""
+Configurazione della suite di benchmark (tests/benchmark).
+
+I benchmark richiedono pytest-benchmark e girano solo con --benchmark-only
+(di solito tramite scripts/benchmark.py): in una normale esecuzione di
+pytest vengono saltati, così la suite funzionale resta veloce.
+"""
+
+import pytest
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("benchmark_only", default=False):
+        return
+    salta = pytest.mark.skip(reason="benchmark: eseguire con --benchmark-only (scripts/benchmark.py)")
+    for item in items:
+        if "benchmark" in item.fixturenames:
+            item.add_marker(salta)
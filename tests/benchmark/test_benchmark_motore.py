@@ -0,0 +1,147 @@
+"""
+Benchmark dei percorsi caldi del motore di gioco.
+
+Misurano, per numero di cartelle da 1 a 10.000:
+- costruzione di Cartella() e generazione in blocco (Cartella.crea_lotto);
+- estrazione dei 90 numeri con Tabellone.estrai_numero();
+- un turno completo (estrazione e propagazione, dichiarazione dei bot,
+  verifica premi) e Partita.esegui_turno();
+- la valutazione dei reclami di tutti i bot a metà partita;
+- una partita completa dalla creazione alla tombola.
+
+Ogni giocatore ha una cartella: con più di Partita.MAX_GIOCATORI cartelle
+la partita è in modalità sala. Le partite vengono create fuori dalla misura
+(setup di benchmark.pedantic) e riusate tra i round finché non terminano.
+
+Esecuzione, baseline e soglia di regressione: scripts/benchmark.py.
+"""
+
+import random
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from bingo_game.cartella import Cartella
+from bingo_game.game_controller import crea_partita_standard
+from bingo_game.partita import Partita
+from bingo_game.tabellone import Tabellone
+
+CARTELLE = [1, 10, 100, 1_000, 10_000]
+CARTELLE_PARTITA_COMPLETA = [1, 10, 100, 1_000]
+SEME = 20_240_601
+
+# Round per dimensione: le partite grandi costano decimi di secondo a turno.
+_ROUND = {1: 200, 10: 200, 100: 50, 1_000: 20, 10_000: 5}
+
+_partite: dict = {}
+
+
+def _crea_partita(cartelle: int) -> Partita:
+    """Partita avviata con un umano e cartelle-1 bot, una cartella ciascuno."""
+    partita = crea_partita_standard(
+        num_bot=max(1, cartelle - 1),
+        seme=SEME,
+        modalita_sala=cartelle > Partita.MAX_GIOCATORI,
+    )
+    partita.avvia_partita()
+    return partita
+
+
+def _partita_in_corso(cartelle: int) -> Partita:
+    """Partita condivisa della dimensione data, ricreata quando termina."""
+    partita = _partite.get(cartelle)
+    if partita is None or partita.is_terminata():
+        partita = _partite[cartelle] = _crea_partita(cartelle)
+    return partita
+
+
+def _turno_completo(partita: Partita) -> None:
+    """Un turno come lo gioca la finestra: estrazione, bot, verifica."""
+    partita.esegui_fase_estrazione()
+    premi_gia_assegnati = partita.premi_gia_assegnati.copia()
+    premi_tipo_chiusi = set(partita.premi_tipo_chiusi)
+    for giocatore in partita.get_giocatori():
+        if giocatore.is_automatico():
+            giocatore.dichiara_fine_fase_azione(premi_gia_assegnati, premi_tipo_chiusi)
+    partita.esegui_fase_verifica()
+
+
+def _gioca_fino_alla_fine(partita: Partita) -> None:
+    while not partita.is_terminata():
+        _turno_completo(partita)
+
+
+@pytest.mark.parametrize("cartelle", CARTELLE)
+def test_costruzione_cartelle(benchmark, cartelle):
+    rng = random.Random(SEME)
+    risultato = benchmark.pedantic(
+        lambda: [Cartella(rng=rng) for _ in range(cartelle)],
+        rounds=max(3, _ROUND[cartelle] // 10),
+    )
+    assert len(risultato) == cartelle
+
+
+@pytest.mark.parametrize("cartelle", CARTELLE)
+def test_lotto_cartelle(benchmark, cartelle):
+    rng = random.Random(SEME)
+    risultato = benchmark.pedantic(
+        Cartella.crea_lotto, args=(cartelle, rng), rounds=max(3, _ROUND[cartelle] // 10)
+    )
+    assert len(risultato) == cartelle
+
+
+def test_estrazione_tabellone(benchmark):
+    def prepara():
+        return (Tabellone(rng=random.Random(SEME)),), {}
+
+    def estrai_tutti(tabellone):
+        for _ in range(90):
+            tabellone.estrai_numero()
+        return tabellone
+
+    tabellone = benchmark.pedantic(estrai_tutti, setup=prepara, rounds=500)
+    assert tabellone.get_conteggio_estratti() == 90
+
+
+@pytest.mark.parametrize("cartelle", CARTELLE)
+def test_turno_completo(benchmark, cartelle):
+    def prepara():
+        return (_partita_in_corso(cartelle),), {}
+
+    benchmark.pedantic(_turno_completo, setup=prepara, rounds=_ROUND[cartelle])
+
+
+@pytest.mark.parametrize("cartelle", CARTELLE)
+def test_esegui_turno(benchmark, cartelle):
+    def prepara():
+        return (_partita_in_corso(cartelle),), {}
+
+    benchmark.pedantic(lambda partita: partita.esegui_turno(), setup=prepara, rounds=_ROUND[cartelle])
+
+
+@pytest.mark.parametrize("cartelle", CARTELLE)
+def test_valutazione_reclamo_bot(benchmark, cartelle):
+    partita = _crea_partita(cartelle)
+    while partita.tabellone.get_conteggio_estratti() < 45 and not partita.is_terminata():
+        partita.esegui_turno()
+    bot = [g for g in partita.get_giocatori() if g.is_automatico()]
+    premi_gia_assegnati = partita.premi_gia_assegnati.copia()
+    premi_tipo_chiusi = set(partita.premi_tipo_chiusi)
+
+    def valuta_tutti():
+        for giocatore in bot:
+            giocatore._valuta_potenziale_reclamo(premi_gia_assegnati, premi_tipo_chiusi)
+
+    benchmark.pedantic(valuta_tutti, rounds=_ROUND[cartelle])
+
+
+@pytest.mark.parametrize("cartelle", CARTELLE_PARTITA_COMPLETA)
+def test_partita_completa(benchmark, cartelle):
+    def gioca():
+        partita = _crea_partita(cartelle)
+        _gioca_fino_alla_fine(partita)
+        return partita
+
+    partita = benchmark.pedantic(gioca, rounds=max(3, _ROUND[cartelle] // 20))
+    assert partita.is_terminata()
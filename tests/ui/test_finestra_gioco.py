@@ -103,6 +103,7 @@ class TestFinestraGiocoAccessibilitaBuildUi(unittest.TestCase):
 
     def test_build_ui_imposta_nomi_accessibili_principali_e_log(self) -> None:
         finestra = self._crea_finestra_stub()
+        finestra._griglie_disegnate = False
 
         with patch.object(finestra_gioco_module.wx, "Panel", _FakePanel), \
              patch.object(finestra_gioco_module.wx, "Button", _FakeButton), \
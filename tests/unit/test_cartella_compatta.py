@@ -0,0 +1,164 @@
+"""
+Test unitari per bingo_game.cartella_compatta.CartellaCompatta.
+
+Verificano che la cartella a maschere di bit resti equivalente a Cartella
+su segnazione, verifiche dei premi e integrazione con Partita e bot.
+"""
+
+import random
+import unittest
+
+from bingo_game.cartella import Cartella
+from bingo_game.cartella_compatta import CartellaCompatta
+from bingo_game.exceptions import (
+    CartellaNumeroTypeException,
+    CartellaNumeroValueException,
+    CartellaRigaTypeException,
+    CartellaRigaValueException,
+)
+from bingo_game.partita import Partita
+from bingo_game.players import GiocatoreAutomatico, GiocatoreBase
+from bingo_game.tabellone import Tabellone
+
+
+class TestCartellaCompatta(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.cartella = CartellaCompatta()
+
+    def test_e_istanza_di_cartella(self) -> None:
+        self.assertIsInstance(self.cartella, Cartella)
+
+    def test_maschere_coerenti_con_griglia(self) -> None:
+        for indice_riga in range(3):
+            numeri_riga = self.cartella.get_numeri_riga(indice_riga)
+            maschera_attesa = 0
+            for numero in numeri_riga:
+                maschera_attesa |= 1 << (numero - 1)
+            self.assertEqual(self.cartella._maschere_righe[indice_riga], maschera_attesa)
+        self.assertEqual(self.cartella._maschera_cartella.bit_count(), 15)
+
+    def test_segna_numero_presente_ritorna_true_poi_false(self) -> None:
+        numero = self.cartella.get_numeri_cartella()[0]
+        self.assertTrue(self.cartella.segna_numero(numero))
+        self.assertFalse(self.cartella.segna_numero(numero))
+        self.assertTrue(self.cartella.is_numero_segnato(numero))
+        self.assertEqual(self.cartella.numeri_segnati, {numero})
+
+    def test_segna_numero_assente_ritorna_false(self) -> None:
+        assente = next(n for n in range(1, 91) if n not in self.cartella.numeri_cartella)
+        self.assertFalse(self.cartella.segna_numero(assente))
+        self.assertEqual(self.cartella.conta_numeri_segnati(), 0)
+
+    def test_segna_numero_validazioni(self) -> None:
+        with self.assertRaises(CartellaNumeroTypeException):
+            self.cartella.segna_numero("5")
+        with self.assertRaises(CartellaNumeroValueException):
+            self.cartella.segna_numero(91)
+
+    def test_verifica_riga_validazioni(self) -> None:
+        with self.assertRaises(CartellaRigaTypeException):
+            self.cartella.verifica_ambo_riga("0")
+        with self.assertRaises(CartellaRigaValueException):
+            self.cartella.verifica_cinquina_riga(3)
+
+    def test_premi_di_riga_per_soglia(self) -> None:
+        numeri_riga = self.cartella.get_numeri_riga(1)
+        verifiche = [
+            self.cartella.verifica_ambo_riga,
+            self.cartella.verifica_terno_riga,
+            self.cartella.verifica_quaterna_riga,
+            self.cartella.verifica_cinquina_riga,
+        ]
+        for segnati, numero in enumerate(numeri_riga, start=1):
+            self.cartella.segna_numero(numero)
+            for soglia, verifica in enumerate(verifiche, start=2):
+                self.assertEqual(verifica(1), segnati >= soglia)
+        self.assertFalse(self.cartella.verifica_ambo_riga(0))
+
+    def test_tombola_e_reset(self) -> None:
+        for numero in self.cartella.get_numeri_cartella():
+            self.cartella.segna_numero(numero)
+        self.assertTrue(self.cartella.verifica_cartella_completa())
+        self.assertEqual(self.cartella.get_numeri_non_segnati(), [])
+        self.cartella.reset_cartella()
+        self.assertEqual(self.cartella.conta_numeri_segnati(), 0)
+        self.assertFalse(self.cartella.verifica_cartella_completa())
+
+    def test_equivalenza_con_cartella_su_sequenza_casuale(self) -> None:
+        rng = random.Random(42)
+        compatta = CartellaCompatta()
+        classica = Cartella()
+        classica.cartella = [list(riga) for riga in compatta.cartella]
+        classica.numeri_cartella = classica._estrai_numeri_set()
+
+        partita = Partita(Tabellone())
+
+        sequenza = list(range(1, 91))
+        rng.shuffle(sequenza)
+        for numero in sequenza:
+            self.assertEqual(compatta.segna_numero(numero), classica.segna_numero(numero))
+            self.assertEqual(
+                partita.verifica_premi_per_cartella(compatta),
+                partita.verifica_premi_per_cartella(classica),
+            )
+
+    def test_vista_segnati_ricostruita_solo_quando_cambia(self) -> None:
+        numeri = self.cartella.get_numeri_cartella()
+        self.cartella.segna_numero(numeri[0])
+        vista = self.cartella.numeri_segnati
+        self.assertIs(self.cartella.numeri_segnati, vista)
+        self.cartella.segna_numero(numeri[1])
+        nuova_vista = self.cartella.numeri_segnati
+        self.assertIsNot(nuova_vista, vista)
+        self.assertEqual(nuova_vista, {numeri[0], numeri[1]})
+        self.cartella.reset_cartella()
+        self.assertEqual(self.cartella.numeri_segnati, set())
+
+    def test_griglia_modificata_e_riallineata_da_numeri_cartella(self) -> None:
+        for col in range(self.cartella.colonne):
+            self.cartella.cartella[0][col] = None
+        self.cartella.cartella[0][0] = 1
+        self.cartella.cartella[0][1] = 11
+        self.cartella.numeri_cartella = self.cartella._estrai_numeri_set()
+
+        self.cartella.segna_numero(1)
+        self.cartella.segna_numero(11)
+        self.assertTrue(self.cartella.verifica_ambo_riga(0))
+        self.assertFalse(self.cartella.verifica_terno_riga(0))
+
+
+class TestCartellaCompattaIntegrazione(unittest.TestCase):
+
+    def test_bot_valuta_reclamo_su_cartella_compatta(self) -> None:
+        bot = GiocatoreAutomatico("Bot")
+        cartella = CartellaCompatta()
+        bot.aggiungi_cartella(cartella)
+        for numero in cartella.get_numeri_riga(2)[:3]:
+            bot.aggiorna_con_numero(numero)
+
+        reclamo = bot._valuta_potenziale_reclamo(set())
+
+        self.assertIsNotNone(reclamo)
+        self.assertEqual(reclamo.tipo, "terno")
+        self.assertEqual(reclamo.indice_riga, 2)
+
+    def test_partita_completa_con_cartelle_compatte(self) -> None:
+        giocatori = []
+        for indice in range(3):
+            bot = GiocatoreAutomatico(f"Bot {indice}", id_giocatore=indice + 1)
+            bot.aggiungi_cartella(CartellaCompatta())
+            bot.aggiungi_cartella(CartellaCompatta())
+            giocatori.append(bot)
+        giocatori.append(GiocatoreBase("Base", id_giocatore=9))
+        partita = Partita(Tabellone(), giocatori)
+        partita.avvia_partita()
+
+        while not partita.is_terminata():
+            partita.esegui_turno()
+
+        self.assertTrue(partita.has_tombola())
+
+
+if __name__ == "__main__":
+    unittest.main()
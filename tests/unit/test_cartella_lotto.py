@@ -0,0 +1,72 @@
+"""
+Test unitari per la generazione in lotto di Cartella (genera_lotto / crea_lotto)
+e per la costruzione di una cartella da griglia esistente.
+"""
+
+import random
+import unittest
+
+from bingo_game.cartella import Cartella
+from bingo_game.cartella_compatta import CartellaCompatta
+
+
+class TestGeneraLotto(unittest.TestCase):
+
+    def test_griglie_valide(self) -> None:
+        lotto = Cartella.genera_lotto(300, random.Random(3))
+
+        self.assertEqual(len(lotto), 300)
+        for griglia in lotto:
+            # La validazione completa di Cartella non deve sollevare eccezioni.
+            cartella = Cartella(griglia=griglia)
+            self.assertEqual(len(cartella.numeri_cartella), 15)
+            for indice_colonna in range(9):
+                colonna = [riga[indice_colonna] for riga in griglia if riga[indice_colonna] is not None]
+                self.assertEqual(colonna, sorted(colonna))
+
+    def test_deterministico_con_rng(self) -> None:
+        self.assertEqual(
+            Cartella.genera_lotto(20, random.Random(8)),
+            Cartella.genera_lotto(20, random.Random(8)),
+        )
+
+    def test_lotto_vuoto_e_negativo(self) -> None:
+        self.assertEqual(Cartella.genera_lotto(0), [])
+        with self.assertRaises(ValueError):
+            Cartella.genera_lotto(-1)
+
+    def test_copertura_di_tutti_i_numeri(self) -> None:
+        visti = set()
+        for griglia in Cartella.genera_lotto(200, random.Random(1)):
+            for riga in griglia:
+                visti.update(valore for valore in riga if valore is not None)
+        self.assertEqual(visti, set(range(1, 91)))
+
+
+class TestCartellaDaGriglia(unittest.TestCase):
+
+    def test_crea_lotto_usa_la_classe_chiamante(self) -> None:
+        cartelle = CartellaCompatta.crea_lotto(4, random.Random(5))
+        self.assertEqual(len(cartelle), 4)
+        for cartella in cartelle:
+            self.assertIsInstance(cartella, CartellaCompatta)
+            numero = cartella.get_numeri_cartella()[0]
+            self.assertTrue(cartella.segna_numero(numero))
+
+    def test_griglia_copiata_e_validata(self) -> None:
+        griglia = Cartella.genera_lotto(1, random.Random(2))[0]
+        cartella = Cartella(griglia=griglia)
+        griglia[0][0] = 999
+        self.assertNotEqual(cartella.cartella[0][0], 999)
+
+        griglia_non_valida = [list(riga) for riga in cartella.cartella]
+        colonna = next(c for c in range(9) if griglia_non_valida[0][c] is None)
+        griglia_non_valida[0][colonna] = colonna * 10 + 1 if colonna else 1
+        with self.assertRaises(RuntimeError):
+            Cartella(griglia=griglia_non_valida)
+        with self.assertRaises(RuntimeError):
+            Cartella(griglia=[[None] * 9])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+"""
+Test unitari per bingo_game/checkpoint_partita.py.
+
+Verificano che una partita collegata a un CheckpointPartita venga ricostruita
+da ripristina_partita() con roster, cartelle, segnazioni (anche manuali del
+giocatore umano), estrazioni, premi e fase del turno; che la ripresa a metà
+turno riapra la finestra di reclamo, che un TabelloneMescolato riprenda la
+stessa sequenza, che gli snapshot periodici compattino il file e che un
+record finale troncato o un file non valido vengano gestiti.
+"""
+
+import os
+import tempfile
+import unittest
+
+from bingo_game.checkpoint_partita import (
+    DIMENSIONE_INTESTAZIONE,
+    CheckpointPartita,
+    ripristina_partita,
+)
+from bingo_game.exceptions import CheckpointPartitaFormatoException
+from bingo_game.game_controller import crea_partita_standard
+from bingo_game.players.giocatore_umano import GiocatoreUmano
+from bingo_game.tabellone_mescolato import TabelloneMescolato
+
+
+def _turno(partita):
+    risultato = partita.esegui_fase_estrazione()
+    for giocatore in partita.get_giocatori():
+        if isinstance(giocatore, GiocatoreUmano):
+            for cartella in giocatore.get_cartelle():
+                cartella.segna_numero(risultato["numero_estratto"])
+        elif giocatore.is_automatico():
+            giocatore.dichiara_fine_fase_azione(
+                set(partita.premi_gia_assegnati), set(partita.premi_tipo_chiusi)
+            )
+    partita.esegui_fase_verifica()
+
+
+class TestCheckpointPartita(unittest.TestCase):
+
+    def setUp(self) -> None:
+        cartella = tempfile.TemporaryDirectory()
+        self.addCleanup(cartella.cleanup)
+        self.percorso = os.path.join(cartella.name, "partita.tsck")
+
+    def _collega(self, partita, **opzioni):
+        checkpoint = CheckpointPartita(self.percorso, **opzioni)
+        self.addCleanup(checkpoint.chiudi)
+        partita.collega_checkpoint(checkpoint)
+        return checkpoint
+
+    def assertPartiteUguali(self, ripresa, originale) -> None:
+        self.assertEqual(ripresa.get_stato_partita(), originale.get_stato_partita())
+        self.assertEqual(ripresa.fase_turno_corrente, originale.fase_turno_corrente)
+        self.assertEqual(ripresa.tabellone.storico_estrazioni, originale.tabellone.storico_estrazioni)
+        self.assertEqual(ripresa.ultimo_numero_estratto, originale.ultimo_numero_estratto)
+        self.assertEqual(ripresa.premi_gia_assegnati, originale.premi_gia_assegnati)
+        self.assertEqual(ripresa.premi_tipo_chiusi, originale.premi_tipo_chiusi)
+        self.assertEqual(ripresa.storico_premi, originale.storico_premi)
+        self.assertEqual(ripresa.seme, originale.seme)
+        self.assertEqual(ripresa.configurazione, originale.configurazione)
+        for giocatore_ripreso, giocatore in zip(ripresa.get_giocatori(), originale.get_giocatori(), strict=True):
+            self.assertIs(type(giocatore_ripreso), type(giocatore))
+            self.assertEqual(giocatore_ripreso.get_nome(), giocatore.get_nome())
+            self.assertEqual(giocatore_ripreso.get_id_giocatore(), giocatore.get_id_giocatore())
+            for cartella_ripresa, cartella in zip(
+                giocatore_ripreso.get_cartelle(), giocatore.get_cartelle(), strict=True
+            ):
+                self.assertEqual(cartella_ripresa.indice, cartella.indice)
+                self.assertEqual(cartella_ripresa.indice_pool, cartella.indice_pool)
+                self.assertEqual(cartella_ripresa.cartella, cartella.cartella)
+                self.assertEqual(cartella_ripresa.numeri_segnati, cartella.numeri_segnati)
+
+    def test_ripresa_fine_turno(self) -> None:
+        partita = crea_partita_standard(num_cartelle_umano=2, num_bot=4, seme=11)
+        partita.avvia_partita()
+        self._collega(partita)
+        for _ in range(40):
+            _turno(partita)
+
+        ripresa = ripristina_partita(self.percorso)
+
+        self.assertPartiteUguali(ripresa, partita)
+        self.assertTrue(partita.storico_premi)
+        # La partita ripresa prosegue con il normale ciclo di turno.
+        _turno(ripresa)
+        self.assertEqual(ripresa.tabellone.get_conteggio_estratti(), 41)
+
+    def test_ripresa_a_meta_turno_riapre_la_finestra(self) -> None:
+        partita = crea_partita_standard(num_bot=2, seme=12)
+        partita.avvia_partita()
+        self._collega(partita)
+        for _ in range(5):
+            _turno(partita)
+        partita.esegui_fase_estrazione()
+
+        ripresa = ripristina_partita(self.percorso)
+
+        self.assertPartiteUguali(ripresa, partita)
+        self.assertEqual(ripresa.fase_turno_corrente, "attesa_reclami")
+        ripresa.esegui_fase_verifica()
+        self.assertEqual(ripresa.fase_turno_corrente, "attesa_estrazione")
+
+    def test_partita_terminata_e_modalita_sala(self) -> None:
+        partita = crea_partita_standard(num_bot=30, seme=13, modalita_sala=True)
+        partita.avvia_partita()
+        self._collega(partita, turni_per_snapshot=7)
+        while not partita.is_terminata():
+            _turno(partita)
+
+        ripresa = ripristina_partita(self.percorso)
+
+        self.assertTrue(ripresa.modalita_sala)
+        self.assertTrue(ripresa.is_terminata())
+        self.assertPartiteUguali(ripresa, partita)
+
+    def test_tabellone_mescolato_riprende_la_stessa_sequenza(self) -> None:
+        partita = crea_partita_standard(num_bot=2, seme=14)
+        partita.tabellone = TabelloneMescolato(sequenza=range(90, 0, -1))
+        partita.avvia_partita()
+        self._collega(partita)
+        for _ in range(10):
+            _turno(partita)
+
+        ripresa = ripristina_partita(self.percorso)
+
+        self.assertIsInstance(ripresa.tabellone, TabelloneMescolato)
+        self.assertEqual(ripresa.tabellone.get_sequenza(), partita.tabellone.get_sequenza())
+        self.assertEqual(ripresa.esegui_fase_estrazione()["numero_estratto"], 80)
+
+    def test_snapshot_periodico_compatta_il_file(self) -> None:
+        partita = crea_partita_standard(num_bot=3, seme=15)
+        partita.avvia_partita()
+        self._collega(partita, turni_per_snapshot=5)
+        dimensioni = []
+        for _ in range(10):
+            _turno(partita)
+            dimensioni.append(os.path.getsize(self.percorso))
+
+        # Al quinto e al decimo turno il file viene riscritto con un solo snapshot.
+        self.assertLess(dimensioni[4], dimensioni[3])
+        self.assertLess(dimensioni[9], dimensioni[8])
+        self.assertFalse(os.path.exists(self.percorso + ".tmp"))
+        self.assertPartiteUguali(ripristina_partita(self.percorso), partita)
+
+    def test_record_troncato_e_file_non_valido(self) -> None:
+        partita = crea_partita_standard(num_bot=2, seme=16)
+        partita.avvia_partita()
+        self._collega(partita)
+        for _ in range(3):
+            _turno(partita)
+        storico = list(partita.tabellone.storico_estrazioni)
+        partita.esegui_fase_estrazione()
+        with open(self.percorso, "ab") as file:
+            file.write(b"\x02\x01\x00")
+
+        ripresa = ripristina_partita(self.percorso)
+        self.assertEqual(ripresa.tabellone.storico_estrazioni[:3], storico)
+        self.assertEqual(ripresa.tabellone.get_conteggio_estratti(), 4)
+
+        with open(self.percorso, "wb") as file:
+            file.write(b"XXXX" + bytes(DIMENSIONE_INTESTAZIONE - 4))
+        with self.assertRaises(CheckpointPartitaFormatoException):
+            ripristina_partita(self.percorso)
+
+
+if __name__ == "__main__":
+    unittest.main()
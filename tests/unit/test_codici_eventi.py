@@ -242,12 +242,28 @@ class TestCodiciEventi(unittest.TestCase):
             codici_eventi.TURNO_TUTTI_PRONTI,
             codici_eventi.TURNO_PAUSA_INIZIO,
             codici_eventi.TURNO_PAUSA_COUNTDOWN,
+            codici_eventi.TURNO_BOT_PASSA,
+            codici_eventi.TURNO_BOT_PASSANO,
             codici_eventi.PAUSA_ATTIVATA,
             codici_eventi.PAUSA_DISATTIVATA,
         }
         literal_vals = set(get_args(codici_eventi.Codici_Eventi))
         self.assertEqual(costanti, literal_vals)
 
+    def test_chiavi_bot_passa_turno_nel_catalogo(self) -> None:
+        from bingo_game.ui.locales import MESSAGGI_EVENTI
+
+        self.assertEqual(
+            MESSAGGI_EVENTI[codici_eventi.TURNO_BOT_PASSA][0].format(nome="Bot 1"),
+            "Bot 1 ha passato il turno.",
+        )
+        self.assertEqual(
+            MESSAGGI_EVENTI[codici_eventi.TURNO_BOT_PASSANO][0].format(
+                nomi="Bot 1, Bot 2", ultimo="Bot 3"
+            ),
+            "Bot 1, Bot 2 e Bot 3 hanno passato il turno.",
+        )
+
 
 # ---------------------------------------------------------------------------
 # 5. codici_loop
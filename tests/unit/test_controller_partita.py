@@ -0,0 +1,78 @@
+"""
+Test unitari per ControllerPartita in bingo_game/game_controller.py.
+
+Verificano che contatore dei turni e flag di terminazione siano per partita:
+due partite intercalate nello stesso processo mantengono conteggi separati,
+la creazione di una nuova partita non azzera quelli di un'altra e il
+contesto viene creato anche per partite costruite senza il controller.
+"""
+
+import unittest
+
+from bingo_game.game_controller import (
+    ControllerPartita,
+    avvia_partita_sicura,
+    controller_partita,
+    crea_giocatori_automatici,
+    crea_partita_standard,
+    esegui_fase_estrazione_sicura,
+    esegui_fase_verifica_sicura,
+    esegui_turno_sicuro,
+    partita_terminata,
+)
+from bingo_game.partita import Partita
+from bingo_game.tabellone import Tabellone
+
+
+class TestControllerPartita(unittest.TestCase):
+
+    def _partita(self, seme: int) -> Partita:
+        partita = crea_partita_standard(num_bot=2, seme=seme)
+        avvia_partita_sicura(partita)
+        return partita
+
+    def test_partite_intercalate_contatori_separati(self) -> None:
+        prima = self._partita(seme=1)
+        seconda = self._partita(seme=2)
+
+        for _ in range(3):
+            esegui_turno_sicuro(prima)
+        esegui_fase_estrazione_sicura(seconda)
+        esegui_fase_verifica_sicura(seconda)
+        esegui_turno_sicuro(prima)
+
+        self.assertEqual(controller_partita(prima).turno_corrente, 4)
+        self.assertEqual(controller_partita(seconda).turno_corrente, 1)
+
+    def test_nuova_partita_non_azzera_le_altre(self) -> None:
+        prima = self._partita(seme=3)
+        esegui_turno_sicuro(prima)
+
+        nuova = self._partita(seme=4)
+
+        self.assertEqual(controller_partita(prima).turno_corrente, 1)
+        self.assertEqual(controller_partita(nuova).turno_corrente, 0)
+
+    def test_terminazione_registrata_per_partita(self) -> None:
+        prima = self._partita(seme=5)
+        seconda = self._partita(seme=6)
+        prima.termina_partita()
+
+        self.assertTrue(partita_terminata(prima))
+        self.assertFalse(partita_terminata(seconda))
+
+        self.assertTrue(controller_partita(prima).terminazione_registrata)
+        self.assertFalse(controller_partita(seconda).terminazione_registrata)
+
+    def test_contesto_creato_al_primo_uso(self) -> None:
+        partita = Partita(Tabellone(), crea_giocatori_automatici(num_bot=2))
+
+        contesto = controller_partita(partita)
+
+        self.assertIsInstance(contesto, ControllerPartita)
+        self.assertIs(controller_partita(partita), contesto)
+        self.assertEqual(contesto.turno_corrente, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
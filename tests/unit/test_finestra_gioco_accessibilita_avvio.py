@@ -108,10 +108,8 @@ class TestDichiaraFineBotAnnuncio(unittest.TestCase):
 
         finestra._dichiara_fine_bot(bot, set(), set())
 
-        finestra._renderer.mostra_messaggio_sistema.assert_called_once()
-        testo: str = finestra._renderer.mostra_messaggio_sistema.call_args.args[0]
-        self.assertIn("BotTest", testo)
-        self.assertIn("passato il turno", testo)
+        finestra._renderer.annuncia_bot_passa_turno.assert_called_once_with("BotTest")
+        finestra._renderer.mostra_messaggio_sistema.assert_not_called()
 
 
 if __name__ == "__main__":
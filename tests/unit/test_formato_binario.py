@@ -0,0 +1,46 @@
+"""
+Test unitari per bingo_game.formato_binario.
+
+Verificano la verifica dell'intestazione dei file binari di giornale e
+checkpoint e la codifica dei campi interi opzionali.
+"""
+
+import unittest
+
+from bingo_game.exceptions import CheckpointPartitaFormatoException
+from bingo_game.formato_binario import (
+    DIMENSIONE_INTESTAZIONE,
+    assente_se_negativo,
+    codifica_intestazione,
+    meno_uno_se_assente,
+    verifica_intestazione,
+)
+
+
+class TestIntestazione(unittest.TestCase):
+
+    def _verifica(self, intestazione: bytes) -> None:
+        verifica_intestazione(intestazione, b"TEST", 3, "file di prova", CheckpointPartitaFormatoException)
+
+    def test_intestazione_valida(self) -> None:
+        intestazione = codifica_intestazione(b"TEST", 3)
+        self.assertEqual(len(intestazione), DIMENSIONE_INTESTAZIONE)
+        self._verifica(intestazione)
+
+    def test_intestazioni_non_valide(self) -> None:
+        for intestazione in (b"TES", codifica_intestazione(b"XXXX", 3), codifica_intestazione(b"TEST", 4)):
+            with self.assertRaises(CheckpointPartitaFormatoException):
+                self._verifica(intestazione)
+
+
+class TestCampiOpzionali(unittest.TestCase):
+
+    def test_meno_uno_per_assente(self) -> None:
+        self.assertEqual(meno_uno_se_assente(None), -1)
+        self.assertEqual(meno_uno_se_assente(2), 2)
+        self.assertIsNone(assente_se_negativo(-1))
+        self.assertEqual(assente_se_negativo(0), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
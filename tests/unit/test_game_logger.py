@@ -1,15 +1,28 @@
 """Unit tests for bingo_game.logging.GameLogger (Phase 1).
 
 Tests the GameLogger singleton initialization, file creation,
-session markers, and debug/info level configuration.
+session markers, debug/info level configuration, the optional
+buffered (QueueHandler/QueueListener) pipeline, log rotation and the
+session index.
 """
+import gzip
 import logging
 from pathlib import Path
 import tempfile
+import threading
+import time
 import unittest
 from unittest.mock import patch
 
-from bingo_game.logging.game_logger import GameLogger, _LOG_DIR, _LOG_FILE, _LOGGER_NAME
+from bingo_game import latenze
+from bingo_game.logging.game_logger import (
+    GameLogger,
+    _LOG_DIR,
+    _LOG_FILE,
+    _LOGGER_NAME,
+    indice_sessioni,
+    leggi_sessione,
+)
 
 
 class TestGameLogger(unittest.TestCase):
@@ -41,6 +54,7 @@ class TestGameLogger(unittest.TestCase):
     def _reset_logger_state(self) -> None:
         GameLogger._initialized = False
         GameLogger._instance = None
+        GameLogger._listener = None
         for name in self.LOGGER_NAMES:
             logging.getLogger(name).handlers.clear()
 
@@ -129,5 +143,161 @@ class TestGameLogger(unittest.TestCase):
         self.assertIn("Sistema di logging in chiusura.", log_content, "Shutdown message should be in log")
 
 
+
+    def test_bufferizzato_scrive_tutto_allo_shutdown(self) -> None:
+        """Test that the buffered pipeline writes every record by shutdown()."""
+        GameLogger.initialize(debug_mode=True, bufferizzato=True, intervallo_flush_s=60.0)
+        logger = logging.getLogger("tombola_stark.game")
+        for indice in range(500):
+            logger.debug("Riga %d", indice)
+
+        GameLogger.shutdown()
+
+        log_content = self.log_file.read_text(encoding="utf-8")
+        self.assertIn("Riga 0", log_content)
+        self.assertIn("Riga 499", log_content)
+        self.assertIn("SESSIONE CHIUSA:", log_content)
+        self.assertLess(log_content.index("Riga 499"), log_content.index("SESSIONE CHIUSA:"))
+
+
+    def test_bufferizzato_error_scaricato_subito(self) -> None:
+        """Test that an ERROR record is on disk as soon as logger.error() returns."""
+        GameLogger.initialize(bufferizzato=True, record_per_flush=10_000, intervallo_flush_s=60.0)
+        logger = logging.getLogger("tombola_stark.errors")
+        logger.info("Prima dell'errore")
+        logger.error("Errore grave")
+
+        log_content = self.log_file.read_text(encoding="utf-8")
+        self.assertIn("Prima dell'errore", log_content)
+        self.assertIn("Errore grave", log_content)
+
+
+    def test_bufferizzato_flush_periodico(self) -> None:
+        """Test that buffered records reach the file within the flush interval."""
+        GameLogger.initialize(bufferizzato=True, record_per_flush=10_000, intervallo_flush_s=0.05)
+        logging.getLogger("tombola_stark.game").info("Riga periodica")
+
+        scadenza = time.monotonic() + 2.0
+        while time.monotonic() < scadenza:
+            if "Riga periodica" in self.log_file.read_text(encoding="utf-8"):
+                break
+            time.sleep(0.02)
+        self.assertIn("Riga periodica", self.log_file.read_text(encoding="utf-8"))
+
+
+    def test_bufferizzato_shutdown_non_blocca_i_log_successivi(self) -> None:
+        """Test that shutdown() with a full queue completes and later errors do not hang."""
+        GameLogger.initialize(bufferizzato=True, capacita_coda=1, intervallo_flush_s=60.0)
+        logger = logging.getLogger("tombola_stark.game")
+        for indice in range(50):
+            logger.info("Riga %d", indice)
+        GameLogger.shutdown()
+
+        esito = threading.Thread(target=logging.getLogger("tombola_stark.errors").error,
+                                 args=("Errore dopo la chiusura",), daemon=True)
+        esito.start()
+        esito.join(timeout=2.0)
+        self.assertFalse(esito.is_alive())
+        self.assertIn("Riga 49", self.log_file.read_text(encoding="utf-8"))
+
+
+    def test_bufferizzato_rispetta_livello(self) -> None:
+        """Test that the buffered pipeline keeps INFO level filtering."""
+        GameLogger.initialize(debug_mode=False, bufferizzato=True)
+        logging.getLogger("tombola_stark.game").debug("Riga di debug")
+        GameLogger.shutdown()
+
+        self.assertNotIn("Riga di debug", self.log_file.read_text(encoding="utf-8"))
+
+
+    def test_rotazione_per_dimensione_con_conservazione(self) -> None:
+        """Test that the log rotates by size and keeps only `conserva` segments."""
+        GameLogger.initialize(max_byte=2_000, conserva=2)
+        logger = logging.getLogger("tombola_stark.game")
+        for indice in range(200):
+            logger.info("Riga %d", indice)
+        GameLogger.shutdown()
+
+        segmenti = sorted(p.name for p in self.log_dir.glob("tombola_stark.log.*") if p.suffix != ".idx")
+        self.assertEqual(segmenti, ["tombola_stark.log.1", "tombola_stark.log.2"])
+        self.assertLess(self.log_file.stat().st_size, 2_000)
+        self.assertIn("SESSIONE CHIUSA:", self.log_file.read_text(encoding="utf-8"))
+
+
+    def test_rotazione_compressa(self) -> None:
+        """Test that rotated segments are gzip-compressed when requested."""
+        GameLogger.initialize(max_byte=2_000, comprimi=True, conserva=3)
+        logger = logging.getLogger("tombola_stark.game")
+        for indice in range(100):
+            logger.info("Riga %d", indice)
+        GameLogger.shutdown()
+
+        primo = self.log_dir / "tombola_stark.log.1.gz"
+        self.assertTrue(primo.exists())
+        with gzip.open(primo, "rt", encoding="utf-8") as segmento:
+            self.assertIn("| Riga ", segmento.read())
+        self.assertFalse((self.log_dir / "tombola_stark.log.1").exists())
+
+
+    def test_rotazione_per_eta(self) -> None:
+        """Test that the log rotates once the segment is older than the interval."""
+        GameLogger.initialize(max_byte=0, intervallo_rotazione_s=0.05)
+        logger = logging.getLogger("tombola_stark.game")
+        logger.info("Prima della rotazione")
+        time.sleep(0.1)
+        logger.info("Dopo la rotazione")
+        GameLogger.shutdown()
+
+        self.assertIn("Prima della rotazione", (self.log_dir / "tombola_stark.log.1").read_text(encoding="utf-8"))
+        self.assertIn("Dopo la rotazione", self.log_file.read_text(encoding="utf-8"))
+
+
+    def test_indice_sessioni(self) -> None:
+        """Test that each session start offset points to its SESSIONE AVVIATA line."""
+        for sessione in range(3):
+            GameLogger.initialize()
+            logging.getLogger("tombola_stark.game").info("Sessione %d", sessione)
+            GameLogger.shutdown()
+            self._reset_logger_state()
+
+        voci = indice_sessioni(self.log_file)
+
+        self.assertEqual(len(voci), 3)
+        with open(self.log_file, "rb") as file:
+            for offset, _timestamp in voci:
+                file.seek(offset)
+                self.assertIn(b"SESSIONE AVVIATA:", file.readline())
+        self.assertIn("Sessione 1", "\n".join(leggi_sessione(1, self.log_file)))
+        self.assertNotIn("Sessione 2", "\n".join(leggi_sessione(1, self.log_file)))
+        self.assertIn("Sessione 2", "\n".join(leggi_sessione(-1, self.log_file)))
+
+
+    def test_indice_sessioni_ricostruito(self) -> None:
+        """Test that a missing index is rebuilt by scanning the segment."""
+        GameLogger.initialize(bufferizzato=True)
+        GameLogger.shutdown()
+        atteso = indice_sessioni(self.log_file)
+        Path(f"{self.log_file}.idx").unlink()
+
+        self.assertEqual(indice_sessioni(self.log_file), atteso)
+        self.assertTrue(Path(f"{self.log_file}.idx").exists())
+
+
+    def test_shutdown_scrive_rapporto_latenze(self) -> None:
+        """Test that shutdown() dumps the latency report when instrumentation is on."""
+        latenze.azzera()
+        latenze.attiva()
+        self.addCleanup(latenze.azzera)
+        self.addCleanup(latenze.attiva, False)
+        GameLogger.initialize()
+        latenze.registra(latenze.SPAN_ESTRAZIONE, 5_000)
+
+        GameLogger.shutdown()
+
+        log_content = self.log_file.read_text(encoding="utf-8")
+        self.assertIn("[LAT] estrazione", log_content)
+        self.assertIn("p99=", log_content)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -10,6 +10,9 @@ i premi disponibili sulle proprie cartelle e di costruire il reclamo appropriato
 import unittest
 from bingo_game.players import GiocatoreAutomatico
 from bingo_game.cartella import Cartella
+from bingo_game.cartella_compatta import CartellaCompatta
+from bingo_game.game_controller import crea_partita_standard
+from bingo_game.players.giocatore_automatico import _RANGO_PREMIO
 from bingo_game.events.eventi_partita import ReclamoVittoria
 
 
@@ -293,5 +296,156 @@ class TestGiocatoreAutomaticoBotAttivo(unittest.TestCase):
         assert reclamo.indice_riga == 0
 
 
+    def test_bot_aggiorna_reclamo_tra_valutazioni(self):
+        """
+        Test: Il reclamo segue le segnazioni fatte tra una valutazione e l'altra.
+
+        Scenario:
+        - Bot con due cartelle, valutato prima di ogni nuova segnazione
+        - Prima un ambo sulla cartella 2, poi un terno sulla cartella 1,
+          poi la cartella 2 viene azzerata e ne viene aggiunta una terza
+
+        Atteso:
+        - Ogni valutazione riflette lo stato corrente delle cartelle
+        """
+        bot = GiocatoreAutomatico("TestBot")
+        prima = Cartella()
+        seconda = Cartella()
+        bot.aggiungi_cartella(prima)
+        bot.aggiungi_cartella(seconda)
+        assert bot._valuta_potenziale_reclamo(set()) is None
+
+        for num in [n for n in seconda.cartella[1] if n is not None][:2]:
+            seconda.segna_numero(num)
+        reclamo = bot._valuta_potenziale_reclamo(set())
+        assert (reclamo.tipo, reclamo.indice_cartella, reclamo.indice_riga) == ("ambo", seconda.indice, 1)
+
+        for num in [n for n in prima.cartella[2] if n is not None][:3]:
+            prima.segna_numero(num)
+        reclamo = bot._valuta_potenziale_reclamo(set())
+        assert (reclamo.tipo, reclamo.indice_cartella, reclamo.indice_riga) == ("terno", prima.indice, 2)
+
+        # Con il terno chiuso resta l'ambo della seconda cartella.
+        reclamo = bot._valuta_potenziale_reclamo(set(), {"terno"})
+        assert (reclamo.tipo, reclamo.indice_cartella) == ("ambo", seconda.indice)
+
+        seconda.reset_cartella()
+        reclamo = bot._valuta_potenziale_reclamo(set(), {"terno"})
+        assert reclamo is None
+
+        nuova = Cartella()
+        for num in [n for n in nuova.cartella[0] if n is not None]:
+            nuova.segna_numero(num)
+        bot.aggiungi_cartella(nuova)
+        reclamo = bot._valuta_potenziale_reclamo(set())
+        assert (reclamo.tipo, reclamo.indice_cartella, reclamo.indice_riga) == ("cinquina", nuova.indice, 0)
+
+
+    def test_bot_pari_rango_sceglie_prima_cartella_libera(self):
+        """
+        Test: A parità di rango vince la prima cartella (e riga) non assegnata.
+
+        Scenario:
+        - Bot con due cartelle, entrambe con ambo sulla riga 0
+        - L'ambo della prima cartella è già assegnato
+
+        Atteso:
+        - Il bot reclama l'ambo della seconda cartella
+        """
+        bot = GiocatoreAutomatico("TestBot")
+        cartelle = [Cartella(), Cartella()]
+        for cartella in cartelle:
+            bot.aggiungi_cartella(cartella)
+            for num in [n for n in cartella.cartella[0] if n is not None][:2]:
+                cartella.segna_numero(num)
+
+        reclamo = bot._valuta_potenziale_reclamo(set())
+        assert reclamo.indice_cartella == cartelle[0].indice
+
+        premi_assegnati = {f"cartella_{cartelle[0].indice}_riga_0_ambo"}
+        reclamo = bot._valuta_potenziale_reclamo(premi_assegnati)
+        assert (reclamo.tipo, reclamo.indice_cartella) == ("ambo", cartelle[1].indice)
+
+
+    def test_bot_cartella_compatta_segue_le_segnazioni(self):
+        """
+        Test: Le segnazioni su una CartellaCompatta aggiornano i candidati.
+
+        Scenario:
+        - Bot con una CartellaCompatta, ambo sulla riga 2, poi reset
+
+        Atteso:
+        - Prima l'ambo sulla riga 2, dopo il reset nessun reclamo
+        """
+        bot = GiocatoreAutomatico("TestBot")
+        cartella = CartellaCompatta()
+        bot.aggiungi_cartella(cartella)
+        assert bot._valuta_potenziale_reclamo(set()) is None
+
+        for num in [n for n in cartella.cartella[2] if n is not None][:2]:
+            cartella.segna_numero(num)
+        reclamo = bot._valuta_potenziale_reclamo(set())
+        assert (reclamo.tipo, reclamo.indice_riga) == ("ambo", 2)
+
+        cartella.reset_cartella()
+        assert bot._valuta_potenziale_reclamo(set()) is None
+
+
+    def test_bot_aggiornato_dal_percorso_di_segnazione_della_partita(self):
+        """
+        Test: In partita i candidati seguono le notifiche di Partita.
+
+        Scenario:
+        - Partita con tre bot, una serie di turni completi
+        - Dopo ogni estrazione il reclamo del bot viene confrontato con il
+          premio più alto letto dal tracciatore della partita
+
+        Atteso:
+        - Nessuna cartella da ricalcolare dopo la prima valutazione
+        - Il reclamo coincide con quello atteso
+        - I candidati dei tipi chiusi vengono scartati
+        """
+        partita = crea_partita_standard(num_bot=3, seme=11)
+        partita.avvia_partita()
+        bot = next(g for g in partita.get_giocatori() if g.is_automatico())
+        bot._valuta_potenziale_reclamo(set())
+        tracciatore = partita.tracciatore_premi
+
+        for _ in range(40):
+            partita.esegui_fase_estrazione()
+            assert not bot._cartelle_da_sincronizzare
+            chiusi = set(partita.premi_tipo_chiusi)
+            atteso = None
+            for tipo in ("tombola", "cinquina", "quaterna", "terno", "ambo"):
+                if tipo in chiusi:
+                    continue
+                for cartella in bot.get_cartelle():
+                    if tipo == "tombola":
+                        if tracciatore.ha_tombola(cartella):
+                            atteso = (tipo, cartella.indice, None)
+                            break
+                        continue
+                    righe = [r for r in range(3) if tracciatore.premio_massimo_riga(cartella, r) == tipo]
+                    if righe:
+                        atteso = (tipo, cartella.indice, righe[0])
+                        break
+                if atteso is not None:
+                    break
+            reclamo = bot._valuta_potenziale_reclamo(partita.premi_gia_assegnati, chiusi)
+            ottenuto = None if reclamo is None else (reclamo.tipo, reclamo.indice_cartella, reclamo.indice_riga)
+            assert ottenuto == atteso
+
+            for giocatore in partita.get_giocatori():
+                if giocatore.is_automatico():
+                    giocatore.dichiara_fine_fase_azione(partita.premi_gia_assegnati, chiusi)
+            partita.esegui_fase_verifica()
+            for tipo in partita.premi_tipo_chiusi:
+                assert not bot._ordini_per_rango[_RANGO_PREMIO[tipo]]
+            if partita.is_terminata():
+                break
+
+        assert partita.premi_tipo_chiusi
+
+
 if __name__ == "__main__":
     unittest.main()
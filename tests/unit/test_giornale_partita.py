@@ -0,0 +1,184 @@
+"""
+Test unitari per bingo_game/giornale_partita.py.
+
+Verificano che una partita collegata a un GiornalePartita registri estrazioni,
+segnazioni, reclami, premi, fasi e fine partita, che più partite (anche da
+sessioni diverse) si accodino allo stesso file rileggendo solo la coda dopo
+l'ultimo segnalibro, e che il lettore in streaming gestisca blocchi piccoli,
+record sconosciuti, coda troncata e file non validi.
+"""
+
+import os
+import tempfile
+import unittest
+
+from bingo_game.exceptions import GiornalePartitaFormatoException, GiornalePartitaSemeException
+from bingo_game.game_controller import crea_partita_standard
+from bingo_game.formato_binario import DIMENSIONE_INTESTAZIONE
+from bingo_game.giornale_partita import (
+    PREMI,
+    SEME_MASSIMO,
+    GiornalePartita,
+    leggi_giornale,
+    partite_dal_giornale,
+)
+
+
+def _gioca_partita(partita):
+    partita.avvia_partita()
+    while not partita.is_terminata():
+        partita.esegui_fase_estrazione()
+        for giocatore in partita.get_giocatori():
+            if giocatore.is_automatico():
+                giocatore.dichiara_fine_fase_azione(
+                    set(partita.premi_gia_assegnati), set(partita.premi_tipo_chiusi)
+                )
+        partita.esegui_fase_verifica()
+
+
+class TestGiornalePartita(unittest.TestCase):
+
+    def setUp(self) -> None:
+        cartella = tempfile.TemporaryDirectory()
+        self.addCleanup(cartella.cleanup)
+        self.percorso = os.path.join(cartella.name, "partite.tsgp")
+
+    def _registra_partita(self, seme):
+        partita = crea_partita_standard(num_bot=4, seme=seme)
+        with GiornalePartita(self.percorso) as giornale:
+            partita.collega_giornale(giornale)
+            _gioca_partita(partita)
+        return partita
+
+    def test_partita_completa_registrata(self) -> None:
+        partita = self._registra_partita(seme=11)
+
+        record = list(leggi_giornale(self.percorso))
+
+        inizio = record[0].come_dizionario()
+        self.assertEqual(record[0].tipo, "inizio_partita")
+        self.assertEqual(inizio["seme"], 11)
+        self.assertEqual(inizio["numero_giocatori"], 5)
+
+        estratti = [r.come_dizionario()["numero"] for r in record if r.tipo == "estrazione"]
+        self.assertEqual(estratti, partita.tabellone.storico_estrazioni)
+
+        premi = [r.come_dizionario() for r in record if r.tipo == "premio"]
+        self.assertEqual(
+            [(PREMI[p["premio"]], p["cartella"]) for p in premi],
+            [(evento["premio"], evento["cartella"]) for evento in partita.storico_premi],
+        )
+
+        fine = record[-1].come_dizionario()
+        self.assertEqual(record[-1].tipo, "fine_partita")
+        self.assertEqual(fine["turni"], len(estratti))
+        self.assertEqual(fine["tombola"], 1)
+
+    def test_reclami_e_fasi(self) -> None:
+        self._registra_partita(seme=3)
+
+        record = list(leggi_giornale(self.percorso))
+        reclami = [r.come_dizionario() for r in record if r.tipo == "reclamo"]
+        fasi = [r.come_dizionario()["fase"] for r in record if r.tipo == "fase"]
+
+        self.assertTrue(reclami)
+        self.assertTrue(all(r["successo"] in (0, 1) for r in reclami))
+        # ogni turno apre la fase di reclamo; tutti tranne l'ultimo tornano all'estrazione
+        turni = sum(1 for r in record if r.tipo == "estrazione")
+        self.assertEqual(fasi.count(1), turni)
+        self.assertEqual(fasi.count(0), turni - 1)
+
+    def test_partite_accodate_tra_sessioni(self) -> None:
+        self._registra_partita(seme=1)
+        self._registra_partita(seme=2)
+
+        partite = list(partite_dal_giornale(self.percorso))
+
+        self.assertEqual(len(partite), 2)
+        self.assertEqual([p[0].come_dizionario()["seme"] for p in partite], [1, 2])
+        self.assertTrue(all(p[-1].tipo == "fine_partita" for p in partite))
+
+    def test_blocchi_piccoli_stesso_risultato(self) -> None:
+        self._registra_partita(seme=5)
+
+        self.assertEqual(
+            list(leggi_giornale(self.percorso, dimensione_blocco=7)),
+            list(leggi_giornale(self.percorso)),
+        )
+
+    def test_record_sconosciuto_saltato_e_coda_troncata_ignorata(self) -> None:
+        self._registra_partita(seme=7)
+        attesi = list(leggi_giornale(self.percorso))
+        with open(self.percorso, "ab") as file:
+            file.write(bytes((200, 3, 1, 2, 3)))   # tipo futuro, 3 byte di contenuto
+            file.write(bytes((2, 2, 5)))           # estrazione troncata
+
+        self.assertEqual(list(leggi_giornale(self.percorso)), attesi)
+
+    def test_coda_troncata_rimossa_alla_riapertura(self) -> None:
+        self._registra_partita(seme=7)
+        with open(self.percorso, "ab") as file:
+            file.write(bytes((2, 2, 5)))           # estrazione troncata
+        self._registra_partita(seme=8)
+
+        partite = list(partite_dal_giornale(self.percorso))
+        self.assertEqual([p[0].come_dizionario()["seme"] for p in partite], [7, 8])
+        self.assertTrue(all(p[-1].tipo == "fine_partita" for p in partite))
+
+    def test_id_partita_proseguono_tra_sessioni(self) -> None:
+        for seme in (1, 2, 3):
+            self._registra_partita(seme=seme)
+
+        id_partite = [p[0].come_dizionario()["id_partita"] for p in partite_dal_giornale(self.percorso)]
+        self.assertEqual(id_partite, [0, 1, 2])
+
+    def test_riapertura_legge_solo_la_coda(self) -> None:
+        self._registra_partita(seme=1)
+        self._registra_partita(seme=2)
+        # Una lunghezza errata nel primo record renderebbe il file illeggibile
+        # da capo: la riapertura riparte dall'ultimo segnalibro e non lo vede.
+        with open(self.percorso, "r+b") as file:
+            file.seek(DIMENSIONE_INTESTAZIONE + 1)
+            file.write(bytes((3,)))
+
+        with GiornalePartita(self.percorso) as giornale:
+            partita = crea_partita_standard(num_bot=1, seme=3)
+            self.assertEqual(giornale.inizia_partita(partita), 2)
+
+    def test_coda_senza_segnalibro_riletta_dopo_interruzione(self) -> None:
+        self._registra_partita(seme=1)
+        # Processo interrotto: record scritti dopo l'ultimo segnalibro e uno troncato.
+        giornale = GiornalePartita(self.percorso)
+        giornale.inizia_partita(crea_partita_standard(num_bot=1, seme=2))
+        giornale._file.write(giornale._buffer)
+        giornale._file.write(bytes((2, 2, 5)))
+        giornale._file.close()
+
+        with GiornalePartita(self.percorso) as giornale:
+            self.assertEqual(giornale.inizia_partita(crea_partita_standard(num_bot=1, seme=3)), 2)
+        semi = [p[0].come_dizionario()["seme"] for p in partite_dal_giornale(self.percorso)]
+        self.assertEqual(semi, [1, 2, 3])
+
+    def test_seme_fuori_range(self) -> None:
+        self._registra_partita(seme=SEME_MASSIMO)
+        with GiornalePartita(self.percorso) as giornale:
+            for seme in (SEME_MASSIMO + 1, -5):
+                partita = crea_partita_standard(num_bot=1, seme=seme)
+                with self.assertRaises(GiornalePartitaSemeException):
+                    giornale.inizia_partita(partita)
+
+        partite = list(partite_dal_giornale(self.percorso))
+        self.assertEqual([p[0].come_dizionario()["seme"] for p in partite], [SEME_MASSIMO])
+
+    def test_file_non_valido(self) -> None:
+        with open(self.percorso, "wb") as file:
+            file.write(b"NONVALIDO")
+
+        with self.assertRaises(GiornalePartitaFormatoException):
+            list(leggi_giornale(self.percorso))
+        with self.assertRaises(GiornalePartitaFormatoException):
+            GiornalePartita(self.percorso)
+
+
+if __name__ == "__main__":
+    unittest.main()
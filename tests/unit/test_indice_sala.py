@@ -0,0 +1,106 @@
+"""
+Test unitari per bingo_game.indice_sala.IndiceSala.
+
+Verificano la segnazione a blocchi (anche su CartellaCompatta), le notifiche
+dei premi raggiunti (immediate o accodate per GiocatoreAutomatico), la
+lettura dei contatori usata nella verifica dei reclami e l'indice obsoleto
+dopo una segnazione esterna.
+"""
+
+import unittest
+
+from bingo_game.cartella import Cartella
+from bingo_game.cartella_compatta import CartellaCompatta
+from bingo_game.indice_sala import IndiceSala
+from bingo_game.players import GiocatoreAutomatico
+from bingo_game.players.giocatore_base import GiocatoreBase
+from bingo_game.tracciatore_premi import TracciatorePremi
+
+
+class _GiocatoreRegistratore(GiocatoreBase):
+    """Giocatore senza coda: riceve le notifiche durante segna()."""
+
+    def __init__(self) -> None:
+        super().__init__("Registratore")
+        self.eventi = []
+
+    def _notifica_premio_raggiunto(self, cartella, tipo, indice_riga) -> None:
+        self.eventi.append((tipo, indice_riga))
+
+
+class TestIndiceSala(unittest.TestCase):
+
+    def test_segna_notifica_i_premi_e_la_tombola(self) -> None:
+        for cartella in (Cartella(), CartellaCompatta()):
+            giocatore = _GiocatoreRegistratore()
+            indice = IndiceSala()
+            indice.aggiungi_cartella(giocatore, cartella)
+            numeri = cartella.get_numeri_cartella()
+            for numero in numeri:
+                self.assertEqual(indice.segna(numero, set()), numero == numeri[-1])
+                self.assertEqual(indice.cartelle_con_numero(numero), [cartella])
+            # Una seconda segnazione dello stesso numero non produce nulla.
+            self.assertIsNone(indice.segna(numeri[0], set()))
+
+            self.assertEqual(cartella.conta_numeri_segnati(), 15)
+            self.assertEqual(giocatore.eventi.count(("cinquina", 1)), 1)
+            self.assertEqual(giocatore.eventi[-1], ("tombola", None))
+            self.assertEqual(len(giocatore.eventi), 13)
+
+    def test_tipi_chiusi_non_notificati(self) -> None:
+        giocatore = _GiocatoreRegistratore()
+        cartella = Cartella()
+        indice = IndiceSala()
+        indice.aggiungi_cartella(giocatore, cartella)
+        for numero in cartella.get_numeri_riga(0)[:3]:
+            indice.segna(numero, {"ambo", "terno"})
+        self.assertEqual(giocatore.eventi, [])
+        indice.segna(cartella.get_numeri_riga(0)[3], {"ambo", "terno"})
+        self.assertEqual(giocatore.eventi, [("quaterna", 0)])
+
+    def test_coda_del_bot_consegnata_alla_valutazione(self) -> None:
+        bot = GiocatoreAutomatico("Bot", id_giocatore=1)
+        cartella = Cartella(indice=4)
+        bot.aggiungi_cartella(cartella)
+        bot._valuta_potenziale_reclamo(set())
+        indice = IndiceSala()
+        indice.aggiungi_cartella(bot, cartella)
+
+        for numero in cartella.get_numeri_riga(2)[:3]:
+            indice.segna(numero, set())
+        self.assertEqual(bot._premi_in_coda, [2, 2])
+
+        reclamo = bot._valuta_potenziale_reclamo(set())
+        self.assertEqual((reclamo.tipo, reclamo.indice_cartella, reclamo.indice_riga), ("terno", 4, 2))
+        self.assertEqual(bot._premi_in_coda, [])
+
+    def test_contatori_equivalenti_al_tracciatore(self) -> None:
+        cartella = Cartella()
+        indice = IndiceSala()
+        indice.aggiungi_cartella(_GiocatoreRegistratore(), cartella)
+        tracciatore = TracciatorePremi()
+        numeri = cartella.get_numeri_cartella()
+        for numero in numeri:
+            indice.segna(numero, set())
+            for indice_riga in range(3):
+                self.assertEqual(
+                    indice.premio_massimo_riga(cartella, indice_riga),
+                    tracciatore.premio_massimo_riga(cartella, indice_riga),
+                )
+            self.assertEqual(indice.ha_tombola(cartella), tracciatore.ha_tombola(cartella))
+        self.assertTrue(indice.contiene(cartella))
+        self.assertFalse(indice.contiene(Cartella()))
+
+    def test_segnazione_esterna_rende_obsoleto_l_indice(self) -> None:
+        cartella = Cartella()
+        indice = IndiceSala()
+        indice.aggiungi_cartella(_GiocatoreRegistratore(), cartella)
+        self.assertFalse(indice.obsoleto)
+        cartella.segna_numero(cartella.get_numeri_cartella()[0])
+        self.assertTrue(indice.obsoleto)
+        indice.scollega()
+        self.assertNotIn(indice, cartella._osservatori_segnazioni)
+
+
+if __name__ == "__main__":
+    unittest.main()
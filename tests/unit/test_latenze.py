@@ -0,0 +1,112 @@
+"""
+Test unitari per bingo_game/latenze.py.
+
+Verificano l'accuratezza dei percentili dell'istogramma, che la
+strumentazione spenta non registri nulla, che una partita strumentata
+misuri gli span del ciclo di turno, l'esportazione del rapporto e che il
+dominio strumentato non carichi il package di logging.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from bingo_game.game_controller import crea_partita_standard
+from bingo_game import latenze
+
+
+class TestIstogramma(unittest.TestCase):
+
+    def test_percentili_entro_errore_bucket(self) -> None:
+        istogramma = latenze.Istogramma()
+        for durata in range(1, 100_001):
+            istogramma.registra(durata * 1_000)
+
+        for percentuale in (50, 95, 99):
+            esatto = percentuale * 1_000 * 1_000
+            stimato = istogramma.percentile(percentuale)
+            self.assertGreaterEqual(stimato, esatto)
+            self.assertLessEqual(stimato, esatto * 1.125)
+
+    def test_valori_piccoli_esatti_e_massimo(self) -> None:
+        istogramma = latenze.Istogramma()
+        for durata in (3, 3, 3, 7):
+            istogramma.registra(durata)
+
+        self.assertEqual(istogramma.percentile(50), 4)
+        self.assertEqual(istogramma.percentile(100), 7)
+        self.assertEqual(latenze.Istogramma().percentile(99), 0)
+
+
+class TestStrumentazione(unittest.TestCase):
+
+    def setUp(self) -> None:
+        latenze.azzera()
+        self.addCleanup(latenze.azzera)
+        self.addCleanup(latenze.attiva, False)
+
+    def test_spenta_non_registra(self) -> None:
+        latenze.attiva(False)
+
+        t0 = latenze.inizio()
+        latenze.fine(latenze.SPAN_ESTRAZIONE, t0)
+
+        self.assertIsNone(t0)
+        self.assertEqual(latenze.rapporto(), {})
+        self.assertEqual(latenze.righe_rapporto(), [])
+
+    def test_partita_strumentata(self) -> None:
+        latenze.attiva()
+        partita = crea_partita_standard(num_bot=3, seme=4)
+        partita.avvia_partita()
+        for _ in range(10):
+            partita.esegui_fase_estrazione()
+            for giocatore in partita.get_giocatori():
+                if giocatore.is_automatico():
+                    giocatore.dichiara_fine_fase_azione(
+                        set(partita.premi_gia_assegnati), set(partita.premi_tipo_chiusi)
+                    )
+            partita.esegui_fase_verifica()
+
+        rapporto = latenze.rapporto()
+
+        self.assertEqual(rapporto[latenze.SPAN_ESTRAZIONE]["numero"], 10)
+        self.assertEqual(rapporto[latenze.SPAN_PROPAGAZIONE]["numero"], 10)
+        self.assertEqual(rapporto[latenze.SPAN_VERIFICA_PREMI]["numero"], 10)
+        self.assertEqual(rapporto[latenze.SPAN_EVENTI]["numero"], 10)
+        self.assertEqual(rapporto[latenze.SPAN_VALUTAZIONE_BOT]["numero"], 30)
+        voce = rapporto[latenze.SPAN_PROPAGAZIONE]
+        self.assertLessEqual(voce["p50_ms"], voce["p95_ms"])
+        self.assertLessEqual(voce["p99_ms"], voce["max_ms"])
+
+    def test_esporta_rapporto(self) -> None:
+        latenze.attiva()
+        latenze.registra(latenze.SPAN_RENDER, 2_000_000)
+        cartella = tempfile.TemporaryDirectory()
+        self.addCleanup(cartella.cleanup)
+        percorso = os.path.join(cartella.name, "latenze.json")
+
+        latenze.esporta_rapporto(percorso)
+
+        with open(percorso, encoding="utf-8") as file:
+            dati = json.load(file)
+        self.assertEqual(dati[latenze.SPAN_RENDER]["numero"], 1)
+        self.assertAlmostEqual(dati[latenze.SPAN_RENDER]["max_ms"], 2.0)
+
+    def test_dominio_non_importa_il_logging(self) -> None:
+        codice = (
+            "import sys, bingo_game.partita, bingo_game.players.giocatore_automatico;"
+            "print(any(m.startswith('bingo_game.logging') for m in sys.modules))"
+        )
+        esito = subprocess.run(
+            [sys.executable, "-c", codice], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+        )
+        self.assertEqual(esito.stdout.strip(), "False")
+
+
+if __name__ == "__main__":
+    unittest.main()
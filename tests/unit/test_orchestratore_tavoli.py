@@ -0,0 +1,177 @@
+"""
+Test unitari per bingo_game/orchestratore_tavoli.py.
+
+Verificano che l'orchestratore porti a termine molte partite sullo stesso
+event loop, che la finestra d'azione si chiuda in anticipo quando tutti i
+bot hanno dichiarato e alla scadenza quando manca l'umano, che la
+dichiarazione dell'umano chiuda la finestra e che l'errore di un tavolo
+non fermi gli altri.
+"""
+
+import asyncio
+import time
+import unittest
+
+from bingo_game.exceptions import PartitaGiocoException
+from bingo_game.game_controller import crea_giocatori_automatici, crea_partita_standard
+from bingo_game.orchestratore_tavoli import OrchestratoreTavoli, esegui_tavoli
+from bingo_game.partita import Partita
+from bingo_game.players.giocatore_umano import GiocatoreUmano
+from bingo_game.tabellone import Tabellone
+
+
+def _partita_bot(num_bot: int = 3) -> Partita:
+    return Partita(Tabellone(), crea_giocatori_automatici(num_bot=num_bot))
+
+
+class TestOrchestratoreTavoli(unittest.TestCase):
+
+    def test_molti_tavoli_terminano(self) -> None:
+        partite = [_partita_bot() for _ in range(40)]
+        turni_notificati = []
+
+        tavoli = esegui_tavoli(
+            partite,
+            durata_finestra_s=0.01,
+            durata_pausa_s=0.0,
+            ritardo_bot_min_s=0.0,
+            seme=7,
+            al_turno=lambda tavolo, estrazione, verifica: turni_notificati.append(tavolo.id_tavolo),
+        )
+
+        for tavolo in tavoli:
+            self.assertIsNone(tavolo.errore)
+            self.assertTrue(tavolo.is_terminato())
+            self.assertTrue(tavolo.partita.is_terminata())
+            self.assertEqual(tavolo.turni, tavolo.partita.tabellone.get_conteggio_estratti())
+        self.assertEqual(len(turni_notificati), sum(t.turni for t in tavoli))
+
+    def test_finestra_chiusa_in_anticipo_se_tutti_pronti(self) -> None:
+        inizio = time.monotonic()
+
+        tavoli = esegui_tavoli(
+            [_partita_bot()], durata_finestra_s=30.0, durata_pausa_s=0.0,
+            ritardo_bot_min_s=0.0, quota_ritardo_bot=0.0,
+        )
+
+        self.assertTrue(tavoli[0].partita.is_terminata())
+        self.assertLess(time.monotonic() - inizio, 10.0)
+
+    def test_umano_assente_finestra_scade(self) -> None:
+        partita = crea_partita_standard(num_bot=2, seme=3)
+
+        tavoli = esegui_tavoli(
+            [partita], durata_finestra_s=0.005, durata_pausa_s=0.0, ritardo_bot_min_s=0.0,
+        )
+
+        self.assertTrue(tavoli[0].partita.is_terminata())
+        self.assertGreater(tavoli[0].turni, 0)
+
+    def test_dichiarazione_umano_chiude_la_finestra(self) -> None:
+        partita = crea_partita_standard(num_bot=2, seme=4)
+        umano = next(g for g in partita.get_giocatori() if isinstance(g, GiocatoreUmano))
+
+        async def dichiara_umano(tavolo, estrazione, verifica):
+            if tavolo.turni >= 3:
+                orchestratore.ferma()
+
+        orchestratore = OrchestratoreTavoli(
+            durata_finestra_s=30.0, durata_pausa_s=0.0, ritardo_bot_min_s=0.0,
+            quota_ritardo_bot=0.0, al_turno=dichiara_umano,
+        )
+        tavolo = orchestratore.aggiungi_tavolo(partita)
+
+        async def umano_risponde():
+            while True:
+                await asyncio.sleep(0.001)
+                if tavolo.fase == "attesa_reclami" and not umano.turno_dichiarato_concluso:
+                    umano.dichiara_fine_turno()
+                    tavolo.notifica_dichiarazione()
+
+        async def principale():
+            risposta = asyncio.create_task(umano_risponde())
+            try:
+                await orchestratore.esegui()
+            except asyncio.CancelledError:
+                pass
+            finally:
+                risposta.cancel()
+
+        inizio = time.monotonic()
+        asyncio.run(principale())
+
+        self.assertGreaterEqual(tavolo.turni, 3)
+        self.assertLess(time.monotonic() - inizio, 10.0)
+
+    def test_errore_di_un_tavolo_non_ferma_gli_altri(self) -> None:
+        rotta = _partita_bot()
+
+        def estrazione_rotta():
+            raise PartitaGiocoException("fase non valida")
+
+        rotta.esegui_fase_estrazione = estrazione_rotta
+        sana = _partita_bot()
+
+        tavoli = esegui_tavoli(
+            [rotta, sana], durata_finestra_s=0.01, durata_pausa_s=0.0, ritardo_bot_min_s=0.0,
+        )
+
+        self.assertIsInstance(tavoli[0].errore, PartitaGiocoException)
+        self.assertTrue(tavoli[0].is_terminato())
+        self.assertIsNone(tavoli[1].errore)
+        self.assertTrue(tavoli[1].partita.is_terminata())
+
+    def test_errori_qualsiasi_salvati_nel_tavolo(self) -> None:
+        callback_rotto = _partita_bot()
+        bot_rotto = _partita_bot()
+        sana = _partita_bot()
+        bot = next(g for g in bot_rotto.get_giocatori() if g.is_automatico())
+
+        def dichiarazione_rotta(*_argomenti):
+            raise KeyError("stato del bot corrotto")
+
+        bot.dichiara_fine_fase_azione = dichiarazione_rotta
+
+        def al_turno(tavolo, _estrazione, _verifica):
+            if tavolo.partita is callback_rotto:
+                raise ValueError("callback rotto")
+
+        tavoli = esegui_tavoli(
+            [callback_rotto, bot_rotto, sana], durata_finestra_s=0.01, durata_pausa_s=0.0,
+            ritardo_bot_min_s=0.0, al_turno=al_turno,
+        )
+
+        self.assertIsInstance(tavoli[0].errore, ValueError)
+        self.assertIsInstance(tavoli[1].errore, KeyError)
+        self.assertTrue(all(t.is_terminato() for t in tavoli))
+        self.assertIsNone(tavoli[2].errore)
+        self.assertTrue(tavoli[2].partita.is_terminata())
+
+    def test_ferma_cancella_esegui(self) -> None:
+        orchestratore = OrchestratoreTavoli(durata_finestra_s=60.0, ritardo_bot_min_s=30.0)
+        orchestratore.aggiungi_tavolo(_partita_bot())
+
+        async def principale():
+            esecuzione = asyncio.create_task(orchestratore.esegui())
+            await asyncio.sleep(0.01)
+            orchestratore.ferma()
+            await esecuzione
+
+        with self.assertRaises(asyncio.CancelledError):
+            asyncio.run(principale())
+
+    def test_jitter_registrato(self) -> None:
+        orchestratore = OrchestratoreTavoli(
+            durata_finestra_s=0.002, durata_pausa_s=0.001, ritardo_bot_min_s=0.0,
+        )
+        for _ in range(5):
+            orchestratore.aggiungi_tavolo(_partita_bot(num_bot=2))
+
+        tavoli = asyncio.run(orchestratore.esegui())
+
+        self.assertTrue(all(t.errore is None for t in tavoli))
+        self.assertGreater(orchestratore.jitter.numero, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+"""
+Test unitari per l'indice invertito numero -> cartelle di Partita.
+
+Verificano che la propagazione di un numero estratto tocchi solo le cartelle
+che lo contengono, escluda i giocatori umani e si riallinei al roster.
+"""
+
+import unittest
+
+from bingo_game.cartella import Cartella
+from bingo_game.exceptions import (
+    GiocatoreNumeroTypeException,
+    GiocatoreNumeroValueException,
+)
+from bingo_game.partita import Partita
+from bingo_game.players import GiocatoreAutomatico, GiocatoreBase, GiocatoreUmano
+from bingo_game.tabellone import Tabellone
+
+
+class TestPartitaIndiceNumeri(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.bot = GiocatoreAutomatico("Bot", id_giocatore=1)
+        self.bot.aggiungi_cartella(Cartella())
+        self.bot.aggiungi_cartella(Cartella())
+        self.umano = GiocatoreUmano("Umano", id_giocatore=2)
+        self.umano.aggiungi_cartella(Cartella())
+        self.partita = Partita(Tabellone(), [self.bot, self.umano])
+        self.partita.avvia_partita()
+
+    def test_indice_coerente_con_griglie(self) -> None:
+        for numero in range(1, 91):
+            for giocatore, cartella, riga, colonna in self.partita.get_posizioni_numero(numero):
+                self.assertIs(giocatore, self.bot)
+                self.assertEqual(cartella.cartella[riga][colonna], numero)
+        totale = sum(len(self.partita.get_posizioni_numero(n)) for n in range(1, 91))
+        self.assertEqual(totale, 30)
+
+    def test_propagazione_segna_solo_cartelle_colpite(self) -> None:
+        cartella_a, cartella_b = self.bot.get_cartelle()
+        numero = next(n for n in cartella_a.numeri_cartella if n not in cartella_b.numeri_cartella)
+
+        self.partita.aggiorna_giocatori_con_numero(numero)
+
+        self.assertTrue(cartella_a.is_numero_segnato(numero))
+        self.assertEqual(cartella_b.conta_numeri_segnati(), 0)
+        self.assertEqual(self.partita.get_cartelle_modificate_turno(), [cartella_a])
+
+    def test_umano_escluso_dalla_propagazione(self) -> None:
+        cartella_umano = self.umano.get_cartelle()[0]
+        numero = next(iter(cartella_umano.numeri_cartella))
+
+        self.partita.aggiorna_giocatori_con_numero(numero)
+
+        self.assertFalse(cartella_umano.is_numero_segnato(numero))
+
+    def test_numero_assente_non_modifica_nulla(self) -> None:
+        presenti = set()
+        for cartella in self.bot.get_cartelle():
+            presenti |= cartella.numeri_cartella
+        assente = next(n for n in range(1, 91) if n not in presenti)
+
+        self.partita.aggiorna_giocatori_con_numero(assente)
+
+        self.assertEqual(self.partita.get_cartelle_modificate_turno(), [])
+
+    def test_validazione_numero(self) -> None:
+        with self.assertRaises(GiocatoreNumeroTypeException):
+            self.partita.aggiorna_giocatori_con_numero("5")
+        with self.assertRaises(GiocatoreNumeroValueException):
+            self.partita.aggiorna_giocatori_con_numero(0)
+
+    def test_indice_ricostruito_se_cambiano_le_cartelle(self) -> None:
+        nuova = Cartella()
+        self.bot.aggiungi_cartella(nuova)
+        numero = next(iter(nuova.numeri_cartella))
+
+        self.partita.aggiorna_giocatori_con_numero(numero)
+
+        self.assertTrue(nuova.is_numero_segnato(numero))
+
+    def test_indice_non_ricostruito_se_roster_invariato(self) -> None:
+        costruzioni = []
+        originale = self.partita._costruisci_indice_numeri
+
+        def conta_costruzioni() -> None:
+            costruzioni.append(1)
+            originale()
+
+        self.partita._costruisci_indice_numeri = conta_costruzioni
+        for numero in range(1, 11):
+            self.partita.aggiorna_giocatori_con_numero(numero)
+        self.assertEqual(costruzioni, [])
+
+        self.bot.aggiungi_cartella(Cartella())
+        self.partita.aggiorna_giocatori_con_numero(11)
+        self.partita.aggiorna_giocatori_con_numero(12)
+        self.assertEqual(costruzioni, [1])
+
+    def test_equivalenza_con_propagazione_completa(self) -> None:
+        base = GiocatoreBase("Base", id_giocatore=3)
+        base.aggiungi_cartella(Cartella())
+        partita = Partita(Tabellone(), [self.bot, base])
+        partita.avvia_partita()
+        originali = self.bot.get_cartelle() + base.get_cartelle()
+        copie = []
+        for originale in originali:
+            copia = Cartella()
+            copia.cartella = [list(riga) for riga in originale.cartella]
+            copia.numeri_cartella = copia._estrai_numeri_set()
+            copie.append(copia)
+
+        while partita.tabellone.get_numeri_disponibili():
+            numero = partita.estrai_prossimo_numero()
+            for copia in copie:
+                copia.segna_numero(numero)
+            for originale, copia in zip(originali, copie):
+                self.assertEqual(originale.numeri_segnati, copia.numeri_segnati)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+"""
+Test unitari per la modalità sala di Partita.
+
+Verificano limite del roster, indice per id, contatori di turno e che una
+partita in modalità sala produca gli stessi premi, esiti dei reclami e
+tombola di una partita standard con le stesse cartelle e le stesse estrazioni.
+"""
+
+import random
+import unittest
+
+from bingo_game.cartella import Cartella
+from bingo_game.exceptions import (
+    ControllerBotExcessException,
+    PartitaGiocatoreGiaPresenteException,
+    PartitaRosterPienoException,
+)
+from bingo_game.game_controller import crea_giocatori_automatici, crea_partita_standard
+from bingo_game.partita import Partita
+from bingo_game.players import GiocatoreAutomatico, GiocatoreUmano
+from bingo_game.tabellone import Tabellone
+from bingo_game.tabellone_mescolato import TabelloneMescolato
+
+
+def _crea_partita(modalita_sala, griglie, sequenza, cartelle_per_bot=2):
+    partita = Partita(TabelloneMescolato(sequenza=sequenza), modalita_sala=modalita_sala)
+    umano = GiocatoreUmano("Umano", id_giocatore=1)
+    umano.aggiungi_cartella(Cartella(griglia=griglie[0]))
+    partita.aggiungi_giocatore(umano)
+    prossima = 1
+    for indice_bot in range(3):
+        bot = GiocatoreAutomatico(f"Bot {indice_bot + 1}", id_giocatore=indice_bot + 2)
+        for griglia in griglie[prossima:prossima + cartelle_per_bot]:
+            bot.aggiungi_cartella(Cartella(griglia=griglia))
+        prossima += cartelle_per_bot
+        partita.aggiungi_giocatore(bot)
+    partita.avvia_partita()
+    return partita
+
+
+def _gioca_turno(partita):
+    partita.esegui_fase_estrazione()
+    raggiunti = partita.get_premi_raggiunti_turno()
+    for giocatore in partita.get_giocatori():
+        if giocatore.is_automatico():
+            giocatore.dichiara_fine_fase_azione(
+                set(partita.premi_gia_assegnati), set(partita.premi_tipo_chiusi)
+            )
+    risultato = partita.esegui_fase_verifica()
+    esiti = [(esito["id_giocatore"], esito["successo"]) for esito in risultato["reclami_bot"]]
+    return raggiunti, risultato["premi_nuovi"], esiti, risultato["tombola_rilevata"]
+
+
+class TestPartitaModalitaSalaRoster(unittest.TestCase):
+
+    def test_limite_roster_sala(self) -> None:
+        partita = Partita(Tabellone(), modalita_sala=True)
+        for indice in range(50):
+            partita.aggiungi_giocatore(GiocatoreAutomatico(f"Bot {indice}", id_giocatore=indice))
+
+        self.assertEqual(partita.MAX_GIOCATORI, Partita.MAX_GIOCATORI_SALA)
+        self.assertEqual(partita.get_numero_giocatori(), 50)
+        self.assertEqual(Partita(Tabellone()).MAX_GIOCATORI, 8)
+
+    def test_limite_standard_invariato(self) -> None:
+        partita = Partita(Tabellone())
+        for indice in range(Partita.MAX_GIOCATORI):
+            partita.aggiungi_giocatore(GiocatoreAutomatico(f"Bot {indice}", id_giocatore=indice))
+        with self.assertRaises(PartitaRosterPienoException):
+            partita.aggiungi_giocatore(GiocatoreAutomatico("Extra", id_giocatore=99))
+
+    def test_id_duplicato_rifiutato(self) -> None:
+        partita = Partita(Tabellone(), modalita_sala=True)
+        partita.aggiungi_giocatore(GiocatoreAutomatico("Bot A", id_giocatore=7))
+        with self.assertRaises(PartitaGiocatoreGiaPresenteException):
+            partita.aggiungi_giocatore(GiocatoreAutomatico("Bot B", id_giocatore=7))
+
+    def test_get_giocatore_per_id(self) -> None:
+        for modalita_sala in (False, True):
+            bot = GiocatoreAutomatico("Bot", id_giocatore=42)
+            partita = Partita(Tabellone(), [bot], modalita_sala=modalita_sala)
+            self.assertIs(partita.get_giocatore_per_id(42), bot)
+            self.assertIsNone(partita.get_giocatore_per_id(43))
+
+
+class TestPartitaModalitaSalaContatori(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.bot_a = GiocatoreAutomatico("Bot A", id_giocatore=1)
+        self.bot_b = GiocatoreAutomatico("Bot B", id_giocatore=2)
+        for bot in (self.bot_a, self.bot_b):
+            bot.aggiungi_cartella(Cartella())
+        self.partita = Partita(Tabellone(), [self.bot_a, self.bot_b], modalita_sala=True)
+        self.partita.avvia_partita()
+
+    def test_tutti_hanno_dichiarato_fine(self) -> None:
+        self.assertFalse(self.partita.tutti_hanno_dichiarato_fine())
+        self.bot_a.dichiara_fine_turno()
+        self.assertFalse(self.partita.tutti_hanno_dichiarato_fine())
+        self.bot_b.turno_dichiarato_concluso = True
+        self.assertTrue(self.partita.tutti_hanno_dichiarato_fine())
+        self.bot_b.turno_dichiarato_concluso = False
+        self.assertFalse(self.partita.tutti_hanno_dichiarato_fine())
+
+    def test_verifica_azzera_dichiarazioni_e_reclami(self) -> None:
+        self.partita.esegui_fase_estrazione()
+        for bot in (self.bot_a, self.bot_b):
+            bot.dichiara_fine_fase_azione(set(), set())
+        self.assertTrue(self.partita.tutti_hanno_dichiarato_fine())
+
+        self.partita.esegui_fase_verifica()
+
+        self.assertFalse(self.partita.tutti_hanno_dichiarato_fine())
+        for bot in (self.bot_a, self.bot_b):
+            self.assertFalse(bot.turno_dichiarato_concluso)
+            self.assertIsNone(bot.reclamo_turno)
+
+    def test_reset_di_turno_per_generazione(self) -> None:
+        self.partita.esegui_fase_estrazione()
+        for bot in (self.bot_a, self.bot_b):
+            bot.dichiara_fine_fase_azione(set(), set())
+            # Il reset non passa più dal singolo giocatore.
+            bot.reset_reclamo_turno = None
+
+        self.partita.esegui_fase_verifica()
+
+        self.assertFalse(self.bot_a.turno_dichiarato_concluso)
+        self.partita.esegui_fase_estrazione()
+        self.bot_a.dichiara_fine_turno()
+        self.assertFalse(self.partita.tutti_hanno_dichiarato_fine())
+        self.bot_b.dichiara_fine_turno()
+        self.assertTrue(self.partita.tutti_hanno_dichiarato_fine())
+
+
+class TestPartitaModalitaSalaEquivalenza(unittest.TestCase):
+
+    def test_stessi_premi_reclami_e_tombola_della_partita_standard(self) -> None:
+        rng = random.Random(31)
+        griglie = Cartella.genera_lotto(7, rng)
+        sequenza = list(range(1, 91))
+        rng.shuffle(sequenza)
+
+        standard = _crea_partita(False, griglie, sequenza)
+        sala = _crea_partita(True, griglie, sequenza)
+
+        while not standard.is_terminata():
+            self.assertEqual(_gioca_turno(sala), _gioca_turno(standard))
+        self.assertTrue(sala.is_terminata())
+        self.assertEqual(sala.storico_premi, standard.storico_premi)
+
+
+class TestControllerModalitaSala(unittest.TestCase):
+
+    def test_crea_partita_standard_sala(self) -> None:
+        partita = crea_partita_standard(num_bot=40, seme=3, modalita_sala=True)
+
+        self.assertTrue(partita.modalita_sala)
+        self.assertEqual(partita.get_numero_giocatori(), 41)
+        self.assertTrue(partita.configurazione["modalita_sala"])
+
+    def test_limite_bot_standard(self) -> None:
+        with self.assertRaises(ControllerBotExcessException) as contesto:
+            crea_giocatori_automatici(8)
+        self.assertIn("Massimo 7 bot", str(contesto.exception))
+        self.assertEqual(len(crea_giocatori_automatici(8, modalita_sala=True)), 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
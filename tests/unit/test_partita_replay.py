@@ -0,0 +1,91 @@
+"""
+Test unitari per la riproducibilità delle partite.
+
+Verificano che crea_partita_standard() con lo stesso seme produca le stesse
+cartelle e la stessa sequenza di estrazioni, e che ricrea_partita() ricostruisca
+una partita identica da (seme, configurazione).
+"""
+
+import random
+import unittest
+
+from bingo_game.game_controller import (
+    crea_giocatori_automatici,
+    crea_partita_standard,
+    ricrea_partita,
+)
+
+
+def _griglie(partita):
+    return [
+        [cartella.cartella for cartella in giocatore.get_cartelle()]
+        for giocatore in partita.get_giocatori()
+    ]
+
+
+def _estrazioni(partita, quante=90):
+    return [partita.tabellone.estrai_numero() for _ in range(quante)]
+
+
+class TestPartitaRiproducibile(unittest.TestCase):
+
+    def test_stesso_seme_stesse_cartelle_ed_estrazioni(self) -> None:
+        prima = crea_partita_standard("Anna", num_cartelle_umano=3, num_bot=4, seme=2024)
+        seconda = crea_partita_standard("Anna", num_cartelle_umano=3, num_bot=4, seme=2024)
+
+        self.assertEqual(_griglie(prima), _griglie(seconda))
+        self.assertEqual(_estrazioni(prima), _estrazioni(seconda))
+
+    def test_semi_diversi_partite_diverse(self) -> None:
+        prima = crea_partita_standard(num_bot=3, seme=1)
+        seconda = crea_partita_standard(num_bot=3, seme=2)
+
+        self.assertNotEqual(_griglie(prima), _griglie(seconda))
+
+    def test_seme_e_configurazione_salvati_sulla_partita(self) -> None:
+        partita = crea_partita_standard("Luca", num_cartelle_umano=2, num_bot=3)
+
+        self.assertIsInstance(partita.seme, int)
+        self.assertEqual(
+            partita.configurazione,
+            {"nome_giocatore_umano": "Luca", "num_cartelle_umano": 2, "num_bot": 3, "modalita_sala": False},
+        )
+
+    def test_ricrea_partita_identica(self) -> None:
+        originale = crea_partita_standard("Sara", num_cartelle_umano=2, num_bot=5)
+        estrazioni_originali = _estrazioni(originale, 40)
+
+        replica = ricrea_partita(originale.seme, originale.configurazione)
+
+        self.assertEqual(replica.seme, originale.seme)
+        self.assertEqual(_griglie(replica), _griglie(originale))
+        self.assertEqual(_estrazioni(replica, 40), estrazioni_originali)
+
+    def test_ricrea_partita_indipendente_dal_random_globale(self) -> None:
+        random.seed(1)
+        originale = crea_partita_standard(num_bot=2, seme=99)
+        random.seed(2)
+        replica = ricrea_partita(99, originale.configurazione)
+
+        self.assertEqual(_griglie(replica), _griglie(originale))
+        self.assertEqual(_estrazioni(replica), _estrazioni(originale))
+
+    def test_ricrea_partita_chiave_sconosciuta(self) -> None:
+        with self.assertRaises(ValueError):
+            ricrea_partita(1, {"num_bot": 2, "velocita": 3})
+
+
+class TestCreaGiocatoriAutomaticiRng(unittest.TestCase):
+
+    def test_rng_determina_cartelle_dei_bot(self) -> None:
+        primi = crea_giocatori_automatici(5, rng=random.Random(7))
+        secondi = crea_giocatori_automatici(5, rng=random.Random(7))
+
+        self.assertEqual(
+            [[c.cartella for c in bot.get_cartelle()] for bot in primi],
+            [[c.cartella for c in bot.get_cartelle()] for bot in secondi],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+Test unitari per l'API di stato a livelli di Partita.
+
+Verificano il riepilogo a costo costante, il contatore di versione e che
+get_stato_sintetico() resti coerente con get_stato_completo().
+"""
+
+import unittest
+
+from bingo_game.cartella import Cartella
+from bingo_game.game_controller import ottieni_stato_riepilogo
+from bingo_game.partita import Partita
+from bingo_game.players import GiocatoreAutomatico, GiocatoreUmano
+from bingo_game.tabellone import Tabellone
+
+
+class TestPartitaStatoRiepilogo(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.umano = GiocatoreUmano("Umano", id_giocatore=1)
+        self.umano.aggiungi_cartella(Cartella())
+        self.bot = GiocatoreAutomatico("Bot", id_giocatore=2)
+        self.bot.aggiungi_cartella(Cartella())
+        self.partita = Partita(Tabellone(), [self.umano, self.bot])
+
+    def test_riepilogo_iniziale(self) -> None:
+        riepilogo = self.partita.get_stato_riepilogo()
+
+        self.assertEqual(riepilogo["stato_partita"], "non_iniziata")
+        self.assertEqual(riepilogo["fase_turno"], "attesa_estrazione")
+        self.assertIsNone(riepilogo["ultimo_numero_estratto"])
+        self.assertEqual(riepilogo["conteggio_estratti"], 0)
+        self.assertEqual(riepilogo["conteggio_giocatori"], 2)
+        self.assertEqual(riepilogo["conteggio_premi_assegnati"], 0)
+        self.assertEqual(riepilogo["versione"], self.partita.get_versione_stato())
+
+    def test_versione_cresce_a_ogni_modifica(self) -> None:
+        versioni = [self.partita.get_versione_stato()]
+        self.partita.avvia_partita()
+        versioni.append(self.partita.get_versione_stato())
+        self.partita.esegui_fase_estrazione()
+        versioni.append(self.partita.get_versione_stato())
+        self.partita.esegui_fase_verifica()
+        versioni.append(self.partita.get_versione_stato())
+
+        self.assertEqual(versioni, sorted(set(versioni)))
+
+    def test_versione_stabile_senza_modifiche(self) -> None:
+        self.partita.avvia_partita()
+        versione = self.partita.get_versione_stato()
+
+        self.partita.get_stato_riepilogo()
+        self.partita.get_stato_sintetico()
+        self.partita.get_stato_completo()
+
+        self.assertEqual(self.partita.get_versione_stato(), versione)
+
+    def test_riepilogo_dopo_estrazione(self) -> None:
+        self.partita.avvia_partita()
+        numero = self.partita.esegui_fase_estrazione()["numero_estratto"]
+
+        riepilogo = ottieni_stato_riepilogo(self.partita)
+
+        self.assertEqual(riepilogo["stato_partita"], "in_corso")
+        self.assertEqual(riepilogo["fase_turno"], "attesa_reclami")
+        self.assertEqual(riepilogo["ultimo_numero_estratto"], numero)
+        self.assertEqual(riepilogo["conteggio_estratti"], 1)
+
+    def test_sintetico_coerente_con_completo(self) -> None:
+        self.partita.avvia_partita()
+        for _ in range(5):
+            self.partita.esegui_turno()
+
+        sintetico = self.partita.get_stato_sintetico()
+        completo = self.partita.get_stato_completo()
+
+        for chiave in sintetico:
+            self.assertEqual(sintetico[chiave], completo[chiave])
+
+    def test_ottieni_stato_riepilogo_parametro_non_valido(self) -> None:
+        with self.assertRaises(ValueError):
+            ottieni_stato_riepilogo("non una partita")
+
+
+if __name__ == "__main__":
+    unittest.main()
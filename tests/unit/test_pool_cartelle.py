@@ -0,0 +1,162 @@
+"""
+Test unitari per bingo_game.pool_cartelle (pool binario di cartelle con mmap).
+"""
+
+import os
+import random
+import tempfile
+import unittest
+
+from bingo_game.cartella import Cartella
+from bingo_game.checkpoint_partita import CheckpointPartita, ripristina_partita
+from bingo_game.cartella_compatta import CartellaCompatta
+from bingo_game.exceptions import PoolCartelleEsauritoException, PoolCartelleFormatoException
+from bingo_game.game_controller import assegna_cartelle_a_giocatore
+from bingo_game.giornale_partita import GiornalePartita, leggi_giornale
+from bingo_game.partita import Partita
+from bingo_game.players import GiocatoreAutomatico
+from bingo_game.tabellone import Tabellone
+from bingo_game.pool_cartelle import (
+    BYTE_PER_CARTELLA,
+    DIMENSIONE_INTESTAZIONE,
+    PoolCartelle,
+    codifica_griglia,
+    decodifica_griglia,
+    scrivi_pool,
+)
+
+
+class TestPoolCartelle(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self._cartella_temp = tempfile.TemporaryDirectory()
+        self.percorso = os.path.join(self._cartella_temp.name, "pool.bin")
+
+    def tearDown(self) -> None:
+        self._cartella_temp.cleanup()
+
+    def test_codifica_e_decodifica_round_trip(self) -> None:
+        for griglia in Cartella.genera_lotto(50, random.Random(1)):
+            record = codifica_griglia(griglia)
+            self.assertEqual(len(record), BYTE_PER_CARTELLA)
+            self.assertEqual(decodifica_griglia(record), griglia)
+
+    def test_decodifica_rifiuta_record_corrotti(self) -> None:
+        record = bytearray(codifica_griglia(Cartella.genera_lotto(1, random.Random(3))[0]))
+        corrotti = []
+        for posizione, valore in ((0, 0), (4, 91), (14, 255)):
+            copia = bytearray(record)
+            copia[posizione] = valore
+            corrotti.append(copia)
+        # Due numeri della stessa riga nella stessa colonna, riga non ordinata,
+        # colonna non crescente dall'alto in basso, record troncato.
+        copia = bytearray(record)
+        copia[1] = copia[0]
+        corrotti.append(copia)
+        corrotti.append(bytearray(record[4::-1] + record[5:]))
+        corrotti.append(bytearray(record[5:10] + record[:5] + record[10:]))
+        corrotti.append(record[:14])
+        for copia in corrotti:
+            with self.assertRaises(PoolCartelleFormatoException, msg=bytes(copia)):
+                decodifica_griglia(bytes(copia), valida=True)
+
+    def test_pool_cartelle_riproducibile(self) -> None:
+        scritte = scrivi_pool(self.percorso, num_cartelle=100, rng=random.Random(7))
+        self.assertEqual(scritte, 100)
+        self.assertEqual(os.path.getsize(self.percorso), DIMENSIONE_INTESTAZIONE + 100 * BYTE_PER_CARTELLA)
+
+        attese = Cartella.genera_lotto(100, random.Random(7))
+        with PoolCartelle(self.percorso) as pool:
+            self.assertEqual(len(pool), 100)
+            self.assertFalse(pool.con_serie)
+            self.assertEqual(pool.get_griglia(42), attese[42])
+            cartella = pool.distribuisci(CartellaCompatta)
+            self.assertIsInstance(cartella, CartellaCompatta)
+            self.assertEqual(cartella.cartella, attese[0])
+            self.assertEqual(cartella.indice_pool, 0)
+            self.assertEqual(pool.get_posizione(), 1)
+            self.assertEqual(pool.get_rimanenti(), 99)
+            with self.assertRaises(IndexError):
+                pool.get_griglia(100)
+
+    def test_pool_esaurito(self) -> None:
+        scrivi_pool(self.percorso, num_cartelle=2, rng=random.Random(1))
+        with PoolCartelle(self.percorso, posizione_iniziale=1) as pool:
+            pool.distribuisci()
+            with self.assertRaises(PoolCartelleEsauritoException):
+                pool.distribuisci()
+
+    def test_pool_a_serie(self) -> None:
+        scrivi_pool(self.percorso, num_serie=3, rng=random.Random(2))
+        with PoolCartelle(self.percorso) as pool:
+            self.assertTrue(pool.con_serie)
+            pool.distribuisci()
+            serie = pool.distribuisci_serie()
+            self.assertEqual(pool.get_posizione(), 12)
+            numeri = sorted(n for c in serie for n in c.numeri_cartella)
+            self.assertEqual(numeri, list(range(1, 91)))
+            pool.distribuisci()
+            with self.assertRaises(PoolCartelleEsauritoException):
+                pool.distribuisci_serie()
+            self.assertEqual(pool.get_posizione(), 13)
+
+    def test_file_non_valido(self) -> None:
+        with open(self.percorso, "wb") as file_pool:
+            file_pool.write(b"XXXX" + bytes(12))
+        with self.assertRaises(PoolCartelleFormatoException):
+            PoolCartelle(self.percorso)
+
+        scrivi_pool(self.percorso, num_cartelle=3, rng=random.Random(1))
+        with open(self.percorso, "ab") as file_pool:
+            file_pool.write(b"\x01")
+        with self.assertRaises(PoolCartelleFormatoException):
+            PoolCartelle(self.percorso)
+
+    def test_record_corrotti_rifiutati_all_apertura(self) -> None:
+        scrivi_pool(self.percorso, num_cartelle=3, rng=random.Random(1))
+        with open(self.percorso, "r+b") as file_pool:
+            file_pool.seek(DIMENSIONE_INTESTAZIONE + BYTE_PER_CARTELLA + 2)
+            file_pool.write(b"\x5b")
+        with self.assertRaises(PoolCartelleFormatoException):
+            PoolCartelle(self.percorso)
+
+    def test_parametri_scrittura_non_validi(self) -> None:
+        with self.assertRaises(ValueError):
+            scrivi_pool(self.percorso, num_cartelle=1, num_serie=1)
+        with self.assertRaises(ValueError):
+            scrivi_pool(self.percorso, num_cartelle=-1)
+
+    def test_assegna_cartelle_dal_pool(self) -> None:
+        scrivi_pool(self.percorso, num_cartelle=5, rng=random.Random(3))
+        bot = GiocatoreAutomatico("Bot")
+        with PoolCartelle(self.percorso) as pool:
+            assegna_cartelle_a_giocatore(bot, 3, pool=pool)
+            self.assertEqual(pool.get_posizione(), 3)
+            self.assertEqual(bot.get_cartelle()[2].cartella, pool.get_griglia(2))
+
+    def test_indice_pool_nel_giornale_e_nel_checkpoint(self) -> None:
+        scrivi_pool(self.percorso, num_cartelle=10, rng=random.Random(4))
+        bot = GiocatoreAutomatico("Bot", id_giocatore=7)
+        altro = GiocatoreAutomatico("Altro")
+        with PoolCartelle(self.percorso, posizione_iniziale=5) as pool:
+            assegna_cartelle_a_giocatore(bot, 2, pool=pool)
+        assegna_cartelle_a_giocatore(altro, 1, rng=random.Random(4))
+        partita = Partita(Tabellone(), [bot, altro])
+        percorso_giornale = os.path.join(self._cartella_temp.name, "partite.tsgp")
+        percorso_checkpoint = os.path.join(self._cartella_temp.name, "partita.tsck")
+        with GiornalePartita(percorso_giornale) as giornale, CheckpointPartita(percorso_checkpoint) as checkpoint:
+            partita.collega_giornale(giornale)
+            partita.collega_checkpoint(checkpoint)
+
+        vendute = [r.come_dizionario() for r in leggi_giornale(percorso_giornale) if r.tipo == "cartella_pool"]
+        self.assertEqual(vendute, [
+            {"id_giocatore": 7, "cartella": 1, "indice_pool": 5},
+            {"id_giocatore": 7, "cartella": 2, "indice_pool": 6},
+        ])
+        giocatori = ripristina_partita(percorso_checkpoint).get_giocatori()
+        self.assertEqual([c.indice_pool for c in giocatori[0].get_cartelle()], [5, 6])
+        self.assertIsNone(giocatori[1].get_cartelle()[0].indice_pool)
+
+
+if __name__ == "__main__":
+    unittest.main()
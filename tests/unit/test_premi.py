@@ -0,0 +1,28 @@
+"""
+Test unitari per bingo_game.premi.
+
+Verificano che l'enumerazione dei premi sia la stessa usata da registro,
+tracciatore, giornale e checkpoint.
+"""
+
+import unittest
+
+from bingo_game import checkpoint_partita, giornale_partita, registro_premi, tracciatore_premi
+from bingo_game.premi import CODICE_PREMIO, PREMI, PREMI_RIGA, SOGLIE_PREMI_RIGA
+
+
+class TestPremi(unittest.TestCase):
+
+    def test_enumerazione_unica(self) -> None:
+        self.assertEqual(PREMI, ("ambo", "terno", "quaterna", "cinquina", "tombola"))
+        self.assertEqual([tipo for tipo, _soglia in SOGLIE_PREMI_RIGA], list(PREMI_RIGA))
+        self.assertEqual([soglia for _tipo, soglia in SOGLIE_PREMI_RIGA], [2, 3, 4, 5])
+        self.assertEqual([CODICE_PREMIO[premio] for premio in PREMI], list(range(5)))
+        self.assertIs(giornale_partita.PREMI, PREMI)
+        self.assertIs(checkpoint_partita.PREMI, PREMI)
+        self.assertIs(registro_premi.PREMI_RIGA, PREMI_RIGA)
+        self.assertIs(tracciatore_premi.SOGLIE_PREMI_RIGA, SOGLIE_PREMI_RIGA)
+
+
+if __name__ == "__main__":
+    unittest.main()
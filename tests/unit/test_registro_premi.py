@@ -0,0 +1,122 @@
+"""
+Test unitari per bingo_game.registro_premi.
+
+Verificano la codifica intera dei premi e il suo inverso, il comportamento
+di RegistroPremi come set di chiavi stringa (appartenenza, aggiunta,
+iterazione, confronto con un set), l'accesso per codice, la copia e il
+bitset grezzo, e che Partita.verifica_premi registri i premi nel registro.
+"""
+
+import unittest
+
+from bingo_game.game_controller import crea_partita_standard
+from bingo_game.registro_premi import (
+    CODICI_PER_CARTELLA,
+    PREMI,
+    RegistroPremi,
+    chiave_premio,
+    codice_da_chiave,
+    codice_premio,
+)
+
+
+class TestCodiciPremio(unittest.TestCase):
+
+    def test_codifica_e_chiave_sono_inverse(self) -> None:
+        codici = set()
+        for indice in range(0, 40):
+            for riga in range(3):
+                for tipo in PREMI[:-1]:
+                    codice = codice_premio(indice, tipo, riga)
+                    chiave = f"cartella_{indice}_riga_{riga}_{tipo}"
+                    self.assertEqual(chiave_premio(codice), chiave)
+                    self.assertEqual(codice_da_chiave(chiave), codice)
+                    codici.add(codice)
+            codice = codice_premio(indice, "tombola")
+            self.assertEqual(chiave_premio(codice), f"cartella_{indice}_tombola")
+            codici.add(codice)
+        # Codici distinti e contigui: nessun buco nel bitset.
+        self.assertEqual(codici, set(range(40 * CODICI_PER_CARTELLA)))
+
+    def test_chiavi_e_premi_non_validi(self) -> None:
+        for chiave in ("", "cartella", "cartella_x_tombola", "cartella_1_riga_3_ambo",
+                       "cartella_1_riga_0_bingo", "giocatore_1_tombola"):
+            self.assertIsNone(codice_da_chiave(chiave), chiave)
+        with self.assertRaises(ValueError):
+            codice_premio(1, "ambo")
+        with self.assertRaises(ValueError):
+            codice_premio(-1, "tombola")
+        with self.assertRaises(ValueError):
+            codice_premio(None, "tombola")
+
+
+class TestRegistroPremi(unittest.TestCase):
+
+    def test_vista_set_di_chiavi_stringa(self) -> None:
+        registro = RegistroPremi()
+        self.assertEqual(registro, set())
+        registro.add("cartella_3_tombola")
+        registro.update(["cartella_1_riga_2_terno", "cartella_1_riga_2_terno"])
+
+        self.assertEqual(len(registro), 2)
+        self.assertIn("cartella_1_riga_2_terno", registro)
+        self.assertNotIn("cartella_1_riga_2_ambo", registro)
+        self.assertNotIn("chiave_qualsiasi", registro)
+        self.assertEqual(registro, {"cartella_3_tombola", "cartella_1_riga_2_terno"})
+        self.assertEqual(list(registro), ["cartella_1_riga_2_terno", "cartella_3_tombola"])
+
+        registro.discard("cartella_3_tombola")
+        self.assertEqual(registro, {"cartella_1_riga_2_terno"})
+
+    def test_chiavi_fuori_formato_come_in_un_set(self) -> None:
+        registro = RegistroPremi(["cartella_1_tombola", "cartella_None_tombola"])
+        registro.add("chiave_qualsiasi")
+
+        self.assertEqual(len(registro), 3)
+        self.assertIn("cartella_None_tombola", registro)
+        self.assertEqual(registro, {"cartella_1_tombola", "cartella_None_tombola", "chiave_qualsiasi"})
+        self.assertEqual(list(registro.codici()), [codice_premio(1, "tombola")])
+        self.assertEqual(registro.copia(), registro)
+
+        registro.discard("chiave_qualsiasi")
+        self.assertNotIn("chiave_qualsiasi", registro)
+        self.assertEqual(len(registro), 2)
+
+    def test_accesso_per_codice_copia_e_byte(self) -> None:
+        registro = RegistroPremi()
+        codice = codice_premio(250, "cinquina", 1)
+        self.assertFalse(registro.contiene_codice(codice))
+        self.assertTrue(registro.aggiungi_codice(codice))
+        self.assertFalse(registro.aggiungi_codice(codice))
+        self.assertIn(codice, registro)
+        self.assertIn("cartella_250_riga_1_cinquina", registro)
+
+        copia = registro.copia()
+        copia.add("cartella_1_tombola")
+        self.assertEqual(len(registro), 1)
+        self.assertEqual(len(copia), 2)
+
+        ripristinato = RegistroPremi.da_byte(copia.in_byte())
+        self.assertEqual(ripristinato, copia)
+        self.assertEqual(list(ripristinato.codici()), sorted(copia.codici()))
+
+    def test_partita_registra_i_premi_nel_registro(self) -> None:
+        partita = crea_partita_standard(num_bot=4, seme=21)
+        partita.avvia_partita()
+        while not partita.storico_premi:
+            partita.esegui_fase_estrazione()
+            for giocatore in partita.get_giocatori():
+                if giocatore.is_automatico():
+                    giocatore.dichiara_fine_fase_azione(
+                        partita.premi_gia_assegnati.copia(), set(partita.premi_tipo_chiusi)
+                    )
+            partita.esegui_fase_verifica()
+
+        self.assertIsInstance(partita.premi_gia_assegnati, RegistroPremi)
+        for evento in partita.storico_premi:
+            codice = codice_premio(evento["cartella"], evento["premio"], evento["riga"])
+            self.assertTrue(partita.premi_gia_assegnati.contiene_codice(codice))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+"""
+Test unitari per bingo_game.serie (serie da 6 cartelle che coprono 1-90).
+"""
+
+import random
+import unittest
+
+from bingo_game.cartella import Cartella
+from bingo_game.cartella_compatta import CartellaCompatta
+from bingo_game.serie import CARTELLE_PER_SERIE, Serie, genera_griglie_serie, genera_serie
+
+
+class TestGeneraSerie(unittest.TestCase):
+
+    def test_serie_copre_1_90_con_cartelle_valide(self) -> None:
+        rng = random.Random(4)
+        for griglie in genera_serie(200, rng):
+            self.assertEqual(len(griglie), CARTELLE_PER_SERIE)
+            numeri = []
+            for griglia in griglie:
+                # La validazione di Cartella solleva RuntimeError se una regola è violata.
+                numeri.extend(Cartella(griglia=griglia).numeri_cartella)
+            self.assertEqual(sorted(numeri), list(range(1, 91)))
+
+    def test_deterministica_con_rng(self) -> None:
+        self.assertEqual(genera_griglie_serie(random.Random(9)), genera_griglie_serie(random.Random(9)))
+
+    def test_numero_di_serie_negativo(self) -> None:
+        with self.assertRaises(ValueError):
+            list(genera_serie(-1))
+
+
+class TestSerie(unittest.TestCase):
+
+    def test_ogni_numero_in_una_sola_cartella(self) -> None:
+        serie = Serie(random.Random(1), classe_cartella=CartellaCompatta)
+        for numero in range(1, 91):
+            cartella = serie.get_cartella_con_numero(numero)
+            self.assertIn(numero, cartella.numeri_cartella)
+        self.assertEqual([c.indice for c in serie.get_cartelle()], [1, 2, 3, 4, 5, 6])
+
+    def test_segna_numero_tocca_solo_la_cartella_giusta(self) -> None:
+        serie = Serie(random.Random(2))
+        cartella = serie.segna_numero(45)
+        self.assertTrue(cartella.is_numero_segnato(45))
+        self.assertEqual(sum(c.conta_numeri_segnati() for c in serie.get_cartelle()), 1)
+        with self.assertRaises(ValueError):
+            serie.segna_numero(0)
+
+    def test_griglie_non_formanti_una_serie(self) -> None:
+        griglie = genera_griglie_serie(random.Random(3))
+        with self.assertRaises(ValueError):
+            Serie(griglie=griglie[:5])
+        griglie[5] = griglie[0]
+        with self.assertRaises(ValueError):
+            Serie(griglie=griglie)
+
+
+if __name__ == "__main__":
+    unittest.main()
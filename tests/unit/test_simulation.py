@@ -0,0 +1,113 @@
+"""
+Test unitari per bingo_game.simulation.
+
+Verificano determinismo per seme, coerenza delle statistiche aggregate e
+l'unione di risultati parziali.
+"""
+
+import random
+import unittest
+
+from bingo_game.cartella import Cartella
+from bingo_game.simulation import (
+    PREMI_SIMULATI,
+    RisultatoSimulazione,
+    esegui_simulazione,
+    esegui_simulazione_parallela,
+    partiziona_partite,
+    seme_partita,
+    simula_partita,
+)
+
+
+class TestSimulaPartita(unittest.TestCase):
+
+    def test_partita_termina_con_tombola_e_premi_in_ordine(self) -> None:
+        eventi = simula_partita(3, 2, random.Random(11))
+
+        premi = [evento["premio"] for evento in eventi]
+        self.assertEqual(premi[-1], "tombola")
+        turni = [evento["turno"] for evento in eventi]
+        self.assertEqual(turni, sorted(turni))
+        for evento in eventi:
+            self.assertIn(evento["id_giocatore"], (1, 2, 3))
+
+    def test_stesso_seme_stessa_partita(self) -> None:
+        self.assertEqual(
+            simula_partita(4, 1, random.Random(5), Cartella),
+            simula_partita(4, 1, random.Random(5), Cartella),
+        )
+
+
+class TestEseguiSimulazione(unittest.TestCase):
+
+    def test_statistiche_coerenti(self) -> None:
+        risultato = esegui_simulazione(30, num_giocatori=3, cartelle_per_giocatore=2, seme=2)
+
+        self.assertEqual(risultato.partite_giocate, 30)
+        self.assertEqual(risultato.partite_con_premio("tombola"), 30)
+        self.assertEqual(risultato.partite_con_premio("ambo"), 30)
+        self.assertLess(risultato.media_estrazioni("ambo"), risultato.media_estrazioni("tombola"))
+        for premio in PREMI_SIMULATI:
+            vittorie = sum(risultato.vittorie_per_giocatore[premio].values())
+            assegnazioni = risultato.partite_con_premio(premio)
+            self.assertGreaterEqual(vittorie, assegnazioni)
+            self.assertLessEqual(risultato.pareggi_per_premio[premio], assegnazioni)
+        self.assertAlmostEqual(sum(risultato.distribuzione_vittorie("tombola").values()), 1.0)
+
+    def test_determinismo_e_unione_per_intervalli(self) -> None:
+        completo = esegui_simulazione(12, seme=9)
+        self.assertEqual(completo, esegui_simulazione(12, seme=9))
+
+        parziale = RisultatoSimulazione()
+        parziale.unisci(esegui_simulazione(5, seme=9))
+        parziale.unisci(esegui_simulazione(7, seme=9, indice_iniziale=5))
+        self.assertEqual(parziale, completo)
+        self.assertNotEqual(esegui_simulazione(12, seme=10), completo)
+
+    def test_semi_distinti_per_indice(self) -> None:
+        self.assertNotEqual(seme_partita(1, 0), seme_partita(0, 1))
+        self.assertEqual(len({seme_partita(3, i) for i in range(100)}), 100)
+        # Con lo schema (seme << 32) + indice queste coppie collidevano.
+        self.assertNotEqual(seme_partita(-1, 2**32), seme_partita(0, 0))
+        self.assertNotEqual(seme_partita(0, 2**32), seme_partita(1, 0))
+        self.assertNotEqual(seme_partita(-1, 5), seme_partita(-2, 2**32 + 5))
+        for seme in (-(2**70), -1, 0, 2**40, 2**80):
+            self.assertTrue(0 <= seme_partita(seme, 7) < 2**63)
+
+    def test_parametri_non_validi(self) -> None:
+        with self.assertRaises(ValueError):
+            esegui_simulazione(-1)
+        with self.assertRaises(ValueError):
+            esegui_simulazione(1, num_giocatori=1)
+        with self.assertRaises(ValueError):
+            esegui_simulazione(1, cartelle_per_giocatore=0)
+
+
+
+class TestEseguiSimulazioneParallela(unittest.TestCase):
+
+    def test_partizione_disgiunta_e_completa(self) -> None:
+        shard = partiziona_partite(10, 4, indice_iniziale=3)
+        self.assertEqual(shard, [(3, 3), (6, 3), (9, 2), (11, 2)])
+        self.assertEqual(partiziona_partite(2, 5), [(0, 1), (1, 1)])
+        with self.assertRaises(ValueError):
+            partiziona_partite(5, 0)
+
+    def test_risultato_identico_a_esecuzione_singola(self) -> None:
+        singolo = esegui_simulazione(16, num_giocatori=3, seme=21)
+        parallelo = esegui_simulazione_parallela(
+            16, num_giocatori=3, seme=21, num_processi=2, num_shard=5
+        )
+        self.assertEqual(parallelo, singolo)
+
+    def test_round_trip_dizionario(self) -> None:
+        risultato = esegui_simulazione(4, seme=1)
+        self.assertEqual(RisultatoSimulazione.da_dict(risultato.to_dict()), risultato)
+
+    def test_campagna_vuota(self) -> None:
+        self.assertEqual(esegui_simulazione_parallela(0, num_processi=2).partite_giocate, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+"""
+Test unitari per bingo_game/ui/stato_griglie.py.
+
+Verificano la mappatura numero → cella del tabellone, il calcolo degli stati
+di tabellone e cartella, che StatoGriglia ritorni solo le celle cambiate e la
+geometria (rettangoli, hit test) e i nomi accessibili delle griglie disegnate.
+Il modulo non importa wx: i test girano anche senza wxPython.
+"""
+
+import unittest
+
+from bingo_game.ui.stato_griglie import (
+    CELLE_CARTELLA,
+    CELLE_TABELLONE,
+    STATO_CARTELLA_ESTRATTO,
+    STATO_CARTELLA_NUMERO,
+    STATO_CARTELLA_SEGNATO,
+    STATO_CARTELLA_VUOTA,
+    STATO_TABELLONE_ESTRATTO,
+    StatoGriglia,
+    cella_in_punto,
+    indice_cella_tabellone,
+    nome_cella_cartella,
+    nome_cella_tabellone,
+    numero_cella_tabellone,
+    rettangolo_cella,
+    stati_cartella,
+    stati_tabellone,
+)
+
+_GRIGLIA = (
+    (1, "-", 21, "-", 41, "-", 61, "-", 81),
+    ("-", 12, "-", 32, "-", 52, "-", 72, 90),
+    (5, "-", 25, 35, "-", 55, "-", 75, "-"),
+)
+
+
+class TestMappaturaTabellone(unittest.TestCase):
+
+    def test_indici_biunivoci(self) -> None:
+        indici = [indice_cella_tabellone(numero) for numero in range(1, 91)]
+        self.assertEqual(sorted(indici), list(range(CELLE_TABELLONE)))
+        for numero in range(1, 91):
+            self.assertEqual(numero_cella_tabellone(indice_cella_tabellone(numero)), numero)
+
+    def test_colonna_per_decina(self) -> None:
+        self.assertEqual(indice_cella_tabellone(1), 0)
+        self.assertEqual(indice_cella_tabellone(11), 1)
+        self.assertEqual(indice_cella_tabellone(2), 9)
+        self.assertEqual(indice_cella_tabellone(90), 89)
+
+
+class TestStati(unittest.TestCase):
+
+    def test_stati_tabellone(self) -> None:
+        stati = stati_tabellone({7, 90})
+        self.assertEqual(len(stati), CELLE_TABELLONE)
+        self.assertEqual(stati[indice_cella_tabellone(7)], STATO_TABELLONE_ESTRATTO)
+        self.assertEqual(sum(stati), 2)
+
+    def test_stati_cartella(self) -> None:
+        stati, etichette = stati_cartella(_GRIGLIA, numeri_segnati={1}, numeri_estratti={1, 21})
+
+        self.assertEqual(len(stati), CELLE_CARTELLA)
+        self.assertEqual(stati[0], STATO_CARTELLA_SEGNATO)
+        self.assertEqual(stati[1], STATO_CARTELLA_VUOTA)
+        self.assertEqual(stati[2], STATO_CARTELLA_ESTRATTO)
+        self.assertEqual(stati[4], STATO_CARTELLA_NUMERO)
+        self.assertEqual(etichette[:3], ("1", "", "21"))
+
+
+class TestStatoGriglia(unittest.TestCase):
+
+    def test_primo_confronto_ritorna_tutte_le_celle(self) -> None:
+        griglia = StatoGriglia(CELLE_TABELLONE)
+        self.assertEqual(griglia.celle_modificate(stati_tabellone(())), list(range(CELLE_TABELLONE)))
+
+    def test_solo_il_numero_estratto(self) -> None:
+        griglia = StatoGriglia(CELLE_TABELLONE)
+        griglia.registra(stati_tabellone({3}))
+
+        modificate = griglia.celle_modificate(stati_tabellone({3, 44}))
+
+        self.assertEqual(modificate, [indice_cella_tabellone(44)])
+
+    def test_nessuna_modifica(self) -> None:
+        griglia = StatoGriglia(CELLE_TABELLONE)
+        griglia.registra(stati_tabellone({3}))
+        self.assertEqual(griglia.celle_modificate(stati_tabellone({3})), [])
+
+    def test_cambio_etichette_cartella(self) -> None:
+        griglia = StatoGriglia(CELLE_CARTELLA)
+        griglia.registra(*stati_cartella(_GRIGLIA, set(), set()))
+        altra = tuple(
+            tuple(valore + 1 if isinstance(valore, int) and valore < 90 else valore for valore in riga)
+            for riga in _GRIGLIA
+        )
+
+        modificate = griglia.celle_modificate(*stati_cartella(altra, set(), set()))
+
+        # cambiano solo le celle con numero, tranne il 90 (indice 17) rimasto uguale
+        attese = [
+            riga * 9 + colonna
+            for riga in range(3)
+            for colonna in range(9)
+            if isinstance(_GRIGLIA[riga][colonna], int) and _GRIGLIA[riga][colonna] != 90
+        ]
+        self.assertEqual(modificate, attese)
+
+    def test_invalida_singola_cella(self) -> None:
+        griglia = StatoGriglia(CELLE_CARTELLA)
+        stati, etichette = stati_cartella(_GRIGLIA, set(), set())
+        griglia.registra(stati, etichette)
+
+        griglia.invalida(4)
+
+        self.assertEqual(griglia.celle_modificate(stati, etichette), [4])
+
+    def test_invalida_tutto(self) -> None:
+        griglia = StatoGriglia(CELLE_CARTELLA)
+        stati, etichette = stati_cartella(_GRIGLIA, set(), set())
+        griglia.registra(stati, etichette)
+
+        griglia.invalida()
+
+        self.assertEqual(len(griglia.celle_modificate(stati, etichette)), CELLE_CARTELLA)
+
+
+class TestGeometriaGriglie(unittest.TestCase):
+
+    def test_rettangoli_cartella(self) -> None:
+        # 9 colonne da 60px + 8 spazi da 2px; 3 righe da 34px + 2 spazi da 2px
+        self.assertEqual(rettangolo_cella(0, 9, 3, 556, 106, 2), (0, 0, 60, 34))
+        self.assertEqual(rettangolo_cella(10, 9, 3, 556, 106, 2), (62, 36, 60, 34))
+        self.assertEqual(rettangolo_cella(26, 9, 3, 556, 106, 2), (496, 72, 60, 34))
+
+    def test_hit_test_inverso_dei_rettangoli(self) -> None:
+        for indice in range(CELLE_TABELLONE):
+            x, y, w, h = rettangolo_cella(indice, 9, 10, 300, 400, 1)
+            self.assertEqual(cella_in_punto(x, y, 9, 10, 300, 400, 1), indice)
+            self.assertEqual(cella_in_punto(x + w - 1, y + h - 1, 9, 10, 300, 400, 1), indice)
+
+    def test_hit_test_fuori_dalle_celle(self) -> None:
+        self.assertIsNone(cella_in_punto(60, 0, 9, 3, 556, 106, 2))   # spaziatura
+        self.assertIsNone(cella_in_punto(-1, 5, 9, 3, 556, 106, 2))
+        self.assertIsNone(cella_in_punto(5, 200, 9, 3, 556, 106, 2))
+        self.assertIsNone(cella_in_punto(0, 0, 9, 3, 0, 0, 2))
+
+    def test_nomi_accessibili(self) -> None:
+        self.assertEqual(nome_cella_tabellone(indice_cella_tabellone(45)), "45")
+        _stati, etichette = stati_cartella(_GRIGLIA, set(), set())
+        self.assertEqual(nome_cella_cartella(0, etichette), "1")
+        self.assertEqual(nome_cella_cartella(1, etichette), "")
+        self.assertEqual(nome_cella_cartella(0, None), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Test unitari per bingo_game.tabellone_mescolato.TabelloneMescolato.
+
+Oltre ai test specifici (sequenza pre-impegnata, determinismo con rng,
+stato su bytearray) riesegue l'intera suite di Tabellone sulla variante
+mescolata, per verificarne la compatibilità di contratto.
+"""
+
+import random
+import unittest
+
+from bingo_game.cartella import Cartella
+from bingo_game.exceptions.tabellone_exceptions import TabelloneNumeriEsauritiException
+from bingo_game.partita import Partita
+from bingo_game.players import GiocatoreAutomatico
+from bingo_game.tabellone_mescolato import TabelloneMescolato
+from tests import test_tabellone as _contratto_tabellone
+
+
+class TestTabelloneMescolatoContratto(_contratto_tabellone.TestTabellone):
+
+    def setUp(self):
+        self.tabellone = TabelloneMescolato()
+
+
+class TestTabelloneMescolato(unittest.TestCase):
+
+    def test_sequenza_pre_impegnata(self) -> None:
+        sequenza = list(range(90, 0, -1))
+        tabellone = TabelloneMescolato(sequenza=sequenza)
+
+        estratti = [tabellone.estrai_numero() for _ in range(90)]
+
+        self.assertEqual(estratti, sequenza)
+        with self.assertRaises(TabelloneNumeriEsauritiException):
+            tabellone.estrai_numero()
+        tabellone.reset_tabellone()
+        self.assertEqual(tabellone.estrai_numero(), 90)
+
+    def test_sequenza_non_valida(self) -> None:
+        with self.assertRaises(ValueError):
+            TabelloneMescolato(sequenza=[1, 2, 3])
+        with self.assertRaises(ValueError):
+            TabelloneMescolato(sequenza=[1] * 90)
+
+    def test_deterministico_con_rng(self) -> None:
+        primo = TabelloneMescolato(rng=random.Random(12))
+        secondo = TabelloneMescolato(rng=random.Random(12))
+        self.assertEqual(
+            [primo.estrai_numero() for _ in range(90)],
+            [secondo.estrai_numero() for _ in range(90)],
+        )
+
+    def test_interrogazioni_su_bytearray(self) -> None:
+        tabellone = TabelloneMescolato(sequenza=[7, 3, 90] + [n for n in range(1, 90) if n not in (7, 3)])
+        for _ in range(3):
+            tabellone.estrai_numero()
+
+        self.assertEqual(tabellone.get_numeri_estratti(), [3, 7, 90])
+        self.assertTrue(tabellone.is_numero_estratto(90))
+        self.assertFalse(tabellone.is_numero_estratto(1))
+        self.assertEqual(tabellone.get_ultimi_numeri_estratti(2), (3, 90))
+        self.assertEqual(tabellone.storico_estrazioni, [7, 3, 90])
+        self.assertEqual(tabellone.get_conteggio_disponibili(), 87)
+        self.assertEqual(len(tabellone.get_numeri_disponibili()), 87)
+
+    def test_partita_completa(self) -> None:
+        bot_a = GiocatoreAutomatico("A", id_giocatore=1)
+        bot_b = GiocatoreAutomatico("B", id_giocatore=2)
+        for bot in (bot_a, bot_b):
+            bot.aggiungi_cartella(Cartella())
+        partita = Partita(TabelloneMescolato(rng=random.Random(3)), [bot_a, bot_b])
+        partita.avvia_partita()
+        while not partita.is_terminata():
+            partita.esegui_turno()
+        self.assertTrue(partita.has_tombola())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Test unitari per bingo_game.tracciatore_premi.TracciatorePremi.
+
+Verificano i contatori incrementali per riga/cartella, gli eventi di premio
+appena raggiunto e l'equivalenza con Partita.verifica_premi_per_cartella().
+"""
+
+import random
+import unittest
+
+from bingo_game.cartella import Cartella
+from bingo_game.cartella_compatta import CartellaCompatta
+from bingo_game.partita import Partita
+from bingo_game.players import GiocatoreAutomatico
+from bingo_game.tabellone import Tabellone
+from bingo_game.tracciatore_premi import TracciatorePremi
+
+
+class TestTracciatorePremi(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tracciatore = TracciatorePremi()
+        self.cartella = Cartella()
+        self.tracciatore.registra_cartella(self.cartella)
+
+    def _segna(self, numero: int):
+        riga, _colonna = self.cartella.get_coordinate_numero(numero)
+        self.assertTrue(self.cartella.segna_numero(numero))
+        return self.tracciatore.segna(self.cartella, riga)
+
+    def test_eventi_emessi_solo_al_raggiungimento_della_soglia(self) -> None:
+        numeri_riga = self.cartella.get_numeri_riga(0)
+        attesi = [[], [("ambo", 0)], [("terno", 0)], [("quaterna", 0)], [("cinquina", 0)]]
+        for numero, atteso in zip(numeri_riga, attesi):
+            self.assertEqual(self._segna(numero), atteso)
+        self.assertEqual(self.tracciatore.premio_massimo_riga(self.cartella, 0), "cinquina")
+        self.assertIsNone(self.tracciatore.premio_massimo_riga(self.cartella, 1))
+
+    def test_tombola_sull_ultimo_numero(self) -> None:
+        numeri = self.cartella.get_numeri_cartella()
+        for numero in numeri[:-1]:
+            self.assertNotIn(("tombola", None), self._segna(numero))
+        self.assertIn(("tombola", None), self._segna(numeri[-1]))
+        self.assertTrue(self.tracciatore.ha_tombola(self.cartella))
+
+    def test_riallineamento_dopo_segnazione_esterna(self) -> None:
+        numeri_riga = self.cartella.get_numeri_riga(2)
+        for numero in numeri_riga[:3]:
+            self.cartella.segna_numero(numero)
+
+        self.assertEqual(self.tracciatore.conta_segnati_riga(self.cartella, 2), 3)
+        self.assertEqual(self.tracciatore.premio_massimo_riga(self.cartella, 2), "terno")
+        self.assertEqual(self._segna(numeri_riga[3]), [("quaterna", 2)])
+
+    def test_stato_premi_equivalente_a_verifica_premi_per_cartella(self) -> None:
+        partita = Partita(Tabellone())
+        rng = random.Random(7)
+        for cartella in (Cartella(), CartellaCompatta()):
+            tracciatore = TracciatorePremi()
+            tracciatore.registra_cartella(cartella)
+            sequenza = list(range(1, 91))
+            rng.shuffle(sequenza)
+            for numero in sequenza:
+                if cartella.segna_numero(numero):
+                    riga, _colonna = cartella.get_coordinate_numero(numero)
+                    tracciatore.segna(cartella, riga)
+                self.assertEqual(
+                    tracciatore.stato_premi(cartella),
+                    partita.verifica_premi_per_cartella(cartella),
+                )
+
+
+class TestTracciatorePremiPartita(unittest.TestCase):
+
+    def test_premi_raggiunti_turno_coerenti_con_le_cartelle(self) -> None:
+        bot_a = GiocatoreAutomatico("A", id_giocatore=1)
+        bot_a.aggiungi_cartella(Cartella())
+        bot_b = GiocatoreAutomatico("B", id_giocatore=2)
+        bot_b.aggiungi_cartella(Cartella())
+        partita = Partita(Tabellone(), [bot_a, bot_b])
+        partita.avvia_partita()
+
+        raggiunti = []
+        while not partita.is_terminata():
+            partita.esegui_fase_estrazione()
+            raggiunti.extend(partita.get_premi_raggiunti_turno())
+            for bot in (bot_a, bot_b):
+                bot.dichiara_fine_fase_azione(partita.premi_gia_assegnati, partita.premi_tipo_chiusi)
+            partita.esegui_fase_verifica()
+
+        tombole = [e for e in raggiunti if e["premio"] == "tombola"]
+        self.assertGreaterEqual(len(tombole), 1)
+        ambi = {(e["id_giocatore"], e["riga"]) for e in raggiunti if e["premio"] == "ambo"}
+        self.assertEqual(len(ambi), len([e for e in raggiunti if e["premio"] == "ambo"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
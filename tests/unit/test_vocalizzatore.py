@@ -7,18 +7,34 @@ Copertura:
 - Vocalizzatore: forwarding di interrompi come interrupt=True/False
 - Vocalizzatore: silenzio su eccezione del backend
 - conformita' strutturale IVocalizzatore per entrambe le classi
+- VocalizzatoreAsincrono (con BackendFittizio): chiamante mai bloccato,
+  priorita', unione e sostituzione per chiave, scarto degli annunci scaduti
+  o superati, interruzione, coda limitata, worker resiliente agli errori
+- VocalizzatoreAsincrono: COM inizializzato e rilasciato nel thread del worker
+- smoke test su Windows con Auto() reale (saltato altrove o senza AO2)
 
 Non incluso:
-- test costruzione con Auto() senza patch: fragile in ambiente headless/CI.
-  Auto() puo' sollevare errori se nessun screen reader e' attivo.
-  Non e' stato introdotto un test fragile come da indicazioni del task.
+- test costruzione con Auto() senza patch fuori da Windows: fragile in
+  ambiente headless/CI.
 """
 from __future__ import annotations
 
+import sys
+import threading
+import time
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
-from my_lib.vocalizzatore import IVocalizzatore, NullVocalizzatore, Vocalizzatore
+from my_lib import vocalizzatore as vocalizzatore_module
+from my_lib.vocalizzatore import (
+    PRIORITA_ALTA,
+    PRIORITA_BASSA,
+    BackendFittizio,
+    IVocalizzatore,
+    NullVocalizzatore,
+    Vocalizzatore,
+    VocalizzatoreAsincrono,
+)
 
 
 class TestNullVocalizzatore(unittest.TestCase):
@@ -78,5 +94,160 @@ class TestVocalizzatore(unittest.TestCase):
         self.assertIsInstance(v, IVocalizzatore)
 
 
+
+def _unisci_nomi(nomi: list[str]) -> str:
+    return " + ".join(nomi)
+
+
+class TestVocalizzatoreAsincrono(unittest.TestCase):
+    """Verifica coda, worker e regole di coalescenza di VocalizzatoreAsincrono."""
+
+    def setUp(self) -> None:
+        self.adesso = 100.0
+        self.backend = BackendFittizio()
+        self.v = VocalizzatoreAsincrono(backend=self.backend, orologio=lambda: self.adesso)
+        self.addCleanup(self.v.chiudi)
+
+    def _trattieni_worker(self) -> None:
+        """Blocca il worker sul primo annuncio, così i successivi restano in coda."""
+        self.backend.blocca()
+        self.v.vocalizza_testo("primo")
+        self.assertTrue(self.backend.in_parlato.wait(1.0))
+
+    def _rilascia_e_attendi(self) -> None:
+        self.backend.sblocca()
+        self.assertTrue(self.v.attendi(2.0))
+
+    def test_chiamante_non_bloccato_da_backend_lento(self) -> None:
+        self._trattieni_worker()
+        inizio = time.monotonic()
+        self.v.vocalizza_testo("secondo")
+        self.assertLess(time.monotonic() - inizio, 0.5)
+        self._rilascia_e_attendi()
+        self.assertEqual(self.backend.testi, ["primo", "secondo"])
+
+    def test_priorita_alta_pronunciata_prima(self) -> None:
+        self._trattieni_worker()
+        self.v.accoda("normale")
+        self.v.accoda("urgente", priorita=PRIORITA_ALTA)
+        self._rilascia_e_attendi()
+        self.assertEqual(self.backend.testi, ["primo", "urgente", "normale"])
+
+    def test_annunci_con_unisci_diventano_uno(self) -> None:
+        self._trattieni_worker()
+        for nome in ("Bot 1", "Bot 2", "Bot 3"):
+            self.v.accoda(nome, chiave="bot", unisci=_unisci_nomi)
+        self._rilascia_e_attendi()
+        self.assertEqual(self.backend.testi, ["primo", "Bot 1 + Bot 2 + Bot 3"])
+
+    def test_stessa_chiave_senza_unisci_sostituisce(self) -> None:
+        self._trattieni_worker()
+        self.v.accoda("Avviso 30", chiave="avviso")
+        self.v.accoda("Avviso 10", chiave="avviso")
+        self._rilascia_e_attendi()
+        self.assertEqual(self.backend.testi, ["primo", "Avviso 10"])
+
+    def test_annuncio_scaduto_scartato(self) -> None:
+        self._trattieni_worker()
+        self.v.accoda("Avviso", chiave="avviso", validita_s=2.0)
+        self.v.accoda("Dopo")
+        self.adesso += 5.0
+        self._rilascia_e_attendi()
+        self.assertEqual(self.backend.testi, ["primo", "Dopo"])
+        self.assertEqual(self.v.scartati, 1)
+
+    def test_annulla_chiavi_superate(self) -> None:
+        self._trattieni_worker()
+        self.v.accoda("Avviso", chiave="avviso")
+        self.v.accoda("Numero estratto", annulla=("avviso",))
+        self._rilascia_e_attendi()
+        self.assertEqual(self.backend.testi, ["primo", "Numero estratto"])
+
+    def test_interrompi_svuota_la_coda(self) -> None:
+        self._trattieni_worker()
+        self.v.accoda("a")
+        self.v.accoda("b")
+        self.v.vocalizza_testo("c", interrompi=True)
+        self._rilascia_e_attendi()
+        self.assertEqual(self.backend.pronunciati, [("primo", False), ("c", True)])
+
+    def test_coda_piena_scarta_il_meno_prioritario(self) -> None:
+        backend = BackendFittizio()
+        v = VocalizzatoreAsincrono(backend=backend, capacita=2)
+        self.addCleanup(v.chiudi)
+        backend.blocca()
+        v.vocalizza_testo("primo")
+        self.assertTrue(backend.in_parlato.wait(1.0))
+        v.accoda("contorno", priorita=PRIORITA_BASSA)
+        v.accoda("x")
+        v.accoda("y")
+        backend.sblocca()
+        self.assertTrue(v.attendi(2.0))
+        self.assertEqual(backend.testi, ["primo", "x", "y"])
+
+    def test_errore_backend_non_ferma_il_worker(self) -> None:
+        backend = MagicMock()
+        backend.speak.side_effect = [RuntimeError("SAPI"), None]
+        v = VocalizzatoreAsincrono(backend=backend)
+        self.addCleanup(v.chiudi)
+        v.vocalizza_testo("uno")
+        v.vocalizza_testo("due")
+        self.assertTrue(v.attendi(2.0))
+        self.assertEqual(backend.speak.call_count, 2)
+
+    def test_chiudi_ferma_il_worker(self) -> None:
+        self.v.chiudi()
+        self.assertFalse(self.v._worker.is_alive())
+        self.v.vocalizza_testo("ignorato")
+        self.assertEqual(self.backend.testi, [])
+
+    def test_implementa_ivocalizzatore(self) -> None:
+        self.assertIsInstance(self.v, IVocalizzatore)
+
+
+class TestVocalizzatoreAsincronoCom(unittest.TestCase):
+    """Verifica l'inizializzazione COM nel thread del worker."""
+
+    def test_com_inizializzato_e_rilasciato_nel_worker(self) -> None:
+        thread_chiamate: list[tuple[str, str]] = []
+        pythoncom = MagicMock()
+        pythoncom.CoInitialize.side_effect = lambda: thread_chiamate.append(
+            ("init", threading.current_thread().name)
+        )
+        pythoncom.CoUninitialize.side_effect = lambda: thread_chiamate.append(
+            ("uninit", threading.current_thread().name)
+        )
+        auto = MagicMock(side_effect=lambda: thread_chiamate.append(
+            ("auto", threading.current_thread().name)
+        ) or BackendFittizio())
+        with patch.object(vocalizzatore_module, "_pythoncom", pythoncom), \
+             patch.object(vocalizzatore_module, "_Auto", auto), \
+             patch.object(vocalizzatore_module, "_AO2_DISPONIBILE", True):
+            v = VocalizzatoreAsincrono()
+            v.vocalizza_testo("uno")
+            self.assertTrue(v.attendi(2.0))
+            v.chiudi()
+
+        self.assertEqual(
+            thread_chiamate,
+            [("init", "vocalizzatore"), ("auto", "vocalizzatore"), ("uninit", "vocalizzatore")],
+        )
+
+
+@unittest.skipUnless(
+    sys.platform == "win32" and vocalizzatore_module._AO2_DISPONIBILE,
+    "smoke test di Auto() solo su Windows con accessible_output2",
+)
+class TestVocalizzatoreAsincronoWindows(unittest.TestCase):
+    """Smoke test: il worker crea e usa Auto() reale come fa main.py."""
+
+    def test_auto_creato_nel_worker(self) -> None:
+        v = VocalizzatoreAsincrono()
+        self.addCleanup(v.chiudi)
+        v.vocalizza_testo("Tombola Stark")
+        self.assertTrue(v.attendi(5.0))
+        self.assertIsNotNone(v._backend)
+
+
 if __name__ == "__main__":
     unittest.main()